@@ -40,13 +40,15 @@ CREATE TABLE IF NOT EXISTS fin_data (
     corp_name VARCHAR(100) NOT NULL,          -- 회사명
     stock_code VARCHAR(20),                   -- 주식 코드 (거래소 코드)
     rcept_no VARCHAR(20),                     -- 접수번호 (DART 보고서 접수번호)
-    reprt_code VARCHAR(20),                   -- 보고서 코드 (사업보고서, 반기보고서 등)
+    reprt_code VARCHAR(20) DEFAULT '11011',   -- 보고서 코드 (11011: 사업, 11012: 반기, 11013: 1분기, 11014: 3분기)
     bsns_year VARCHAR(4) NOT NULL,            -- 사업연도
-    sj_div VARCHAR(10),                       -- 재무제표 구분 (BS: 재무상태표, IS: 손익계산서, CF: 현금흐름표)
+    sj_div VARCHAR(10),                       -- 재무제표 구분 (BS: 재무상태표, IS: 손익계산서, CF: 현금흐름표, RATIO: 재무비율, TTM: 최근 4분기 합계)
     sj_nm VARCHAR(100),                       -- 재무제표명 (재무상태표, 손익계산서, 현금흐름표)
     account_nm VARCHAR(100),                  -- 계정과목명
+    canonical_account VARCHAR(100),           -- 표준 계정 (수집 시 계정과목명/계정코드로 매핑, 매핑 없으면 NULL)
     thstrm_nm VARCHAR(20),                    -- 당기명 (예: 2023년)
     thstrm_amount NUMERIC,                    -- 당기금액
+    thstrm_add_amount NUMERIC,                -- 당기누적금액 (분기/반기 손익계산서)
     frmtrm_nm VARCHAR(20),                    -- 전기명 (예: 2022년)
     frmtrm_amount NUMERIC,                    -- 전기금액
     bfefrmtrm_nm VARCHAR(20),                -- 전전기명 (예: 2021년)
@@ -67,5 +69,96 @@ CREATE TABLE IF NOT EXISTS fin_data (
     eps_growth NUMERIC,                       -- EPS증가율 (%)
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,    -- 데이터 생성 시간
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,    -- 데이터 수정 시간
-    UNIQUE(corp_code, bsns_year, sj_div, account_nm)  -- 회사코드, 사업연도, 재무제표구분, 계정과목명의 조합은 유니크해야 함
-);
\ No newline at end of file
+    -- 회사코드, 사업연도, 보고서코드, 재무제표구분, 계정과목명의 조합은 유니크해야 함
+    CONSTRAINT fin_data_period_account_key UNIQUE(corp_code, bsns_year, reprt_code, sj_div, account_nm)
+);
+
+
+-- 분기/반기 보고서 지원 마이그레이션 (기존 fin_data 테이블용)
+ALTER TABLE fin_data ADD COLUMN IF NOT EXISTS thstrm_add_amount NUMERIC;
+UPDATE fin_data SET reprt_code = '11011' WHERE reprt_code IS NULL;
+ALTER TABLE fin_data ALTER COLUMN reprt_code SET DEFAULT '11011';
+ALTER TABLE fin_data DROP CONSTRAINT IF EXISTS fin_data_corp_code_bsns_year_sj_div_account_nm_key;
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'fin_data_period_account_key') THEN
+        ALTER TABLE fin_data ADD CONSTRAINT fin_data_period_account_key
+            UNIQUE (corp_code, bsns_year, reprt_code, sj_div, account_nm);
+    END IF;
+END $$;
+
+
+-- DART 공시목록 증분 동기화 기준점 (high-water mark)
+CREATE TABLE IF NOT EXISTS dart_sync_state (
+    sync_name VARCHAR(50) PRIMARY KEY,        -- 동기화 작업 이름
+    last_rcept_dt VARCHAR(8) NOT NULL,        -- 마지막으로 처리한 접수일자 (YYYYMMDD)
+    last_rcept_no VARCHAR(20) NOT NULL,       -- 마지막으로 처리한 접수번호
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP     -- 갱신 시간
+);
+
+
+-- 백그라운드 작업 큐 (SELECT ... FOR UPDATE SKIP LOCKED로 작업자 간 분배)
+CREATE TABLE IF NOT EXISTS job_queue (
+    id BIGSERIAL PRIMARY KEY,                 -- 작업 ID
+    job_type VARCHAR(50) NOT NULL,            -- 작업 유형 (ingest_financial, recompute_ratios)
+    payload JSONB NOT NULL DEFAULT '{}',      -- 작업 인자
+    status VARCHAR(20) NOT NULL DEFAULT 'queued',  -- 상태 (queued, running, succeeded, failed)
+    priority INTEGER NOT NULL DEFAULT 0,      -- 우선순위 (클수록 먼저 실행)
+    dedup_key VARCHAR(200),                   -- 중복 제거 키
+    attempts INTEGER NOT NULL DEFAULT 0,      -- 시도 횟수
+    max_attempts INTEGER NOT NULL DEFAULT 3,  -- 최대 시도 횟수
+    progress NUMERIC NOT NULL DEFAULT 0,      -- 진행률 (0~1)
+    progress_message TEXT,                    -- 진행 단계
+    result JSONB,                             -- 실행 결과
+    error TEXT,                               -- 마지막 오류
+    run_after TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,  -- 실행 가능 시각 (재시도 백오프)
+    locked_by VARCHAR(100),                   -- 실행 중인 작업자
+    locked_at TIMESTAMP,                      -- 실행 시작 시각
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    finished_at TIMESTAMP
+);
+
+-- 대기/실행 중인 작업끼리만 중복 제거 키가 유일
+CREATE UNIQUE INDEX IF NOT EXISTS job_queue_dedup_key_active
+    ON job_queue (dedup_key) WHERE status IN ('queued', 'running');
+
+-- 작업 가져오기용 인덱스
+CREATE INDEX IF NOT EXISTS job_queue_claim
+    ON job_queue (priority DESC, id) WHERE status = 'queued';
+
+
+-- 표준 계정 컬럼 (기존 fin_data 테이블용) 및 조회용 인덱스
+-- 기존 행은 python -m app.cli.normalize_accounts 로 채움
+ALTER TABLE fin_data ADD COLUMN IF NOT EXISTS canonical_account VARCHAR(100);
+CREATE INDEX IF NOT EXISTS fin_data_canonical_account
+    ON fin_data (corp_code, bsns_year, reprt_code, canonical_account)
+    WHERE canonical_account IS NOT NULL;
+
+
+-- 계정과목 매핑 테이블 (기본 매핑에 없는 회사별 계정명/계정코드 추가용, 애플리케이션 시작 시 로드)
+CREATE TABLE IF NOT EXISTS account_mapping (
+    id SERIAL PRIMARY KEY,
+    account_nm VARCHAR(200),                  -- 공시된 계정과목명 (정규화 전)
+    account_id VARCHAR(200),                  -- DART 표준 계정코드 (예: ifrs-full_Revenue)
+    canonical_account VARCHAR(100) NOT NULL,  -- 표준 계정 (예: 매출액)
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CHECK (account_nm IS NOT NULL OR account_id IS NOT NULL)
+);
+
+
+-- 응답 스냅샷 테이블 (회사/연도/응답 종류별로 미리 직렬화한 JSON 응답)
+-- 수집/재무비율 계산 시 갱신되며, version이 코드의 SNAPSHOT_VERSION과 다르면 조회 시 다시 생성됨
+CREATE TABLE IF NOT EXISTS response_snapshot (
+    corp_code VARCHAR(20) NOT NULL,           -- 회사 코드
+    corp_name VARCHAR(100) NOT NULL,          -- 회사명
+    bsns_year VARCHAR(10) NOT NULL,           -- 사업연도 ('latest': 연도 미지정 조회)
+    response_type VARCHAR(50) NOT NULL,       -- 응답 종류 (financial_metrics, ratios:11011 등)
+    version INTEGER NOT NULL,                 -- 스냅샷 형식 버전
+    body BYTEA NOT NULL,                      -- 직렬화된 JSON 응답 본문 (UTF-8)
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (corp_code, bsns_year, response_type)
+);
+
+-- 스냅샷은 기본 키(회사 코드, 연도, 응답 종류)로만 조회하므로 회사명 인덱스는 두지 않음
+DROP INDEX IF EXISTS response_snapshot_lookup;
@@ -0,0 +1,108 @@
+import os
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from fastapi.concurrency import run_in_threadpool
+
+from app.foundation.infra.database.database import query_logger
+from app.foundation.infra.database.query_log import ORDER_KEYS
+from app.foundation.infra.profiling.memory import ALLOCATION_TRACKER
+from app.foundation.infra.profiling.sampler import CONTINUOUS_PROFILER, PROFILE_STORE
+from app.foundation.infra.security.admin import require_admin
+from app.foundation.infra.tracing.tracer import TRACER
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin)])
+
+@router.get("/traces", summary="최근 요청 추적 목록")
+async def list_traces(limit: int = Query(50, ge=1, le=500, description="조회할 추적 수")):
+    """최근 추적의 요약(총 시간, 자기 시간이 긴 구간 상위 3개)을 최신순으로 반환합니다."""
+    traces = [
+        {
+            "trace_id": trace["trace_id"],
+            "name": trace["name"],
+            "started_at": trace["started_at"],
+            "duration_ms": trace["duration_ms"],
+            "span_count": trace["span_count"],
+            "error": trace["error"],
+            "hot_spans": trace["breakdown"][:3]
+        }
+        for trace in TRACER.recent(limit)
+    ]
+    return {"status": "success", "data": traces}
+
+@router.get("/traces/{trace_id}", summary="요청 추적 상세")
+async def get_trace(trace_id: str):
+    """추적의 전체 구간 목록과 구간 이름별 시간 합계를 반환합니다."""
+    trace = TRACER.find(trace_id)
+    if trace is None:
+        raise HTTPException(status_code=404, detail=f"추적을 찾을 수 없습니다: {trace_id}")
+    return {"status": "success", "data": trace}
+
+@router.get("/queries", summary="SQL 문 지문별 실행 통계")
+async def list_queries(
+    limit: int = Query(20, ge=1, le=200, description="조회할 SQL 문 수"),
+    order: str = Query("total", description=f"정렬 기준 ({', '.join(ORDER_KEYS)})")
+):
+    """이 작업자가 실행한 SQL 문을 지문별로 묶어 누적 시간 등 기준 상위 목록을 반환합니다."""
+    try:
+        queries = query_logger.stats.top(limit, order)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {
+        "status": "success",
+        "data": {
+            "pid": os.getpid(),
+            "since": query_logger.stats.started_at,
+            "slow_ms": query_logger.slow_ms,
+            "queries": queries
+        }
+    }
+
+@router.delete("/queries", summary="SQL 실행 통계 초기화")
+async def reset_queries():
+    query_logger.stats.reset()
+    return {"status": "success"}
+
+@router.get("/profiles", summary="요청별 프로파일 목록")
+async def list_profiles():
+    """X-Profile 헤더로 프로파일한 최근 요청 목록 (작업자별)"""
+    return {"status": "success", "data": PROFILE_STORE.recent()}
+
+@router.get("/profiles/continuous", summary="연속 샘플링 프로파일 (접힌 스택)", response_class=PlainTextResponse)
+async def get_continuous_profile():
+    """PROFILE_SAMPLE_HZ로 켠 연속 샘플링 결과를 flamegraph.pl/speedscope 입력 형식으로 반환합니다."""
+    if not CONTINUOUS_PROFILER.running:
+        raise HTTPException(status_code=404, detail="연속 샘플링이 꺼져 있습니다 (PROFILE_SAMPLE_HZ).")
+    snapshot = CONTINUOUS_PROFILER.snapshot()
+    return PlainTextResponse(snapshot["collapsed"], headers={
+        "X-Profile-Samples": str(snapshot["samples"]),
+        "X-Profile-Since": str(snapshot["started_at"])
+    })
+
+@router.delete("/profiles/continuous", summary="연속 샘플링 결과 초기화")
+async def reset_continuous_profile():
+    CONTINUOUS_PROFILER.reset()
+    return {"status": "success"}
+
+@router.get("/profiles/{profile_id}", summary="요청별 프로파일 결과", response_class=PlainTextResponse)
+async def get_profile(profile_id: str):
+    """sample은 접힌 스택, cprofile은 누적 시간 순 함수별 통계를 텍스트로 반환합니다."""
+    profile = PROFILE_STORE.get(profile_id)
+    if profile is None or "output" not in profile:
+        raise HTTPException(status_code=404, detail=f"프로파일을 찾을 수 없습니다: {profile_id}")
+    return PlainTextResponse(profile["output"])
+
+@router.get("/memory", summary="단계별 메모리 할당 통계")
+async def get_memory_report(sites: int = Query(0, ge=0, le=100, description="현재 살아 있는 할당 위치 상위 개수")):
+    """MEMORY_TRACKING으로 켠 할당 추적의 단계별 최대/잔존 메모리와 잔존 할당 위치 (작업자별)"""
+    if not ALLOCATION_TRACKER.enabled:
+        raise HTTPException(status_code=404, detail="메모리 할당 추적이 꺼져 있습니다 (MEMORY_TRACKING).")
+    report = ALLOCATION_TRACKER.report()
+    if sites:
+        # 스냅샷은 추적 중인 할당 수에 비례해 오래 걸리므로 스레드에서 실행
+        report["top_sites"] = await run_in_threadpool(ALLOCATION_TRACKER.top_sites_now, sites)
+    return {"status": "success", "data": report}
+
+@router.delete("/memory", summary="단계별 메모리 할당 통계 초기화")
+async def reset_memory_report():
+    ALLOCATION_TRACKER.reset()
+    return {"status": "success"}
@@ -0,0 +1,24 @@
+import aiohttp
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domin.fin.controller.fin_controller import FinController
+from app.domin.fin.service.dart_api_service import DartApiService, create_dart_session
+from app.foundation.core.container.container import Container, get_container
+from app.foundation.infra.database.database import get_db_session
+
+# DART API 요청 제한 시간(초)
+DART_REQUEST_TIMEOUT = 60
+
+def register_fin_dependencies(container: Container) -> None:
+    """재무 도메인의 애플리케이션 범위 의존성을 등록합니다. 실행 중인 이벤트 루프 안에서 호출해야 합니다."""
+    session = create_dart_session(timeout=aiohttp.ClientTimeout(total=DART_REQUEST_TIMEOUT))
+    dart_api = DartApiService(session=session)
+    container.register(DartApiService, dart_api, close=dart_api.close)
+
+def get_fin_controller(
+    container: Container = Depends(get_container),
+    db: AsyncSession = Depends(get_db_session)
+) -> FinController:
+    """요청마다 DB 세션만 새로 묶은 컨트롤러를 반환합니다."""
+    return FinController(db, container.resolve(DartApiService))
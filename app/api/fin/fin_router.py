@@ -1,40 +1,104 @@
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 from typing import Optional
 
+from app.api.fin.dependencies import get_fin_controller
 from app.domin.fin.controller.fin_controller import FinController
-from app.foundation.infra.database.database import get_db_session
+from app.platform.messaging.event_bus import event_bus, sse_stream
 from app.domin.fin.models.schemas import (
     CompanyNameRequest,
-    FinancialMetricsResponse
+    FinancialMetricsResponse,
+    IngestJobRequest,
+    RatioJobRequest,
+    JobStatusResponse
 )
 
 router = APIRouter(tags=["financial"])
 
-@router.get("/ratios/{company_name}", response_model=FinancialMetricsResponse)
+@router.get("/ratios/{company_name}")
 async def get_financial_ratios(
     company_name: str, 
     year: Optional[int] = Query(None, description="조회할 연도. 지정하지 않으면 직전 연도의 데이터를 조회"),
-    db: AsyncSession = Depends(get_db_session)
+    reprt_code: str = Query("11011", description="보고서 코드 (11011: 사업, 11012: 반기, 11013: 1분기, 11014: 3분기)"),
+    controller: FinController = Depends(get_fin_controller)
 ):
     """회사명으로 재무비율을 조회합니다."""
-    controller = FinController(db)
-    return await controller.get_financial_ratios(company_name, year)
+    return await controller.get_financial_ratios(company_name, year, reprt_code)
+
+@router.get("/companies/search", summary="회사명 자동완성/유사 검색")
+async def search_companies(
+    q: str = Query(..., min_length=1, description="회사명 또는 일부 (초성 검색 가능, 예: ㅅㅅㅈㅈ)"),
+    limit: int = Query(10, ge=1, le=50, description="최대 후보 수"),
+    controller: FinController = Depends(get_fin_controller)
+):
+    """DART 전체 회사명에서 접두어/유사도 순으로 후보를 찾습니다. 상장 회사를 먼저 보여줍니다."""
+    return await controller.search_companies(q, limit)
+
+@router.get("/ratio-metrics", summary="재무비율 지표 정의 및 평가 시간 조회")
+async def get_ratio_metrics(controller: FinController = Depends(get_fin_controller)):
+    """재무비율 레지스트리의 지표 정의와 지표별 누적 평가 시간을 조회합니다."""
+    return await controller.get_ratio_metrics()
 
 @router.get("/financial", summary="재무제표 조회 (기본 회사)")
 async def get_financial(
     year: Optional[int] = Query(None, description="조회할 연도. 지정하지 않으면 직전 연도의 데이터를 조회"),
-    db: AsyncSession = Depends(get_db_session)
+    controller: FinController = Depends(get_fin_controller)
 ):
     """기본 회사의 재무제표를 조회합니다."""
-    controller = FinController(db)
     return await controller.get_financial(year=year)
 
 @router.post("/financial", summary="회사명으로 재무제표 조회", response_model=FinancialMetricsResponse)
 async def get_financial_by_name(
     payload: CompanyNameRequest,
     year: Optional[int] = Query(None, description="조회할 연도. 지정하지 않으면 직전 연도의 데이터를 조회"),
-    db: AsyncSession = Depends(get_db_session)
+    controller: FinController = Depends(get_fin_controller)
 ):
-    controller = FinController(db)
-    return await controller.get_financial(company_name=payload.company_name, year=year)
\ No newline at end of file
+    return await controller.get_financial(company_name=payload.company_name, year=year)
+
+@router.post("/sync/disclosures", summary="DART 공시목록 기반 증분 동기화")
+async def sync_disclosures(controller: FinController = Depends(get_fin_controller)):
+    """마지막 동기화 이후 제출된 신규/정정 정기보고서의 재수집 작업을 등록합니다."""
+    return await controller.sync_disclosures()
+
+@router.post("/jobs/ingest", summary="재무제표 수집 작업 등록", response_model=JobStatusResponse, status_code=202)
+async def enqueue_ingestion(
+    payload: IngestJobRequest,
+    controller: FinController = Depends(get_fin_controller)
+):
+    """재무제표 수집을 백그라운드 작업으로 등록하고 즉시 반환합니다."""
+    return await controller.enqueue_ingestion(payload)
+
+@router.post("/jobs/ratios", summary="재무비율 재계산 작업 등록", response_model=JobStatusResponse, status_code=202)
+async def enqueue_ratio_recomputation(
+    payload: RatioJobRequest,
+    controller: FinController = Depends(get_fin_controller)
+):
+    """재무비율 재계산을 백그라운드 작업으로 등록하고 즉시 반환합니다."""
+    return await controller.enqueue_ratio_recomputation(payload)
+
+@router.get("/jobs/{job_id}", summary="작업 상태 조회", response_model=JobStatusResponse)
+async def get_job(job_id: int, controller: FinController = Depends(get_fin_controller)):
+    return await controller.get_job(job_id)
+
+@router.get("/events", summary="수집 진행/신규 공시 이벤트 스트림 (SSE)")
+async def stream_events(
+    request: Request,
+    job_id: Optional[int] = Query(None, description="진행 상황을 구독할 작업 ID"),
+    corp_codes: Optional[str] = Query(None, description="신규 공시를 구독할 회사 코드 목록 (쉼표 구분)")
+):
+    """작업 진행 이벤트와 관심 회사의 신규 공시 이벤트를 Server-Sent Events로 전달합니다."""
+    watched = {code.strip() for code in corp_codes.split(",") if code.strip()} if corp_codes else set()
+
+    def predicate(event) -> bool:
+        if job_id is None and not watched:
+            return True
+        if job_id is not None and event.get("job_id") == job_id:
+            return True
+        return bool(watched) and event.get("corp_code") in watched
+
+    subscription = event_bus.subscribe(predicate)
+    return StreamingResponse(
+        sse_stream(subscription, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -0,0 +1,17 @@
+from fastapi import APIRouter
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse
+
+from app.foundation.infra.metrics.registry import REGISTRY
+
+router = APIRouter(tags=["monitoring"])
+
+# Prometheus 텍스트 형식
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 수집용 지표. 다중 작업자 실행 시 모든 작업자의 지표를 합쳐 출력합니다."""
+    # 작업자 파일을 읽고 합치는 동안 이벤트 루프를 막지 않도록 스레드에서 실행
+    body = await run_in_threadpool(REGISTRY.render)
+    return PlainTextResponse(body, media_type=METRICS_CONTENT_TYPE)
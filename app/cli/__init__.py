@@ -0,0 +1,10 @@
+"""
+명령행 도구 모듈
+
+이 패키지는 API 서버 밖에서 실행하는 운영용 명령들을 포함합니다.
+주요 기능:
+- 전체 시장 과거 재무제표 대량 수집 (backfill)
+- 백그라운드 작업자 프로세스 (job_worker)
+- 기존 재무제표 행의 표준 계정 채우기 (normalize_accounts)
+- 프로덕션 API 서버 다중 작업자 실행 (serve)
+"""
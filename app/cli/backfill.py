@@ -0,0 +1,108 @@
+"""전체 시장 과거 재무제표 대량 수집 명령
+
+사용 예:
+    python -m app.cli.backfill --from-year 2015 --to-year 2023
+    python -m app.cli.backfill --from-year 2020 --to-year 2023 --corp-file codes.txt --concurrency 8
+    python -m app.cli.backfill --from-year 2015 --to-year 2023 --multi-company
+"""
+import os
+import asyncio
+import argparse
+import logging
+from typing import List
+
+from app.domin.fin.models.schemas import CompanyInfo
+from app.domin.fin.service.corp_code_index import CorpCodeIndex
+from app.domin.fin.service.dart_api_service import DartApiService
+from app.domin.fin.service.backfill_service import BackfillService
+from app.domin.fin.service.account_taxonomy import load_account_mappings
+from app.foundation.infra.logger.logging_config import configure_logging
+from app.foundation.infra.profiling.memory import start_from_env as start_memory_tracking, track_allocations
+
+logger = logging.getLogger(__name__)
+
+async def ensure_corp_code_file(dart_api: DartApiService, path: str) -> None:
+    """로컬 고유번호 파일이 없으면 DART에서 다운로드하여 저장합니다."""
+    if not os.path.exists(path):
+        logger.info("고유번호 파일이 없어 DART에서 다운로드합니다: %s", path)
+        content = await dart_api.download_corp_code_zip()
+        CorpCodeIndex.save_zip(content, path)
+
+async def load_corp_code_index(dart_api: DartApiService, path: str) -> CorpCodeIndex:
+    """로컬 고유번호 파일을 읽고, 없으면 DART에서 다운로드하여 저장합니다."""
+    await ensure_corp_code_file(dart_api, path)
+    with track_allocations("corp_code.load"):
+        return CorpCodeIndex.from_file(path)
+
+def select_companies(index: CorpCodeIndex, corp_file: str = None) -> List[CompanyInfo]:
+    """수집 대상 회사를 선택합니다. 파일이 없으면 전체 상장 회사를 대상으로 합니다."""
+    if not corp_file:
+        return index.listed()
+
+    companies = []
+    with open(corp_file, encoding="utf-8") as f:
+        for line in f:
+            corp_code = line.strip()
+            if not corp_code or corp_code.startswith("#"):
+                continue
+            company = index.get_by_code(corp_code)
+            if company is None:
+                logger.warning("고유번호 파일에 없는 회사 코드입니다: %s", corp_code)
+                continue
+            companies.append(company)
+    return companies
+
+async def main(args: argparse.Namespace) -> None:
+    # DB 엔진은 환경 변수를 읽은 뒤 생성되므로 실행 시점에 가져옴
+    from app.foundation.infra.database.database import async_session, engine
+
+    # 작업자 프로세스가 fork되기 전에 계정과목 매핑을 로드
+    async with async_session() as session:
+        await load_account_mappings(session)
+
+    dart_api = DartApiService()
+    index = await load_corp_code_index(dart_api, args.corp_code_file)
+    companies = select_companies(index, args.corp_file)
+    logger.info("수집 대상 회사 수: %s", len(companies))
+
+    service = BackfillService(
+        session_factory=async_session,
+        dart_api=dart_api,
+        concurrency=args.concurrency,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        checkpoint_path=args.checkpoint,
+        reprt_code=args.reprt_code,
+        compute_ratios=not args.skip_ratios,
+        report_interval=args.report_interval,
+        multi_company=args.multi_company
+    )
+    try:
+        result = await service.run(companies, range(args.from_year, args.to_year + 1))
+    finally:
+        await engine.dispose()
+
+    logger.info("대량 수집 종료 - 처리: %s/%s, 저장 행 수: %s, 실패: %s", result['processed'], result['total'], result['rows'], len(result['failed']))
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="DART 재무제표 과거 데이터 대량 수집")
+    parser.add_argument("--from-year", type=int, required=True, help="수집 시작 연도")
+    parser.add_argument("--to-year", type=int, required=True, help="수집 종료 연도 (포함)")
+    parser.add_argument("--corp-file", help="수집할 회사 코드 목록 파일 (한 줄에 하나). 없으면 전체 상장 회사")
+    parser.add_argument("--corp-code-file", default=os.getenv("CORP_CODE_FILE", "data/CORPCODE.zip"),
+                        help="DART 고유번호 파일 경로. 없으면 다운로드하여 저장")
+    parser.add_argument("--reprt-code", default="11011", help="보고서 코드 (11011: 사업, 11012: 반기, 11013: 1분기, 11014: 3분기, 기본: 사업보고서)")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시 DART 요청 수")
+    parser.add_argument("--workers", type=int, default=None, help="검증/변환 작업자 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--batch-size", type=int, default=5000, help="DB 일괄 저장 행 수")
+    parser.add_argument("--checkpoint", default="data/backfill.checkpoint", help="재시작용 체크포인트 파일")
+    parser.add_argument("--skip-ratios", action="store_true", help="재무비율 계산 생략")
+    parser.add_argument("--multi-company", action="store_true",
+                        help="다중회사 주요계정 API로 100개 회사씩 묶어 조회 (현금흐름표 제외)")
+    parser.add_argument("--report-interval", type=float, default=10.0, help="처리율 보고 주기(초)")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    configure_logging()
+    start_memory_tracking()
+    asyncio.run(main(parse_args()))
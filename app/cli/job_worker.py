@@ -0,0 +1,60 @@
+"""백그라운드 작업자 프로세스
+
+API 서버와 별도로 작업 큐만 처리합니다. 프로세스를 늘리면 처리량이 늘어납니다.
+
+사용 예:
+    python -m app.cli.job_worker --concurrency 4
+"""
+import os
+import signal
+import asyncio
+import argparse
+import logging
+
+from app.platform.messaging.job_queue import JobWorkerPool
+from app.platform.messaging.event_bus import event_bus, PostgresEventRelay
+from app.domin.fin.service.job_handlers import FIN_JOB_HANDLERS
+from app.domin.fin.service.account_taxonomy import load_account_mappings
+from app.foundation.infra.logger.logging_config import configure_logging
+from app.foundation.infra.profiling.memory import start_from_env as start_memory_tracking
+
+logger = logging.getLogger(__name__)
+
+async def main(args: argparse.Namespace) -> None:
+    from app.foundation.infra.database.database import async_session, engine
+
+    async with async_session() as session:
+        await load_account_mappings(session)
+
+    # 진행 이벤트를 API 프로세스의 SSE 구독자에게 전달
+    relay = PostgresEventRelay(engine, event_bus)
+    await relay.start()
+    pool = JobWorkerPool(
+        async_session,
+        FIN_JOB_HANDLERS,
+        concurrency=args.concurrency,
+        poll_interval=args.poll_interval,
+        event_bus=event_bus
+    )
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    pool.start()
+    await stop.wait()
+    logger.info("종료 신호를 받아 실행 중인 작업을 마무리합니다.")
+    await pool.stop()
+    await relay.stop()
+    await engine.dispose()
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="백그라운드 작업자")
+    parser.add_argument("--concurrency", type=int, default=int(os.getenv("JOB_WORKERS", "2")), help="동시 실행 작업 수")
+    parser.add_argument("--poll-interval", type=float, default=1.0, help="대기 작업이 없을 때 폴링 주기(초)")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    configure_logging()
+    start_memory_tracking()
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,56 @@
+"""기존 재무제표 행의 표준 계정(canonical_account) 채우기
+
+표준 계정 컬럼이 추가되기 전에 저장된 행이나, 매핑 테이블에 새 매핑을 추가한 뒤
+아직 매핑되지 않은 행을 id 순으로 배치 처리합니다. 여러 번 실행해도 안전합니다.
+
+사용 예:
+    python -m app.cli.normalize_accounts --batch-size 5000
+"""
+import asyncio
+import argparse
+import logging
+
+from app.domin.fin.repository.fin_repository import get_unmapped_accounts, update_canonical_accounts
+from app.domin.fin.service.account_taxonomy import ACCOUNT_TAXONOMY, load_account_mappings
+from app.foundation.infra.logger.logging_config import configure_logging
+
+logger = logging.getLogger(__name__)
+
+async def main(args: argparse.Namespace) -> None:
+    from app.foundation.infra.database.database import async_session, engine
+
+    scanned = 0
+    mapped = 0
+    last_id = 0
+    try:
+        async with async_session() as session:
+            await load_account_mappings(session)
+            while True:
+                rows = await get_unmapped_accounts(session, last_id, args.batch_size)
+                if not rows:
+                    break
+                updates = []
+                for row in rows:
+                    canonical = ACCOUNT_TAXONOMY.resolve(row["account_nm"])
+                    if canonical is not None:
+                        updates.append({"id": row["id"], "canonical_account": canonical})
+                await update_canonical_accounts(session, updates)
+                await session.commit()
+
+                last_id = rows[-1]["id"]
+                scanned += len(rows)
+                mapped += len(updates)
+                logger.info("진행 상황 - 검사: %s, 매핑: %s, 마지막 id: %s", scanned, mapped, last_id)
+    finally:
+        await engine.dispose()
+
+    logger.info("표준 계정 채우기 완료 - 검사: %s, 매핑: %s, 매핑 안 됨: %s", scanned, mapped, scanned - mapped)
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="기존 재무제표 행의 표준 계정 채우기")
+    parser.add_argument("--batch-size", type=int, default=5000, help="한 번에 처리할 행 수")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    configure_logging()
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,382 @@
+"""프로덕션 API 서버 실행 명령 (pre-fork 다중 작업자)
+
+부모 프로세스가 리슨 소켓을 열고 고유번호 인덱스를 매핑하고 애플리케이션 모듈을 미리 읽은 뒤
+작업자를 fork합니다. 작업자는 uvloop/httptools로 같은 소켓을 받아 처리하며,
+고유번호 인덱스는 같은 읽기 전용 매핑을, 미리 읽은 모듈은 copy-on-write 페이지를 공유합니다.
+
+신호:
+    SIGHUP          새 코드로 작업자를 하나씩 교체 (새 작업자가 예열을 마치면 기존 작업자를 정상 종료)
+    SIGTERM/SIGINT  모든 작업자를 정상 종료
+
+롤링 재시작:
+    import한 모듈은 sys.modules에 남아 있어 같은 프로세스에서 다시 import해도 기존 코드가 반환되고,
+    fork한 작업자도 그 모듈을 그대로 물려받습니다. 그래서 SIGHUP을 받은 부모는 같은 pid로 자신을
+    다시 exec하여 새 코드를 미리 읽고, 리슨 소켓과 기존 작업자를 환경 변수로 넘겨받아 하나씩 교체합니다.
+    작업자마다 import하는 방식과 달리 새 코드도 fork 전에 한 번만 읽어 copy-on-write 공유가 유지됩니다.
+    새 코드를 import할 수 없으면 exec하지 않고 기존 작업자를 유지합니다.
+
+사용 예:
+    python -m app.cli.serve --port 9000
+    python -m app.cli.serve --workers 8 --graceful-timeout 60
+"""
+import os
+import gc
+import sys
+import time
+import errno
+import importlib
+import select
+import signal
+import socket
+import asyncio
+import argparse
+import logging
+import tempfile
+import subprocess
+from typing import Dict, Iterable, List, Optional, Set
+
+from app.foundation.infra.logger.logging_config import configure_logging, stop_logging
+from app.foundation.infra.profiling.memory import start_from_env as start_memory_tracking, track_allocations
+
+logger = logging.getLogger(__name__)
+
+APP = "app.main:app"
+
+# 롤링 재시작으로 다시 exec한 부모에 넘기는 리슨 소켓 fd와 기존 작업자 pid 목록
+LISTEN_FD_ENV = "FIN_SERVE_LISTEN_FD"
+WORKER_PIDS_ENV = "FIN_SERVE_WORKER_PIDS"
+
+def default_workers() -> int:
+    """사용 가능한 CPU 수 (WEB_CONCURRENCY가 있으면 그 값)"""
+    if os.getenv("WEB_CONCURRENCY"):
+        return int(os.environ["WEB_CONCURRENCY"])
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+def bind_socket(host: str, port: int, backlog: int) -> socket.socket:
+    """작업자들이 함께 받을 리슨 소켓을 엽니다."""
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+def inherited_socket() -> Optional[socket.socket]:
+    """다시 exec하기 전 부모가 열어 둔 리슨 소켓 (처음 실행이면 None)"""
+    fd = os.environ.pop(LISTEN_FD_ENV, None)
+    if fd is None:
+        return None
+    sock = socket.socket(fileno=int(fd))
+    sock.set_inheritable(True)
+    return sock
+
+def inherited_workers() -> List[int]:
+    """다시 exec하기 전 부모가 실행한 작업자 pid 목록"""
+    pids = os.environ.pop(WORKER_PIDS_ENV, "")
+    return [int(pid) for pid in pids.split(",") if pid]
+
+def preload(corp_code_file: str, app_path: str = APP) -> None:
+    """fork 전에 공유 데이터를 준비합니다: 고유번호 인덱스 매핑, 회사명 검색 색인, 애플리케이션 모듈."""
+    from app.cli.backfill import ensure_corp_code_file
+    from app.domin.fin.service.corp_code_index import MappedCorpCodeIndex, set_shared_index
+    from app.domin.fin.service.company_search import CompanySearchIndex, set_shared_search_index
+    from app.domin.fin.service.dart_api_service import DartApiService
+    from app.foundation.core.config.settings import settings
+
+    try:
+        asyncio.run(ensure_corp_code_file(DartApiService(), corp_code_file))
+        # 작업자는 fork로 같은 읽기 전용 매핑을 물려받아 페이지 캐시를 공유함
+        with track_allocations("corp_code.compile"):
+            index = MappedCorpCodeIndex.from_file(corp_code_file, settings.CORP_CODE_INDEX_FILE)
+        set_shared_index(index)
+        with track_allocations("company_search.build"):
+            set_shared_search_index(CompanySearchIndex(index.entries()))
+        logger.info("고유번호 인덱스 미리 읽기 완료 - 회사 수: %s", len(index))
+    except Exception as e:
+        # 작업자가 첫 조회 시 각자 다운로드하므로 실행은 계속함
+        logger.warning("고유번호 인덱스를 미리 읽지 못했습니다: %s", e)
+
+    # 작업자가 같은 모듈을 다시 import하지 않도록 애플리케이션 모듈을 미리 읽음
+    importlib.import_module(app_path.split(":", 1)[0])
+
+    # 이후 생성되는 객체만 GC 대상으로 두어 공유 페이지가 GC 스캔으로 복사되지 않도록 함
+    gc.collect()
+    gc.freeze()
+
+class Arbiter:
+    """작업자 프로세스를 만들고 감시하며 재시작합니다."""
+
+    def __init__(self, sock: socket.socket, args: argparse.Namespace, adopted: Iterable[int] = ()):
+        self.sock = sock
+        self.args = args
+        # pid → 준비 알림 파이프(읽기). 넘겨받은 작업자는 이미 준비를 마쳤으므로 파이프가 없음
+        self.workers: Dict[int, Optional[int]] = {pid: None for pid in adopted}
+        self.retiring: Set[int] = set()  # 교체/종료를 위해 멈추는 작업자
+        self.stopping = False
+        self.reload_requested = False
+
+    def spawn(self) -> int:
+        """작업자를 하나 fork합니다. 작업자는 요청을 받을 준비가 되면 파이프로 알립니다."""
+        ready_r, ready_w = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(ready_r)
+            code = 0
+            try:
+                run_worker(self.sock, self.args, ready_w)
+            except BaseException:
+                logger.exception("작업자 비정상 종료")
+                code = 1
+            finally:
+                # os._exit는 atexit를 실행하지 않으므로 큐에 남은 로그를 직접 출력
+                stop_logging()
+                os._exit(code)
+        os.close(ready_w)
+        self.workers[pid] = ready_r
+        logger.info("작업자 시작 - pid: %s", pid)
+        return pid
+
+    def wait_ready(self, pid: int, timeout: float) -> bool:
+        """작업자의 예열 완료 알림을 기다립니다."""
+        ready_r = self.workers.get(pid)
+        if ready_r is None:
+            return False
+        readable, _, _ = select.select([ready_r], [], [], timeout)
+        return bool(readable) and os.read(ready_r, 1) == b"1"
+
+    def stop_worker(self, pid: int, timeout: float) -> None:
+        """작업자에 SIGTERM을 보내고, 제한 시간 안에 끝나지 않으면 SIGKILL로 종료합니다."""
+        self.retiring.add(pid)
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.reap(pid):
+                return
+            time.sleep(0.1)
+        logger.warning("작업자가 제한 시간 안에 종료되지 않아 강제 종료합니다 - pid: %s", pid)
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        os.waitpid(pid, 0)
+        self.forget(pid)
+        self.retiring.discard(pid)
+
+    def forget(self, pid: int) -> None:
+        ready_r = self.workers.pop(pid, None)
+        if ready_r is not None:
+            os.close(ready_r)
+
+    def reap(self, pid: int = -1) -> List[int]:
+        """종료된 작업자를 회수합니다."""
+        reaped = []
+        while True:
+            try:
+                done, status = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if done == 0:
+                break
+            if done in self.workers:
+                self.forget(done)
+                reaped.append(done)
+                if not self.stopping and done not in self.retiring:
+                    logger.warning("작업자 종료 감지 - pid: %s, 상태: %s", done, status)
+                self.retiring.discard(done)
+            if pid != -1:
+                break
+        return reaped
+
+    def rolling_restart(self) -> None:
+        """새 코드를 읽도록 부모 프로세스를 같은 pid로 다시 exec합니다.
+
+        다시 실행된 부모는 새 코드를 미리 읽은 뒤 넘겨받은 작업자를 replace_workers로 교체합니다.
+        새 코드를 import할 수 없으면 exec하지 않고 기존 작업자를 유지합니다.
+        """
+        logger.info("롤링 재시작 시작")
+        module = self.args.app.split(":", 1)[0]
+        check = subprocess.run([sys.executable, "-c", f"import {module}"], capture_output=True, text=True)
+        if check.returncode != 0:
+            lines = check.stderr.strip().splitlines()
+            logger.error("새 코드를 불러오지 못해 롤링 재시작을 중단합니다: %s", lines[-1] if lines else check.returncode)
+            return
+
+        os.environ[LISTEN_FD_ENV] = str(self.sock.fileno())
+        os.environ[WORKER_PIDS_ENV] = ",".join(map(str, self.workers))
+        # 새 프로세스가 신호 처리기를 설치하기 전에 SIGHUP을 받아도 종료되지 않도록 무시 상태로 exec
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+        # exec하면 출력 스레드가 사라지므로 큐에 남은 로그를 먼저 출력
+        stop_logging()
+        try:
+            os.execv(sys.executable, sys.orig_argv)
+        except OSError:
+            configure_logging()
+            logger.exception("부모 프로세스를 다시 실행하지 못해 기존 작업자를 유지합니다.")
+            os.environ.pop(LISTEN_FD_ENV, None)
+            os.environ.pop(WORKER_PIDS_ENV, None)
+            signal.signal(signal.SIGHUP, self.request_reload)
+
+    def replace_workers(self, old_pids: List[int]) -> None:
+        """작업자를 하나씩 교체합니다. 새 작업자가 준비되지 않으면 기존 작업자를 유지하고 중단합니다."""
+        for old_pid in old_pids:
+            new_pid = self.spawn()
+            if not self.wait_ready(new_pid, self.args.ready_timeout):
+                logger.error("새 작업자가 준비되지 않아 롤링 재시작을 중단합니다 - pid: %s", new_pid)
+                self.stop_worker(new_pid, self.args.graceful_timeout)
+                return
+            self.stop_worker(old_pid, self.args.graceful_timeout)
+        logger.info("롤링 재시작 완료")
+
+    def request_reload(self, signum, frame) -> None:
+        self.reload_requested = True
+
+    def run(self) -> None:
+        def request_stop(signum, frame):
+            self.stopping = True
+
+        signal.signal(signal.SIGTERM, request_stop)
+        signal.signal(signal.SIGINT, request_stop)
+        signal.signal(signal.SIGHUP, self.request_reload)
+
+        if self.workers:
+            # 다시 exec하기 전의 작업자를 새 코드의 작업자로 교체
+            self.replace_workers(list(self.workers))
+        for _ in range(self.args.workers - len(self.workers)):
+            self.spawn()
+        logger.info("서버 시작 - 주소: %s:%s, 작업자 수: %s", self.args.host, self.args.port, self.args.workers)
+
+        while not self.stopping:
+            if self.reload_requested:
+                self.reload_requested = False
+                self.rolling_restart()
+            self.reap()
+            # 비정상 종료된 작업자를 다시 채움
+            while not self.stopping and len(self.workers) < self.args.workers:
+                self.spawn()
+                time.sleep(self.args.respawn_delay)
+            time.sleep(0.5)
+
+        logger.info("종료 신호를 받아 작업자를 정상 종료합니다.")
+        for pid in list(self.workers):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        deadline = time.monotonic() + self.args.graceful_timeout
+        while self.workers and time.monotonic() < deadline:
+            self.reap()
+            time.sleep(0.1)
+        for pid in list(self.workers):
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+            self.forget(pid)
+
+def run_worker(sock: socket.socket, args: argparse.Namespace, ready_w: int) -> None:
+    """작업자 프로세스: uvloop/httptools로 공유 소켓에서 요청을 처리합니다."""
+    import uvicorn
+
+    # 부모의 신호 처리기를 해제 (uvicorn이 SIGTERM/SIGINT 정상 종료를 설치함).
+    # SIGHUP은 부모만 처리하므로 프로세스 그룹 전체에 전달되어도 작업자는 무시함
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(sig, signal.SIG_DFL)
+    signal.signal(signal.SIGHUP, signal.SIG_IGN)
+
+    config = uvicorn.Config(
+        args.app,
+        loop="uvloop",
+        http="httptools",
+        lifespan="on",
+        access_log=args.access_log,
+        # uvicorn 로그도 루트 로거의 큐 핸들러로 보냄
+        log_config=None,
+        proxy_headers=True,
+        forwarded_allow_ips=args.forwarded_allow_ips,
+        timeout_keep_alive=args.keep_alive,
+        timeout_graceful_shutdown=args.graceful_timeout,
+        limit_concurrency=args.limit_concurrency
+    )
+    server = uvicorn.Server(config)
+
+    async def notify_ready() -> None:
+        # lifespan 시작(작업자 예열 포함)이 끝나고 요청을 받기 시작하면 부모에 알림
+        while not server.started:
+            if server.should_exit:
+                return
+            await asyncio.sleep(0.05)
+        os.write(ready_w, b"1")
+        os.close(ready_w)
+
+    async def serve() -> None:
+        notifier = asyncio.create_task(notify_ready())
+        await server.serve(sockets=[sock])
+        notifier.cancel()
+
+    config.setup_event_loop()
+    asyncio.run(serve())
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="프로덕션 API 서버 (pre-fork 다중 작업자)")
+    parser.add_argument("--app", default=APP, help="ASGI 애플리케이션 (모듈:속성)")
+    parser.add_argument("--host", default=os.getenv("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "9000")))
+    parser.add_argument("--workers", type=int, default=default_workers(), help="작업자 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--backlog", type=int, default=2048)
+    parser.add_argument("--corp-code-file", default=os.getenv("CORP_CODE_FILE", "data/CORPCODE.zip"),
+                        help="fork 전에 읽을 DART 고유번호 파일 경로. 없으면 다운로드하여 저장")
+    parser.add_argument("--graceful-timeout", type=int, default=30, help="작업자 정상 종료 대기 시간(초)")
+    parser.add_argument("--ready-timeout", type=float, default=60.0, help="롤링 재시작 시 새 작업자 준비 대기 시간(초)")
+    parser.add_argument("--respawn-delay", type=float, default=1.0, help="비정상 종료된 작업자 재시작 간격(초)")
+    parser.add_argument("--keep-alive", type=int, default=5, help="keep-alive 유지 시간(초)")
+    parser.add_argument("--limit-concurrency", type=int, default=None, help="작업자당 최대 동시 연결 수")
+    parser.add_argument("--forwarded-allow-ips", default=os.getenv("FORWARDED_ALLOW_IPS", "127.0.0.1"))
+    parser.add_argument("--access-log", action="store_true", help="접근 로그 출력")
+    parser.add_argument("--metrics-dir", default=os.getenv("METRICS_DIR"),
+                        help="작업자별 지표 파일 디렉터리 (기본: 임시 디렉터리)")
+    return parser.parse_args(argv)
+
+def prepare_metrics_dir(path: Optional[str]) -> str:
+    """작업자들이 지표를 모을 디렉터리를 비우고 METRICS_DIR로 알립니다.
+
+    /metrics 요청을 받은 작업자가 이 디렉터리의 파일을 합쳐 모든 작업자의 지표를 출력합니다.
+    이전 실행의 파일이 섞이지 않도록 시작할 때 비웁니다.
+    """
+    if path:
+        os.makedirs(path, exist_ok=True)
+        for filename in os.listdir(path):
+            if filename.endswith((".json", ".tmp")):
+                os.remove(os.path.join(path, filename))
+    else:
+        path = tempfile.mkdtemp(prefix="fin-metrics-")
+    os.environ["METRICS_DIR"] = path
+    logger.info("지표 디렉터리: %s", path)
+    return path
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    if args.workers < 1:
+        sys.exit("작업자 수는 1 이상이어야 합니다.")
+    sock = inherited_socket()
+    if sock is None:
+        try:
+            sock = bind_socket(args.host, args.port, args.backlog)
+        except OSError as e:
+            if e.errno == errno.EADDRINUSE:
+                sys.exit(f"이미 사용 중인 주소입니다: {args.host}:{args.port}")
+            raise
+        prepare_metrics_dir(args.metrics_dir)
+    else:
+        # 롤링 재시작: 기존 작업자가 계속 쓰는 지표 디렉터리(METRICS_DIR)는 그대로 둠
+        logger.info("롤링 재시작 - 넘겨받은 소켓으로 계속 실행합니다.")
+    preload(args.corp_code_file, args.app)
+    Arbiter(sock, args, inherited_workers()).run()
+
+if __name__ == "__main__":
+    configure_logging()
+    start_memory_tracking()
+    main()
@@ -1,31 +1,37 @@
-from fastapi import HTTPException, Query
+from fastapi import HTTPException, Query, Response
 from app.domin.fin.service.fin_service import FinService
+from app.domin.fin.service.dart_api_service import DartApiService
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import text
 import logging
 from typing import Optional
-from decimal import Decimal
 
 from app.domin.fin.models.schemas import (
-    FinancialMetricsResponse,
-    FinancialMetrics,
-    GrowthData,
-    DebtLiquidityData
+    IngestJobRequest,
+    RatioJobRequest,
+    JobStatusResponse
 )
-
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+from app.domin.fin.repository.fin_repository import get_stored_ratios
+from app.domin.fin.service.ratio_registry import RATIO_EVALUATOR
+from app.foundation.infra.tracing.tracer import traced
+from app.domin.fin.service.response_snapshot_service import (
+    FINANCIAL_METRICS,
+    build_financial_metrics,
+    build_ratios,
+    empty_financial_metrics,
+    encode_response,
+    ratio_columns,
+    ratios_response_type,
+    year_key
 )
+
 logger = logging.getLogger(__name__)
 
 class FinController:
-    def __init__(self, db_session: AsyncSession):
-        logger.info("FinController가 초기화되었습니다.")
+    def __init__(self, db_session: AsyncSession, dart_api: Optional[DartApiService] = None):
         self.db_session = db_session
-        self.service = FinService(db_session)
+        self.service = FinService(db_session, dart_api)
 
+    @traced()
     async def get_financial(
         self, 
         company_name: str = Query(..., description="회사명"),
@@ -37,278 +43,194 @@ class FinController:
             company_name: 회사명
             year: 조회할 연도. None이면 직전 연도의 데이터를 조회
         """
-        logger.info(f"재무제표 조회 요청 - 회사: {company_name}, 연도: {year}")
+        logger.info("재무제표 조회 요청 - 회사: %s, 연도: %s", company_name, year)
         try:
+            # 회사명 보정(표기 차이, 오타) 후에는 확인된 회사 코드/회사명만 사용
+            company_info = await self.service.get_company_info(company_name)
+
+            # 미리 직렬화된 응답이 있으면 그대로 반환
+            snapshot_year = year_key(year)
+            body = await self.service.get_response_snapshot(company_info.corp_code, snapshot_year, FINANCIAL_METRICS)
+            if body is not None:
+                return Response(content=body, media_type="application/json")
+
             raw_data = await self.service.fetch_and_save_financial_data(
-                company_name=company_name,
+                company_info=company_info,
                 year=year
             )
             
             if raw_data["status"] != "success":
-                return FinancialMetricsResponse(
-                    companyName=company_name,
-                    financialMetrics=FinancialMetrics(
-                        operatingMargin=[],
-                        netMargin=[],
-                        roe=[],
-                        roa=[],
-                        years=[]
-                    ),
-                    growthData=GrowthData(
-                        revenueGrowth=[],
-                        netIncomeGrowth=[],
-                        years=[]
-                    ),
-                    debtLiquidityData=DebtLiquidityData(
-                        debtRatio=[],
-                        currentRatio=[],
-                        years=[]
-                    )
-                )
+                return Response(content=encode_response(empty_financial_metrics(company_info.corp_name)), media_type="application/json")
             
             # 재무제표 데이터에서 필요한 정보 추출
-            financial_data = raw_data["data"]
-            years = []
-            operating_margins = []
-            net_margins = []
-            roe_values = []
-            roa_values = []
-            revenue_growths = []
-            net_income_growths = []
-            debt_ratios = []
-            current_ratios = []
-            
-            # 먼저 모든 필요한 데이터를 추출
-            financial_values = {}
-            for data in financial_data:
-                if data["account_nm"] in ["매출액", "영업이익", "당기순이익", "자산총계", "자본총계", "부채총계", "유동자산", "유동부채"]:
-                    financial_values[data["account_nm"]] = {
-                        "current": float(data["thstrm_amount"]),
-                        "previous": float(data["frmtrm_amount"]),
-                        "year": data["bsns_year"]
-                    }
-                    if data["account_nm"] == "자산총계":
-                        years.append(data["bsns_year"])
-            
-            # 모든 데이터가 있는 경우에만 계산
-            if all(key in financial_values for key in ["매출액", "영업이익", "당기순이익", "자산총계", "자본총계", "부채총계", "유동자산", "유동부채"]):
-                # 매출액 관련 계산
-                revenue = financial_values["매출액"]["current"]
-                prev_revenue = financial_values["매출액"]["previous"]
-                if prev_revenue != 0:
-                    revenue_growth = ((revenue - prev_revenue) / abs(prev_revenue)) * 100
-                    revenue_growths.append(revenue_growth)
-                
-                # 영업이익률 계산
-                operating_profit = financial_values["영업이익"]["current"]
-                if revenue != 0:
-                    operating_margin = (operating_profit / revenue) * 100
-                    operating_margins.append(operating_margin)
-                
-                # 순이익 관련 계산
-                net_income = financial_values["당기순이익"]["current"]
-                prev_net_income = financial_values["당기순이익"]["previous"]
-                if revenue != 0:
-                    net_margin = (net_income / revenue) * 100
-                    net_margins.append(net_margin)
-                if prev_net_income != 0:
-                    net_income_growth = ((net_income - prev_net_income) / abs(prev_net_income)) * 100
-                    net_income_growths.append(net_income_growth)
-                
-                # ROA 계산
-                total_assets = financial_values["자산총계"]["current"]
-                if total_assets != 0:
-                    roa = (net_income / total_assets) * 100
-                    roa_values.append(roa)
-                
-                # ROE 계산
-                total_equity = financial_values["자본총계"]["current"]
-                if total_equity != 0:
-                    roe = (net_income / total_equity) * 100
-                    roe_values.append(roe)
-                
-                # 부채비율 계산
-                total_liabilities = financial_values["부채총계"]["current"]
-                if total_equity != 0:
-                    debt_ratio = (total_liabilities / total_equity) * 100
-                    debt_ratios.append(debt_ratio)
-                
-                # 유동비율 계산
-                current_assets = financial_values["유동자산"]["current"]
-                current_liabilities = financial_values["유동부채"]["current"]
-                if current_liabilities != 0:
-                    current_ratio = (current_assets / current_liabilities) * 100
-                    current_ratios.append(current_ratio)
-            
-            logger.info(f"재무제표 조회 성공 - 회사: {company_name}, 연도: {year}")
-            return FinancialMetricsResponse(
-                companyName=company_name,
-                financialMetrics=FinancialMetrics(
-                    operatingMargin=operating_margins,
-                    netMargin=net_margins,
-                    roe=roe_values,
-                    roa=roa_values,
-                    years=years
-                ),
-                growthData=GrowthData(
-                    revenueGrowth=revenue_growths,
-                    netIncomeGrowth=net_income_growths,
-                    years=years
-                ),
-                debtLiquidityData=DebtLiquidityData(
-                    debtRatio=debt_ratios,
-                    currentRatio=current_ratios,
-                    years=years
-                )
+            response = build_financial_metrics(company_info.corp_name, raw_data["data"])
+            body = await self.service.save_response_snapshot(
+                company_info.corp_code, company_info.corp_name, snapshot_year, FINANCIAL_METRICS, response
             )
+            logger.info("재무제표 조회 성공 - 회사: %s, 연도: %s", company_name, year)
+            return Response(content=body, media_type="application/json")
         except ValueError as e:
             # 회사명 관련 오류
             error_message = str(e)
-            logger.error(f"회사명 관련 오류: {error_message}")
+            logger.error("회사명 관련 오류: %s", error_message)
             raise HTTPException(status_code=400, detail=error_message)
         except Exception as e:
             # 기타 오류
             error_message = str(e)
-            logger.error(f"기타 오류: {error_message}")
+            logger.error("기타 오류: %s", error_message)
             raise HTTPException(status_code=500, detail=error_message)
 
+    @traced()
     async def get_financial_ratios(
         self, 
         company_name: str = Query(..., description="회사명"),
-        year: Optional[int] = Query(None, description="조회할 연도. 지정하지 않으면 직전 연도의 데이터를 조회")
+        year: Optional[int] = Query(None, description="조회할 연도. 지정하지 않으면 직전 연도의 데이터를 조회"),
+        reprt_code: str = Query("11011", description="보고서 코드 (11011: 사업, 11012: 반기, 11013: 1분기, 11014: 3분기)")
     ):
         """회사명으로 재무비율을 조회합니다.
         
         Args:
             company_name: 회사명
             year: 조회할 연도. None이면 직전 연도의 데이터를 조회
+            reprt_code: 보고서 코드. 분기/반기 재무비율의 ROE/ROA는 TTM 순이익 기준
         """
-        logger.info(f"재무비율 조회 요청 - 회사: {company_name}, 연도: {year}")
+        logger.info("재무비율 조회 요청 - 회사: %s, 연도: %s, 보고서: %s", company_name, year, reprt_code)
         try:
-            # 회사 코드 조회 (fin_data 테이블에서)
-            company_query = text("""
-                SELECT DISTINCT corp_code FROM fin_data WHERE corp_name = :company_name
-            """)
-            company_result = await self.db_session.execute(company_query, {"company_name": company_name})
-            company_row = company_result.fetchone()
+            # 회사명 보정(표기 차이, 오타) 후에는 확인된 회사 코드/회사명만 사용
+            company_info = await self.service.get_company_info(company_name)
+            corp_code = company_info.corp_code
+            logger.info("회사 코드: %s", corp_code)
+
+            # 미리 직렬화된 응답이 있으면 그대로 반환
+            snapshot_year = year_key(year)
+            response_type = ratios_response_type(reprt_code)
+            body = await self.service.get_response_snapshot(corp_code, snapshot_year, response_type)
+            if body is not None:
+                return Response(content=body, media_type="application/json")
+            
+            # 재무비율 데이터 가져오기 (한글 필드명 사용, 컬럼은 레지스트리의 저장 대상 지표)
+            # 연도가 지정되지 않았으면 최신 연도의 데이터만 조회
+            columns = ratio_columns()
+            year_filter = str(year) if year is not None else None
+            rows = await get_stored_ratios(self.db_session, corp_code, reprt_code, columns, year_filter)
             
-            if not company_row:
-                logger.warning(f"회사명 '{company_name}'에 해당하는 회사 코드를 찾을 수 없습니다.")
-                # 회사 정보가 없으면 DART API에서 데이터를 가져옴
+            # 저장된 데이터가 없으면 DART API에서 가져옴
+            if not rows:
+                logger.info("저장된 재무비율이 없어 DART API에서 가져옵니다 - 회사: %s, 연도: %s", company_info.corp_name, year)
                 data = await self.service.fetch_and_save_financial_data(
-                    company_name=company_name,
+                    company_info=company_info,
                     year=year
                 )
-                if data["status"] == "error":
-                    logger.warning(f"재무제표 데이터 조회 실패 - 회사: {company_name}")
-                    return {
-                        "status": "success",
-                        "message": "재무비율이 성공적으로 조회되었습니다.",
-                        "data": []
-                    }
-                # 데이터를 가져온 후 다시 회사 코드 조회
-                company_result = await self.db_session.execute(company_query, {"company_name": company_name})
-                company_row = company_result.fetchone()
-                if not company_row:
-                    logger.warning(f"회사 코드를 찾을 수 없습니다 - 회사: {company_name}")
-                    return {
-                        "status": "success",
-                        "message": "재무비율이 성공적으로 조회되었습니다.",
-                        "data": []
-                    }
+                if data["status"] == "success":
+                    # 데이터를 가져온 후 다시 조회
+                    rows = await get_stored_ratios(self.db_session, corp_code, reprt_code, columns, year_filter)
+                else:
+                    logger.warning("재무제표 데이터 조회 실패 - 회사: %s", company_info.corp_name)
             
-            corp_code = company_row[0]
-            logger.info(f"회사 코드: {corp_code}")
+            response = build_ratios(rows)
+            logger.info("조회된 재무비율 수: %s", len(response['data']))
+            if not rows:
+                return response
             
-            # 재무비율 데이터 가져오기 (한글 필드명 사용)
-            ratios_query = text("""
-                SELECT 
-                    bsns_year as "사업연도",
-                    ROUND(debt_ratio, 2) as "부채비율",
-                    ROUND(current_ratio, 2) as "유동비율",
-                    ROUND(interest_coverage_ratio, 2) as "이자보상배율",
-                    ROUND(operating_profit_ratio, 2) as "영업이익률",
-                    ROUND(net_profit_ratio, 2) as "순이익률",
-                    ROUND(roe, 2) as "ROE",
-                    ROUND(roa, 2) as "ROA",
-                    ROUND(debt_dependency, 2) as "부채의존도",
-                    ROUND(cash_flow_debt_ratio, 2) as "현금흐름부채비율",
-                    ROUND(sales_growth, 2) as "매출액증가율",
-                    ROUND(operating_profit_growth, 2) as "영업이익증가율",
-                    ROUND(eps_growth, 2) as "EPS증가율"
-                FROM fin_data 
-                WHERE corp_code = :corp_code
-                AND (
-                    debt_ratio IS NOT NULL OR
-                    current_ratio IS NOT NULL OR
-                    interest_coverage_ratio IS NOT NULL OR
-                    operating_profit_ratio IS NOT NULL OR
-                    net_profit_ratio IS NOT NULL OR
-                    roe IS NOT NULL OR
-                    roa IS NOT NULL OR
-                    debt_dependency IS NOT NULL OR
-                    cash_flow_debt_ratio IS NOT NULL OR
-                    sales_growth IS NOT NULL OR
-                    operating_profit_growth IS NOT NULL OR
-                    eps_growth IS NOT NULL
-                )
-            """)
-            
-            if year is not None:
-                ratios_query = text(str(ratios_query) + " AND bsns_year = :year")
-                ratios_result = await self.db_session.execute(ratios_query, {"corp_code": corp_code, "year": str(year)})
-                
-                # 해당 연도의 데이터가 없으면 DART API에서 가져옴
-                if ratios_result.rowcount == 0:
-                    logger.info(f"해당 연도({year})의 데이터가 없어 DART API에서 가져옵니다.")
-                    data = await self.service.fetch_and_save_financial_data(
-                        company_name=company_name,
-                        year=year
-                    )
-                    if data["status"] == "success":
-                        # 데이터를 가져온 후 다시 조회
-                        ratios_result = await self.db_session.execute(ratios_query, {"corp_code": corp_code, "year": str(year)})
-            else:
-                # 연도가 지정되지 않았으면 최신 연도의 데이터만 조회
-                ratios_query = text(str(ratios_query) + " AND bsns_year = (SELECT MAX(bsns_year) FROM fin_data WHERE corp_code = :corp_code)")
-                ratios_result = await self.db_session.execute(ratios_query, {"corp_code": corp_code})
-            
-            # 결과를 딕셔너리로 변환
-            ratios = []
-            for row in ratios_result:
-                ratio_dict = {
-                    "사업연도": row[0],
-                    "부채비율": row[1],
-                    "유동비율": row[2],
-                    "이자보상배율": row[3],
-                    "영업이익률": row[4],
-                    "순이익률": row[5],
-                    "ROE": row[6],
-                    "ROA": row[7],
-                    "부채의존도": row[8],
-                    "현금흐름부채비율": row[9],
-                    "매출액증가율": row[10],
-                    "영업이익증가율": row[11],
-                    "EPS증가율": row[12]
-                }
-                # null이 아닌 값만 포함
-                ratio_dict = {k: v for k, v in ratio_dict.items() if v is not None}
-                ratios.append(ratio_dict)
-                
-            logger.info(f"조회된 재무비율 수: {len(ratios)}")
-            
-            return {
-                "status": "success",
-                "message": "재무비율이 성공적으로 조회되었습니다.",
-                "data": ratios
-            }
+            body = await self.service.save_response_snapshot(
+                corp_code, company_info.corp_name, snapshot_year, response_type, response
+            )
+            return Response(content=body, media_type="application/json")
         except ValueError as e:
             # 회사명 관련 오류
             error_message = str(e)
-            logger.error(f"회사명 관련 오류: {error_message}")
+            logger.error("회사명 관련 오류: %s", error_message)
             raise HTTPException(status_code=400, detail=error_message)
         except Exception as e:
             # 기타 오류
             error_message = str(e)
-            logger.error(f"기타 오류: {error_message}")
-            raise HTTPException(status_code=500, detail=error_message)
\ No newline at end of file
+            logger.error("기타 오류: %s", error_message)
+            raise HTTPException(status_code=500, detail=error_message)
+
+    @traced()
+    async def search_companies(self, query: str, limit: int = 10):
+        """회사명 자동완성/유사 검색 후보를 조회합니다."""
+        try:
+            return {
+                "status": "success",
+                "data": await self.service.search_companies(query, limit)
+            }
+        except Exception as e:
+            error_message = str(e)
+            logger.error("회사명 검색 오류: %s", error_message)
+            raise HTTPException(status_code=500, detail=error_message)
+
+    @traced()
+    async def sync_disclosures(self):
+        """DART 공시목록 기준으로 신규/정정 정기보고서를 증분 동기화합니다."""
+        logger.info("공시목록 증분 동기화 요청")
+        try:
+            return await self.service.sync_disclosures()
+        except Exception as e:
+            error_message = str(e)
+            logger.error("공시목록 동기화 오류: %s", error_message)
+            raise HTTPException(status_code=500, detail=error_message)
+
+    async def enqueue_ingestion(self, request: IngestJobRequest) -> JobStatusResponse:
+        """재무제표 수집 작업을 등록합니다."""
+        logger.info("수집 작업 등록 요청 - 회사: %s, 연도: %s", request.company_name, request.year)
+        try:
+            job = await self.service.enqueue_ingestion(
+                company_name=request.company_name,
+                year=request.year,
+                reprt_code=request.reprt_code,
+                priority=request.priority,
+                full_statement=request.full_statement
+            )
+            return JobStatusResponse(**job)
+        except Exception as e:
+            error_message = str(e)
+            logger.error("작업 등록 오류: %s", error_message)
+            raise HTTPException(status_code=500, detail=error_message)
+
+    async def enqueue_ratio_recomputation(self, request: RatioJobRequest) -> JobStatusResponse:
+        """재무비율 재계산 작업을 등록합니다."""
+        logger.info("재무비율 재계산 작업 등록 요청 - 회사 코드: %s, 연도: %s", request.corp_code, request.bsns_year)
+        try:
+            job = await self.service.enqueue_ratio_recomputation(
+                corp_code=request.corp_code,
+                corp_name=request.corp_name,
+                bsns_year=request.bsns_year,
+                reprt_code=request.reprt_code,
+                priority=request.priority
+            )
+            return JobStatusResponse(**job)
+        except Exception as e:
+            error_message = str(e)
+            logger.error("작업 등록 오류: %s", error_message)
+            raise HTTPException(status_code=500, detail=error_message)
+
+    async def get_job(self, job_id: int) -> JobStatusResponse:
+        """작업 상태를 조회합니다."""
+        job = await self.service.get_job(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail=f"작업을 찾을 수 없습니다: {job_id}")
+        return JobStatusResponse(**job)
+
+    async def get_ratio_metrics(self):
+        """재무비율 레지스트리의 지표 정의와 지표별 평가 시간을 조회합니다."""
+        timings = RATIO_EVALUATOR.timing_stats()
+        return {
+            "status": "success",
+            "data": [
+                {
+                    "name": definition.name,
+                    "label": definition.label,
+                    "kind": definition.kind,
+                    "unit": definition.unit,
+                    "zero_policy": definition.zero_policy,
+                    "stored": definition.stored,
+                    "inputs": [
+                        {"sj_div": sj_div, "account_nm": account_nm, "year_offset": offset}
+                        for sj_div, account_nm, offset in definition.dependencies()
+                    ],
+                    "timing": timings[name]
+                }
+                for name, definition in RATIO_EVALUATOR.definitions.items()
+            ]
+        }
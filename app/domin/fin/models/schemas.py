@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from typing import List, Optional
 from datetime import datetime
 
@@ -42,9 +42,11 @@ class RawFinancialStatement(BaseModel):
     corp_code: str                   # 회사 코드
     sj_div: str                      # 재무제표 구분    
     sj_nm: str                       # 재무제표명
+    account_id: Optional[str] = None # 표준계정코드 (전체 재무제표 API에서만 제공)
     account_nm: str                  # 계정명
     thstrm_nm: str                   # 당기명
     thstrm_amount: str               # 당기금액
+    thstrm_add_amount: Optional[str] = None  # 당기누적금액 (분기/반기 보고서)
     frmtrm_nm: str                   # 전기명
     frmtrm_amount: str               # 전기금액
     bfefrmtrm_nm: str               # 전전기명
@@ -52,6 +54,9 @@ class RawFinancialStatement(BaseModel):
     ord: int                        # 계정과목 정렬순서
     currency: str                   # 통화 단위
 
+# 재무제표 목록을 한 번에 검증하는 어댑터
+RAW_STATEMENT_LIST = TypeAdapter(List[RawFinancialStatement])
+
 class CompanyInfo(BaseModel):
     """DART에서 제공하는 회사 기본 정보"""
     corp_code: str          # 회사 코드
@@ -59,6 +64,39 @@ class CompanyInfo(BaseModel):
     stock_code: str        # 주식 코드
     modify_date: str       # 최종 수정일 
 
+class Disclosure(BaseModel):
+    """DART 공시검색(list.json) 결과 항목"""
+    corp_code: str          # 회사 코드
+    corp_name: str          # 회사명
+    stock_code: str = ""    # 주식 코드
+    corp_cls: str = ""      # 법인구분 (Y: 유가, K: 코스닥, N: 코넥스, E: 기타)
+    report_nm: str          # 보고서명 (예: [기재정정]사업보고서 (2023.12))
+    rcept_no: str           # 접수번호
+    flr_nm: str = ""        # 공시 제출인명
+    rcept_dt: str           # 접수일자 (YYYYMMDD)
+    rm: str = ""            # 비고
+
+class DisclosureListResponse(BaseModel):
+    """DART 공시검색(list.json) 응답 구조"""
+    status: str
+    message: str
+    page_no: int = 1
+    page_count: int = 0
+    total_count: int = 0
+    total_page: int = 0
+    list: List[Disclosure] = []
+
+class SyncTarget(BaseModel):
+    """증분 동기화로 수집 대상이 된 정기보고서"""
+    corp_code: str          # 회사 코드
+    corp_name: str          # 회사명
+    stock_code: str = ""    # 주식 코드
+    bsns_year: str          # 사업연도
+    reprt_code: str         # 보고서 코드
+    rcept_no: str           # 최신 접수번호
+    rcept_dt: str           # 접수일자
+    amended: bool = False   # 정정 공시 여부
+
 class StockInfo(BaseModel):
     """주식 발행정보"""
     istc_totqy: int        # 발행한 주식의 총수
@@ -68,6 +106,39 @@ class StockInfo(BaseModel):
 class CompanyNameRequest(BaseModel):
     company_name: str
 
+class IngestJobRequest(BaseModel):
+    """재무제표 수집 작업 요청"""
+    company_name: str
+    year: Optional[int] = None
+    reprt_code: str = "11011"
+    full_statement: bool = False             # 전체 재무제표(모든 계정과목) 수집 여부
+    priority: int = 0
+
+class RatioJobRequest(BaseModel):
+    """재무비율 재계산 작업 요청"""
+    corp_code: str
+    corp_name: str
+    bsns_year: str
+    reprt_code: str = "11011"
+    priority: int = 0
+
+class JobStatusResponse(BaseModel):
+    """작업 상태"""
+    id: int
+    job_type: str
+    status: str                              # queued, running, succeeded, failed
+    priority: int
+    attempts: int
+    max_attempts: int
+    progress: float
+    progress_message: Optional[str] = None
+    result: Optional[dict] = None
+    error: Optional[str] = None
+    deduplicated: bool = False
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
 class FinancialMetrics(BaseModel):
     operatingMargin: List[float]
     netMargin: List[float]
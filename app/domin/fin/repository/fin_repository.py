@@ -1,7 +1,9 @@
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
+
+from app.foundation.infra.metrics.storage import ROWS_INGESTED
 
 logger = logging.getLogger(__name__)
 
@@ -38,45 +40,60 @@ async def delete_financial_statements(
     
     await db_session.commit()
 
+async def delete_period_statements(
+    db_session: AsyncSession,
+    corp_code: str,
+    bsns_year: str,
+    reprt_code: str
+) -> None:
+    """특정 보고서 기간의 재무제표 데이터를 삭제합니다. (정정 공시 재수집용)
+    
+    Args:
+        db_session: 데이터베이스 세션
+        corp_code: 회사 코드
+        bsns_year: 사업연도
+        reprt_code: 보고서 코드
+    """
+    query = text("""
+        DELETE FROM fin_data 
+        WHERE corp_code = :corp_code 
+        AND bsns_year = :bsns_year
+        AND reprt_code = :reprt_code
+        AND sj_div NOT IN ('RATIO', 'TTM')
+    """)
+    await db_session.execute(query, {"corp_code": corp_code, "bsns_year": bsns_year, "reprt_code": reprt_code})
+
 async def insert_financial_statement(db_session: AsyncSession, data: Dict[str, Any]) -> None:
     """재무제표 데이터를 저장합니다."""
     query = text("""
         INSERT INTO fin_data (
-            corp_code, corp_name, stock_code, bsns_year, sj_div, sj_nm, 
-            account_nm, thstrm_amount, frmtrm_amount, bfefrmtrm_amount, ord
+            corp_code, corp_name, stock_code, rcept_no, reprt_code, bsns_year, sj_div, sj_nm, 
+            account_nm, canonical_account, thstrm_nm, thstrm_amount, thstrm_add_amount, frmtrm_nm, frmtrm_amount,
+            bfefrmtrm_nm, bfefrmtrm_amount, ord, currency
         ) VALUES (
-            :corp_code, :corp_name, :stock_code, :bsns_year, :sj_div, :sj_nm,
-            :account_nm, :thstrm_amount, :frmtrm_amount, :bfefrmtrm_amount, :ord
+            :corp_code, :corp_name, :stock_code, :rcept_no, :reprt_code, :bsns_year, :sj_div, :sj_nm,
+            :account_nm, :canonical_account, :thstrm_nm, :thstrm_amount, :thstrm_add_amount, :frmtrm_nm, :frmtrm_amount,
+            :bfefrmtrm_nm, :bfefrmtrm_amount, :ord, :currency
         )
     """)
     await db_session.execute(query, data)
     await db_session.commit()
 
-async def get_statement_summary(db_session: AsyncSession) -> List[Dict[str, Any]]:
-    """회사별 재무제표 종류와 데이터 수를 조회합니다."""
-    query = text("""
-        SELECT corp_code, corp_name, sj_div, sj_nm, COUNT(*) as count
-        FROM fin_data
-        GROUP BY corp_code, corp_name, sj_div, sj_nm
-        ORDER BY corp_code, sj_div
-    """)
-    result = await db_session.execute(query)
-    return [dict(row) for row in result]
-
 async def get_key_financial_items(db_session: AsyncSession) -> List[Dict[str, Any]]:
     """주요 재무 항목을 조회합니다."""
     query = text("""
         SELECT 
             corp_code, corp_name, bsns_year, sj_div, sj_nm,
-            account_nm, thstrm_amount, frmtrm_amount, bfefrmtrm_amount
+            account_nm, canonical_account, thstrm_amount, frmtrm_amount, bfefrmtrm_amount
         FROM fin_data
-        WHERE account_nm IN (
-            '자산총계', '부채총계', '자본총계', '유동자산', '유동부채',
-            '매출액', '영업이익', '당기순이익', '영업활동현금흐름'
-        )
+        WHERE canonical_account = ANY(:accounts)
+        AND sj_div IN ('BS', 'IS', 'CF')
         ORDER BY corp_code, bsns_year DESC, sj_div, account_nm
     """)
-    result = await db_session.execute(query)
+    result = await db_session.execute(query, {"accounts": [
+        '자산총계', '부채총계', '자본총계', '유동자산', '유동부채',
+        '매출액', '영업이익', '당기순이익', '영업활동현금흐름'
+    ]})
     return [dict(row) for row in result]
 
 async def get_company_by_name(db_session: AsyncSession, company_name: str) -> Optional[Dict[str, Any]]:
@@ -110,48 +127,44 @@ async def get_financial_statements_by_corp_code(db_session: AsyncSession, corp_c
     result = await db_session.execute(query, {"corp_code": corp_code})
     return [dict(row) for row in result]
 
-async def save_financial_statements(db_session: AsyncSession, statements: List[Dict[str, Any]]) -> None:
-    """재무제표 데이터를 저장합니다."""
-    try:
-        for statement in statements:
-            await insert_financial_statement(db_session, statement)
-    except Exception as e:
-        logger.error(f"Error saving financial statements: {e}")
-        raise
-
-async def save_financial_ratios(db_session: AsyncSession, ratios: Dict[str, Any]) -> None:
-    """재무비율을 저장합니다."""
+async def bulk_save_financial_statements(db_session: AsyncSession, statements: List[Dict[str, Any]]) -> int:
+    """재무제표 데이터를 한 번의 executemany로 일괄 저장합니다.
+    
+    이미 존재하는 (회사, 연도, 보고서, 재무제표 구분, 계정과목) 행은 갱신하므로
+    대량 수집이 중단된 뒤 다시 실행해도 안전합니다. 같은 계정명이 여러 번 나오면
+    deduplicate_statements와 같이 정렬순서(ord)가 가장 작은 행을 남깁니다.
+    커밋은 호출자가 담당합니다.
+    
+    Returns:
+        저장한 행 수
+    """
+    if not statements:
+        return 0
     query = text("""
         INSERT INTO fin_data (
-            corp_code, corp_name, bsns_year,
-            debt_ratio, current_ratio, interest_coverage_ratio,
-            operating_profit_ratio, net_profit_ratio, roe, roa,
-            debt_dependency, cash_flow_debt_ratio,
-            sales_growth, operating_profit_growth, eps_growth
+            corp_code, corp_name, stock_code, rcept_no, reprt_code, bsns_year, sj_div, sj_nm,
+            account_nm, canonical_account, thstrm_nm, thstrm_amount, thstrm_add_amount, frmtrm_nm, frmtrm_amount,
+            bfefrmtrm_nm, bfefrmtrm_amount, ord, currency
         ) VALUES (
-            :corp_code, :corp_name, :bsns_year,
-            :debt_ratio, :current_ratio, :interest_coverage_ratio,
-            :operating_profit_ratio, :net_profit_ratio, :roe, :roa,
-            :debt_dependency, :cash_flow_debt_ratio,
-            :sales_growth, :operating_profit_growth, :eps_growth
+            :corp_code, :corp_name, :stock_code, :rcept_no, :reprt_code, :bsns_year, :sj_div, :sj_nm,
+            :account_nm, :canonical_account, :thstrm_nm, :thstrm_amount, :thstrm_add_amount, :frmtrm_nm, :frmtrm_amount,
+            :bfefrmtrm_nm, :bfefrmtrm_amount, :ord, :currency
         )
-        ON CONFLICT (corp_code, bsns_year) 
+        ON CONFLICT (corp_code, bsns_year, reprt_code, sj_div, account_nm)
         DO UPDATE SET
-            debt_ratio = EXCLUDED.debt_ratio,
-            current_ratio = EXCLUDED.current_ratio,
-            interest_coverage_ratio = EXCLUDED.interest_coverage_ratio,
-            operating_profit_ratio = EXCLUDED.operating_profit_ratio,
-            net_profit_ratio = EXCLUDED.net_profit_ratio,
-            roe = EXCLUDED.roe,
-            roa = EXCLUDED.roa,
-            debt_dependency = EXCLUDED.debt_dependency,
-            cash_flow_debt_ratio = EXCLUDED.cash_flow_debt_ratio,
-            sales_growth = EXCLUDED.sales_growth,
-            operating_profit_growth = EXCLUDED.operating_profit_growth,
-            eps_growth = EXCLUDED.eps_growth
-    """)
-    await db_session.execute(query, ratios)
-    await db_session.commit()
+            rcept_no = EXCLUDED.rcept_no,
+            canonical_account = EXCLUDED.canonical_account,
+            thstrm_amount = EXCLUDED.thstrm_amount,
+            thstrm_add_amount = EXCLUDED.thstrm_add_amount,
+            frmtrm_amount = EXCLUDED.frmtrm_amount,
+            bfefrmtrm_amount = EXCLUDED.bfefrmtrm_amount,
+            ord = EXCLUDED.ord,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE fin_data.ord IS NULL OR EXCLUDED.ord <= fin_data.ord
+    """)
+    await db_session.execute(query, statements)
+    ROWS_INGESTED.inc(len(statements))
+    return len(statements)
 
 async def get_financial_statements(db_session: AsyncSession, corp_code: str, bsns_year: str) -> List[Dict[str, Any]]:
     """회사 코드와 사업연도로 재무제표 데이터를 조회합니다."""
@@ -181,4 +194,336 @@ async def get_financial_statements(db_session: AsyncSession, corp_code: str, bsn
     """)
     result = await db_session.execute(query, {"corp_code": corp_code, "bsns_year": bsns_year})
     rows = result.fetchall()
-    return [dict(zip(result.keys(), row)) for row in rows]
\ No newline at end of file
+    return [dict(zip(result.keys(), row)) for row in rows]
+
+async def get_flow_amounts(
+    db_session: AsyncSession,
+    corp_code: str,
+    years: List[str],
+    accounts: List[str]
+) -> List[Dict[str, Any]]:
+    """여러 연도/보고서의 손익계산서 금액(당기, 당기누적)과 저장된 TTM 금액을 표준 계정 기준으로 조회합니다."""
+    query = text("""
+        SELECT bsns_year, reprt_code, sj_div, canonical_account AS account_nm, thstrm_amount, thstrm_add_amount
+        FROM fin_data
+        WHERE corp_code = :corp_code
+        AND bsns_year = ANY(:years)
+        AND sj_div IN ('IS', 'TTM')
+        AND canonical_account = ANY(:accounts)
+        -- 같은 표준 계정의 행이 여러 개면 정렬순서가 가장 앞선 행이 마지막에 와서 우선함
+        ORDER BY ord DESC NULLS FIRST
+    """)
+    result = await db_session.execute(query, {"corp_code": corp_code, "years": years, "accounts": accounts})
+    return [dict(zip(result.keys(), row)) for row in result.fetchall()]
+
+async def replace_ttm_amounts(
+    db_session: AsyncSession,
+    corp_code: str,
+    corp_name: str,
+    bsns_year: str,
+    reprt_code: str,
+    amounts: Dict[str, float]
+) -> None:
+    """특정 기간의 최근 4분기 합계(TTM) 행을 교체합니다."""
+    delete_query = text("""
+        DELETE FROM fin_data
+        WHERE corp_code = :corp_code
+        AND bsns_year = :bsns_year
+        AND reprt_code = :reprt_code
+        AND sj_div = 'TTM'
+    """)
+    await db_session.execute(delete_query, {"corp_code": corp_code, "bsns_year": bsns_year, "reprt_code": reprt_code})
+    if not amounts:
+        return
+
+    insert_query = text("""
+        INSERT INTO fin_data (
+            corp_code, corp_name, bsns_year, reprt_code, sj_div, sj_nm, account_nm, canonical_account, thstrm_amount
+        ) VALUES (
+            :corp_code, :corp_name, :bsns_year, :reprt_code, 'TTM', '최근 4분기 합계', :account_nm, :account_nm, :amount
+        )
+    """)
+    await db_session.execute(insert_query, [
+        {
+            "corp_code": corp_code,
+            "corp_name": corp_name,
+            "bsns_year": bsns_year,
+            "reprt_code": reprt_code,
+            "account_nm": account_nm,
+            "amount": amount
+        }
+        for account_nm, amount in amounts.items()
+    ])
+
+async def get_ratio_inputs(
+    db_session: AsyncSession,
+    corp_code: str,
+    years: List[str],
+    reprt_codes: List[str],
+    accounts: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    """재무비율 계산에 쓰이는 재무상태표/손익계산서/현금흐름표/TTM 금액을 여러 기간에 걸쳐 한 번에 조회합니다.
+
+    표준 계정이 매핑된 행만 조회하며 account_nm에는 표준 계정명을 돌려줍니다.
+    """
+    query = """
+        SELECT bsns_year, reprt_code, sj_div, canonical_account AS account_nm,
+               thstrm_amount, thstrm_add_amount, frmtrm_amount, bfefrmtrm_amount
+        FROM fin_data
+        WHERE corp_code = :corp_code
+        AND bsns_year = ANY(:years)
+        AND reprt_code = ANY(:reprt_codes)
+        AND sj_div IN ('BS', 'IS', 'CF', 'TTM')
+        AND canonical_account IS NOT NULL
+    """
+    params = {"corp_code": corp_code, "years": years, "reprt_codes": reprt_codes}
+    if accounts is not None:
+        query += " AND canonical_account = ANY(:accounts)"
+        params["accounts"] = accounts
+    result = await db_session.execute(text(query + " ORDER BY sj_div, ord"), params)
+    return [dict(zip(result.keys(), row)) for row in result.fetchall()]
+
+async def save_ratio_cells(
+    db_session: AsyncSession,
+    corp_code: str,
+    corp_name: str,
+    bsns_year: str,
+    reprt_code: str,
+    values: Dict[str, Optional[float]]
+) -> None:
+    """재무비율 행에서 지정한 컬럼만 갱신합니다. 행이 없으면 새로 만듭니다.
+
+    values의 키는 호출하는 쪽에서 검증된 재무비율 컬럼명이어야 합니다.
+    """
+    if not values:
+        return
+    params = {
+        "corp_code": corp_code,
+        "corp_name": corp_name,
+        "bsns_year": bsns_year,
+        "reprt_code": reprt_code,
+        **values
+    }
+    assignments = ", ".join(f"{column} = :{column}" for column in values)
+    update_query = text(f"""
+        UPDATE fin_data SET {assignments}, updated_at = CURRENT_TIMESTAMP
+        WHERE corp_code = :corp_code
+        AND bsns_year = :bsns_year
+        AND reprt_code = :reprt_code
+        AND sj_div = 'RATIO'
+    """)
+    result = await db_session.execute(update_query, params)
+    if result.rowcount:
+        return
+
+    columns = ", ".join(values)
+    placeholders = ", ".join(f":{column}" for column in values)
+    insert_query = text(f"""
+        INSERT INTO fin_data (
+            corp_code, corp_name, bsns_year, reprt_code, sj_div, sj_nm, {columns}
+        ) VALUES (
+            :corp_code, :corp_name, :bsns_year, :reprt_code, 'RATIO', '재무비율', {placeholders}
+        )
+    """)
+    await db_session.execute(insert_query, params)
+
+async def get_account_mappings(db_session: AsyncSession) -> List[Dict[str, Any]]:
+    """계정과목 매핑 테이블을 조회합니다."""
+    query = text("""
+        SELECT account_nm, account_id, canonical_account
+        FROM account_mapping
+        ORDER BY id
+    """)
+    result = await db_session.execute(query)
+    return [dict(zip(result.keys(), row)) for row in result.fetchall()]
+
+async def get_unmapped_accounts(db_session: AsyncSession, after_id: int, limit: int) -> List[Dict[str, Any]]:
+    """표준 계정이 비어 있는 재무제표 행을 id 순으로 조회합니다."""
+    query = text("""
+        SELECT id, account_nm
+        FROM fin_data
+        WHERE id > :after_id
+        AND canonical_account IS NULL
+        AND sj_div NOT IN ('RATIO', 'TTM')
+        ORDER BY id
+        LIMIT :limit
+    """)
+    result = await db_session.execute(query, {"after_id": after_id, "limit": limit})
+    return [dict(zip(result.keys(), row)) for row in result.fetchall()]
+
+async def update_canonical_accounts(db_session: AsyncSession, updates: List[Dict[str, Any]]) -> None:
+    """행별 표준 계정을 일괄 갱신합니다. updates: [{"id": ..., "canonical_account": ...}]"""
+    if not updates:
+        return
+    query = text("UPDATE fin_data SET canonical_account = :canonical_account WHERE id = :id")
+    await db_session.execute(query, updates)
+
+async def get_company_statements(
+    db_session: AsyncSession,
+    corp_code: str,
+    year: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """회사 코드로 사업보고서 재무제표(재무비율/TTM 제외)를 조회합니다. year가 None이면 전체 연도"""
+    query = """
+        SELECT bsns_year, sj_div, sj_nm, account_nm, canonical_account,
+               thstrm_amount, frmtrm_amount, bfefrmtrm_amount
+        FROM fin_data
+        WHERE corp_code = :corp_code
+        AND reprt_code = '11011'
+        AND sj_div NOT IN ('RATIO', 'TTM')
+    """
+    params = {"corp_code": corp_code}
+    if year is not None:
+        query += " AND bsns_year = :year"
+        params["year"] = year
+    result = await db_session.execute(text(query + " ORDER BY bsns_year DESC, sj_div, ord"), params)
+    return [dict(zip(result.keys(), row)) for row in result.fetchall()]
+
+async def get_stored_ratios(
+    db_session: AsyncSession,
+    corp_code: str,
+    reprt_code: str,
+    columns: List[Tuple[str, str]],
+    year: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """저장된 재무비율을 (컬럼명, 한글 필드명) 목록의 필드명으로 조회합니다.
+
+    year가 None이면 최신 연도만 조회합니다. columns는 호출하는 쪽에서 검증된 재무비율 컬럼이어야 합니다.
+    값은 DB에서 float8로 변환하여 Decimal 없이 바로 직렬화할 수 있게 돌려줍니다.
+    """
+    select_list = ",\n".join(f'ROUND({column}, 2)::float8 as "{label}"' for column, label in columns)
+    not_null = " OR ".join(f"{column} IS NOT NULL" for column, _ in columns)
+    query = f"""
+        SELECT 
+            bsns_year as "사업연도",
+            {select_list}
+        FROM fin_data 
+        WHERE corp_code = :corp_code
+        AND reprt_code = :reprt_code
+        AND ({not_null})
+    """
+    params = {"corp_code": corp_code, "reprt_code": reprt_code}
+    if year is not None:
+        query += " AND bsns_year = :year"
+        params["year"] = year
+    else:
+        query += " AND bsns_year = (SELECT MAX(bsns_year) FROM fin_data WHERE corp_code = :corp_code AND reprt_code = :reprt_code)"
+    result = await db_session.execute(text(query), params)
+    return [dict(zip(result.keys(), row)) for row in result.fetchall()]
+
+async def get_response_snapshot(
+    db_session: AsyncSession,
+    corp_code: str,
+    bsns_year: str,
+    response_type: str
+) -> Optional[Dict[str, Any]]:
+    """회사 코드/연도/응답 종류로 응답 스냅샷을 조회합니다."""
+    query = text("""
+        SELECT corp_name, version, body
+        FROM response_snapshot
+        WHERE corp_code = :corp_code
+        AND bsns_year = :bsns_year
+        AND response_type = :response_type
+    """)
+    result = await db_session.execute(query, {
+        "corp_code": corp_code,
+        "bsns_year": bsns_year,
+        "response_type": response_type
+    })
+    row = result.fetchone()
+    if row is None:
+        return None
+    return dict(zip(result.keys(), row))
+
+async def save_response_snapshot(
+    db_session: AsyncSession,
+    corp_code: str,
+    corp_name: str,
+    bsns_year: str,
+    response_type: str,
+    version: int,
+    body: bytes
+) -> None:
+    """응답 스냅샷을 저장합니다. 커밋은 호출하는 쪽에서 합니다."""
+    query = text("""
+        INSERT INTO response_snapshot (
+            corp_code, corp_name, bsns_year, response_type, version, body
+        ) VALUES (
+            :corp_code, :corp_name, :bsns_year, :response_type, :version, :body
+        )
+        ON CONFLICT (corp_code, bsns_year, response_type) DO UPDATE SET
+            corp_name = EXCLUDED.corp_name,
+            version = EXCLUDED.version,
+            body = EXCLUDED.body,
+            updated_at = CURRENT_TIMESTAMP
+    """)
+    await db_session.execute(query, {
+        "corp_code": corp_code,
+        "corp_name": corp_name,
+        "bsns_year": bsns_year,
+        "response_type": response_type,
+        "version": version,
+        "body": body
+    })
+
+async def delete_response_snapshot(
+    db_session: AsyncSession,
+    corp_code: str,
+    bsns_year: str,
+    response_type: str
+) -> None:
+    """응답 스냅샷을 삭제합니다. 다음 조회 시 다시 생성됩니다. 커밋은 호출하는 쪽에서 합니다."""
+    query = text("""
+        DELETE FROM response_snapshot
+        WHERE corp_code = :corp_code
+        AND bsns_year = :bsns_year
+        AND response_type = :response_type
+    """)
+    await db_session.execute(query, {
+        "corp_code": corp_code,
+        "bsns_year": bsns_year,
+        "response_type": response_type
+    })
+
+async def get_latest_years(db_session: AsyncSession, corp_code: str, reprt_codes: List[str]) -> Dict[str, str]:
+    """보고서 코드별로 저장된 가장 최근 사업연도를 조회합니다."""
+    query = text("""
+        SELECT reprt_code, MAX(bsns_year)
+        FROM fin_data
+        WHERE corp_code = :corp_code
+        AND reprt_code = ANY(:reprt_codes)
+        GROUP BY reprt_code
+    """)
+    result = await db_session.execute(query, {"corp_code": corp_code, "reprt_codes": list(reprt_codes)})
+    return {row[0]: row[1] for row in result.fetchall()}
+
+async def get_sync_state(db_session: AsyncSession, sync_name: str) -> Optional[Dict[str, Any]]:
+    """증분 동기화의 기준점(high-water mark)을 조회합니다."""
+    query = text("""
+        SELECT sync_name, last_rcept_dt, last_rcept_no, updated_at
+        FROM dart_sync_state
+        WHERE sync_name = :sync_name
+    """)
+    result = await db_session.execute(query, {"sync_name": sync_name})
+    row = result.fetchone()
+    if row:
+        return dict(zip(result.keys(), row))
+    return None
+
+async def save_sync_state(db_session: AsyncSession, sync_name: str, last_rcept_dt: str, last_rcept_no: str) -> None:
+    """증분 동기화의 기준점(high-water mark)을 저장합니다."""
+    query = text("""
+        INSERT INTO dart_sync_state (sync_name, last_rcept_dt, last_rcept_no, updated_at)
+        VALUES (:sync_name, :last_rcept_dt, :last_rcept_no, CURRENT_TIMESTAMP)
+        ON CONFLICT (sync_name)
+        DO UPDATE SET
+            last_rcept_dt = EXCLUDED.last_rcept_dt,
+            last_rcept_no = EXCLUDED.last_rcept_no,
+            updated_at = EXCLUDED.updated_at
+    """)
+    await db_session.execute(query, {
+        "sync_name": sync_name,
+        "last_rcept_dt": last_rcept_dt,
+        "last_rcept_no": last_rcept_no
+    })
+    await db_session.commit()
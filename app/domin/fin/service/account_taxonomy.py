@@ -0,0 +1,134 @@
+import re
+import logging
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domin.fin.repository.fin_repository import get_account_mappings
+
+logger = logging.getLogger(__name__)
+
+# 표준 계정 → 회사별로 다르게 공시되는 계정과목명
+DEFAULT_ACCOUNT_ALIASES: Dict[str, List[str]] = {
+    "매출액": ["매출액", "수익(매출액)", "매출", "매출수익", "영업수익", "매출 및 지분법손익"],
+    "영업이익": ["영업이익", "영업이익(손실)", "영업손익"],
+    "당기순이익": [
+        "당기순이익", "당기순이익(손실)", "당기순손익", "연결당기순이익",
+        "분기순이익", "분기순이익(손실)", "반기순이익", "반기순이익(손실)"
+    ],
+    "자산총계": ["자산총계", "자산 총계"],
+    "부채총계": ["부채총계", "부채 총계"],
+    "자본총계": ["자본총계", "자본 총계"],
+    "유동자산": ["유동자산"],
+    "유동부채": ["유동부채"],
+    "이자비용": ["이자비용", "이자비용(금융원가)"],
+    "영업활동현금흐름": ["영업활동현금흐름", "영업활동으로 인한 현금흐름", "영업활동 현금흐름"],
+    "기본주당이익": ["기본주당이익", "기본주당이익(손실)", "기본주당순이익", "기본주당순이익(손실)"],
+    "단기차입금": ["단기차입금"],
+    "장기차입금": ["장기차입금"],
+    "사채": ["사채"],
+    "유동성장기부채": ["유동성장기부채", "유동성장기차입금"]
+}
+
+# DART 전체 재무제표의 표준 계정코드(account_id) → 표준 계정
+DEFAULT_ACCOUNT_IDS: Dict[str, str] = {
+    "ifrs-full_Revenue": "매출액",
+    "ifrs_Revenue": "매출액",
+    "dart_OperatingIncomeLoss": "영업이익",
+    "ifrs-full_ProfitLoss": "당기순이익",
+    "ifrs_ProfitLoss": "당기순이익",
+    "ifrs-full_Assets": "자산총계",
+    "ifrs_Assets": "자산총계",
+    "ifrs-full_Liabilities": "부채총계",
+    "ifrs_Liabilities": "부채총계",
+    "ifrs-full_Equity": "자본총계",
+    "ifrs_Equity": "자본총계",
+    "ifrs-full_CurrentAssets": "유동자산",
+    "ifrs_CurrentAssets": "유동자산",
+    "ifrs-full_CurrentLiabilities": "유동부채",
+    "ifrs_CurrentLiabilities": "유동부채",
+    "ifrs-full_InterestExpense": "이자비용",
+    "ifrs-full_CashFlowsFromUsedInOperatingActivities": "영업활동현금흐름",
+    "ifrs_CashFlowsFromUsedInOperatingActivities": "영업활동현금흐름",
+    "ifrs-full_BasicEarningsLossPerShare": "기본주당이익",
+    "ifrs_BasicEarningsLossPerShare": "기본주당이익",
+    "ifrs-full_ShorttermBorrowings": "단기차입금",
+    "ifrs-full_LongtermBorrowings": "장기차입금",
+    "dart_BondsIssued": "사채",
+    "ifrs-full_CurrentPortionOfLongtermBorrowings": "유동성장기부채"
+}
+
+# 계정과목명 앞의 목차 번호 (예: "Ⅰ.", "1.", "(1)", "가.")
+_NUMBERING = re.compile(r"^(?:(?:[ⅠⅡⅢⅣⅤⅥⅦⅧⅨⅩ]+|[IVX]+|\d+|[가-하])[.)]|\(\d+\))\s*")
+_SPACES = re.compile(r"\s+")
+
+def normalize_account_name(account_nm: str) -> str:
+    """비교용 계정과목명: 전각/반각 통일, 목차 번호와 공백 제거"""
+    name = unicodedata.normalize("NFKC", account_nm).strip()
+    name = _NUMBERING.sub("", name)
+    return _SPACES.sub("", name)
+
+class AccountTaxonomy:
+    """정규화된 계정과목명/DART 계정코드 → 표준 계정 색인
+
+    수집 시 한 번 적용하여 표준 계정을 fin_data.canonical_account에 저장하므로
+    조회 시에는 문자열 목록 비교 대신 인덱스된 컬럼으로 필터링합니다.
+    """
+
+    def __init__(self, aliases: Dict[str, List[str]], account_ids: Dict[str, str]):
+        self._by_name: Dict[str, str] = {}
+        self._by_id: Dict[str, str] = {}
+        for canonical, names in aliases.items():
+            self.add_alias(canonical, canonical)
+            for name in names:
+                self.add_alias(name, canonical)
+        for account_id, canonical in account_ids.items():
+            self.add_account_id(account_id, canonical)
+
+    @property
+    def canonical_accounts(self) -> List[str]:
+        return sorted(set(self._by_name.values()) | set(self._by_id.values()))
+
+    def add_alias(self, account_nm: str, canonical: str) -> None:
+        self._by_name[normalize_account_name(account_nm)] = canonical
+
+    def add_account_id(self, account_id: str, canonical: str) -> None:
+        self._by_id[account_id] = canonical
+
+    def extend(self, mappings: Iterable[Tuple[Optional[str], Optional[str], str]]) -> int:
+        """(계정과목명, 계정코드, 표준 계정) 매핑을 추가합니다. 기본 매핑보다 우선합니다."""
+        count = 0
+        for account_nm, account_id, canonical in mappings:
+            if account_nm:
+                self.add_alias(account_nm, canonical)
+                count += 1
+            if account_id:
+                self.add_account_id(account_id, canonical)
+                count += 1
+        return count
+
+    def resolve(self, account_nm: str, account_id: Optional[str] = None) -> Optional[str]:
+        """표준 계정을 찾습니다. 계정코드가 있으면 우선하고, 매핑되지 않으면 None을 반환합니다."""
+        if account_id:
+            canonical = self._by_id.get(account_id)
+            if canonical is not None:
+                return canonical
+        return self._by_name.get(normalize_account_name(account_nm))
+
+# 애플리케이션 전역 계정 색인 (시작 시 account_mapping 테이블의 매핑이 추가됨)
+ACCOUNT_TAXONOMY = AccountTaxonomy(DEFAULT_ACCOUNT_ALIASES, DEFAULT_ACCOUNT_IDS)
+
+async def load_account_mappings(db_session: AsyncSession) -> int:
+    """account_mapping 테이블의 매핑을 전역 계정 색인에 추가합니다.
+
+    수집 전에(프로세스 풀 생성 전에) 호출해야 작업자 프로세스에도 반영됩니다.
+    """
+    try:
+        rows = await get_account_mappings(db_session)
+    except Exception as e:
+        logger.warning("계정과목 매핑 테이블을 읽지 못해 기본 매핑만 사용합니다: %s", e)
+        await db_session.rollback()
+        return 0
+    count = ACCOUNT_TAXONOMY.extend((row["account_nm"], row["account_id"], row["canonical_account"]) for row in rows)
+    logger.info("계정과목 매핑 로드 완료 - 추가 매핑 수: %s", count)
+    return count
@@ -0,0 +1,229 @@
+import os
+import time
+import asyncio
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Iterable, Optional, Set, Tuple
+
+
+from app.domin.fin.models.schemas import CompanyInfo
+from app.domin.fin.repository.fin_repository import bulk_save_financial_statements
+from app.domin.fin.service.dart_api_service import DartApiService, MULTI_COMPANY_BATCH, create_dart_session
+from app.domin.fin.service.financial_data_processor import parse_statement_items
+from app.domin.fin.service.ratio_recompute_service import RatioRecomputeService
+from app.foundation.infra.profiling.memory import track_allocations
+
+logger = logging.getLogger(__name__)
+
+class BackfillCheckpoint:
+    """완료된 (회사 코드, 연도)를 한 줄씩 기록하는 재시작용 체크포인트 파일"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.completed: Set[str] = set()
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.completed = {line.strip() for line in f if line.strip()}
+            logger.info("체크포인트 로드: %s, 완료된 작업 수: %s", path, len(self.completed))
+
+    @staticmethod
+    def key(corp_code: str, year: int, reprt_code: str = "11011") -> str:
+        # 사업보고서는 기존 체크포인트와 호환되도록 보고서 코드를 생략
+        if reprt_code == "11011":
+            return f"{corp_code}:{year}"
+        return f"{corp_code}:{year}:{reprt_code}"
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.completed
+
+    def mark(self, keys: Iterable[str]) -> None:
+        """작업 완료를 기록합니다. DB 커밋 이후에만 호출해야 합니다."""
+        keys = [key for key in keys if key not in self.completed]
+        if not keys:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("".join(f"{key}\n" for key in keys))
+            f.flush()
+            os.fsync(f.fileno())
+        self.completed.update(keys)
+
+class BackfillService:
+    """전체 시장 과거 재무제표를 병렬로 대량 수집합니다.
+
+    DART 조회는 제한된 수의 비동기 작업자로, 검증/변환은 프로세스 풀에서,
+    DB 저장은 배치 단위로 수행하며 커밋된 작업만 체크포인트에 기록합니다.
+    다중회사 모드에서는 연도별로 100개 회사씩 묶어 다중회사 주요계정 API를 한 번만 호출합니다.
+    """
+
+    def __init__(
+        self,
+        session_factory,
+        dart_api: Optional[DartApiService] = None,
+        concurrency: int = 4,
+        workers: Optional[int] = None,
+        batch_size: int = 5000,
+        checkpoint_path: str = "data/backfill.checkpoint",
+        reprt_code: str = "11011",
+        compute_ratios: bool = True,
+        report_interval: float = 10.0,
+        multi_company: bool = False
+    ):
+        self.session_factory = session_factory
+        self.dart_api = dart_api or DartApiService()
+        self.concurrency = concurrency
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.checkpoint = BackfillCheckpoint(checkpoint_path)
+        self.reprt_code = reprt_code
+        self.compute_ratios = compute_ratios
+        self.report_interval = report_interval
+        self.multi_company = multi_company
+
+        self._started_at = 0.0
+        self._done = 0
+        self._rows = 0
+        self._failed: List[Dict[str, Any]] = []
+
+    async def run(self, companies: List[CompanyInfo], years: Iterable[int]) -> Dict[str, Any]:
+        """회사 목록과 연도 범위에 대해 수집을 실행합니다."""
+        years = list(years)
+        pending = [
+            (company, year)
+            for company in companies
+            for year in years
+            if BackfillCheckpoint.key(company.corp_code, year, self.reprt_code) not in self.checkpoint
+        ]
+        total = len(companies) * len(years)
+        logger.info("대량 수집 시작 - 전체 작업: %s, 남은 작업: %s, 동시 요청: %s, 작업자 프로세스: %s", total, len(pending), self.concurrency, self.workers)
+
+        self._started_at = time.monotonic()
+        job_queue: asyncio.Queue = asyncio.Queue()
+        for job in self._group_jobs(pending):
+            job_queue.put_nowait(job)
+        # 저장이 밀리면 조회도 멈추도록 결과 큐 크기를 제한
+        result_queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 4)
+
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            async with create_dart_session() as http:
+                fetchers = [
+                    asyncio.create_task(self._fetch_worker(job_queue, result_queue, http, pool, loop))
+                    for _ in range(self.concurrency)
+                ]
+                fetching = asyncio.gather(*fetchers)
+                writer = asyncio.create_task(self._writer(result_queue))
+                reporter = asyncio.create_task(self._reporter(len(pending)))
+                try:
+                    # 저장이 실패하면 결과 큐가 비지 않아 조회 작업자가 put에서 멈추므로 함께 감시
+                    await asyncio.wait({fetching, writer}, return_when=asyncio.FIRST_COMPLETED)
+                    if writer.done():
+                        # 저장 작업자는 종료 신호(None)를 받기 전에는 끝나지 않으므로 먼저 끝났으면 실패한 것
+                        writer.result()
+                        raise RuntimeError("저장 작업자가 조회보다 먼저 종료되었습니다.")
+                    await fetching
+                    await result_queue.put(None)
+                    await writer
+                finally:
+                    reporter.cancel()
+                    fetching.cancel()
+                    writer.cancel()
+                    # 세션과 프로세스 풀을 닫기 전에 취소된 작업이 끝나기를 기다림
+                    await asyncio.gather(fetching, writer, reporter, return_exceptions=True)
+
+        self._report(len(pending))
+        return {
+            "status": "success" if not self._failed else "partial",
+            "total": total,
+            "processed": self._done,
+            "rows": self._rows,
+            "failed": self._failed
+        }
+
+    def _group_jobs(self, pending: List[Tuple[CompanyInfo, int]]) -> List[Tuple[List[CompanyInfo], int]]:
+        """남은 작업을 DART 요청 단위로 묶습니다. 단일 모드는 회사 하나, 다중회사 모드는 연도별 최대 100개 회사입니다."""
+        if not self.multi_company:
+            return [([company], year) for company, year in pending]
+
+        by_year: Dict[int, List[CompanyInfo]] = {}
+        for company, year in pending:
+            by_year.setdefault(year, []).append(company)
+        return [
+            (companies[start:start + MULTI_COMPANY_BATCH], year)
+            for year, companies in by_year.items()
+            for start in range(0, len(companies), MULTI_COMPANY_BATCH)
+        ]
+
+    async def _fetch_items(self, companies: List[CompanyInfo], year: int, http) -> Dict[str, List[dict]]:
+        if self.multi_company:
+            return await self.dart_api.fetch_multi_company_items(companies, year, self.reprt_code, session=http)
+        company = companies[0]
+        items = await self.dart_api.fetch_raw_statement_items(company.corp_code, year, self.reprt_code, session=http)
+        return {company.corp_code: items} if items else {}
+
+    async def _fetch_worker(self, job_queue, result_queue, http, pool, loop) -> None:
+        """DART에서 원본을 조회하고 프로세스 풀에서 검증/변환합니다."""
+        while True:
+            try:
+                companies, year = job_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                items_by_corp = await self._fetch_items(companies, year, http)
+                for company in companies:
+                    rows = []
+                    items = items_by_corp.get(company.corp_code)
+                    if items:
+                        rows = await loop.run_in_executor(pool, parse_statement_items, items, company.model_dump())
+                    await result_queue.put((company, year, rows))
+            except Exception as e:
+                for company in companies:
+                    logger.error("수집 실패 - 회사: %s(%s), 연도: %s, 오류: %s", company.corp_name, company.corp_code, year, e)
+                    self._failed.append({"corp_code": company.corp_code, "year": year, "error": str(e)})
+
+    async def _writer(self, result_queue) -> None:
+        """변환된 행을 배치 단위로 저장하고 체크포인트를 기록합니다."""
+        buffer: List[Dict[str, Any]] = []
+        keys: List[Tuple[CompanyInfo, int]] = []
+        while True:
+            result = await result_queue.get()
+            if result is None:
+                break
+            company, year, rows = result
+            buffer.extend(rows)
+            keys.append((company, year))
+            if len(buffer) >= self.batch_size:
+                await self._flush(buffer, keys)
+                buffer, keys = [], []
+        if keys:
+            await self._flush(buffer, keys)
+
+    async def _flush(self, rows: List[Dict[str, Any]], keys: List[Tuple[CompanyInfo, int]]) -> None:
+        with track_allocations("backfill.flush"):
+            async with self.session_factory() as session:
+                await bulk_save_financial_statements(session, rows)
+                await session.commit()
+
+                if self.compute_ratios:
+                    recompute_service = RatioRecomputeService(session)
+                    years_with_data = {(row["corp_code"], row["bsns_year"]) for row in rows}
+                    corp_names = {company.corp_code: company.corp_name for company, _ in keys}
+                    for corp_code, bsns_year in sorted(years_with_data):
+                        await recompute_service.apply_changes(corp_code, corp_names[corp_code], bsns_year, self.reprt_code)
+
+        self.checkpoint.mark(BackfillCheckpoint.key(company.corp_code, year, self.reprt_code) for company, year in keys)
+        self._done += len(keys)
+        self._rows += len(rows)
+
+    async def _reporter(self, pending: int) -> None:
+        while True:
+            await asyncio.sleep(self.report_interval)
+            self._report(pending)
+
+    def _report(self, pending: int) -> None:
+        elapsed = max(time.monotonic() - self._started_at, 1e-9)
+        logger.info(
+            "진행 상황 - 완료: %s/%s, 실패: %s, 처리율: %.1f 회사-연도/분, %.1f 행/초", self._done, pending, len(self._failed), self._done / elapsed * 60, self._rows / elapsed
+        )
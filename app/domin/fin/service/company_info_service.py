@@ -1,59 +1,33 @@
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 import logging
-from datetime import datetime
-from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domin.fin.models.schemas import CompanyInfo
 from app.domin.fin.service.dart_api_service import DartApiService
+from app.foundation.infra.tracing.tracer import traced
 
 logger = logging.getLogger(__name__)
 
 class CompanyInfoService:
-    def __init__(self, db_session: AsyncSession):
+    def __init__(self, db_session: AsyncSession, dart_api: Optional[DartApiService] = None):
         self.db_session = db_session
-        self.dart_api = DartApiService()
+        self.dart_api = dart_api or DartApiService()
 
+    @traced()
     async def get_company_info(self, company_name: str) -> CompanyInfo:
-        """회사 정보를 조회합니다."""
+        """회사 정보를 조회합니다.
+
+        회사명은 공유 고유번호 인덱스(메모리 매핑)에서 찾고 표기 차이/오타는 검색 색인으로 보정합니다.
+        fin_data를 회사명으로 조회하지 않으므로 스냅샷 조회 경로에서도 DB를 읽지 않습니다.
+        """
         try:
-            # DB에서 먼저 조회
-            db_company = await self._get_company_from_db(company_name)
-            if db_company:
-                # 딕셔너리 키를 CompanyInfo 필드와 일치시킴
-                company_data = {
-                    "corp_code": db_company.get("corp_code", ""),
-                    "corp_name": db_company.get("corp_name", company_name),
-                    "stock_code": db_company.get("stock_code", ""),
-                    "modify_date": datetime.now().strftime("%Y%m%d")
-                }
-                try:
-                    return CompanyInfo(**company_data)
-                except Exception as e:
-                    logger.warning(f"DB 데이터로 CompanyInfo 생성 실패: {e}")
-            
-            # API에서 조회
             return await self.dart_api.fetch_company_info(company_name)
-            
         except Exception as e:
-            logger.error(f"회사 정보 조회 실패: {str(e)}")
+            logger.error("회사 정보 조회 실패: %s", e)
             raise
 
-    async def _get_company_from_db(self, company_name: str) -> Dict[str, Any]:
-        """DB에서 회사 정보를 조회합니다."""
-        query = text("""
-            SELECT corp_code, corp_name, stock_code 
-            FROM fin_data 
-            WHERE corp_name = :company_name 
-            LIMIT 1
-        """)
-        result = await self.db_session.execute(query, {"company_name": company_name})
-        row = result.fetchone()
-        
-        if row:
-            return {
-                "corp_code": row[0],
-                "corp_name": row[1],
-                "stock_code": row[2]
-            }
-        return None 
\ No newline at end of file
+    @traced()
+    async def search_companies(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """회사명 자동완성/유사 검색 후보를 조회합니다."""
+        matches = await self.dart_api.search_companies(query, limit)
+        return [match._asdict() for match in matches]
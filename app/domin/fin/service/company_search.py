@@ -0,0 +1,284 @@
+import re
+import heapq
+import logging
+import unicodedata
+from bisect import bisect_left, insort
+from collections import Counter
+from operator import itemgetter
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 회사명 비교 시 제거하는 법인 형태 표기 (NFKC 정규화 후 "㈜"는 "(주)"가 됨)
+_LEGAL_FORMS = re.compile(r"\((?:주|유|재|사|합|株)\)|주식회사|유한책임회사|유한회사|재단법인|사단법인")
+_NON_WORD = re.compile(r"[^0-9a-z가-힣ㄱ-ㆎ]+")
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = " ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"
+_CHOSEONG_SET = frozenset(_CHOSEONG)
+
+# 검색 결과 순위 조정
+PREFIX_SCAN_LIMIT = 30         # 접두어 일치로 가져올 최대 후보 수
+GRAM_CANDIDATES = 30           # 2-gram 공유 수로 고를 후보 수
+RERANK_CANDIDATES = 15         # 자모 단위 유사도로 다시 정렬할 후보 수
+POSTING_BUDGET = 2500          # 후보 생성 시 셀 역색인 항목 수 상한 (드문 n-gram부터 셈)
+RESOLVE_MIN_SCORE = 0.6        # 오타 보정으로 회사를 확정할 최소 점수
+RESOLVE_MIN_MARGIN = 0.1       # 확정하려면 2순위 후보와의 최소 점수 차이
+COMPACT_RATIO = 0.25           # 삭제 표시된 항목 비율이 이보다 크면 색인을 다시 만듦
+
+def normalize_company_name(name: str) -> str:
+    """비교용 회사명: 전각/반각 통일, 소문자, 법인 형태 표기와 공백/기호 제거"""
+    name = unicodedata.normalize("NFKC", name).lower()
+    name = _LEGAL_FORMS.sub("", name)
+    return _NON_WORD.sub("", name)
+
+def to_choseong(key: str) -> str:
+    """한글 음절을 초성으로 바꿉니다 (예: 삼성전자 → ㅅㅅㅈㅈ). 한글이 아닌 문자는 그대로 둡니다."""
+    return "".join(
+        _CHOSEONG[(ord(ch) - _HANGUL_BASE) // 588] if _HANGUL_BASE <= ord(ch) <= _HANGUL_LAST else ch
+        for ch in key
+    )
+
+def to_jamo(key: str) -> str:
+    """한글 음절을 초성/중성/종성 자모로 풀어 씁니다 (오타 유사도 계산용)."""
+    jamo = []
+    for ch in key:
+        code = ord(ch) - _HANGUL_BASE
+        if 0 <= code <= _HANGUL_LAST - _HANGUL_BASE:
+            jamo.append(_CHOSEONG[code // 588])
+            jamo.append(_JUNGSEONG[(code % 588) // 28])
+            if code % 28:
+                jamo.append(_JONGSEONG[code % 28])
+        else:
+            jamo.append(ch)
+    return "".join(jamo)
+
+def is_choseong_query(key: str) -> bool:
+    return bool(key) and all(ch in _CHOSEONG_SET for ch in key)
+
+def name_grams(key: str) -> set:
+    """음절 2-gram 집합. 첫 음절은 시작 표시와 묶어 접두어 일치에 가중치를 둡니다."""
+    padded = "^" + key
+    return {padded[i:i + 2] for i in range(len(padded) - 1)}
+
+def _dice(left: set, right: set) -> float:
+    if not left or not right:
+        return 0.0
+    return 2 * len(left & right) / (len(left) + len(right))
+
+def _bigrams(text: str) -> set:
+    return {text[i:i + 2] for i in range(len(text) - 1)} if len(text) > 1 else {text}
+
+class CompanyMatch(NamedTuple):
+    corp_code: str
+    corp_name: str
+    stock_code: str
+    score: float
+
+class CompanySearchIndex:
+    """DART 전체 회사명 검색 색인 (자동완성, 오타/표기 차이 보정)
+
+    - 정규화한 회사명 정렬 배열을 이진 탐색하여 접두어 일치 후보를 찾음 (초성 검색 포함)
+    - 음절 2-gram 역색인으로 부분/순서/표기 차이가 있는 후보를 모은 뒤
+      상위 후보만 자모 단위 유사도로 다시 정렬함
+    - 고유번호 파일이 갱신되면 바뀐 회사만 반영하며, 삭제된 항목은 표시만 해 두었다가
+      비율이 커지면 다시 만듦
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, str, str]] = ()):
+        self._codes: List[str] = []
+        self._names: List[str] = []
+        self._stock_codes: List[str] = []
+        self._keys: List[str] = []
+        self._alive = bytearray()
+        self._by_code: Dict[str, int] = {}
+        self._by_key: List[Tuple[str, int]] = []
+        self._by_choseong: List[Tuple[str, int]] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._dead = 0
+        for corp_code, corp_name, stock_code in entries:
+            self._add(corp_code, corp_name, stock_code, sort=False)
+        self._by_key.sort()
+        self._by_choseong.sort()
+
+    def __len__(self) -> int:
+        return len(self._codes) - self._dead
+
+    def _add(self, corp_code: str, corp_name: str, stock_code: str, sort: bool = True) -> None:
+        company_id = len(self._codes)
+        key = normalize_company_name(corp_name)
+        self._codes.append(corp_code)
+        self._names.append(corp_name)
+        self._stock_codes.append(stock_code)
+        self._keys.append(key)
+        self._alive.append(1)
+        self._by_code[corp_code] = company_id
+        if sort:
+            insort(self._by_key, (key, company_id))
+            insort(self._by_choseong, (to_choseong(key), company_id))
+        else:
+            self._by_key.append((key, company_id))
+            self._by_choseong.append((to_choseong(key), company_id))
+        for gram in name_grams(key):
+            self._postings.setdefault(gram, []).append(company_id)
+
+    def _remove(self, corp_code: str) -> None:
+        company_id = self._by_code.pop(corp_code)
+        self._alive[company_id] = 0
+        self._dead += 1
+        key = self._keys[company_id]
+        for sorted_keys, sort_key in ((self._by_key, key), (self._by_choseong, to_choseong(key))):
+            position = bisect_left(sorted_keys, (sort_key, company_id))
+            if position < len(sorted_keys) and sorted_keys[position] == (sort_key, company_id):
+                del sorted_keys[position]
+        # 역색인에는 남겨 두고 조회 시 _alive로 거름
+
+    def diff(self, entries: Iterable[Tuple[str, str, str]]) -> Tuple[List[str], List[Tuple[str, str, str]]]:
+        """새 고유번호 항목과 비교하여 (삭제할 회사 코드, 추가/변경할 항목)을 구합니다.
+
+        색인을 바꾸지 않으므로 이벤트 루프 밖의 스레드에서 실행할 수 있습니다.
+        """
+        seen = set()
+        changed = []
+        for corp_code, corp_name, stock_code in entries:
+            seen.add(corp_code)
+            company_id = self._by_code.get(corp_code)
+            if (company_id is None or self._names[company_id] != corp_name
+                    or self._stock_codes[company_id] != stock_code):
+                changed.append((corp_code, corp_name, stock_code))
+        removed = [corp_code for corp_code in self._by_code if corp_code not in seen]
+        return removed, changed
+
+    def apply(self, removed: List[str], changed: List[Tuple[str, str, str]]) -> None:
+        """diff 결과를 반영합니다."""
+        for corp_code in removed:
+            self._remove(corp_code)
+        for corp_code, corp_name, stock_code in changed:
+            if corp_code in self._by_code:
+                self._remove(corp_code)
+            self._add(corp_code, corp_name, stock_code)
+        if self._dead > len(self._codes) * COMPACT_RATIO:
+            self._compact()
+        logger.info("회사명 검색 색인 갱신 - 삭제: %s, 추가/변경: %s, 회사 수: %s", len(removed), len(changed), len(self))
+
+    def _compact(self) -> None:
+        alive = [
+            (self._codes[i], self._names[i], self._stock_codes[i])
+            for i in range(len(self._codes)) if self._alive[i]
+        ]
+        self.__init__(alive)
+
+    def _prefix_ids(self, sorted_keys: List[Tuple[str, int]], prefix: str, limit: int) -> List[int]:
+        ids = []
+        position = bisect_left(sorted_keys, (prefix,))
+        while position < len(sorted_keys) and len(ids) < limit:
+            key, company_id = sorted_keys[position]
+            if not key.startswith(prefix):
+                break
+            ids.append(company_id)
+            position += 1
+        return ids
+
+    def _gram_candidates(self, grams: set) -> List[int]:
+        """쿼리와 공유하는 2-gram이 많은 후보를 GRAM_CANDIDATES개 고릅니다.
+
+        드문 n-gram의 역색인부터 POSTING_BUDGET까지만 세므로 흔한 n-gram(예: "홀딩")이
+        있어도 조회 시간이 일정합니다. 첫 역색인은 예산과 관계없이 셉니다.
+        """
+        postings = sorted((self._postings[gram] for gram in grams if gram in self._postings), key=len)
+        counts = Counter()
+        budget = POSTING_BUDGET
+        for index, posting in enumerate(postings):
+            if index and len(posting) > budget:
+                break
+            counts.update(posting)
+            budget -= len(posting)
+        return [company_id for company_id, _ in counts.most_common(GRAM_CANDIDATES)]
+
+    def _syllable_score(self, key: str, grams: set, company_id: int) -> float:
+        candidate = self._keys[company_id]
+        if candidate == key:
+            return 1.0
+        length = min(len(candidate), len(key)) / max(len(candidate), len(key), 1)
+        score = 0.8 * _dice(grams, name_grams(candidate)) + 0.1 * length
+        if candidate.startswith(key):
+            score += 0.1
+        return score
+
+    def _rerank(self, key: str, company_id: int, syllable_score: float, jamo_grams: set) -> float:
+        """음절 점수에 자모 단위 유사도를 섞어 한 음절 안의 오타(예: 젼/전)를 구분합니다."""
+        if syllable_score >= 1.0:
+            return 1.0
+        jamo = _dice(jamo_grams, _bigrams(to_jamo(self._keys[company_id])))
+        return round(min(0.5 * syllable_score + 0.5 * jamo, 0.99), 4)
+
+    def search(self, query: str, limit: int = 10) -> List[CompanyMatch]:
+        """회사명 후보를 점수 순으로 반환합니다. 같은 점수면 상장 회사를 먼저 둡니다."""
+        # 초성은 NFKC 정규화 시 조합용 자모로 바뀌므로 정규화 전에 판별
+        choseong = "".join(query.split())
+        key = choseong if is_choseong_query(choseong) else normalize_company_name(query)
+        if not key or limit <= 0:
+            return []
+
+        if key is choseong:
+            ids = self._prefix_ids(self._by_choseong, key, PREFIX_SCAN_LIMIT)
+            scored = {
+                company_id: round(len(key) / max(len(self._keys[company_id]), 1), 4)
+                for company_id in ids
+            }
+        else:
+            grams = name_grams(key)
+            ids = self._prefix_ids(self._by_key, key, PREFIX_SCAN_LIMIT)
+            # 접두어 일치 후보가 충분하면(입력 중인 자동완성) n-gram 후보는 찾지 않음
+            if len(ids) < PREFIX_SCAN_LIMIT:
+                ids.extend(self._gram_candidates(grams))
+            scored = {
+                company_id: self._syllable_score(key, grams, company_id)
+                for company_id in set(ids) if self._alive[company_id]
+            }
+            jamo_grams = _bigrams(to_jamo(key))
+            top = heapq.nlargest(RERANK_CANDIDATES, scored.items(), key=itemgetter(1))
+            scored = {
+                company_id: self._rerank(key, company_id, score, jamo_grams)
+                for company_id, score in top
+            }
+
+        ranked = heapq.nsmallest(
+            limit, scored.items(),
+            key=lambda item: (-item[1], not self._stock_codes[item[0]], len(self._keys[item[0]]), item[0])
+        )
+        return [
+            CompanyMatch(self._codes[company_id], self._names[company_id], self._stock_codes[company_id], score)
+            for company_id, score in ranked
+        ]
+
+    def resolve(self, company_name: str) -> Optional[str]:
+        """정확히 일치하지 않는 회사명을 회사 코드로 확정합니다. 확정할 수 없으면 None
+
+        정규화한 이름이 같으면(법인 표기, 공백, 전각 차이) 그 회사로, 오타는 1순위 후보의 점수가
+        충분히 높고 2순위와 차이가 있을 때만 확정합니다.
+        정규화한 이름이 같은 회사가 여럿이면(예: "(주)가나"와 "가나 주식회사") 확정하지 않습니다.
+        """
+        matches = self.search(company_name, limit=2)
+        if not matches:
+            return None
+        best = matches[0]
+        second = matches[1].score if len(matches) > 1 else 0.0
+        if best.score >= 1.0:
+            return best.corp_code if second < 1.0 else None
+        if best.score >= RESOLVE_MIN_SCORE and round(best.score - second, 4) >= RESOLVE_MIN_MARGIN:
+            return best.corp_code
+        return None
+
+# 서버 실행기가 fork 전에 만들어 둔 색인 (작업자가 그대로 물려받음)
+_shared_search_index: Optional[CompanySearchIndex] = None
+
+def set_shared_search_index(index: CompanySearchIndex) -> None:
+    global _shared_search_index
+    _shared_search_index = index
+
+def get_shared_search_index() -> Optional[CompanySearchIndex]:
+    return _shared_search_index
@@ -0,0 +1,296 @@
+import os
+import mmap
+import time
+import struct
+import logging
+import zipfile
+import xml.etree.ElementTree as ET
+from io import BytesIO
+from typing import Dict, List, Optional, Iterable, Iterator, Tuple
+
+from app.domin.fin.models.schemas import CompanyInfo
+
+logger = logging.getLogger(__name__)
+
+# 프로세스 시작 전(fork 전)에 미리 읽어 둔 인덱스. 작업자 프로세스가 매핑을 그대로 공유합니다.
+_shared_index: Optional["MappedCorpCodeIndex"] = None
+_shared_loaded_at = 0.0
+
+# (회사 코드, 회사명, 주식 코드, 최종 수정일)
+CorpCodeEntry = Tuple[str, str, str, str]
+
+def iter_corp_codes(xml_file) -> Iterator[CorpCodeEntry]:
+    """CORPCODE.xml 파일 객체를 순차 파싱하여 파일 순서대로 항목을 반환합니다."""
+    for _, element in ET.iterparse(xml_file, events=("end",)):
+        if element.tag != "list":
+            continue
+        yield (
+            element.findtext("corp_code") or "",
+            element.findtext("corp_name") or "",
+            (element.findtext("stock_code") or "").strip(),
+            element.findtext("modify_date") or ""
+        )
+        # 처리한 항목은 바로 해제하여 트리 전체를 메모리에 유지하지 않음
+        element.clear()
+
+def read_corp_codes(path: str) -> List[CorpCodeEntry]:
+    """로컬에 저장된 고유번호 파일(zip 또는 xml)의 항목을 읽습니다."""
+    if path.endswith(".zip"):
+        with zipfile.ZipFile(path) as zip_file:
+            with zip_file.open("CORPCODE.xml") as xml_file:
+                return list(iter_corp_codes(xml_file))
+    with open(path, "rb") as f:
+        return list(iter_corp_codes(f))
+
+class CorpCodeIndex:
+    """DART 고유번호 파일(CORPCODE.xml)의 회사명/회사 코드 조회 인덱스"""
+
+    def __init__(self, companies: Iterable[CompanyInfo]):
+        self.companies: List[CompanyInfo] = list(companies)
+        self._by_name: Dict[str, CompanyInfo] = {}
+        self._by_code: Dict[str, CompanyInfo] = {}
+        for company in self.companies:
+            # 동일 회사명이 여러 건이면 파일상 첫 항목을 사용 (기존 조회 동작과 동일)
+            self._by_name.setdefault(company.corp_name, company)
+            self._by_code[company.corp_code] = company
+
+    def __len__(self) -> int:
+        return len(self.companies)
+
+    def get(self, company_name: str) -> Optional[CompanyInfo]:
+        """회사명으로 회사 정보를 조회합니다."""
+        return self._by_name.get(company_name)
+
+    def get_by_code(self, corp_code: str) -> Optional[CompanyInfo]:
+        """회사 코드로 회사 정보를 조회합니다."""
+        return self._by_code.get(corp_code)
+
+    def listed(self) -> List[CompanyInfo]:
+        """주식 코드가 있는 상장 회사 목록을 반환합니다."""
+        return [company for company in self.companies if company.stock_code]
+
+    def entries(self) -> Iterator[Tuple[str, str, str]]:
+        """(회사 코드, 회사명, 주식 코드)를 순서대로 반환합니다 (회사명 검색 색인용)."""
+        for company in self.companies:
+            yield company.corp_code, company.corp_name, company.stock_code
+
+    @classmethod
+    def from_xml(cls, xml_file) -> "CorpCodeIndex":
+        """CORPCODE.xml 파일 객체를 순차 파싱하여 인덱스를 생성합니다."""
+        return cls(
+            CompanyInfo(corp_code=corp_code, corp_name=corp_name, stock_code=stock_code, modify_date=modify_date)
+            for corp_code, corp_name, stock_code, modify_date in iter_corp_codes(xml_file)
+        )
+
+    @classmethod
+    def from_zip_bytes(cls, content: bytes) -> "CorpCodeIndex":
+        """DART corpCode.xml API가 반환하는 zip 데이터로 인덱스를 생성합니다."""
+        with zipfile.ZipFile(BytesIO(content)) as zip_file:
+            with zip_file.open("CORPCODE.xml") as xml_file:
+                return cls.from_xml(xml_file)
+
+    @classmethod
+    def from_file(cls, path: str) -> "CorpCodeIndex":
+        """로컬에 저장된 고유번호 파일(zip 또는 xml)로 인덱스를 생성합니다."""
+        if path.endswith(".zip"):
+            with open(path, "rb") as f:
+                return cls.from_zip_bytes(f.read())
+        with open(path, "rb") as f:
+            return cls.from_xml(f)
+
+    @staticmethod
+    def save_zip(content: bytes, path: str) -> None:
+        """다운로드한 고유번호 zip 데이터를 로컬 파일로 저장합니다."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+        logger.info("고유번호 파일 저장 완료: %s", path)
+
+# 컴파일된 고유번호 인덱스 파일 형식 (리틀 엔디언)
+#   헤더: 매직(8) | 항목 수(u32) | 회사명 정렬 배열 위치(u32) | 회사명 영역 위치(u32)
+#   레코드: 회사 코드 순으로 정렬된 고정 길이 항목
+#       corp_code(8) | stock_code(6) | modify_date(8) | 회사명 위치(u32) | 회사명 길이(u16)
+#   회사명 정렬 배열: 회사명(UTF-8 바이트) 순, 같은 이름은 원본 파일 순으로 정렬된
+#       레코드 번호(u32) | 회사명 위치(u32) | 회사명 길이(u16)  (탐색 중 레코드를 읽지 않도록 회사명 위치를 함께 둠)
+#   회사명 영역: UTF-8 회사명을 이어 붙인 바이트열
+INDEX_MAGIC = b"CORPIDX1"
+_HEADER = struct.Struct("<8sIII")
+_RECORD = struct.Struct("<8s6s8sIH")
+_NAME_ENTRY = struct.Struct("<IIH")
+
+class MappedCorpCodeIndex:
+    """컴파일된 고유번호 인덱스 파일을 읽기 전용으로 메모리 매핑하여 이진 탐색하는 조회 인덱스
+
+    회사 정보를 파이썬 객체로 들고 있지 않으므로 작업자 프로세스마다의 메모리 사용이 거의 없고,
+    같은 파일을 매핑한 프로세스들은 페이지 캐시를 공유합니다. 조회 API는 CorpCodeIndex와 같습니다.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count, self._names_at, self._strings_at = _HEADER.unpack_from(self._map, 0)
+        if magic != INDEX_MAGIC:
+            self._map.close()
+            raise ValueError(f"고유번호 인덱스 파일 형식이 아닙니다: {path}")
+        self.path = path
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _record_at(self, record: int) -> int:
+        return _HEADER.size + record * _RECORD.size
+
+    def _company(self, record: int) -> CompanyInfo:
+        corp_code, stock_code, modify_date, offset, length = _RECORD.unpack_from(self._map, self._record_at(record))
+        start = self._strings_at + offset
+        return CompanyInfo(
+            corp_code=corp_code.rstrip(b"\0").decode("ascii"),
+            corp_name=self._map[start:start + length].decode("utf-8"),
+            stock_code=stock_code.rstrip(b"\0").decode("ascii"),
+            modify_date=modify_date.rstrip(b"\0").decode("ascii")
+        )
+
+    def get(self, company_name: str) -> Optional[CompanyInfo]:
+        """회사명으로 회사 정보를 조회합니다. 같은 이름이 여러 건이면 원본 파일상 첫 항목"""
+        key = company_name.encode("utf-8")
+        data, unpack, names_at, strings_at = self._map, _NAME_ENTRY.unpack_from, self._names_at, self._strings_at
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            _, offset, length = unpack(data, names_at + middle * _NAME_ENTRY.size)
+            start = strings_at + offset
+            if data[start:start + length] < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low == self._count:
+            return None
+        record, offset, length = unpack(data, names_at + low * _NAME_ENTRY.size)
+        start = strings_at + offset
+        if data[start:start + length] != key:
+            return None
+        return self._company(record)
+
+    def get_by_code(self, corp_code: str) -> Optional[CompanyInfo]:
+        """회사 코드로 회사 정보를 조회합니다."""
+        key = corp_code.encode("ascii", errors="ignore")
+        if len(key) > 8:
+            return None
+        key = key.ljust(8, b"\0")
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            start = self._record_at(middle)
+            if self._map[start:start + 8] < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low == self._count:
+            return None
+        start = self._record_at(low)
+        if self._map[start:start + 8] != key:
+            return None
+        return self._company(low)
+
+    def listed(self) -> List[CompanyInfo]:
+        """주식 코드가 있는 상장 회사 목록을 회사 코드 순으로 반환합니다."""
+        companies = []
+        for record in range(self._count):
+            start = self._record_at(record) + 8
+            if self._map[start:start + 6].rstrip(b"\0"):
+                companies.append(self._company(record))
+        return companies
+
+    def entries(self) -> Iterator[Tuple[str, str, str]]:
+        """(회사 코드, 회사명, 주식 코드)를 회사 코드 순으로 반환합니다 (회사명 검색 색인용)."""
+        data, strings_at = self._map, self._strings_at
+        for record in range(self._count):
+            corp_code, stock_code, _, offset, length = _RECORD.unpack_from(data, self._record_at(record))
+            start = strings_at + offset
+            yield (
+                corp_code.rstrip(b"\0").decode("ascii"),
+                data[start:start + length].decode("utf-8"),
+                stock_code.rstrip(b"\0").decode("ascii")
+            )
+
+    def close(self) -> None:
+        self._map.close()
+
+    @staticmethod
+    def compile(entries: Iterable[CorpCodeEntry], path: str) -> int:
+        """고유번호 항목으로 인덱스 파일을 만듭니다.
+
+        임시 파일에 쓴 뒤 교체하므로 이미 매핑 중인 프로세스는 기존 파일을 계속 읽습니다.
+
+        Returns:
+            저장한 회사 수
+        """
+        # 같은 회사 코드가 여러 건이면 마지막 항목을 사용 (CorpCodeIndex와 동일)
+        by_code: Dict[bytes, Tuple[int, bytes, bytes, bytes]] = {}
+        for position, (corp_code, corp_name, stock_code, modify_date) in enumerate(entries):
+            by_code[corp_code.encode("ascii")] = (
+                position, corp_name.encode("utf-8"), stock_code.encode("ascii"), modify_date.encode("ascii")
+            )
+        codes = sorted(by_code)
+
+        records = bytearray()
+        strings = bytearray()
+        name_entries = []
+        for record, code in enumerate(codes):
+            position, name, stock_code, modify_date = by_code[code]
+            records += _RECORD.pack(code, stock_code, modify_date, len(strings), len(name))
+            name_entries.append((name, position, record, len(strings)))
+            strings += name
+        # 같은 회사명은 원본 파일상 첫 항목이 먼저 오도록 정렬
+        name_entries.sort()
+        names = b"".join(
+            _NAME_ENTRY.pack(record, offset, len(name)) for name, _, record, offset in name_entries
+        )
+
+        names_at = _HEADER.size + len(records)
+        strings_at = names_at + len(names)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # 여러 작업자가 동시에 갱신해도 서로의 임시 파일을 덮어쓰지 않도록 pid를 붙임
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(INDEX_MAGIC, len(codes), names_at, strings_at))
+            f.write(records)
+            f.write(names)
+            f.write(strings)
+        os.replace(tmp_path, path)
+        logger.info("고유번호 인덱스 파일 생성 완료: %s (회사 수: %s)", path, len(codes))
+        return len(codes)
+
+    @classmethod
+    def from_zip_bytes(cls, content: bytes, path: str) -> "MappedCorpCodeIndex":
+        """DART corpCode.xml API가 반환하는 zip 데이터로 인덱스 파일을 만들고 매핑합니다."""
+        with zipfile.ZipFile(BytesIO(content)) as zip_file:
+            with zip_file.open("CORPCODE.xml") as xml_file:
+                cls.compile(iter_corp_codes(xml_file), path)
+        return cls(path)
+
+    @classmethod
+    def from_file(cls, source_path: str, path: str) -> "MappedCorpCodeIndex":
+        """로컬 고유번호 파일(zip 또는 xml)로 인덱스 파일을 만들고 매핑합니다.
+
+        인덱스 파일이 원본보다 새로우면 다시 만들지 않습니다.
+        """
+        if not os.path.exists(path) or os.path.getmtime(path) < os.path.getmtime(source_path):
+            cls.compile(read_corp_codes(source_path), path)
+        return cls(path)
+
+def set_shared_index(index: MappedCorpCodeIndex) -> None:
+    """작업자 프로세스를 만들기 전에 공유할 인덱스를 등록합니다."""
+    global _shared_index, _shared_loaded_at
+    _shared_index = index
+    _shared_loaded_at = time.monotonic()
+
+def get_shared_index() -> Tuple[Optional[MappedCorpCodeIndex], float]:
+    """미리 읽어 둔 인덱스와 읽은 시각(time.monotonic)을 반환합니다. 없으면 (None, 0.0)"""
+    return _shared_index, _shared_loaded_at
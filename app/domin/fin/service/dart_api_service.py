@@ -1,89 +1,328 @@
 import os
+import time
+import fcntl
+import asyncio
 import logging
 import aiohttp
-import zipfile
-import xml.etree.ElementTree as ET
-from io import BytesIO
-from typing import List, Optional
-from dotenv import load_dotenv
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional
 from datetime import datetime
 
-from app.domin.fin.models.schemas import CompanyInfo, RawFinancialStatement, DartApiResponse
+from app.domin.fin.models.schemas import (
+    CompanyInfo,
+    RawFinancialStatement,
+    DartApiResponse,
+    DisclosureListResponse
+)
+from app.domin.fin.service.financial_data_processor import validate_statement_items
+from app.domin.fin.service.corp_code_index import MappedCorpCodeIndex, get_shared_index
+from app.domin.fin.service.company_search import CompanyMatch, CompanySearchIndex, get_shared_search_index
+from app.foundation.core.config.settings import settings
+from app.foundation.infra.metrics.client import client_trace_config
+from app.foundation.infra.metrics.storage import record_cache
+from app.foundation.infra.profiling.memory import track_allocations
+from app.foundation.infra.tracing.client import tracing_trace_config
+from app.foundation.infra.tracing.tracer import traced
+from app.foundation.utils.json_stream import JsonArrayStreamParser
 
-# 로깅 설정
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
 
-# 핸들러가 없으면 추가
-if not logger.handlers:
-    handler = logging.StreamHandler()
-    handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
-    logger.addHandler(handler)
+def create_dart_session(**kwargs) -> aiohttp.ClientSession:
+    """DART 호출 지표와 추적 구간을 기록하는 HTTP 세션을 만듭니다. 실행 중인 이벤트 루프 안에서 호출해야 합니다."""
+    return aiohttp.ClientSession(trace_configs=[client_trace_config(), tracing_trace_config()], **kwargs)
+
+# DART 보고서 코드
+REPORT_NAMES = {
+    "11011": "사업보고서",
+    "11012": "반기보고서",
+    "11013": "1분기보고서",
+    "11014": "3분기보고서"
+}
+
+# 전체 재무제표 수집 시 저장하는 재무제표 구분 (자본변동표는 계정명이 중복되는 행렬 구조라 제외)
+FULL_STATEMENT_DIVISIONS = ("BS", "IS", "CIS", "CF")
+
+# 다중회사 주요계정 API가 한 번에 받는 최대 회사 수
+MULTI_COMPANY_BATCH = 100
+
+# 고유번호 파일 캐시 유지 시간(초). DART는 하루 한 번 갱신하므로 그 이상 보관하지 않음
+CORP_CODE_CACHE_SECONDS = 6 * 60 * 60
+
+# 다른 작업자가 고유번호 인덱스를 갱신 중일 때 잠금을 다시 시도하는 간격(초)
+CORP_CODE_LOCK_POLL_SECONDS = 0.2
+
+@asynccontextmanager
+async def file_lock(path: str, poll_interval: float = CORP_CODE_LOCK_POLL_SECONDS) -> AsyncIterator[None]:
+    """작업자 프로세스 사이의 배타 잠금(flock)
+
+    잠금을 기다리는 동안 이벤트 루프를 막지 않도록 비차단 시도를 반복합니다.
+    파일을 닫으면 잠금이 풀리므로 프로세스가 비정상 종료되어도 잠금이 남지 않습니다.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                await asyncio.sleep(poll_interval)
+        yield
+    finally:
+        os.close(fd)
+
+def annotate_statement_items(items: List[dict], cash_flow: bool = False) -> List[dict]:
+    """DART 재무제표 응답 항목에 기간명을 채웁니다.
+    
+    Args:
+        items: DART API 응답의 list 항목
+        cash_flow: 현금흐름표 응답 여부. True이면 재무제표 구분을 CF로 지정
+    """
+    annotated = []
+    # 응답 항목은 대부분 같은 사업연도이므로 기간명은 연도별로 한 번만 만듦
+    period_names: Dict[str, Dict[str, str]] = {}
+    for item in items:
+        if cash_flow:
+            item["sj_div"] = "CF"
+            item["sj_nm"] = "현금흐름표"
+        elif item.get("sj_div") not in ["BS", "IS"]:
+            continue
+        names = period_names.get(item["bsns_year"])
+        if names is None:
+            bsns_year = int(item["bsns_year"])
+            names = period_names[item["bsns_year"]] = {
+                "thstrm_nm": f"{bsns_year}년",
+                "frmtrm_nm": f"{bsns_year-1}년",
+                "bfefrmtrm_nm": f"{bsns_year-2}년"
+            }
+        item.update(names)
+        annotated.append(item)
+    return annotated
+
+def _file_mtime(path: str) -> float:
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0.0
 
 class DartApiService:
-    def __init__(self):
-        load_dotenv()
-        self.api_key = os.getenv("DART_API_KEY")
+    """DART OpenAPI 클라이언트
+
+    설정과 HTTP 세션, 고유번호 인덱스 캐시를 가지므로 애플리케이션 범위에서 한 번 만들어 공유합니다.
+    세션을 넘기지 않으면 호출마다 세션을 만들어 닫습니다 (CLI, 단발성 사용).
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        session: Optional[aiohttp.ClientSession] = None
+    ):
+        self.api_key = api_key or settings.DART_API_KEY
         if not self.api_key:
             logger.error("DART API 키가 필요합니다.")
             raise ValueError("DART API 키가 필요합니다.")
-        logger.info("DartApiService가 초기화되었습니다.")
+        # 로컬 대역 서버로 교체할 수 있도록 기본 URL을 설정(DART_API_URL)으로 받음
+        self.base_url = (base_url or settings.DART_API_URL).rstrip("/")
+        self.session = session
+        # 서버 실행기가 fork 전에 읽어 둔 인덱스가 있으면 캐시로 사용
+        self._corp_code_index, self._corp_code_loaded_at = get_shared_index()
+        self._corp_code_lock = asyncio.Lock()
+        # 회사명 검색 색인과 색인을 만든 고유번호 인덱스 (인덱스가 바뀌면 차이만 반영)
+        self._search_index = get_shared_search_index()
+        self._search_source = self._corp_code_index if self._search_index is not None else None
+        self._search_lock = asyncio.Lock()
 
-    async def fetch_company_info(self, company_name: str) -> CompanyInfo:
-        """DART API에서 회사 정보를 조회합니다."""
-        logger.info(f"회사 정보 조회 시작: {company_name}")
-        url = "https://opendart.fss.or.kr/api/corpCode.xml"
+    @property
+    def has_shared_session(self) -> bool:
+        return self.session is not None and not self.session.closed
+
+    @asynccontextmanager
+    async def _client(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """공유 HTTP 세션이 있으면 재사용하고, 없으면 호출 동안만 쓸 세션을 만듭니다."""
+        if self.has_shared_session:
+            yield self.session
+            return
+        async with create_dart_session() as session:
+            yield session
+
+    async def close(self) -> None:
+        """공유 HTTP 세션을 닫습니다."""
+        if self.has_shared_session:
+            await self.session.close()
+
+    @traced()
+    async def download_corp_code_zip(self) -> bytes:
+        """DART 고유번호 파일(corpCode.xml, zip 압축)을 다운로드합니다."""
+        url = f"{self.base_url}/corpCode.xml"
         params = {"crtfc_key": self.api_key}
         
-        async with aiohttp.ClientSession() as session:
+        async with self._client() as session:
             async with session.get(url, params=params) as response:
                 if response.status != 200:
-                    logger.error(f"API 요청 실패: {response.status}")
+                    logger.error("API 요청 실패: %s", response.status)
                     raise Exception(f"API 요청 실패: {response.status}")
-                
-                content = await response.read()
-                with zipfile.ZipFile(BytesIO(content)) as zip_file:
-                    with zip_file.open('CORPCODE.xml') as xml_file:
-                        tree = ET.parse(xml_file)
-                        root = tree.getroot()
-                        
-                        for company in root.findall('.//list'):
-                            if company.findtext('corp_name') == company_name:
-                                logger.info(f"회사 정보를 찾았습니다: {company_name}")
-                                return CompanyInfo(
-                                    corp_code=company.findtext('corp_code'),
-                                    corp_name=company_name,
-                                    stock_code=company.findtext('stock_code') or "",
-                                    modify_date=company.findtext('modify_date')
-                                )
-                        
-                        logger.error(f"회사명 '{company_name}'을 찾을 수 없습니다.")
-                        raise ValueError(f"회사명 '{company_name}'을 찾을 수 없습니다.")
+                return await response.read()
+
+    @traced()
+    async def fetch_corp_code_index(self, refresh: bool = False) -> MappedCorpCodeIndex:
+        """DART 고유번호 파일로 만든 조회 인덱스를 반환합니다.
+
+        인덱스는 CORP_CODE_INDEX_FILE에 컴파일하여 메모리 매핑하고 CORP_CODE_CACHE_SECONDS 동안 캐시합니다.
+        캐시가 없거나 만료되면 먼저 다른 작업자가 만든 파일이 유효 기간 안인지 확인하여 다운로드 없이 매핑하고,
+        다운로드는 파일 잠금으로 여러 작업자 프로세스 중 하나만 합니다.
+        같은 프로세스에서 동시에 여러 요청이 와도 한 번만 확인합니다.
+        """
+        async with self._corp_code_lock:
+            if not refresh and not self._corp_code_fresh():
+                self._map_existing_corp_code_index()
+            if refresh or not self._corp_code_fresh():
+                await self._download_corp_code_index()
+            else:
+                record_cache("corp_code_index", "hit")
+            return self._corp_code_index
 
-    async def fetch_financial_statements(self, corp_code: str, year: Optional[int] = None) -> List[RawFinancialStatement]:
+    def _corp_code_fresh(self) -> bool:
+        return (
+            self._corp_code_index is not None
+            and time.monotonic() - self._corp_code_loaded_at <= CORP_CODE_CACHE_SECONDS
+        )
+
+    async def _download_corp_code_index(self) -> None:
+        """고유번호 파일을 다운로드하여 인덱스 파일을 다시 만들고 매핑합니다.
+
+        잠금을 기다리는 동안 다른 작업자가 새 인덱스 파일을 만들었으면 다운로드하지 않고 그 파일을 매핑합니다.
+        """
+        path = settings.CORP_CODE_INDEX_FILE
+        seen_mtime = _file_mtime(path)
+        async with file_lock(f"{path}.lock"):
+            if self._map_existing_corp_code_index(newer_than=seen_mtime):
+                logger.info("다른 작업자가 갱신한 고유번호 인덱스를 사용합니다 - 회사 수: %s", len(self._corp_code_index))
+                return
+            record_cache("corp_code_index", "download")
+            with track_allocations("corp_code.download"):
+                content = await self.download_corp_code_zip()
+            with track_allocations("corp_code.compile"):
+                self._corp_code_index = await asyncio.to_thread(MappedCorpCodeIndex.from_zip_bytes, content, path)
+            self._corp_code_loaded_at = time.monotonic()
+        logger.info("고유번호 인덱스 갱신 - 회사 수: %s", len(self._corp_code_index))
+
+    def _map_existing_corp_code_index(self, newer_than: float = 0.0) -> bool:
+        """유효 기간 안의 컴파일된 인덱스 파일이 있으면 매핑합니다.
+
+        이전 매핑은 조회 중인 요청이 있을 수 있으므로 닫지 않고 참조가 없어질 때 해제되도록 둡니다.
+
+        Args:
+            newer_than: 이 시각(mtime)보다 나중에 만들어진 파일만 매핑
+
+        Returns:
+            매핑했으면 True
+        """
+        path = settings.CORP_CODE_INDEX_FILE
+        try:
+            mtime = os.path.getmtime(path)
+            age = time.time() - mtime
+            if age > CORP_CODE_CACHE_SECONDS or mtime <= newer_than:
+                return False
+            self._corp_code_index = MappedCorpCodeIndex(path)
+            self._corp_code_loaded_at = time.monotonic() - age
+            record_cache("corp_code_index", "mapped")
+            return True
+        except (OSError, ValueError):
+            return False
+
+    @traced()
+    async def fetch_company_search_index(self) -> CompanySearchIndex:
+        """현재 고유번호 인덱스로 만든 회사명 검색 색인을 반환합니다.
+
+        처음에는 전체를 만들고, 고유번호 인덱스가 갱신된 뒤에는 바뀐 회사만 반영합니다.
+        색인 생성과 비교는 스레드에서, 반영은 이벤트 루프에서 하여 조회 중인 색인이 바뀌지 않도록 합니다.
+        """
+        index = await self.fetch_corp_code_index()
+        async with self._search_lock:
+            if self._search_source is index:
+                record_cache("company_search", "hit")
+                return self._search_index
+            if self._search_index is None:
+                record_cache("company_search", "build")
+                with track_allocations("company_search.build"):
+                    self._search_index = await asyncio.to_thread(CompanySearchIndex, index.entries())
+                logger.info("회사명 검색 색인 생성 - 회사 수: %s", len(self._search_index))
+            else:
+                record_cache("company_search", "update")
+                removed, changed = await asyncio.to_thread(self._search_index.diff, index.entries())
+                self._search_index.apply(removed, changed)
+            self._search_source = index
+            return self._search_index
+
+    async def search_companies(self, query: str, limit: int = 10) -> List[CompanyMatch]:
+        """회사명 자동완성/유사 검색 후보를 점수 순으로 반환합니다."""
+        search_index = await self.fetch_company_search_index()
+        return search_index.search(query, limit)
+
+    @traced()
+    async def fetch_company_info(self, company_name: str) -> CompanyInfo:
+        """DART API에서 회사 정보를 조회합니다.
+
+        정확히 일치하는 회사명이 없으면 회사명 검색 색인으로 표기 차이("(주)", 공백 등)나
+        명확한 오타를 보정하고, 보정할 수 없으면 후보를 오류 메시지에 담습니다.
+        """
+        logger.info("회사 정보 조회 시작: %s", company_name)
+        index = await self.fetch_corp_code_index()
+        company = index.get(company_name)
+        if company is None:
+            search_index = await self.fetch_company_search_index()
+            corp_code = search_index.resolve(company_name)
+            if corp_code is not None:
+                company = index.get_by_code(corp_code)
+                if company is not None:
+                    logger.info("회사명 보정: '%s' → '%s'", company_name, company.corp_name)
+                    return company
+            candidates = ", ".join(match.corp_name for match in search_index.search(company_name, limit=5))
+            logger.error("회사명 '%s'을 찾을 수 없습니다.", company_name)
+            if candidates:
+                raise ValueError(f"회사명 '{company_name}'을 찾을 수 없습니다. 후보: {candidates}")
+            raise ValueError(f"회사명 '{company_name}'을 찾을 수 없습니다.")
+        
+        logger.info("회사 정보를 찾았습니다: %s", company_name)
+        return company
+
+    @traced()
+    async def fetch_financial_statements(
+        self,
+        corp_code: str,
+        year: Optional[int] = None,
+        reprt_code: Optional[str] = None
+    ) -> List[RawFinancialStatement]:
         """DART API에서 재무제표 데이터를 조회합니다.
         
         Args:
             corp_code: 회사 코드
             year: 조회할 연도. None이면 직전 연도의 데이터를 조회
+            reprt_code: 보고서 코드. None이면 사업보고서(11011)를 조회
         """
-        logger.info(f"재무제표 조회 시작 - corp_code: {corp_code}, year: {year}")
+        logger.info("재무제표 조회 시작 - corp_code: %s, year: %s", corp_code, year)
         statements = []
         current_year = datetime.now().year
         
         # 연도 설정
         if year is None:
             target_year = current_year - 1
-            logger.info(f"연도가 지정되지 않아 {target_year}년도 데이터를 조회합니다.")
+            logger.info("연도가 지정되지 않아 %s년도 데이터를 조회합니다.", target_year)
         else:
             target_year = year
-            logger.info(f"{target_year}년도 데이터를 조회합니다.")
+            logger.info("%s년도 데이터를 조회합니다.", target_year)
         
-        # 사업보고서만 조회
-        report_codes = [("11011", "사업보고서")]
+        # 보고서 코드가 지정되지 않으면 사업보고서만 조회
+        if reprt_code is None:
+            report_codes = [("11011", "사업보고서")]
+        else:
+            report_codes = [(reprt_code, REPORT_NAMES.get(reprt_code, reprt_code))]
         
         for reprt_code, reprt_name in report_codes:
-            url = "https://opendart.fss.or.kr/api/fnlttSinglAcnt.json"
+            url = f"{self.base_url}/fnlttSinglAcnt.json"
             params = {
                 "crtfc_key": self.api_key,
                 "corp_code": corp_code,
@@ -92,59 +331,290 @@ class DartApiService:
                 "fs_div": "CFS"
             }
             
-            logger.info(f"{target_year}년도 {reprt_name} 조회를 시작합니다.")
+            logger.info("%s년도 %s 조회를 시작합니다.", target_year, reprt_name)
             
-            async with aiohttp.ClientSession() as session:
+            async with self._client() as session:
                 # 재무상태표와 손익계산서 조회
                 async with session.get(url, params=params) as response:
                     if response.status != 200:
-                        logger.error(f"{reprt_name} API 요청 실패: {response.status}")
+                        logger.error("%s API 요청 실패: %s", reprt_name, response.status)
                         continue
                         
                     data = await response.json()
                     api_response = DartApiResponse(**data)
                     
                     if api_response.status != "000":
-                        logger.error(f"{target_year}년도 {reprt_name} API 응답 실패: {api_response.message}")
+                        logger.error("%s년도 %s API 응답 실패: %s", target_year, reprt_name, api_response.message)
                         if year is None and target_year > current_year - 3:
                             # 직전 연도 데이터도 없으면 그 이전 연도 시도
-                            logger.info(f"직전 연도({target_year}) 데이터가 없어 이전 연도({target_year-1}) 조회를 시도합니다.")
-                            return await self.fetch_financial_statements(corp_code, target_year - 1)
+                            logger.info("직전 연도(%s) 데이터가 없어 이전 연도(%s) 조회를 시도합니다.", target_year, target_year-1)
+                            return await self.fetch_financial_statements(corp_code, target_year - 1, reprt_code)
                         continue
                     
-                    for item in api_response.list:
-                        if item.get("sj_div") in ["BS", "IS"]:
-                            item["thstrm_nm"] = f"{int(item['bsns_year'])}년"
-                            item["frmtrm_nm"] = f"{int(item['bsns_year'])-1}년"
-                            item["bfefrmtrm_nm"] = f"{int(item['bsns_year'])-2}년"
-                            statements.append(RawFinancialStatement(**item))
+                    statements.extend(validate_statement_items(annotate_statement_items(api_response.list)))
                 
                 # 현금흐름표 조회
-                cf_url = "https://opendart.fss.or.kr/api/fnlttCashFlow.json"
+                cf_url = f"{self.base_url}/fnlttCashFlow.json"
                 async with session.get(cf_url, params=params) as response:
                     if response.status != 200:
-                        logger.error(f"{reprt_name} 현금흐름표 API 요청 실패: {response.status}")
+                        logger.error("%s 현금흐름표 API 요청 실패: %s", reprt_name, response.status)
                         continue
                         
                     data = await response.json()
                     api_response = DartApiResponse(**data)
                     
                     if api_response.status != "000":
-                        logger.error(f"{target_year}년도 {reprt_name} 현금흐름표 API 응답 실패: {api_response.message}")
+                        logger.error("%s년도 %s 현금흐름표 API 응답 실패: %s", target_year, reprt_name, api_response.message)
                         continue
                     
-                    for item in api_response.list:
-                        item["sj_div"] = "CF"
-                        item["sj_nm"] = "현금흐름표"
-                        item["thstrm_nm"] = f"{int(item['bsns_year'])}년"
-                        item["frmtrm_nm"] = f"{int(item['bsns_year'])-1}년"
-                        item["bfefrmtrm_nm"] = f"{int(item['bsns_year'])-2}년"
-                        statements.append(RawFinancialStatement(**item))
+                    statements.extend(validate_statement_items(annotate_statement_items(api_response.list, cash_flow=True)))
                 
                 # 데이터를 찾았다면 더 이상 시도하지 않음
                 if statements:
-                    logger.info(f"{target_year}년도 {reprt_name}에서 재무제표 데이터를 찾았습니다.")
+                    logger.info("%s년도 %s에서 재무제표 데이터를 찾았습니다.", target_year, reprt_name)
                     break
         
-        logger.info(f"조회된 재무제표 수: {len(statements)}")
-        return statements 
\ No newline at end of file
+        logger.info("조회된 재무제표 수: %s", len(statements))
+        return statements
+
+    @traced()
+    async def fetch_raw_statement_items(
+        self,
+        corp_code: str,
+        year: int,
+        reprt_code: str = "11011",
+        session: Optional[aiohttp.ClientSession] = None
+    ) -> List[dict]:
+        """특정 보고서의 재무제표 원본 항목(재무상태표, 손익계산서, 현금흐름표)을 조회합니다.
+        
+        대량 수집에서 검증을 별도 작업자에서 수행할 수 있도록 Pydantic 모델로 변환하지 않고
+        기간명만 채운 dict 목록을 반환합니다. 데이터가 없으면(013) 빈 목록을 반환합니다.
+        
+        Args:
+            corp_code: 회사 코드
+            year: 사업연도
+            reprt_code: 보고서 코드
+            session: 재사용할 HTTP 세션. None이면 공유 세션, 공유 세션도 없으면 새로 생성
+        """
+        params = {
+            "crtfc_key": self.api_key,
+            "corp_code": corp_code,
+            "bsns_year": str(year),
+            "reprt_code": reprt_code,
+            "fs_div": "CFS"
+        }
+        endpoints = [("fnlttSinglAcnt.json", False), ("fnlttCashFlow.json", True)]
+        
+        # 넘겨받은 세션도 공유 세션도 없을 때만 새로 만들어 닫음
+        owns_session = session is None and not self.has_shared_session
+        if owns_session:
+            session = create_dart_session()
+        elif session is None:
+            session = self.session
+        try:
+            items = []
+            for endpoint, cash_flow in endpoints:
+                async with session.get(f"{self.base_url}/{endpoint}", params=params) as response:
+                    if response.status != 200:
+                        raise Exception(f"{endpoint} API 요청 실패: {response.status}")
+                    data = await response.json()
+                
+                status = data.get("status")
+                if status == "013":
+                    # 재무상태표/손익계산서가 없으면 현금흐름표도 조회하지 않음
+                    if not cash_flow:
+                        return []
+                    continue
+                if status != "000":
+                    raise Exception(f"{endpoint} API 응답 실패: {data.get('message')}")
+                items.extend(annotate_statement_items(data.get("list") or [], cash_flow=cash_flow))
+            return items
+        finally:
+            if owns_session:
+                await session.close()
+
+    @traced()
+    async def fetch_multi_company_items(
+        self,
+        companies: List[CompanyInfo],
+        year: int,
+        reprt_code: str = "11011",
+        session: Optional[aiohttp.ClientSession] = None
+    ) -> Dict[str, List[dict]]:
+        """다중회사 주요계정 API(fnlttMultiAcnt.json)로 여러 회사의 재무상태표/손익계산서를 조회합니다.
+        
+        100개 회사씩 나누어 요청하고 응답을 회사 코드별 원본 항목 목록으로 나눕니다.
+        연결재무제표(CFS)가 있는 회사는 연결 항목만, 없으면 개별(OFS) 항목을 사용합니다.
+        현금흐름표는 이 API에서 제공되지 않습니다.
+        
+        Args:
+            companies: 조회할 회사 목록
+            year: 사업연도
+            reprt_code: 보고서 코드
+            session: 재사용할 HTTP 세션. None이면 공유 세션, 공유 세션도 없으면 새로 생성
+            
+        Returns:
+            회사 코드별 원본 항목 목록. 데이터가 없는 회사는 포함되지 않음
+        """
+        url = f"{self.base_url}/fnlttMultiAcnt.json"
+        # 넘겨받은 세션도 공유 세션도 없을 때만 새로 만들어 닫음
+        owns_session = session is None and not self.has_shared_session
+        if owns_session:
+            session = create_dart_session()
+        elif session is None:
+            session = self.session
+        try:
+            items_by_corp: Dict[str, List[dict]] = {}
+            for start in range(0, len(companies), MULTI_COMPANY_BATCH):
+                chunk = companies[start:start + MULTI_COMPANY_BATCH]
+                # 응답에 회사 코드가 없으면 주식 코드로 회사를 찾음
+                corp_by_stock = {company.stock_code: company.corp_code for company in chunk if company.stock_code}
+                params = {
+                    "crtfc_key": self.api_key,
+                    "corp_code": ",".join(company.corp_code for company in chunk),
+                    "bsns_year": str(year),
+                    "reprt_code": reprt_code
+                }
+                async with session.get(url, params=params) as response:
+                    if response.status != 200:
+                        raise Exception(f"다중회사 API 요청 실패: {response.status}")
+                    data = await response.json()
+                
+                status = data.get("status")
+                if status == "013":
+                    continue
+                if status != "000":
+                    raise Exception(f"다중회사 API 응답 실패: {data.get('message')}")
+                
+                chunk_items: Dict[str, List[dict]] = {}
+                for item in data.get("list") or []:
+                    corp_code = item.get("corp_code") or corp_by_stock.get((item.get("stock_code") or "").strip())
+                    if corp_code is None:
+                        continue
+                    item["corp_code"] = corp_code
+                    chunk_items.setdefault(corp_code, []).append(item)
+                
+                for corp_code, items in chunk_items.items():
+                    consolidated = [item for item in items if item.get("fs_div") == "CFS"]
+                    items_by_corp[corp_code] = annotate_statement_items(consolidated or items)
+            
+            logger.info("다중회사 재무제표 조회 완료 - 요청 회사 수: %s, 응답 회사 수: %s", len(companies), len(items_by_corp))
+            return items_by_corp
+        finally:
+            if owns_session:
+                await session.close()
+
+    async def stream_full_statements(
+        self,
+        corp_code: str,
+        year: int,
+        reprt_code: str = "11011",
+        fs_div: str = "CFS",
+        batch_size: int = 500,
+        chunk_size: int = 64 * 1024
+    ) -> AsyncIterator[List[RawFinancialStatement]]:
+        """전체 재무제표 API(fnlttSinglAcntAll.json)를 스트리밍으로 파싱하여 검증된 배치를 차례로 반환합니다.
+        
+        응답 본문 전체를 메모리에 올리지 않고 수신한 조각에서 항목을 꺼내
+        batch_size개씩 한 번에 검증하므로 요청당 메모리 사용량이 배치 크기로 제한됩니다.
+        
+        Args:
+            corp_code: 회사 코드
+            year: 사업연도
+            reprt_code: 보고서 코드
+            fs_div: CFS(연결) 또는 OFS(개별)
+            batch_size: 한 번에 검증하여 반환할 항목 수
+            chunk_size: 응답 본문을 읽는 조각 크기(바이트)
+        """
+        url = f"{self.base_url}/fnlttSinglAcntAll.json"
+        params = {
+            "crtfc_key": self.api_key,
+            "corp_code": corp_code,
+            "bsns_year": str(year),
+            "reprt_code": reprt_code,
+            "fs_div": fs_div
+        }
+        bsns_year = int(year)
+        names = {
+            "thstrm_nm": f"{bsns_year}년",
+            "frmtrm_nm": f"{bsns_year-1}년",
+            "bfefrmtrm_nm": f"{bsns_year-2}년"
+        }
+        
+        parser = JsonArrayStreamParser("list")
+        total = 0
+        async with self._client() as session:
+            async with session.get(url, params=params) as response:
+                if response.status != 200:
+                    logger.error("전체 재무제표 API 요청 실패: %s", response.status)
+                    raise Exception(f"전체 재무제표 API 요청 실패: {response.status}")
+                
+                batch = []
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    for item in parser.feed(chunk):
+                        if item.get("sj_div") not in FULL_STATEMENT_DIVISIONS:
+                            continue
+                        item.update(names)
+                        item.setdefault("frmtrm_amount", "")
+                        batch.append(item)
+                        if len(batch) >= batch_size:
+                            total += len(batch)
+                            yield validate_statement_items(batch)
+                            batch = []
+                
+                header = parser.close()
+                if header.get("status") not in ("000", "013"):
+                    logger.error("전체 재무제표 API 응답 실패: %s", header.get('message'))
+                    raise Exception(f"전체 재무제표 API 응답 실패: {header.get('message')}")
+                if batch:
+                    total += len(batch)
+                    yield validate_statement_items(batch)
+        
+        logger.info("전체 재무제표 조회 완료 - corp_code: %s, year: %s, 항목 수: %s", corp_code, year, total)
+
+    @traced()
+    async def fetch_disclosure_list(
+        self,
+        bgn_de: str,
+        end_de: str,
+        page_no: int = 1,
+        page_count: int = 100,
+        pblntf_ty: str = "A"
+    ) -> DisclosureListResponse:
+        """DART 공시검색 API(list.json)에서 공시 목록을 조회합니다.
+        
+        Args:
+            bgn_de: 검색 시작 접수일자 (YYYYMMDD)
+            end_de: 검색 종료 접수일자 (YYYYMMDD)
+            page_no: 페이지 번호
+            page_count: 페이지당 건수 (최대 100)
+            pblntf_ty: 공시유형. 기본값 A(정기공시)
+        """
+        url = f"{self.base_url}/list.json"
+        params = {
+            "crtfc_key": self.api_key,
+            "bgn_de": bgn_de,
+            "end_de": end_de,
+            "pblntf_ty": pblntf_ty,
+            "sort": "date",
+            "sort_mth": "asc",
+            "page_no": str(page_no),
+            "page_count": str(page_count)
+        }
+        
+        async with self._client() as session:
+            async with session.get(url, params=params) as response:
+                if response.status != 200:
+                    logger.error("공시검색 API 요청 실패: %s", response.status)
+                    raise Exception(f"공시검색 API 요청 실패: {response.status}")
+                
+                data = await response.json()
+                # 013: 조회된 데이터가 없음
+                if data.get("status") == "013":
+                    return DisclosureListResponse(status="013", message=data.get("message", ""))
+                
+                list_response = DisclosureListResponse(**data)
+                if list_response.status != "000":
+                    logger.error("공시검색 API 응답 실패: %s", list_response.message)
+                    raise Exception(f"공시검색 API 응답 실패: {list_response.message}")
+                return list_response
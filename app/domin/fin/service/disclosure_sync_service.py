@@ -0,0 +1,148 @@
+import re
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domin.fin.models.schemas import Disclosure, SyncTarget
+from app.domin.fin.repository.fin_repository import get_sync_state, save_sync_state
+from app.domin.fin.service.dart_api_service import DartApiService
+from app.domin.fin.service.job_handlers import SYNC_REPORT_JOB
+from app.foundation.core.config.settings import settings
+from app.platform.messaging.job_queue import JobQueue
+
+logger = logging.getLogger(__name__)
+
+# 보고서명 예: "사업보고서 (2023.12)", "[기재정정]반기보고서 (2024.06)"
+REPORT_NAME_PATTERN = re.compile(r"(사업보고서|반기보고서|분기보고서)\s*\((\d{4})\.(\d{2})\)")
+
+# 분기보고서는 결산월로 1분기/3분기를 구분
+QUARTER_REPORT_CODES = {
+    "03": "11013",
+    "09": "11014"
+}
+
+# 수집하는 보고서 코드 (사업, 반기, 1분기, 3분기)
+SUPPORTED_REPORT_CODES = ("11011", "11012", "11013", "11014")
+
+SYNC_NAME = "dart_periodic_reports"
+
+class DisclosureSyncService:
+    """DART 공시목록(list.json)을 기준점부터 조회하여 신규/정정 정기보고서의 재수집 작업을 등록합니다."""
+
+    def __init__(self, db_session: AsyncSession, dart_api: Optional[DartApiService] = None):
+        self.db_session = db_session
+        self.dart_api = dart_api or DartApiService()
+        self.job_queue = JobQueue(db_session)
+        self.lookback_days = settings.DART_SYNC_LOOKBACK_DAYS
+
+    @staticmethod
+    def parse_report(disclosure: Disclosure) -> Optional[Tuple[str, str]]:
+        """보고서명에서 (사업연도, 보고서 코드)를 추출합니다. 정기보고서가 아니면 None을 반환합니다."""
+        match = REPORT_NAME_PATTERN.search(disclosure.report_nm)
+        if not match:
+            return None
+
+        report_type, year, month = match.groups()
+        if report_type == "사업보고서":
+            return year, "11011"
+        if report_type == "반기보고서":
+            return year, "11012"
+        reprt_code = QUARTER_REPORT_CODES.get(month)
+        if reprt_code is None:
+            return None
+        return year, reprt_code
+
+    async def _fetch_disclosures(self, bgn_de: str, end_de: str) -> List[Disclosure]:
+        """기간 내 정기공시 목록을 모든 페이지에 걸쳐 조회합니다."""
+        disclosures = []
+        page_no = 1
+        while True:
+            response = await self.dart_api.fetch_disclosure_list(bgn_de, end_de, page_no=page_no)
+            disclosures.extend(response.list)
+            if page_no >= response.total_page:
+                break
+            page_no += 1
+        return disclosures
+
+    async def collect_targets(self) -> Tuple[List[SyncTarget], List[Disclosure]]:
+        """기준점 이후의 신규/정정 정기보고서를 수집 대상으로 선별합니다.
+
+        Returns:
+            (수집 대상 목록, 기준점 이후 조회된 전체 공시 목록)
+        """
+        state = await get_sync_state(self.db_session, SYNC_NAME)
+        today = datetime.now().strftime("%Y%m%d")
+        if state:
+            bgn_de = state["last_rcept_dt"]
+            last_rcept_no = state["last_rcept_no"]
+        else:
+            bgn_de = (datetime.now() - timedelta(days=self.lookback_days)).strftime("%Y%m%d")
+            last_rcept_no = ""
+
+        logger.info("공시목록 동기화 시작 - 기간: %s ~ %s, 기준 접수번호: %s", bgn_de, today, last_rcept_no or '없음')
+
+        # 접수번호는 접수일자로 시작하므로 문자열 비교로 기준점 이후 공시만 남김
+        disclosures = [
+            disclosure for disclosure in await self._fetch_disclosures(bgn_de, today)
+            if disclosure.rcept_no > last_rcept_no
+        ]
+
+        targets: Dict[Tuple[str, str, str], SyncTarget] = {}
+        for disclosure in disclosures:
+            # 재무제표 API는 상장법인만 지원
+            if not disclosure.stock_code.strip():
+                continue
+            parsed = self.parse_report(disclosure)
+            if parsed is None:
+                continue
+            bsns_year, reprt_code = parsed
+            if reprt_code not in SUPPORTED_REPORT_CODES:
+                continue
+
+            key = (disclosure.corp_code, bsns_year, reprt_code)
+            existing = targets.get(key)
+            if existing is None or disclosure.rcept_no > existing.rcept_no:
+                targets[key] = SyncTarget(
+                    corp_code=disclosure.corp_code,
+                    corp_name=disclosure.corp_name,
+                    stock_code=disclosure.stock_code.strip(),
+                    bsns_year=bsns_year,
+                    reprt_code=reprt_code,
+                    rcept_no=disclosure.rcept_no,
+                    rcept_dt=disclosure.rcept_dt,
+                    amended="정정" in disclosure.report_nm or (existing is not None)
+                )
+
+        ordered = sorted(targets.values(), key=lambda target: target.rcept_no)
+        logger.info("조회된 공시 수: %s, 수집 대상 보고서 수: %s", len(disclosures), len(ordered))
+        return ordered, disclosures
+
+    async def sync(self) -> Dict[str, Any]:
+        """수집 대상 보고서마다 재수집 작업을 등록하고 기준점을 전진시킵니다.
+
+        재수집은 작업자가 처리하므로 계속 실패하는 보고서는 작업 큐의 재시도 후
+        실패(failed) 상태로 남고, 기준점은 등록이 끝난 공시까지 전진합니다.
+        같은 접수번호의 작업이 대기/실행 중이면 새로 등록하지 않습니다.
+        """
+        targets, disclosures = await self.collect_targets()
+
+        enqueued = []
+        for target in targets:
+            job = await self.job_queue.enqueue(
+                SYNC_REPORT_JOB,
+                target.model_dump(),
+                dedup_key=f"{SYNC_REPORT_JOB}:{target.corp_code}:{target.bsns_year}:{target.reprt_code}:{target.rcept_no}"
+            )
+            enqueued.append({**target.model_dump(), "job_id": job["id"], "deduplicated": job["deduplicated"]})
+
+        if disclosures:
+            last = max(disclosures, key=lambda disclosure: disclosure.rcept_no)
+            await save_sync_state(self.db_session, SYNC_NAME, last.rcept_dt, last.rcept_no)
+
+        return {
+            "status": "success",
+            "message": f"{len(enqueued)}건의 보고서 수집 작업을 등록했습니다.",
+            "scanned": len(disclosures),
+            "enqueued": enqueued
+        }
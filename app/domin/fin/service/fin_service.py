@@ -1,41 +1,48 @@
-import os
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from dotenv import load_dotenv
 
 from app.domin.fin.service.company_info_service import CompanyInfoService
+from app.domin.fin.service.dart_api_service import DartApiService
 from app.domin.fin.service.financial_statement_service import FinancialStatementService
+from app.domin.fin.service.disclosure_sync_service import DisclosureSyncService
+from app.domin.fin.service.response_snapshot_service import ResponseSnapshotService
+from app.domin.fin.service.job_handlers import INGEST_JOB, RECOMPUTE_RATIOS_JOB
+from app.platform.messaging.job_queue import JobQueue
 from app.domin.fin.models.schemas import CompanyInfo, RawFinancialStatement
+from app.foundation.infra.tracing.tracer import traced
 
-# 로깅 설정
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
-
-# 핸들러가 없으면 추가
-if not logger.handlers:
-    handler = logging.StreamHandler()
-    handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
-    logger.addHandler(handler)
 
 class FinService:
-    def __init__(self, db_session: AsyncSession):
-        """서비스 초기화"""
-        logger.info("FinService가 초기화되었습니다.")
+    def __init__(self, db_session: AsyncSession, dart_api: Optional[DartApiService] = None):
+        """서비스 초기화
+
+        요청마다 만들어지므로 생성 시 설정 파일 읽기나 로그 출력 없이 세션과 공유 의존성만 연결합니다.
+
+        Args:
+            db_session: 요청 범위 DB 세션
+            dart_api: 애플리케이션 범위 DART 클라이언트. None이면 새로 생성
+        """
         self.db_session = db_session
-        self.company_info_service = CompanyInfoService(db_session)
-        self.financial_statement_service = FinancialStatementService(db_session)
-        load_dotenv()
-        self.api_key = os.getenv("DART_API_KEY")
-        if not self.api_key:
-            logger.error("DART API 키가 필요합니다.")
-            raise ValueError("DART API 키가 필요합니다.")
+        self.dart_api = dart_api or DartApiService()
+        self.company_info_service = CompanyInfoService(db_session, self.dart_api)
+        self.financial_statement_service = FinancialStatementService(db_session, self.dart_api)
+        self.disclosure_sync_service = DisclosureSyncService(db_session, self.dart_api)
+        self.snapshot_service = ResponseSnapshotService(db_session)
+        self.job_queue = JobQueue(db_session)
 
+    @traced()
     async def get_company_info(self, company_name: str) -> CompanyInfo:
         """회사 정보를 조회합니다."""
-        logger.info(f"회사 정보 조회 시작: {company_name}")
+        logger.info("회사 정보 조회 시작: %s", company_name)
         return await self.company_info_service.get_company_info(company_name)
 
+    async def search_companies(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """회사명 자동완성/유사 검색 후보를 조회합니다."""
+        return await self.company_info_service.search_companies(query, limit)
+
+    @traced()
     async def get_financial_statements(self, company_info: CompanyInfo, year: Optional[int] = None) -> list[RawFinancialStatement]:
         """재무제표 데이터를 조회합니다.
         
@@ -43,16 +50,76 @@ class FinService:
             company_info: 회사 정보
             year: 조회할 연도. None이면 최신 연도의 데이터를 조회
         """
-        logger.info(f"재무제표 조회 시작 - 회사: {company_info.corp_name}, 연도: {year}")
+        logger.info("재무제표 조회 시작 - 회사: %s, 연도: %s", company_info.corp_name, year)
         return await self.financial_statement_service.get_financial_statements(company_info, year)
 
-    async def fetch_and_save_financial_data(self, company_name: str, year: Optional[int] = None) -> Dict[str, Any]:
-        """회사명으로 재무제표 데이터를 조회하고 저장합니다.
+    @traced()
+    async def fetch_and_save_financial_data(self, company_info: CompanyInfo, year: Optional[int] = None) -> Dict[str, Any]:
+        """확인된 회사의 재무제표 데이터를 조회하고 저장합니다.
         
         Args:
-            company_name: 회사명
+            company_info: get_company_info로 확인(보정)된 회사 정보
             year: 조회할 연도. None이면 최신 연도의 데이터를 조회
         """
-        logger.info(f"재무제표 데이터 조회 및 저장 시작 - 회사: {company_name}, 연도: {year}")
-        return await self.financial_statement_service.fetch_and_save_financial_data(company_name, year)
+        logger.info("재무제표 데이터 조회 및 저장 시작 - 회사: %s, 연도: %s", company_info.corp_name, year)
+        return await self.financial_statement_service.fetch_and_save_financial_data(company_info, year)
+
+    @traced()
+    async def get_response_snapshot(self, corp_code: str, bsns_year: str, response_type: str) -> Optional[bytes]:
+        """미리 직렬화된 응답 본문을 조회합니다. 없거나 형식 버전이 다르면 None"""
+        return await self.snapshot_service.get(corp_code, bsns_year, response_type)
+
+    @traced()
+    async def save_response_snapshot(
+        self,
+        corp_code: str,
+        corp_name: str,
+        bsns_year: str,
+        response_type: str,
+        payload: Any
+    ) -> bytes:
+        """조회 경로에서 만든 응답을 스냅샷으로 저장하고 직렬화된 본문을 반환합니다."""
+        return await self.snapshot_service.store(corp_code, corp_name, bsns_year, response_type, payload)
+
+    @traced()
+    async def sync_disclosures(self) -> Dict[str, Any]:
+        """DART 공시목록 기준으로 신규/정정 정기보고서를 증분 동기화합니다."""
+        logger.info("공시목록 증분 동기화 시작")
+        return await self.disclosure_sync_service.sync()
+
+    async def enqueue_ingestion(
+        self,
+        company_name: str,
+        year: Optional[int] = None,
+        reprt_code: str = "11011",
+        priority: int = 0,
+        full_statement: bool = False
+    ) -> Dict[str, Any]:
+        """재무제표 수집을 백그라운드 작업으로 등록합니다."""
+        mode = "full" if full_statement else "key"
+        return await self.job_queue.enqueue(
+            INGEST_JOB,
+            {"company_name": company_name, "year": year, "reprt_code": reprt_code, "full_statement": full_statement},
+            priority=priority,
+            dedup_key=f"{INGEST_JOB}:{company_name}:{year or 'latest'}:{reprt_code}:{mode}"
+        )
+
+    async def enqueue_ratio_recomputation(
+        self,
+        corp_code: str,
+        corp_name: str,
+        bsns_year: str,
+        reprt_code: str = "11011",
+        priority: int = 0
+    ) -> Dict[str, Any]:
+        """재무비율 재계산을 백그라운드 작업으로 등록합니다."""
+        return await self.job_queue.enqueue(
+            RECOMPUTE_RATIOS_JOB,
+            {"corp_code": corp_code, "corp_name": corp_name, "bsns_year": bsns_year, "reprt_code": reprt_code},
+            priority=priority,
+            dedup_key=f"{RECOMPUTE_RATIOS_JOB}:{corp_code}:{bsns_year}:{reprt_code}"
+        )
 
+    async def get_job(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """백그라운드 작업 상태를 조회합니다."""
+        return await self.job_queue.get(job_id)
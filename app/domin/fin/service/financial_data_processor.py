@@ -1,9 +1,89 @@
 from typing import List, Dict, Any, Optional
 import logging
-from app.domin.fin.models.schemas import RawFinancialStatement, CompanyInfo
+from pydantic import ValidationError
+from app.domin.fin.models.schemas import RawFinancialStatement, CompanyInfo, RAW_STATEMENT_LIST
+from app.domin.fin.service.account_taxonomy import ACCOUNT_TAXONOMY
 
 logger = logging.getLogger(__name__)
 
+# DB에 숫자로 저장하는 금액 컬럼. 당기누적금액은 분기/반기 보고서에만 있으므로 비어 있으면 NULL
+AMOUNT_COLUMNS = ("thstrm_amount", "thstrm_add_amount", "frmtrm_amount", "bfefrmtrm_amount")
+NULLABLE_AMOUNT_COLUMNS = ("thstrm_add_amount",)
+
+# 요약 경고에 남길 실패 값 예시 수
+MAX_FAILURE_SAMPLES = 5
+
+class ConversionSummary:
+    """일괄 변환 중 실패한 값을 모아 한 번에 경고로 남깁니다."""
+
+    def __init__(self):
+        self.failures: Dict[str, int] = {}
+        self.samples: List[str] = []
+
+    @property
+    def total(self) -> int:
+        return sum(self.failures.values())
+
+    def record(self, column: str, value: Any) -> None:
+        self.failures[column] = self.failures.get(column, 0) + 1
+        if len(self.samples) < MAX_FAILURE_SAMPLES:
+            self.samples.append(f"{column}={value!r}")
+
+    def log(self, context: str) -> None:
+        if self.total:
+            logger.warning("%s - 변환 실패 %s건, 컬럼별: %s, 예시: %s", context, self.total, self.failures, self.samples)
+
+def parse_amounts(
+    values: List[Optional[str]],
+    column: str,
+    summary: ConversionSummary,
+    empty: Optional[float] = 0.0
+) -> List[Optional[float]]:
+    """금액 문자열 목록을 한 번에 숫자로 변환합니다.
+
+    전체 목록을 한 번의 리스트 컴프리헨션으로 변환하고, 변환할 수 없는 값이 섞여 있을 때만
+    항목별로 다시 변환하며 실패 값은 0으로 채우고 summary에 모읍니다.
+
+    Args:
+        empty: 빈 값("", None)을 대신할 값
+    """
+    try:
+        return [float(value.replace(",", "")) if value else empty for value in values]
+    except (ValueError, AttributeError):
+        pass
+
+    parsed: List[Optional[float]] = []
+    for value in values:
+        if not value:
+            parsed.append(empty)
+            continue
+        try:
+            parsed.append(float(value.replace(",", "")))
+        except (ValueError, AttributeError):
+            summary.record(column, value)
+            parsed.append(0.0)
+    return parsed
+
+def validate_statement_items(items: List[Dict[str, Any]], summary: Optional[ConversionSummary] = None) -> List[RawFinancialStatement]:
+    """DART 원본 항목 목록을 TypeAdapter 한 번으로 검증합니다.
+
+    검증에 실패한 항목이 있으면 해당 항목만 제외하고 나머지를 다시 검증하며,
+    제외한 항목은 summary에 모읍니다 (summary가 없으면 한 번 경고로 남김).
+    """
+    try:
+        return RAW_STATEMENT_LIST.validate_python(items)
+    except ValidationError as e:
+        invalid = {error["loc"][0] for error in e.errors() if error["loc"]}
+
+    owned = summary is None
+    summary = summary or ConversionSummary()
+    for index in sorted(invalid):
+        summary.record("item", items[index].get("account_nm"))
+    statements = RAW_STATEMENT_LIST.validate_python([item for index, item in enumerate(items) if index not in invalid])
+    if owned:
+        summary.log(f"재무제표 항목 검증 ({len(items)}건 중 {len(invalid)}건 제외)")
+    return statements
+
 class FinancialDataProcessor:
     def __init__(self):
         pass
@@ -15,7 +95,7 @@ class FinancialDataProcessor:
         try:
             return float(amount_str.replace(",", ""))
         except (ValueError, AttributeError) as e:
-            logger.warning(f"금액 변환 실패: {amount_str}, 에러: {str(e)}")
+            logger.warning("금액 변환 실패: %s, 에러: %s", amount_str, e)
             return 0.0
 
     def deduplicate_statements(self, statements: List[RawFinancialStatement]) -> List[RawFinancialStatement]:
@@ -29,22 +109,78 @@ class FinancialDataProcessor:
 
     def prepare_statement_data(self, statement: RawFinancialStatement, company_info: CompanyInfo) -> Dict[str, Any]:
         """재무제표 데이터를 DB 저장 형식으로 변환합니다."""
-        return {
-            "corp_code": company_info.corp_code,
-            "corp_name": company_info.corp_name,
-            "stock_code": company_info.stock_code,
-            "rcept_no": statement.rcept_no,
-            "reprt_code": statement.reprt_code,
-            "bsns_year": statement.bsns_year,
-            "sj_div": statement.sj_div,
-            "sj_nm": statement.sj_nm,
-            "account_nm": statement.account_nm,
-            "thstrm_nm": statement.thstrm_nm,
-            "thstrm_amount": self.convert_amount(statement.thstrm_amount),
-            "frmtrm_nm": statement.frmtrm_nm,
-            "frmtrm_amount": self.convert_amount(statement.frmtrm_amount),
-            "bfefrmtrm_nm": statement.bfefrmtrm_nm,
-            "bfefrmtrm_amount": self.convert_amount(statement.bfefrmtrm_amount),
-            "ord": statement.ord,
-            "currency": statement.currency
-        } 
\ No newline at end of file
+        return self.prepare_statement_batch([statement], company_info)[0]
+
+    def prepare_statement_batch(
+        self,
+        statements: List[RawFinancialStatement],
+        company_info: CompanyInfo,
+        summary: Optional[ConversionSummary] = None
+    ) -> List[Dict[str, Any]]:
+        """재무제표 목록을 DB 저장 형식으로 변환합니다.
+
+        금액은 컬럼 단위로 한 번에 변환하고, 변환 실패는 행마다 로그를 남기는 대신
+        목록 전체에 대해 한 번 요약 경고로 남깁니다 (summary를 넘기면 호출하는 쪽에서 남김).
+        """
+        owned = summary is None
+        summary = summary or ConversionSummary()
+        amounts = {
+            column: parse_amounts(
+                [getattr(statement, column) for statement in statements],
+                column,
+                summary,
+                None if column in NULLABLE_AMOUNT_COLUMNS else 0.0
+            )
+            for column in AMOUNT_COLUMNS
+        }
+        thstrm, thstrm_add, frmtrm, bfefrmtrm = (amounts[column] for column in AMOUNT_COLUMNS)
+        # 같은 계정과목이 반복되므로 표준 계정은 목록 안에서 한 번씩만 찾음
+        canonical: Dict[tuple, Optional[str]] = {}
+        for statement in statements:
+            key = (statement.account_nm, statement.account_id)
+            if key not in canonical:
+                canonical[key] = ACCOUNT_TAXONOMY.resolve(statement.account_nm, statement.account_id)
+        rows = [
+            {
+                "corp_code": company_info.corp_code,
+                "corp_name": company_info.corp_name,
+                "stock_code": company_info.stock_code,
+                "rcept_no": statement.rcept_no,
+                "reprt_code": statement.reprt_code,
+                "bsns_year": statement.bsns_year,
+                "sj_div": statement.sj_div,
+                "sj_nm": statement.sj_nm,
+                "account_nm": statement.account_nm,
+                "canonical_account": canonical[(statement.account_nm, statement.account_id)],
+                "thstrm_nm": statement.thstrm_nm,
+                "thstrm_amount": thstrm[index],
+                "thstrm_add_amount": thstrm_add[index],
+                "frmtrm_nm": statement.frmtrm_nm,
+                "frmtrm_amount": frmtrm[index],
+                "bfefrmtrm_nm": statement.bfefrmtrm_nm,
+                "bfefrmtrm_amount": bfefrmtrm[index],
+                "ord": statement.ord,
+                "currency": statement.currency
+            }
+            for index, statement in enumerate(statements)
+        ]
+        if owned:
+            summary.log(f"금액 변환 - 회사: {company_info.corp_name}, 행 수: {len(rows)}")
+        return rows
+
+def parse_statement_items(items: List[Dict[str, Any]], company: Dict[str, str]) -> List[Dict[str, Any]]:
+    """DART 원본 항목을 검증하고 중복 제거 후 DB 저장 형식으로 변환합니다.
+    
+    대량 수집 시 프로세스 풀에서 실행할 수 있도록 모듈 수준 함수로 제공합니다.
+    
+    Args:
+        items: 기간명이 채워진 DART 재무제표 원본 항목
+        company: CompanyInfo 필드를 담은 dict
+    """
+    processor = FinancialDataProcessor()
+    company_info = CompanyInfo(**company)
+    summary = ConversionSummary()
+    statements = processor.deduplicate_statements(validate_statement_items(items, summary))
+    rows = processor.prepare_statement_batch(statements, company_info, summary)
+    summary.log(f"재무제표 변환 - 회사: {company_info.corp_name}, 항목 수: {len(items)}")
+    return rows
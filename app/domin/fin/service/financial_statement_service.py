@@ -1,28 +1,39 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable, Awaitable
 import logging
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domin.fin.models.schemas import RawFinancialStatement, CompanyInfo
 from app.domin.fin.repository.fin_repository import (
-    delete_financial_statements,
-    save_financial_statements
+    delete_period_statements,
+    bulk_save_financial_statements,
+    get_company_statements
 )
 from app.domin.fin.service.dart_api_service import DartApiService
 from app.domin.fin.service.financial_data_processor import FinancialDataProcessor
 from app.domin.fin.service.ratio_service import RatioService
-from app.domin.fin.service.company_info_service import CompanyInfoService
+from app.domin.fin.service.ratio_dependency import account_key, diff_statement_rows
+from app.domin.fin.service.ratio_recompute_service import RatioRecomputeService
+from app.foundation.infra.profiling.memory import track_allocations
+from app.foundation.infra.tracing.tracer import span, traced
 
 logger = logging.getLogger(__name__)
 
+# 상태가 없으므로 인스턴스마다 만들지 않고 공유
+DATA_PROCESSOR = FinancialDataProcessor()
+
+# 전체 재무제표 조회 순서 (연결재무제표가 없는 회사는 개별재무제표)
+FULL_STATEMENT_FS_DIVS = ("CFS", "OFS")
+
 class FinancialStatementService:
-    def __init__(self, db_session: AsyncSession):
+    def __init__(self, db_session: AsyncSession, dart_api: Optional[DartApiService] = None):
         self.db_session = db_session
-        self.dart_api = DartApiService()
-        self.data_processor = FinancialDataProcessor()
+        self.dart_api = dart_api or DartApiService()
+        self.data_processor = DATA_PROCESSOR
         self.ratio_service = RatioService(db_session)
-        self.company_info_service = CompanyInfoService(db_session)
+        self.ratio_recompute_service = RatioRecomputeService(db_session)
 
+    @traced()
     async def get_financial_statements(self, company_info: CompanyInfo, year: Optional[int] = None) -> List[RawFinancialStatement]:
         """재무제표 데이터를 조회합니다.
         
@@ -32,70 +43,163 @@ class FinancialStatementService:
         """
         try:
             statements = await self.dart_api.fetch_financial_statements(company_info.corp_code, year)
-            logger.info(f"조회된 재무제표 수: {len(statements)}")
+            logger.info("조회된 재무제표 수: %s", len(statements))
             return statements
         except Exception as e:
-            logger.error(f"재무제표 조회 실패: {str(e)}")
+            logger.error("재무제표 조회 실패: %s", e)
             raise
 
-    async def fetch_and_save_financial_data(self, company_name: str, year: Optional[int] = None) -> Dict[str, Any]:
-        """회사명으로 재무제표 데이터를 조회하고 저장합니다.
+    @traced()
+    async def ingest_statements(
+        self,
+        company_info: CompanyInfo,
+        year: Optional[int],
+        reprt_code: str = "11011",
+        on_progress: Optional[Callable[[str, Dict[str, Any]], Awaitable[None]]] = None
+    ) -> int:
+        """특정 보고서 기간의 재무제표를 DART에서 다시 수집하여 교체 저장합니다.
+        
+        신규 또는 정정 공시가 확인된 기간만 갱신할 때 사용합니다.
+        저장 전후 값을 비교하여 바뀐 계정에 의존하는 TTM/재무비율 셀만 다시 계산합니다.
+        
+        Args:
+            company_info: 회사 정보
+            year: 사업연도. None이면 직전 연도의 데이터를 조회
+            reprt_code: 보고서 코드
+            on_progress: 단계(fetched, saved, ratios_computed)마다 호출할 콜백
+            
+        Returns:
+            저장된 재무제표 행 수
+        """
+        async def report(stage: str, **detail) -> None:
+            if on_progress is not None:
+                await on_progress(stage, detail)
+
+        with track_allocations("ingest.fetch"):
+            statements = await self.dart_api.fetch_financial_statements(company_info.corp_code, year, reprt_code)
+        await report("fetched", count=len(statements))
+        if not statements:
+            logger.warning("수집할 재무제표가 없습니다 - 회사: %s, 연도: %s, 보고서: %s", company_info.corp_name, year, reprt_code)
+            return 0
+        
+        with track_allocations("ingest.prepare"):
+            statements = self.data_processor.deduplicate_statements(statements)
+            statement_data = self.data_processor.prepare_statement_batch(statements, company_info)
+        
+        # 같은 기간의 기존 데이터를 교체 (삭제와 저장을 한 트랜잭션으로 커밋)
+        bsns_year = statements[0].bsns_year
+        with track_allocations("ingest.save"):
+            before = await self.ratio_recompute_service.snapshot(company_info.corp_code, bsns_year, reprt_code)
+            await delete_period_statements(self.db_session, company_info.corp_code, bsns_year, reprt_code)
+            await bulk_save_financial_statements(self.db_session, statement_data)
+            await self.db_session.commit()
+        await report("saved", bsns_year=bsns_year, rows=len(statement_data))
+        
+        with track_allocations("ingest.ratios"):
+            changes = diff_statement_rows(self.ratio_recompute_service.graph, before, statement_data)
+            await self.ratio_recompute_service.apply_changes(
+                company_info.corp_code, company_info.corp_name, bsns_year, reprt_code, changes
+            )
+        await report("ratios_computed", bsns_year=bsns_year, changed_cells=len(changes))
+        logger.info("재무제표 재수집 완료 - 회사: %s, 연도: %s, 행 수: %s", company_info.corp_name, bsns_year, len(statement_data))
+        return len(statement_data)
+
+    @traced()
+    async def ingest_full_statements(
+        self,
+        company_info: CompanyInfo,
+        year: int,
+        reprt_code: str = "11011",
+        batch_size: int = 500
+    ) -> int:
+        """전체 재무제표(모든 계정과목)를 스트리밍으로 수집하여 배치 단위로 저장합니다.
+        
+        주요계정 API에 없는 이자비용 등 세부 계정까지 저장합니다.
+        검증된 배치를 바로 저장하고 버리므로 응답 크기와 관계없이 메모리 사용량이 일정합니다.
+        기존 데이터는 첫 배치를 받은 뒤에 지우고 저장과 함께 한 트랜잭션으로 커밋하므로,
+        응답이 비어 있거나 도중에 실패하면 기존 데이터가 그대로 남습니다.
+        연결재무제표(CFS)가 없으면(013) 개별재무제표(OFS)로 다시 조회합니다.
         
         Args:
-            company_name: 회사명
+            company_info: 회사 정보
+            year: 사업연도
+            reprt_code: 보고서 코드
+            batch_size: 검증/저장 배치 크기
+            
+        Returns:
+            저장된 재무제표 행 수
+        """
+        graph = self.ratio_recompute_service.graph
+        bsns_year = str(year)
+        before = None
+        saved = 0
+        # 재무비율 입력 계정만 남겨 저장 후 변경분 비교에 사용
+        tracked = []
+        try:
+            with track_allocations("ingest_full.stream"):
+                for fs_div in FULL_STATEMENT_FS_DIVS:
+                    async for statements in self.dart_api.stream_full_statements(
+                        company_info.corp_code, year, reprt_code, fs_div=fs_div, batch_size=batch_size
+                    ):
+                        rows = self.data_processor.prepare_statement_batch(statements, company_info)
+                        if not rows:
+                            continue
+                        if before is None:
+                            before = await self.ratio_recompute_service.snapshot(company_info.corp_code, bsns_year, reprt_code)
+                            await delete_period_statements(self.db_session, company_info.corp_code, bsns_year, reprt_code)
+                        saved += await bulk_save_financial_statements(self.db_session, rows)
+                        tracked.extend(row for row in rows if graph.tracks(row["sj_div"], account_key(row)))
+                    if saved:
+                        break
+                    logger.info("전체 재무제표가 없습니다 - 회사: %s, 연도: %s, 구분: %s", company_info.corp_name, year, fs_div)
+        except Exception:
+            await self.db_session.rollback()
+            raise
+        
+        if not saved:
+            await self.db_session.rollback()
+            logger.warning("수집할 전체 재무제표가 없어 기존 데이터를 유지합니다 - 회사: %s, 연도: %s, 보고서: %s", company_info.corp_name, year, reprt_code)
+            return 0
+        await self.db_session.commit()
+        
+        changes = diff_statement_rows(graph, before, tracked)
+        if changes:
+            await self.ratio_recompute_service.apply_changes(
+                company_info.corp_code, company_info.corp_name, bsns_year, reprt_code, changes
+            )
+        logger.info("전체 재무제표 저장 완료 - 회사: %s, 연도: %s, 행 수: %s", company_info.corp_name, year, saved)
+        return saved
+
+    @traced()
+    async def fetch_and_save_financial_data(self, company_info: CompanyInfo, year: Optional[int] = None) -> Dict[str, Any]:
+        """확인된 회사의 재무제표 데이터를 조회하고 저장합니다.
+        
+        입력한 회사명이 보정된 경우에도 저장과 재조회가 같은 회사를 가리키도록
+        회사 정보는 호출하는 쪽에서 확인하여 넘기고, 조회는 회사 코드로 합니다.
+        
+        Args:
+            company_info: get_company_info로 확인(보정)된 회사 정보
             year: 조회할 연도. None이면 직전 연도의 데이터를 조회
         """
+        company_name = company_info.corp_name
         try:
-            # 1. 회사 정보 조회
-            company_info = await self.company_info_service.get_company_info(company_name)
-            
-            # 2. 기존 데이터 확인
-            if year is not None:
-                check_query = text("""
-                    SELECT bsns_year, sj_div, sj_nm, account_nm, 
-                           thstrm_amount, frmtrm_amount, bfefrmtrm_amount
-                    FROM fin_data 
-                    WHERE corp_name = :company_name
-                    AND bsns_year = :year
-                    AND sj_div != 'RATIO'
-                    ORDER BY bsns_year DESC, sj_div, ord
-                """)
-                result = await self.db_session.execute(check_query, {
-                    "company_name": company_name,
-                    "year": str(year)
-                })
-            else:
-                check_query = text("""
-                    SELECT bsns_year, sj_div, sj_nm, account_nm, 
-                           thstrm_amount, frmtrm_amount, bfefrmtrm_amount
-                    FROM fin_data 
-                    WHERE corp_name = :company_name
-                    AND sj_div != 'RATIO'
-                    ORDER BY bsns_year DESC, sj_div, ord
-                """)
-                result = await self.db_session.execute(check_query, {
-                    "company_name": company_name
-                })
-            
-            # 결과를 딕셔너리로 변환
-            data = []
-            for row in result:
-                row_dict = {}
-                for idx, column in enumerate(result.keys()):
-                    row_dict[column] = row[idx]
-                data.append(row_dict)
+            # 1. 기존 데이터 확인
+            year_filter = str(year) if year is not None else None
+            data = await get_company_statements(self.db_session, company_info.corp_code, year_filter)
             
             # 기존 데이터가 있으면 반환
             if data:
-                logger.info(f"기존 데이터가 존재합니다: {company_name}, 연도: {year}")
+                logger.info("기존 데이터가 존재합니다: %s, 연도: %s", company_name, year)
                 return {
                     "status": "success",
                     "message": f"{company_name}의 재무제표 데이터가 이미 존재합니다.",
+                    "corp_code": company_info.corp_code,
                     "data": data
                 }
             
-            # 3. 재무제표 데이터 조회
-            statements = await self.get_financial_statements(company_info, year)
+            # 2. 재무제표 데이터 조회
+            with track_allocations("ingest.fetch"):
+                statements = await self.get_financial_statements(company_info, year)
             
             if not statements:
                 return {
@@ -103,14 +207,19 @@ class FinancialStatementService:
                     "message": "재무제표 데이터를 찾을 수 없습니다."
                 }
             
-            # 4. 중복 제거
-            statements = self.data_processor.deduplicate_statements(statements)
+            # 3. 중복 제거
+            with span("FinancialStatementService.prepare_statements", statements=len(statements)), \
+                    track_allocations("ingest.prepare"):
+                statements = self.data_processor.deduplicate_statements(statements)
+                statement_data = self.data_processor.prepare_statement_batch(statements, company_info)
             
-            # 5. 새로운 데이터 저장
-            statement_data = [self.data_processor.prepare_statement_data(stmt, company_info) for stmt in statements]
-            await save_financial_statements(self.db_session, statement_data)
+            # 4. 새로운 데이터 저장
+            with span("FinancialStatementService.save_statements", rows=len(statement_data)), \
+                    track_allocations("ingest.save"):
+                await bulk_save_financial_statements(self.db_session, statement_data)
+                await self.db_session.commit()
             
-            # 6. 재무비율 계산 및 저장 (한 번만 실행)
+            # 5. 재무비율 계산 및 저장 (한 번만 실행)
             bsns_year = statements[0].bsns_year if statements else None
             if bsns_year:
                 # 기존 재무비율 데이터 확인
@@ -118,6 +227,7 @@ class FinancialStatementService:
                     SELECT 1 FROM fin_data 
                     WHERE corp_code = :corp_code 
                     AND bsns_year = :bsns_year
+                    AND reprt_code = '11011'
                     AND sj_div = 'RATIO'
                     LIMIT 1
                 """)
@@ -126,58 +236,24 @@ class FinancialStatementService:
                     "bsns_year": bsns_year
                 })
                 
-                # 재무비율 데이터가 없을 때만 계산 및 저장
+                # 재무비율 데이터가 없을 때만 계산 및 저장 (다음 연도 성장률도 함께 갱신)
                 if not ratio_result.fetchone():
-                    ratios = await self.ratio_service.calculate_and_save_ratios(
-                        corp_code=company_info.corp_code,
-                        corp_name=company_info.corp_name,
-                        bsns_year=bsns_year
+                    await self.ratio_recompute_service.apply_changes(
+                        company_info.corp_code, company_info.corp_name, bsns_year
                     )
             
-            # 7. 저장된 데이터 조회하여 반환
-            if year is not None:
-                data_query = text("""
-                    SELECT bsns_year, sj_div, sj_nm, account_nm, 
-                           thstrm_amount, frmtrm_amount, bfefrmtrm_amount
-                    FROM fin_data 
-                    WHERE corp_name = :company_name
-                    AND bsns_year = :year
-                    AND sj_div != 'RATIO'
-                    ORDER BY bsns_year DESC, sj_div, ord
-                """)
-                data_result = await self.db_session.execute(data_query, {
-                    "company_name": company_name,
-                    "year": str(year)
-                })
-            else:
-                data_query = text("""
-                    SELECT bsns_year, sj_div, sj_nm, account_nm, 
-                           thstrm_amount, frmtrm_amount, bfefrmtrm_amount
-                    FROM fin_data 
-                    WHERE corp_name = :company_name
-                    AND sj_div != 'RATIO'
-                    ORDER BY bsns_year DESC, sj_div, ord
-                """)
-                data_result = await self.db_session.execute(data_query, {
-                    "company_name": company_name
-                })
-            
-            # 결과를 딕셔너리로 변환
-            data = []
-            for row in data_result:
-                row_dict = {}
-                for idx, column in enumerate(data_result.keys()):
-                    row_dict[column] = row[idx]
-                data.append(row_dict)
+            # 6. 저장된 데이터 조회하여 반환
+            data = await get_company_statements(self.db_session, company_info.corp_code, year_filter)
             
             return {
                 "status": "success",
                 "message": f"{company_name}의 재무제표 데이터가 성공적으로 저장되었습니다.",
+                "corp_code": company_info.corp_code,
                 "data": data
             }
             
         except Exception as e:
-            logger.error(f"재무제표 데이터 저장 실패: {str(e)}")
+            logger.error("재무제표 데이터 저장 실패: %s", e)
             return {
                 "status": "error",
                 "message": str(e)
@@ -0,0 +1,86 @@
+from typing import Dict, Any
+from datetime import datetime
+import logging
+
+from app.domin.fin.models.schemas import CompanyInfo
+from app.platform.messaging.job_queue import JobContext
+from app.domin.fin.service.company_info_service import CompanyInfoService
+from app.domin.fin.service.financial_statement_service import FinancialStatementService
+from app.domin.fin.service.ratio_recompute_service import RatioRecomputeService
+
+logger = logging.getLogger(__name__)
+
+INGEST_JOB = "ingest_financial"
+RECOMPUTE_RATIOS_JOB = "recompute_ratios"
+SYNC_REPORT_JOB = "sync_report"
+
+# 수집 단계별 진행률
+INGEST_PROGRESS = {
+    "resolved": 0.1,
+    "fetched": 0.5,
+    "saved": 0.8,
+    "ratios_computed": 0.95
+}
+
+async def handle_ingest_financial(payload: Dict[str, Any], context: JobContext) -> Dict[str, Any]:
+    """회사명/연도로 재무제표를 수집하여 저장합니다."""
+    company_name = payload["company_name"]
+    year = payload.get("year")
+    reprt_code = payload.get("reprt_code", "11011")
+
+    async with context.session_factory() as session:
+        company_info = await CompanyInfoService(session).get_company_info(company_name)
+        company = {"corp_code": company_info.corp_code, "corp_name": company_info.corp_name}
+        await context.report(INGEST_PROGRESS["resolved"], "resolved", **company)
+
+        async def on_progress(stage: str, detail: Dict[str, Any]) -> None:
+            await context.report(INGEST_PROGRESS[stage], stage, **company, **detail)
+
+        statement_service = FinancialStatementService(session)
+        if payload.get("full_statement"):
+            rows = await statement_service.ingest_full_statements(
+                company_info, year or datetime.now().year - 1, reprt_code
+            )
+            await context.report(INGEST_PROGRESS["ratios_computed"], "ratios_computed", **company)
+        else:
+            rows = await statement_service.ingest_statements(
+                company_info, year, reprt_code, on_progress=on_progress
+            )
+        await session.commit()
+
+    return {"corp_code": company_info.corp_code, "corp_name": company_info.corp_name, "rows": rows}
+
+async def handle_recompute_ratios(payload: Dict[str, Any], context: JobContext) -> Dict[str, Any]:
+    """회사/기간의 TTM과 재무비율을 다시 계산합니다."""
+    async with context.session_factory() as session:
+        periods = await RatioRecomputeService(session).apply_changes(
+            corp_code=payload["corp_code"],
+            corp_name=payload["corp_name"],
+            bsns_year=payload["bsns_year"],
+            reprt_code=payload.get("reprt_code", "11011")
+        )
+    return {"periods": periods}
+
+async def handle_sync_report(payload: Dict[str, Any], context: JobContext) -> Dict[str, Any]:
+    """공시목록 동기화에서 확인된 신규/정정 정기보고서 기간을 재수집합니다."""
+    company_info = CompanyInfo(
+        corp_code=payload["corp_code"],
+        corp_name=payload["corp_name"],
+        stock_code=payload["stock_code"],
+        modify_date=payload["rcept_dt"]
+    )
+    async with context.session_factory() as session:
+        rows = await FinancialStatementService(session).ingest_statements(
+            company_info, int(payload["bsns_year"]), payload["reprt_code"]
+        )
+
+    # 관심 회사를 구독 중인 클라이언트에게 신규 공시 반영을 알림
+    if context.event_bus is not None:
+        await context.event_bus.publish("filing", **payload, rows=rows)
+    return {"corp_code": company_info.corp_code, "rcept_no": payload["rcept_no"], "rows": rows}
+
+FIN_JOB_HANDLERS = {
+    INGEST_JOB: handle_ingest_financial,
+    RECOMPUTE_RATIOS_JOB: handle_recompute_ratios,
+    SYNC_REPORT_JOB: handle_sync_report
+}
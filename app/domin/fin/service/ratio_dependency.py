@@ -0,0 +1,89 @@
+from typing import Dict, Any, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from app.domin.fin.service.ratio_registry import RATIO_EVALUATOR
+
+# 재무비율별 입력 계정: (재무제표 구분, 계정과목, 연도 오프셋)
+# 오프셋 -1은 같은 보고서 코드의 전년도 값을 뜻합니다 (성장률). 레지스트리 정의에서 만들어집니다.
+RATIO_INPUTS: Dict[str, List[Tuple[str, str, int]]] = RATIO_EVALUATOR.dependencies()
+
+Period = Tuple[str, str]  # (사업연도, 보고서 코드)
+AccountKey = Tuple[str, str]  # (재무제표 구분, 계정과목)
+
+class StatementChange(NamedTuple):
+    """값이 바뀐 재무제표 셀"""
+    bsns_year: str
+    reprt_code: str
+    sj_div: str
+    account_nm: str
+
+class RatioDependencyGraph:
+    """재무제표 계정 → 재무비율 셀 역방향 의존성 그래프
+
+    계정 값이 바뀌었을 때 다시 계산해야 하는 (기간, 재무비율) 셀만 찾아냅니다.
+    """
+
+    def __init__(self, ratio_inputs: Optional[Dict[str, List[Tuple[str, str, int]]]] = None):
+        self.ratio_inputs = ratio_inputs or RATIO_INPUTS
+        self._dependents: Dict[AccountKey, List[Tuple[str, int]]] = {}
+        for metric, inputs in self.ratio_inputs.items():
+            for sj_div, account_nm, offset in inputs:
+                self._dependents.setdefault((sj_div, account_nm), []).append((metric, offset))
+
+    @property
+    def metrics(self) -> List[str]:
+        return list(self.ratio_inputs)
+
+    @property
+    def accounts(self) -> List[str]:
+        """그래프에 등장하는 모든 계정과목명"""
+        return sorted({account_nm for _, account_nm in self._dependents})
+
+    def tracks(self, sj_div: str, account_nm: str) -> bool:
+        return (sj_div, account_nm) in self._dependents
+
+    def affected(self, changes: Iterable[StatementChange]) -> Dict[Period, Set[str]]:
+        """변경된 셀 목록으로부터 기간별로 다시 계산할 재무비율을 구합니다."""
+        plan: Dict[Period, Set[str]] = {}
+        for change in changes:
+            for metric, offset in self._dependents.get((change.sj_div, change.account_nm), ()):
+                # 전년도 값(오프셋 -1)을 참조하는 지표는 다음 연도 셀이 영향을 받음
+                year = str(int(change.bsns_year) - offset)
+                plan.setdefault((year, change.reprt_code), set()).add(metric)
+        return plan
+
+    def all_changed(self, bsns_year: str, reprt_code: str) -> List[StatementChange]:
+        """기간 전체가 바뀐 것으로 간주할 때의 변경 목록 (신규 수집, 강제 재계산)"""
+        return [
+            StatementChange(bsns_year, reprt_code, sj_div, account_nm)
+            for sj_div, account_nm in self._dependents
+        ]
+
+# 기본 레지스트리로 만든 그래프 (변경되지 않으므로 서비스 인스턴스 간에 공유)
+DEFAULT_GRAPH = RatioDependencyGraph()
+
+def amount_signature(row: Dict[str, Any]) -> Tuple[Optional[float], ...]:
+    """변경 여부 비교에 쓰는 금액 묶음 (당기, 당기누적, 전기)"""
+    return tuple(
+        None if row.get(column) is None else float(row[column])
+        for column in ("thstrm_amount", "thstrm_add_amount", "frmtrm_amount")
+    )
+
+def account_key(row: Dict[str, Any]) -> str:
+    """행의 표준 계정명. 표준 계정 컬럼이 없거나 비어 있으면 계정과목명"""
+    return row.get("canonical_account") or row["account_nm"]
+
+def diff_statement_rows(
+    graph: RatioDependencyGraph,
+    before: Iterable[Dict[str, Any]],
+    after: Iterable[Dict[str, Any]]
+) -> List[StatementChange]:
+    """저장 전후 행을 비교하여 재무비율에 영향을 주는 변경 셀만 반환합니다. 추가/삭제도 변경으로 봅니다."""
+    def index(rows: Iterable[Dict[str, Any]]) -> Dict[StatementChange, Tuple[Optional[float], ...]]:
+        return {
+            StatementChange(str(row["bsns_year"]), row["reprt_code"], row["sj_div"], account_key(row)): amount_signature(row)
+            for row in rows
+            if graph.tracks(row["sj_div"], account_key(row))
+        }
+
+    old, new = index(before), index(after)
+    return [key for key in old.keys() | new.keys() if old.get(key) != new.get(key)]
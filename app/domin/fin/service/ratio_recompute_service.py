@@ -0,0 +1,107 @@
+import logging
+from typing import Dict, Any, List, Optional, Set
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domin.fin.repository.fin_repository import get_ratio_inputs, save_ratio_cells
+from app.domin.fin.service.ratio_dependency import DEFAULT_GRAPH, Period, RatioDependencyGraph, StatementChange
+from app.domin.fin.service.ratio_service import RatioService
+from app.domin.fin.service.response_snapshot_service import ResponseSnapshotService
+from app.domin.fin.service.ttm_service import FLOW_ACCOUNTS, TtmService
+from app.foundation.infra.tracing.tracer import traced
+
+logger = logging.getLogger(__name__)
+
+class RatioRecomputeService:
+    """재무제표 변경분으로부터 영향받는 재무비율 셀만 찾아 일괄 재계산합니다.
+
+    재계산 비용이 전체 데이터 크기가 아니라 바뀐 셀 수에 비례하도록,
+    의존성 그래프로 (기간, 재무비율) 셀을 구한 뒤 필요한 기간의 입력만 한 번에 조회합니다.
+    """
+
+    def __init__(self, db_session: AsyncSession, graph: Optional[RatioDependencyGraph] = None):
+        self.db_session = db_session
+        self.graph = graph or DEFAULT_GRAPH
+        self.ratio_service = RatioService(db_session)
+        self.ttm_service = TtmService(db_session)
+        self.snapshot_service = ResponseSnapshotService(db_session)
+
+    @traced()
+    async def snapshot(self, corp_code: str, bsns_year: str, reprt_code: str) -> List[Dict[str, Any]]:
+        """저장 전후 비교를 위해 기간의 재무비율 입력 계정 값을 조회합니다."""
+        rows = await get_ratio_inputs(self.db_session, corp_code, [bsns_year], [reprt_code], self.graph.accounts)
+        return [row for row in rows if row["sj_div"] != "TTM"]
+
+    @traced()
+    async def apply_changes(
+        self,
+        corp_code: str,
+        corp_name: str,
+        bsns_year: str,
+        reprt_code: str = "11011",
+        changes: Optional[List[StatementChange]] = None
+    ) -> List[Dict[str, Any]]:
+        """한 기간의 재무제표 변경을 TTM과 재무비율에 반영하고 커밋합니다.
+
+        Args:
+            changes: 값이 바뀐 셀 목록. None이면 기간 전체가 바뀐 것으로 간주 (신규 수집, 강제 재계산)
+
+        Returns:
+            기간별 재계산된 재무비율 셀 목록
+        """
+        if changes is None:
+            changes = self.graph.all_changed(bsns_year, reprt_code)
+
+        # 손익 계정이 바뀐 경우에만 TTM을 다시 계산
+        if any(change.sj_div == "IS" and change.account_nm in FLOW_ACCOUNTS for change in changes):
+            changes = changes + await self.ttm_service.refresh(corp_code, corp_name, bsns_year, reprt_code)
+
+        results = await self.recompute(corp_code, corp_name, changes)
+        await self.refresh_snapshots(
+            corp_code,
+            corp_name,
+            {bsns_year} | {result["bsns_year"] for result in results},
+            {reprt_code} | {result["reprt_code"] for result in results}
+        )
+        await self.db_session.commit()
+        return results
+
+    async def refresh_snapshots(self, corp_code: str, corp_name: str, years: Set[str], reprt_codes: Set[str]) -> None:
+        """갱신된 기간의 응답 스냅샷을 다시 만듭니다. 실패해도 재무비율 저장은 유지합니다."""
+        try:
+            async with self.db_session.begin_nested():
+                await self.snapshot_service.refresh(corp_code, corp_name, years, reprt_codes)
+        except Exception as e:
+            # 남은 오래된 스냅샷은 버전이 같으면 그대로 제공되므로 경고로 남김
+            logger.warning("응답 스냅샷 갱신 실패 - 회사: %s, 연도: %s: %s", corp_code, sorted(years), e)
+
+    @traced()
+    async def recompute(self, corp_code: str, corp_name: str, changes: List[StatementChange]) -> List[Dict[str, Any]]:
+        """변경 셀에 의존하는 재무비율 셀만 다시 계산하여 저장합니다. 커밋은 호출하는 쪽에서 합니다."""
+        plan = self.graph.affected(changes)
+        if not plan:
+            return []
+
+        # 대상 기간과 성장률 계산용 전년도 입력을 한 번에 조회
+        years = sorted({year for year, _ in plan} | {str(int(year) - 1) for year, _ in plan})
+        reprt_codes = sorted({reprt_code for _, reprt_code in plan})
+        rows = await get_ratio_inputs(self.db_session, corp_code, years, reprt_codes)
+        by_period: Dict[Period, List[Dict[str, Any]]] = {}
+        for row in rows:
+            by_period.setdefault((row["bsns_year"], row["reprt_code"]), []).append(row)
+
+        results = []
+        for (year, reprt_code), metrics in sorted(plan.items()):
+            statements = by_period.get((year, reprt_code), [])
+            # 아직 수집되지 않은 기간(다음 연도 등)은 건너뜀
+            if not any(statement["sj_div"] != "TTM" for statement in statements):
+                continue
+            ratios = self.ratio_service.calculate_from_statements(
+                statements, by_period.get((str(int(year) - 1), reprt_code)), metrics
+            )
+            # 계산할 수 없게 된 지표는 NULL로 갱신
+            values = {metric: ratios.get(metric) for metric in sorted(metrics)}
+            await save_ratio_cells(self.db_session, corp_code, corp_name, year, reprt_code, values)
+            results.append({"bsns_year": year, "reprt_code": reprt_code, "ratios": values})
+
+        logger.info("재무비율 증분 재계산 - 회사: %s, 변경 셀: %s, 재계산 셀: %s", corp_code, len(changes), sum(len(result['ratios']) for result in results))
+        return results
@@ -0,0 +1,305 @@
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, Callable, Iterable, List, Optional, Sequence, Tuple
+
+FinancialData = Dict[str, Dict[str, Dict[str, float]]]
+ColumnKey = Tuple[str, str, str]  # (재무제표 구분, 계정과목, current/previous)
+
+@dataclass(frozen=True)
+class Operand:
+    """재무비율 입력 값
+
+    accounts가 여러 개면 존재하는 계정의 합계를 사용하고,
+    모두 없으면 fallback 입력을 사용합니다.
+    """
+    sj_div: str
+    accounts: Tuple[str, ...]
+    period: str = "current"  # current: 당기, previous: 전기 (전년도 같은 보고서)
+    fallback: Optional["Operand"] = None
+
+    def dependencies(self) -> List[Tuple[str, str, int]]:
+        """(재무제표 구분, 계정과목, 연도 오프셋) 목록"""
+        # 전기 값은 같은 행의 전기금액 또는 전년도 보고서의 당기금액에서 옴
+        offsets = (0, -1) if self.period == "previous" else (0,)
+        deps = [(self.sj_div, account_nm, offset) for account_nm in self.accounts for offset in offsets]
+        if self.fallback is not None:
+            deps.extend(self.fallback.dependencies())
+        return deps
+
+def account(sj_div: str, *accounts: str, period: str = "current", fallback: Optional[Operand] = None) -> Operand:
+    return Operand(sj_div, tuple(accounts), period, fallback)
+
+@dataclass(frozen=True)
+class RatioDefinition:
+    """재무비율 정의
+
+    kind가 ratio이면 numerator / denominator * scale,
+    growth이면 (numerator - denominator) / |denominator| * scale 로 계산합니다.
+    분모가 zero_policy를 만족하지 않거나 입력이 없으면 missing 값을 사용하며, None이면 결과에서 생략합니다.
+    """
+    name: str                        # fin_data 컬럼명 / 결과 키
+    label: str                       # 한글 지표명 (재무비율 조회 응답 키)
+    numerator: Operand
+    denominator: Operand
+    kind: str = "ratio"              # ratio | growth
+    scale: float = 100.0
+    unit: str = "%"
+    zero_policy: str = "positive"    # positive: 분모 > 0, nonzero: 분모 != 0
+    missing: Optional[float] = None
+    stored: bool = True              # fin_data 재무비율(RATIO) 행에 저장 여부
+
+    def dependencies(self) -> List[Tuple[str, str, int]]:
+        deps = self.numerator.dependencies() + self.denominator.dependencies()
+        return list(dict.fromkeys(deps))
+
+# 분기/반기 보고서는 TTM 순이익이 있으면 우선 사용
+NET_INCOME_FOR_RETURNS = account("TTM", "당기순이익", fallback=account("IS", "당기순이익"))
+
+# 계정과목은 표준 계정명 (account_taxonomy), 저장 컬럼 순서는 재무비율 조회 응답의 키 순서와 같음
+RATIO_REGISTRY: List[RatioDefinition] = [
+    RatioDefinition("debt_ratio", "부채비율", account("BS", "부채총계"), account("BS", "자본총계")),
+    RatioDefinition("current_ratio", "유동비율", account("BS", "유동자산"), account("BS", "유동부채")),
+    RatioDefinition(
+        "interest_coverage_ratio", "이자보상배율",
+        account("IS", "영업이익"), account("IS", "이자비용"),
+        scale=1.0, unit="배"
+    ),
+    RatioDefinition("operating_profit_ratio", "영업이익률", account("IS", "영업이익"), account("IS", "매출액")),
+    RatioDefinition("net_profit_ratio", "순이익률", account("IS", "당기순이익"), account("IS", "매출액")),
+    RatioDefinition("roe", "ROE", NET_INCOME_FOR_RETURNS, account("BS", "자본총계")),
+    RatioDefinition("roa", "ROA", NET_INCOME_FOR_RETURNS, account("BS", "자산총계")),
+    RatioDefinition(
+        "debt_dependency", "부채의존도",
+        account("BS", "단기차입금", "장기차입금", "사채", "유동성장기부채"), account("BS", "자산총계")
+    ),
+    RatioDefinition(
+        "cash_flow_debt_ratio", "현금흐름부채비율",
+        account("CF", "영업활동현금흐름"),
+        account("BS", "부채총계")
+    ),
+    RatioDefinition(
+        "sales_growth", "매출액증가율",
+        account("IS", "매출액"), account("IS", "매출액", period="previous"),
+        kind="growth", zero_policy="nonzero"
+    ),
+    RatioDefinition(
+        "operating_profit_growth", "영업이익증가율",
+        account("IS", "영업이익"), account("IS", "영업이익", period="previous"),
+        kind="growth", zero_policy="nonzero"
+    ),
+    RatioDefinition(
+        "eps_growth", "EPS증가율",
+        account("IS", "기본주당이익"), account("IS", "기본주당이익", period="previous"),
+        kind="growth", zero_policy="nonzero"
+    ),
+    RatioDefinition(
+        "net_income_growth", "순이익증가율",
+        account("IS", "당기순이익"), account("IS", "당기순이익", period="previous"),
+        kind="growth", zero_policy="nonzero", stored=False
+    )
+]
+
+class RatioEvaluator:
+    """재무비율 정의 목록을 한 번 컴파일하여 반복 평가하는 평가기
+
+    정의마다 입력 조회와 계산을 클로저로 미리 묶어 두므로 평가 시에는 정의를 해석하지 않습니다.
+    회사 하나(evaluate)와 전체 시장 배치(evaluate_columns, evaluate_many)를 모두 지원하며
+    지표별 평가 시간을 누적합니다.
+    """
+
+    def __init__(self, definitions: Iterable[RatioDefinition]):
+        self.definitions: Dict[str, RatioDefinition] = {}
+        for definition in definitions:
+            if definition.kind not in ("ratio", "growth"):
+                raise ValueError(f"지원하지 않는 재무비율 유형입니다: {definition.kind}")
+            if definition.zero_policy not in ("positive", "nonzero"):
+                raise ValueError(f"지원하지 않는 분모 조건입니다: {definition.zero_policy}")
+            self.definitions[definition.name] = definition
+
+        self._scalar = {name: self._compile(definition) for name, definition in self.definitions.items()}
+        self._columnar = {name: self._compile_columns(definition) for name, definition in self.definitions.items()}
+        self._timings: Dict[str, List[int]] = {name: [0, 0] for name in self.definitions}  # [평가 수, 누적 ns]
+
+    @property
+    def stored_columns(self) -> List[str]:
+        return [name for name, definition in self.definitions.items() if definition.stored]
+
+    def dependencies(self, stored_only: bool = True) -> Dict[str, List[Tuple[str, str, int]]]:
+        """지표별 입력 계정 (의존성 그래프 구성용)"""
+        return {
+            name: definition.dependencies()
+            for name, definition in self.definitions.items()
+            if definition.stored or not stored_only
+        }
+
+    @staticmethod
+    def _accept(zero_policy: str) -> Callable[[float], bool]:
+        if zero_policy == "positive":
+            return lambda value: value > 0
+        return lambda value: value != 0
+
+    @classmethod
+    def _compile_operand(cls, operand: Operand) -> Callable[[FinancialData], Optional[float]]:
+        sj_div, accounts, field = operand.sj_div, operand.accounts, operand.period
+        fallback = cls._compile_operand(operand.fallback) if operand.fallback is not None else None
+
+        if len(accounts) == 1:
+            account_nm = accounts[0]
+
+            def get(data: FinancialData) -> Optional[float]:
+                item = data.get(sj_div, {}).get(account_nm)
+                if item is None:
+                    return fallback(data) if fallback is not None else None
+                return item[field]
+            return get
+
+        def get_sum(data: FinancialData) -> Optional[float]:
+            section = data.get(sj_div, {})
+            values = [section[account_nm][field] for account_nm in accounts if account_nm in section]
+            if not values:
+                return fallback(data) if fallback is not None else None
+            return sum(values)
+        return get_sum
+
+    @classmethod
+    def _compile(cls, definition: RatioDefinition) -> Callable[[FinancialData], Optional[float]]:
+        numerator = cls._compile_operand(definition.numerator)
+        denominator = cls._compile_operand(definition.denominator)
+        accept = cls._accept(definition.zero_policy)
+        scale, missing = definition.scale, definition.missing
+
+        if definition.kind == "growth":
+            def evaluate_growth(data: FinancialData) -> Optional[float]:
+                current, previous = numerator(data), denominator(data)
+                if current is None or previous is None or not accept(previous):
+                    return missing
+                return (current - previous) / abs(previous) * scale
+            return evaluate_growth
+
+        def evaluate_ratio(data: FinancialData) -> Optional[float]:
+            value, base = numerator(data), denominator(data)
+            if value is None or base is None or not accept(base):
+                return missing
+            return value / base * scale
+        return evaluate_ratio
+
+    @classmethod
+    def _compile_operand_columns(cls, operand: Operand) -> Callable[[Dict[ColumnKey, Sequence[Optional[float]]], int], List[Optional[float]]]:
+        keys = [(operand.sj_div, account_nm, operand.period) for account_nm in operand.accounts]
+        fallback = cls._compile_operand_columns(operand.fallback) if operand.fallback is not None else None
+
+        def get(columns: Dict[ColumnKey, Sequence[Optional[float]]], size: int) -> List[Optional[float]]:
+            present = [columns[key] for key in keys if key in columns]
+            if len(present) == 1:
+                values = list(present[0])
+            else:
+                values = [None] * size
+                for column in present:
+                    values = [
+                        value if total is None else (total if value is None else total + value)
+                        for total, value in zip(values, column)
+                    ]
+            if fallback is not None and any(value is None for value in values):
+                alternatives = fallback(columns, size)
+                values = [alternative if value is None else value for value, alternative in zip(values, alternatives)]
+            return values
+        return get
+
+    @classmethod
+    def _compile_columns(cls, definition: RatioDefinition):
+        numerator = cls._compile_operand_columns(definition.numerator)
+        denominator = cls._compile_operand_columns(definition.denominator)
+        accept = cls._accept(definition.zero_policy)
+        scale, missing = definition.scale, definition.missing
+        growth = definition.kind == "growth"
+
+        def evaluate(columns: Dict[ColumnKey, Sequence[Optional[float]]], size: int) -> List[Optional[float]]:
+            results = []
+            for value, base in zip(numerator(columns, size), denominator(columns, size)):
+                if value is None or base is None or not accept(base):
+                    results.append(missing)
+                elif growth:
+                    results.append((value - base) / abs(base) * scale)
+                else:
+                    results.append(value / base * scale)
+            return results
+        return evaluate
+
+    def _selected(self, metrics: Optional[Iterable[str]]) -> List[str]:
+        if metrics is None:
+            return list(self.definitions)
+        wanted = set(metrics)
+        return [name for name in self.definitions if name in wanted]
+
+    def evaluate(self, financial_data: FinancialData, metrics: Optional[Iterable[str]] = None) -> Dict[str, float]:
+        """회사 한 기간의 재무비율을 계산합니다. 계산할 수 없는 지표는 missing 정책에 따릅니다."""
+        results = {}
+        for name in self._selected(metrics):
+            started = time.perf_counter_ns()
+            value = self._scalar[name](financial_data)
+            timing = self._timings[name]
+            timing[0] += 1
+            timing[1] += time.perf_counter_ns() - started
+            if value is not None:
+                results[name] = value
+        return results
+
+    def evaluate_columns(
+        self,
+        columns: Dict[ColumnKey, Sequence[Optional[float]]],
+        size: int,
+        metrics: Optional[Iterable[str]] = None
+    ) -> Dict[str, List[Optional[float]]]:
+        """(재무제표 구분, 계정과목, current/previous)별 값 배열로 여러 회사의 재무비율을 한 번에 계산합니다."""
+        results = {}
+        for name in self._selected(metrics):
+            started = time.perf_counter_ns()
+            results[name] = self._columnar[name](columns, size)
+            timing = self._timings[name]
+            timing[0] += size
+            timing[1] += time.perf_counter_ns() - started
+        return results
+
+    def evaluate_many(self, records: Sequence[FinancialData], metrics: Optional[Iterable[str]] = None) -> List[Dict[str, float]]:
+        """회사별 재무 데이터 목록을 열 배열로 변환하여 일괄 계산합니다."""
+        columns = to_columns(records)
+        evaluated = self.evaluate_columns(columns, len(records), metrics)
+        return [
+            {name: values[index] for name, values in evaluated.items() if values[index] is not None}
+            for index in range(len(records))
+        ]
+
+    def timing_stats(self) -> Dict[str, Dict[str, Any]]:
+        """지표별 평가 횟수와 누적/평균 시간"""
+        return {
+            name: {
+                "evaluations": count,
+                "total_ms": round(total_ns / 1e6, 3),
+                "avg_us": round(total_ns / count / 1e3, 3) if count else 0.0
+            }
+            for name, (count, total_ns) in self._timings.items()
+        }
+
+    def reset_timings(self) -> None:
+        for timing in self._timings.values():
+            timing[0] = timing[1] = 0
+
+def to_columns(records: Sequence[FinancialData]) -> Dict[ColumnKey, List[Optional[float]]]:
+    """회사별 재무 데이터(재무제표 구분 → 계정과목 → current/previous)를 열 배열로 변환합니다."""
+    columns: Dict[ColumnKey, List[Optional[float]]] = {}
+    size = len(records)
+    for index, record in enumerate(records):
+        for sj_div, section in record.items():
+            for account_nm, values in section.items():
+                for field in ("current", "previous"):
+                    if field not in values:
+                        continue
+                    # setdefault에 기본 배열을 넘기면 값마다 회사 수 크기의 리스트를 만들므로 없을 때만 생성
+                    column = columns.get((sj_div, account_nm, field))
+                    if column is None:
+                        column = columns[(sj_div, account_nm, field)] = [None] * size
+                    column[index] = values[field]
+    return columns
+
+# 애플리케이션 전역 평가기 (import 시 한 번 컴파일)
+RATIO_EVALUATOR = RatioEvaluator(RATIO_REGISTRY)
@@ -1,33 +1,33 @@
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterable, Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 from datetime import datetime
 from sqlalchemy import text
 
+from app.domin.fin.service.ratio_registry import RATIO_EVALUATOR
+from app.foundation.infra.tracing.tracer import traced
+
 logger = logging.getLogger(__name__)
 
 class RatioService:
     def __init__(self, db_session: AsyncSession):
         self.db_session = db_session
 
-    def _calculate_growth_rate(self, current: float, previous: float) -> float:
-        """성장률을 계산합니다."""
-        if previous == 0:
-            return 0.0
-        return ((current - previous) / abs(previous)) * 100
-
-    async def _get_financial_statements(self, corp_code: str, bsns_year: str) -> List[Dict[str, Any]]:
-        """재무제표 데이터를 조회합니다."""
+    @traced()
+    async def _get_financial_statements(self, corp_code: str, bsns_year: str, reprt_code: str = "11011") -> List[Dict[str, Any]]:
+        """재무제표 데이터를 조회합니다. 최근 4분기 합계(TTM) 행도 함께 조회합니다."""
         query = text("""
             SELECT * FROM fin_data 
             WHERE corp_code = :corp_code 
             AND bsns_year = :bsns_year
-            AND sj_div IN ('BS', 'IS')
+            AND reprt_code = :reprt_code
+            AND sj_div IN ('BS', 'IS', 'CF', 'TTM')
             ORDER BY sj_div, ord
         """)
         result = await self.db_session.execute(query, {
             "corp_code": corp_code,
-            "bsns_year": bsns_year
+            "bsns_year": bsns_year,
+            "reprt_code": reprt_code
         })
         
         statements = []
@@ -39,114 +39,106 @@ class RatioService:
         
         return statements
 
-    def _extract_financial_data(self, statements: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
-        """재무제표 데이터에서 필요한 항목을 추출합니다."""
+    @traced()
+    def _extract_financial_data(
+        self,
+        statements: List[Dict[str, Any]],
+        previous_statements: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Dict[str, float]]:
+        """재무제표 데이터에서 필요한 항목을 추출합니다.
+        
+        전년도 같은 보고서가 저장되어 있으면 전기 금액 대신 그 당기 금액을 사용하여
+        전년도 정정 공시가 성장률에 반영되도록 합니다.
+        """
         financial_data = {
             "BS": {},  # 재무상태표
-            "IS": {}   # 손익계산서
+            "IS": {},  # 손익계산서
+            "CF": {},  # 현금흐름표
+            "TTM": {}  # 최근 4분기 합계
         }
         
         for statement in statements:
             sj_div = statement["sj_div"]
-            account_nm = statement["account_nm"]
+            # 표준 계정이 매핑된 행은 표준 계정명으로 모음 (예: "수익(매출액)" → "매출액")
+            account_nm = statement.get("canonical_account") or statement["account_nm"]
+            # 같은 표준 계정이 여러 행이면 정렬순서가 앞선 행을 사용
+            if account_nm in financial_data.setdefault(sj_div, {}):
+                continue
             
-            # 당기, 전기, 전전기 데이터 추출
+            # 당기, 전기, 전전기 데이터 추출 (TTM 행에는 당기 금액만 있음)
             financial_data[sj_div][account_nm] = {
-                "current": float(statement["thstrm_amount"]),
-                "previous": float(statement["frmtrm_amount"]),
-                "prev_previous": float(statement["bfefrmtrm_amount"])
+                "current": float(statement["thstrm_amount"] or 0),
+                "previous": float(statement["frmtrm_amount"] or 0),
+                "prev_previous": float(statement["bfefrmtrm_amount"] or 0)
             }
         
+        for statement in previous_statements or []:
+            account_nm = statement.get("canonical_account") or statement["account_nm"]
+            current = financial_data.get(statement["sj_div"], {}).get(account_nm)
+            if current is not None and statement["thstrm_amount"] is not None:
+                current["previous"] = float(statement["thstrm_amount"])
+        
         return financial_data
 
-    def _calculate_ratios(self, financial_data: Dict[str, Dict[str, Dict[str, float]]]) -> Dict[str, float]:
-        """재무비율을 계산합니다."""
-        ratios = {}
-        bs_data = financial_data["BS"]
-        is_data = financial_data["IS"]
-        
-        # 안정성 지표
-        if "자산총계" in bs_data and "부채총계" in bs_data and "자본총계" in bs_data:
-            total_assets = bs_data["자산총계"]["current"]
-            total_liabilities = bs_data["부채총계"]["current"]
-            total_equity = bs_data["자본총계"]["current"]
-            
-            if total_equity > 0:
-                ratios["debt_ratio"] = (total_liabilities / total_equity) * 100
-            
-            if total_assets > 0:
-                ratios["roa"] = (is_data["당기순이익"]["current"] / total_assets) * 100
-        
-        if "유동자산" in bs_data and "유동부채" in bs_data:
-            current_assets = bs_data["유동자산"]["current"]
-            current_liabilities = bs_data["유동부채"]["current"]
-            if current_liabilities > 0:
-                ratios["current_ratio"] = (current_assets / current_liabilities) * 100
-        
-        # 수익성 지표
-        if "매출액" in is_data and "영업이익" in is_data and "당기순이익" in is_data:
-            revenue = is_data["매출액"]["current"]
-            operating_profit = is_data["영업이익"]["current"]
-            net_income = is_data["당기순이익"]["current"]
-            
-            if revenue > 0:
-                ratios["operating_profit_ratio"] = (operating_profit / revenue) * 100
-                ratios["net_profit_ratio"] = (net_income / revenue) * 100
-            
-            if "자본총계" in bs_data and bs_data["자본총계"]["current"] > 0:
-                ratios["roe"] = (net_income / bs_data["자본총계"]["current"]) * 100
-        
-        # 성장률 지표
-        if "매출액" in is_data:
-            ratios["sales_growth"] = self._calculate_growth_rate(
-                is_data["매출액"]["current"],
-                is_data["매출액"]["previous"]
-            )
-        
-        if "영업이익" in is_data:
-            ratios["operating_profit_growth"] = self._calculate_growth_rate(
-                is_data["영업이익"]["current"],
-                is_data["영업이익"]["previous"]
-            )
-        
-        return ratios
+    @traced()
+    def _calculate_ratios(
+        self,
+        financial_data: Dict[str, Dict[str, Dict[str, float]]],
+        metrics: Optional[Iterable[str]] = None
+    ) -> Dict[str, float]:
+        """재무비율을 계산합니다. 지표 정의와 0/누락 처리는 재무비율 레지스트리를 따릅니다."""
+        return RATIO_EVALUATOR.evaluate(financial_data, metrics)
 
-    async def calculate_financial_ratios(self, corp_code: str, bsns_year: str) -> Dict[str, Any]:
+    def calculate_from_statements(
+        self,
+        statements: List[Dict[str, Any]],
+        previous_statements: Optional[List[Dict[str, Any]]] = None,
+        metrics: Optional[Iterable[str]] = None
+    ) -> Dict[str, float]:
+        """이미 조회된 재무제표 행으로 재무비율을 계산합니다. metrics가 주어지면 해당 지표만 계산합니다."""
+        return self._calculate_ratios(self._extract_financial_data(statements, previous_statements), metrics)
+
+    @traced()
+    async def calculate_financial_ratios(self, corp_code: str, bsns_year: str, reprt_code: str = "11011") -> Dict[str, Any]:
         """재무비율을 계산합니다."""
         try:
-            statements = await self._get_financial_statements(corp_code, bsns_year)
-            if not statements:
-                logger.warning(f"재무제표 데이터가 없습니다: {corp_code}, {bsns_year}")
+            statements = await self._get_financial_statements(corp_code, bsns_year, reprt_code)
+            if not any(statement["sj_div"] != "TTM" for statement in statements):
+                logger.warning("재무제표 데이터가 없습니다: %s, %s, %s", corp_code, bsns_year, reprt_code)
                 return {}
             
-            financial_data = self._extract_financial_data(statements)
+            previous_statements = await self._get_financial_statements(corp_code, str(int(bsns_year) - 1), reprt_code)
+            financial_data = self._extract_financial_data(statements, previous_statements)
             ratios = self._calculate_ratios(financial_data)
             
             return {
                 "corp_code": corp_code,
                 "bsns_year": bsns_year,
+                "reprt_code": reprt_code,
                 **ratios
             }
             
         except Exception as e:
-            logger.error(f"재무비율 계산 중 오류 발생: {str(e)}")
+            logger.error("재무비율 계산 중 오류 발생: %s", e)
             raise
 
-    async def calculate_and_save_ratios(self, corp_code: str, corp_name: str, bsns_year: str) -> Dict[str, Any]:
+    @traced()
+    async def calculate_and_save_ratios(self, corp_code: str, corp_name: str, bsns_year: str, reprt_code: str = "11011") -> Dict[str, Any]:
         """재무비율을 계산하고 저장합니다."""
         try:
-            ratios = await self.calculate_financial_ratios(corp_code, bsns_year)
+            ratios = await self.calculate_financial_ratios(corp_code, bsns_year, reprt_code)
             if not ratios:
                 return {}
             
-            await self._save_ratios(corp_code, corp_name, bsns_year, ratios)
+            await self._save_ratios(corp_code, corp_name, bsns_year, ratios, reprt_code)
             return ratios
             
         except Exception as e:
-            logger.error(f"재무비율 계산 및 저장 실패: {str(e)}")
+            logger.error("재무비율 계산 및 저장 실패: %s", e)
             raise
 
-    async def _save_ratios(self, corp_code: str, corp_name: str, bsns_year: str, ratios: Dict[str, float]) -> None:
+    @traced()
+    async def _save_ratios(self, corp_code: str, corp_name: str, bsns_year: str, ratios: Dict[str, float], reprt_code: str = "11011") -> None:
         """계산된 재무비율을 저장합니다."""
         try:
             # 기존 재무비율 데이터 삭제
@@ -154,46 +146,42 @@ class RatioService:
                 DELETE FROM fin_data 
                 WHERE corp_code = :corp_code 
                 AND bsns_year = :bsns_year
+                AND reprt_code = :reprt_code
                 AND sj_div = 'RATIO'
             """)
             await self.db_session.execute(delete_query, {
                 "corp_code": corp_code,
-                "bsns_year": bsns_year
+                "bsns_year": bsns_year,
+                "reprt_code": reprt_code
             })
             
-            # 새로운 재무비율 데이터 저장
-            insert_query = text("""
+            # 새로운 재무비율 데이터 저장 (컬럼은 레지스트리의 저장 대상 지표)
+            columns = RATIO_EVALUATOR.stored_columns
+            insert_query = text(f"""
                 INSERT INTO fin_data (
-                    corp_code, corp_name, bsns_year, sj_div, sj_nm,
-                    debt_ratio, current_ratio,
-                    operating_profit_ratio, net_profit_ratio, roe, roa,
-                    sales_growth, operating_profit_growth
+                    corp_code, corp_name, bsns_year, reprt_code, sj_div, sj_nm,
+                    {", ".join(columns)}
                 ) VALUES (
-                    :corp_code, :corp_name, :bsns_year, 'RATIO', '재무비율',
-                    :debt_ratio, :current_ratio,
-                    :operating_profit_ratio, :net_profit_ratio, :roe, :roa,
-                    :sales_growth, :operating_profit_growth
+                    :corp_code, :corp_name, :bsns_year, :reprt_code, 'RATIO', '재무비율',
+                    {", ".join(f":{column}" for column in columns)}
                 )
             """)
             
-            # 기본값 설정
+            # 계산할 수 없는 지표는 NULL로 저장
             ratio_data = {
                 "corp_code": corp_code,
                 "corp_name": corp_name,
                 "bsns_year": bsns_year,
-                **{k: ratios.get(k, 0) for k in [
-                    "debt_ratio", "current_ratio",
-                    "operating_profit_ratio", "net_profit_ratio", "roe", "roa",
-                    "sales_growth", "operating_profit_growth"
-                ]}
+                "reprt_code": reprt_code,
+                **{column: ratios.get(column) for column in columns}
             }
             
             await self.db_session.execute(insert_query, ratio_data)
             await self.db_session.commit()
             
-            logger.info(f"재무비율 저장 완료: {corp_code}, {bsns_year}")
+            logger.info("재무비율 저장 완료: %s, %s, %s", corp_code, bsns_year, reprt_code)
             
         except Exception as e:
-            logger.error(f"재무비율 저장 중 오류 발생: {str(e)}")
+            logger.error("재무비율 저장 중 오류 발생: %s", e)
             await self.db_session.rollback()
             raise 
\ No newline at end of file
@@ -0,0 +1,271 @@
+import logging
+import orjson
+from pydantic import BaseModel
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domin.fin.models.schemas import (
+    FinancialMetricsResponse,
+    FinancialMetrics,
+    GrowthData,
+    DebtLiquidityData
+)
+from app.domin.fin.repository.fin_repository import (
+    delete_response_snapshot,
+    get_company_statements,
+    get_latest_years,
+    get_stored_ratios,
+    get_response_snapshot,
+    save_response_snapshot
+)
+from app.domin.fin.service.ratio_registry import RATIO_EVALUATOR
+from app.foundation.infra.metrics.storage import record_cache
+from app.foundation.infra.tracing.tracer import traced
+
+logger = logging.getLogger(__name__)
+
+# 스냅샷 본문 형식 버전. 응답 스키마나 재무비율 레지스트리가 바뀌면 올려서
+# 기존 스냅샷이 조회 시 다시 생성되도록 합니다.
+SNAPSHOT_VERSION = 2
+
+# 연도를 지정하지 않은 조회의 스냅샷 연도 키
+LATEST = "latest"
+
+FINANCIAL_METRICS = "financial_metrics"
+
+def ratios_response_type(reprt_code: str) -> str:
+    return f"ratios:{reprt_code}"
+
+def year_key(year: Optional[Any]) -> str:
+    return LATEST if year is None else str(year)
+
+def encode_response(payload: Any) -> bytes:
+    """응답을 UTF-8 JSON 바이트로 직렬화합니다.
+
+    모델은 pydantic-core 직렬화기로 바로 바이트를 만들고, 딕셔너리는 orjson을 사용합니다.
+    Decimal은 저장소 계층에서 float로 바꿔 두므로 여기서는 변환하지 않습니다.
+    """
+    if isinstance(payload, BaseModel):
+        return payload.__pydantic_serializer__.to_json(payload)
+    return orjson.dumps(payload)
+
+def financial_metrics_response(
+    company_name: str,
+    years: List[str],
+    operating_margins: List[float],
+    net_margins: List[float],
+    roe_values: List[float],
+    roa_values: List[float],
+    revenue_growths: List[float],
+    net_income_growths: List[float],
+    debt_ratios: List[float],
+    current_ratios: List[float]
+) -> FinancialMetricsResponse:
+    """이미 계산된 값으로 검증 없이 응답 모델을 만듭니다 (model_construct).
+
+    값은 재무비율 레지스트리가 계산한 float와 DB의 사업연도 문자열뿐이므로 다시 검증하지 않습니다.
+    """
+    return FinancialMetricsResponse.model_construct(
+        companyName=company_name,
+        financialMetrics=FinancialMetrics.model_construct(
+            operatingMargin=operating_margins,
+            netMargin=net_margins,
+            roe=roe_values,
+            roa=roa_values,
+            years=years
+        ),
+        growthData=GrowthData.model_construct(
+            revenueGrowth=revenue_growths,
+            netIncomeGrowth=net_income_growths,
+            years=years
+        ),
+        debtLiquidityData=DebtLiquidityData.model_construct(
+            debtRatio=debt_ratios,
+            currentRatio=current_ratios,
+            years=years
+        )
+    )
+
+def empty_financial_metrics(company_name: str) -> FinancialMetricsResponse:
+    return financial_metrics_response(company_name, [], [], [], [], [], [], [], [], [])
+
+def build_financial_metrics(company_name: str, financial_data: Iterable[Dict[str, Any]]) -> FinancialMetricsResponse:
+    """재무제표 행으로 재무지표 응답을 만듭니다."""
+    years = []
+    operating_margins = []
+    net_margins = []
+    roe_values = []
+    roa_values = []
+    revenue_growths = []
+    net_income_growths = []
+    debt_ratios = []
+    current_ratios = []
+
+    # 먼저 모든 필요한 데이터를 추출 (재무제표 구분 → 계정과목)
+    financial_values = {}
+    for data in financial_data:
+        # 표준 계정으로 모으며 같은 계정이 여러 행이면 정렬순서가 앞선 행을 사용
+        account_nm = data.get("canonical_account") or data["account_nm"]
+        section = financial_values.setdefault(data["sj_div"], {})
+        if account_nm in section:
+            continue
+        section[account_nm] = {
+            "current": float(data["thstrm_amount"] or 0),
+            "previous": float(data["frmtrm_amount"] or 0),
+            "year": data["bsns_year"]
+        }
+        if account_nm == "자산총계":
+            years.append(data["bsns_year"])
+
+    # 지표 정의와 0/누락 처리는 재무비율 레지스트리를 따름 (저장되는 재무비율과 동일)
+    response_metrics = {
+        "sales_growth": revenue_growths,
+        "operating_profit_ratio": operating_margins,
+        "net_profit_ratio": net_margins,
+        "net_income_growth": net_income_growths,
+        "roa": roa_values,
+        "roe": roe_values,
+        "debt_ratio": debt_ratios,
+        "current_ratio": current_ratios
+    }
+    metrics = RATIO_EVALUATOR.evaluate(financial_values, response_metrics)
+    for metric, values in response_metrics.items():
+        if metric in metrics:
+            values.append(metrics[metric])
+
+    return financial_metrics_response(
+        company_name, years, operating_margins, net_margins, roe_values, roa_values,
+        revenue_growths, net_income_growths, debt_ratios, current_ratios
+    )
+
+def ratio_columns() -> List[Tuple[str, str]]:
+    """재무비율 조회 응답의 (컬럼명, 한글 필드명) 목록. 레지스트리의 저장 대상 지표"""
+    return [
+        (column, RATIO_EVALUATOR.definitions[column].label)
+        for column in RATIO_EVALUATOR.stored_columns
+    ]
+
+def build_ratios(rows: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """저장된 재무비율 행으로 재무비율 조회 응답을 만듭니다. null인 값은 제외합니다."""
+    ratios = [{k: v for k, v in row.items() if v is not None} for row in rows]
+    return {
+        "status": "success",
+        "message": "재무비율이 성공적으로 조회되었습니다.",
+        "data": ratios
+    }
+
+class ResponseSnapshotService:
+    """회사/연도/응답 종류별로 직렬화된 JSON 응답을 저장하고 조회합니다.
+
+    수집이나 재무비율 계산 시점에 응답을 미리 만들어 두어 조회 경로를
+    인덱스 조회 한 번과 바이트 복사로 줄입니다. 형식 버전이 다른 스냅샷은 없는 것으로 보고
+    조회 시 다시 만듭니다.
+    """
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    @traced()
+    async def get(self, corp_code: str, bsns_year: str, response_type: str) -> Optional[bytes]:
+        """저장된 응답 본문을 반환합니다. 없거나 형식 버전이 다르면 None"""
+        snapshot = await get_response_snapshot(self.db_session, corp_code, bsns_year, response_type)
+        if snapshot is None:
+            record_cache("response_snapshot", "miss")
+            return None
+        if snapshot["version"] != SNAPSHOT_VERSION:
+            record_cache("response_snapshot", "stale")
+            logger.info("응답 스냅샷 버전 불일치 - 회사: %s, 연도: %s, 종류: %s, 버전: %s → %s", corp_code, bsns_year, response_type, snapshot['version'], SNAPSHOT_VERSION)
+            return None
+        record_cache("response_snapshot", "hit")
+        return bytes(snapshot["body"])
+
+    async def put(
+        self,
+        corp_code: str,
+        corp_name: str,
+        bsns_year: str,
+        response_type: str,
+        payload: Any
+    ) -> bytes:
+        """응답을 직렬화하여 저장하고 본문을 반환합니다. 커밋은 호출하는 쪽에서 합니다."""
+        body = encode_response(payload)
+        await save_response_snapshot(
+            self.db_session, corp_code, corp_name, bsns_year, response_type, SNAPSHOT_VERSION, body
+        )
+        return body
+
+    @traced()
+    async def store(
+        self,
+        corp_code: str,
+        corp_name: str,
+        bsns_year: str,
+        response_type: str,
+        payload: Any
+    ) -> bytes:
+        """조회 경로에서 만든 응답을 저장하고 커밋합니다. 저장에 실패해도 응답 본문은 반환합니다."""
+        try:
+            body = await self.put(corp_code, corp_name, bsns_year, response_type, payload)
+            await self.db_session.commit()
+            return body
+        except Exception as e:
+            logger.warning("응답 스냅샷 저장 실패 - 회사: %s, 연도: %s, 종류: %s: %s", corp_name, bsns_year, response_type, e)
+            await self.db_session.rollback()
+            return encode_response(payload)
+
+    async def refresh(
+        self,
+        corp_code: str,
+        corp_name: str,
+        years: Iterable[str],
+        reprt_codes: Iterable[str]
+    ) -> int:
+        """갱신된 기간의 스냅샷을 다시 만듭니다. 커밋은 호출하는 쪽에서 합니다.
+
+        연도 미지정(최신) 스냅샷은 갱신된 연도가 해당 보고서의 최신 연도일 때만 다시 만듭니다.
+        과거 연도만 바뀌면 전체 연도를 담는 최신 재무지표 스냅샷은 삭제만 하여 다음 조회 때 한 번 만들고,
+        최신 연도만 담는 최신 재무비율 스냅샷은 그대로 둡니다.
+
+        Returns:
+            저장한 스냅샷 수
+        """
+        years = sorted(set(years))
+        reprt_codes = sorted(set(reprt_codes))
+        latest_years = await get_latest_years(self.db_session, corp_code, reprt_codes)
+        columns = ratio_columns()
+        count = 0
+        for year in years:
+            count += await self._refresh_period(corp_code, corp_name, year, year, reprt_codes, columns)
+
+        latest_codes = [reprt_code for reprt_code in reprt_codes if latest_years.get(reprt_code) in years]
+        if latest_codes:
+            count += await self._refresh_period(corp_code, corp_name, LATEST, None, latest_codes, columns)
+        if "11011" in reprt_codes and "11011" not in latest_codes:
+            await delete_response_snapshot(self.db_session, corp_code, LATEST, FINANCIAL_METRICS)
+        logger.info("응답 스냅샷 갱신 - 회사: %s, 연도: %s, 최신 갱신: %s, 저장 수: %s", corp_code, years, latest_codes, count)
+        return count
+
+    async def _refresh_period(
+        self,
+        corp_code: str,
+        corp_name: str,
+        key: str,
+        year: Optional[str],
+        reprt_codes: List[str],
+        columns: List[Tuple[str, str]]
+    ) -> int:
+        """한 연도 키(연도 또는 최신)의 재무지표/재무비율 스냅샷을 저장하고 저장 수를 반환합니다."""
+        count = 0
+        # 재무지표 응답은 사업보고서 기준
+        if "11011" in reprt_codes:
+            statements = await get_company_statements(self.db_session, corp_code, year)
+            if statements:
+                await self.put(corp_code, corp_name, key, FINANCIAL_METRICS,
+                               build_financial_metrics(corp_name, statements))
+                count += 1
+        for reprt_code in reprt_codes:
+            rows = await get_stored_ratios(self.db_session, corp_code, reprt_code, columns, year)
+            if rows:
+                await self.put(corp_code, corp_name, key, ratios_response_type(reprt_code), build_ratios(rows))
+                count += 1
+        return count
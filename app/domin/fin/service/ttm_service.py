@@ -0,0 +1,99 @@
+import logging
+from typing import Dict, List, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domin.fin.repository.fin_repository import get_flow_amounts, replace_ttm_amounts
+from app.domin.fin.service.ratio_dependency import StatementChange
+
+logger = logging.getLogger(__name__)
+
+ANNUAL_REPORT_CODE = "11011"
+
+# 연간 보고서를 제외한 보고서 코드 (반기, 1분기, 3분기)
+INTERIM_REPORT_CODES = ("11012", "11013", "11014")
+
+# 기간 합산이 의미 있는 손익 계정
+FLOW_ACCOUNTS = ["매출액", "영업이익", "당기순이익"]
+
+Period = Tuple[str, str]  # (사업연도, 보고서 코드)
+
+def affected_periods(bsns_year: str, reprt_code: str) -> List[Period]:
+    """한 보고서가 갱신되었을 때 TTM/재무비율을 다시 계산해야 하는 기간 목록
+
+    TTM(Y, P) = 누적(Y, P) + 연간(Y-1) - 누적(Y-1, P) 이므로
+    연간 보고서는 다음 해의 모든 중간 보고서에, 중간 보고서는 다음 해 같은 보고서에 영향을 줍니다.
+    """
+    periods = [(bsns_year, reprt_code)]
+    next_year = str(int(bsns_year) + 1)
+    if reprt_code == ANNUAL_REPORT_CODE:
+        periods.extend((next_year, code) for code in INTERIM_REPORT_CODES)
+    else:
+        periods.append((next_year, reprt_code))
+    return periods
+
+def compute_ttm(flows: Dict[Period, Dict[str, float]], bsns_year: str, reprt_code: str) -> Dict[str, float]:
+    """누적 손익 금액으로 최근 4분기 합계를 계산합니다. 필요한 기간이 없는 계정은 제외합니다."""
+    current = flows.get((bsns_year, reprt_code), {})
+    if reprt_code == ANNUAL_REPORT_CODE:
+        return dict(current)
+
+    previous_year = str(int(bsns_year) - 1)
+    previous_annual = flows.get((previous_year, ANNUAL_REPORT_CODE), {})
+    previous_cumulative = flows.get((previous_year, reprt_code), {})
+    return {
+        account: amount + previous_annual[account] - previous_cumulative[account]
+        for account, amount in current.items()
+        if account in previous_annual and account in previous_cumulative
+    }
+
+class TtmService:
+    """분기/반기 보고서 수집 시 영향받는 기간의 TTM만 증분 재계산합니다."""
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def _load_flows(self, corp_code: str, years: List[str]) -> Tuple[Dict[Period, Dict[str, float]], Dict[Period, Dict[str, float]]]:
+        """연도/보고서별 누적 손익 금액과 현재 저장된 TTM 금액을 조회합니다."""
+        rows = await get_flow_amounts(self.db_session, corp_code, years, FLOW_ACCOUNTS)
+        flows: Dict[Period, Dict[str, float]] = {}
+        stored: Dict[Period, Dict[str, float]] = {}
+        for row in rows:
+            # 손익계산서의 당기금액은 분기 3개월분이므로 누적금액이 있으면 누적금액을 사용
+            amount = row["thstrm_add_amount"] if row["thstrm_add_amount"] is not None else row["thstrm_amount"]
+            if amount is None:
+                continue
+            target = stored if row["sj_div"] == "TTM" else flows
+            target.setdefault((row["bsns_year"], row["reprt_code"]), {})[row["account_nm"]] = float(amount)
+        return flows, stored
+
+    async def refresh(
+        self,
+        corp_code: str,
+        corp_name: str,
+        bsns_year: str,
+        reprt_code: str = ANNUAL_REPORT_CODE
+    ) -> List[StatementChange]:
+        """갱신된 보고서 기간과 그에 의존하는 기간의 TTM을 다시 계산합니다. 커밋은 호출하는 쪽에서 합니다.
+
+        Returns:
+            값이 바뀐 TTM 셀 목록 (재무비율 증분 재계산 입력)
+        """
+        periods = affected_periods(bsns_year, reprt_code)
+        years = sorted({str(int(year) + offset) for year, _ in periods for offset in (-1, 0)})
+        flows, stored = await self._load_flows(corp_code, years)
+
+        changes: List[StatementChange] = []
+        for year, code in periods:
+            ttm = compute_ttm(flows, year, code) if (year, code) in flows else {}
+            previous = stored.get((year, code), {})
+            if ttm == previous:
+                continue
+            await replace_ttm_amounts(self.db_session, corp_code, corp_name, year, code, ttm)
+            changes.extend(
+                StatementChange(year, code, "TTM", account_nm)
+                for account_nm in ttm.keys() | previous.keys()
+                if ttm.get(account_nm) != previous.get(account_nm)
+            )
+
+        logger.info("TTM 재계산 완료 - 회사: %s, 기준 기간: %s/%s, 변경 셀 수: %s", corp_code, bsns_year, reprt_code, len(changes))
+        return changes
@@ -9,6 +9,12 @@ class Settings:
     
     # DART API 설정
     DART_API_KEY: str = os.getenv("DART_API_KEY", "")
-    DART_API_URL: str = "https://opendart.fss.or.kr/api"
+    DART_API_URL: str = os.getenv("DART_API_URL", "https://opendart.fss.or.kr/api")
+    DART_SYNC_LOOKBACK_DAYS: int = int(os.getenv("DART_SYNC_LOOKBACK_DAYS", "7"))
+    # 작업자 프로세스들이 함께 매핑하는 컴파일된 고유번호 인덱스 파일
+    CORP_CODE_INDEX_FILE: str = os.getenv("CORP_CODE_INDEX_FILE", "data/CORPCODE.idx")
+
+    # 관리자 API 토큰 (X-Admin-Token). 비어 있으면 /admin 경로를 사용할 수 없음
+    ADMIN_TOKEN: str = os.getenv("ADMIN_TOKEN", "")
 
 settings = Settings() 
\ No newline at end of file
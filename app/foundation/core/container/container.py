@@ -0,0 +1,48 @@
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Type, TypeVar
+from fastapi import Request
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+class Container:
+    """애플리케이션 범위 의존성 보관소
+
+    설정, HTTP 클라이언트, 캐시처럼 요청 간에 공유할 수 있는 객체를 애플리케이션 시작 시 한 번 만들어
+    타입으로 등록하고, 요청에서는 DB 세션만 새로 묶습니다. 종료 시 등록 역순으로 정리합니다.
+    """
+
+    def __init__(self):
+        self._instances: Dict[type, Any] = {}
+        self._closers: List[Callable[[], Awaitable[None]]] = []
+
+    def register(self, key: Type[T], instance: T, close: Optional[Callable[[], Awaitable[None]]] = None) -> T:
+        """인스턴스를 등록합니다. close를 넘기면 종료 시 호출합니다."""
+        self._instances[key] = instance
+        if close is not None:
+            self._closers.append(close)
+        return instance
+
+    def resolve(self, key: Type[T]) -> T:
+        try:
+            return self._instances[key]
+        except KeyError:
+            raise RuntimeError(f"등록되지 않은 의존성입니다: {key.__name__}") from None
+
+    def __contains__(self, key: type) -> bool:
+        return key in self._instances
+
+    async def aclose(self) -> None:
+        """등록 역순으로 정리 함수를 호출합니다. 하나가 실패해도 나머지는 계속 정리합니다."""
+        while self._closers:
+            close = self._closers.pop()
+            try:
+                await close()
+            except Exception as e:
+                logger.error("의존성 정리 실패: %s", e)
+        self._instances.clear()
+
+def get_container(request: Request) -> Container:
+    """애플리케이션 시작 시 app.state에 만든 컨테이너를 반환합니다."""
+    return request.app.state.container
@@ -5,6 +5,10 @@ import os
 from dotenv import load_dotenv
 import logging
 
+from app.foundation.infra.database.query_log import QueryLogger
+from app.foundation.infra.metrics.pool import InstrumentedAsyncPool
+from app.foundation.infra.tracing.sql import instrument_engine
+
 logger = logging.getLogger(__name__)
 
 # 환경 변수 로드
@@ -24,16 +28,26 @@ if not DATABASE_URL:
 if "db:5432" in DATABASE_URL:
     DATABASE_URL = DATABASE_URL.replace("db:5432", "fin_db:5432")
 
-logger.info(f"Connecting to database with URL: {DATABASE_URL}")
+logger.info("Connecting to database with URL: %s", DATABASE_URL)
 
-# 비동기 엔진 생성
+# 비동기 엔진 생성 (SQL 문 전체 출력은 개발 중 SQL_ECHO=1일 때만)
 engine = create_async_engine(
     DATABASE_URL,
-    echo=True,
+    echo=os.getenv("SQL_ECHO") == "1",
     pool_pre_ping=True,  # 연결 상태 확인
+    poolclass=InstrumentedAsyncPool,  # 연결 대기 시간/사용량 지표 기록
     pool_size=5,  # 연결 풀 크기
     max_overflow=10  # 최대 추가 연결 수
 )
+# 추적 중인 요청의 SQL 실행을 구간으로 기록
+instrument_engine(engine)
+
+# SQL 문 지문별 실행 통계와 느린 쿼리 로그 (기준 시간 이상 또는 표본만 기록)
+query_logger = QueryLogger(
+    slow_ms=float(os.getenv("SLOW_QUERY_MS", "200")),
+    sample_rate=float(os.getenv("SQL_LOG_SAMPLE_RATE", "0"))
+)
+query_logger.instrument(engine)
 
 # 비동기 세션 팩토리 생성
 async_session = sessionmaker(
@@ -71,5 +85,5 @@ async def init_db():
                 await conn.run_sync(Base.metadata.create_all)
         logger.info("Database initialization completed successfully")
     except Exception as e:
-        logger.error(f"Database initialization failed: {str(e)}")
+        logger.error("Database initialization failed: %s", e)
         raise 
\ No newline at end of file
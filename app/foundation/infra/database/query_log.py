@@ -0,0 +1,143 @@
+import re
+import time
+import random
+import logging
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+# 리터럴/바인드 변수를 ?로 바꿔 같은 형태의 SQL 문을 하나로 묶음
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$])-?\d+(?:\.\d+)?\b")
+_BIND_PARAMETER = re.compile(r"(?<!:):\w+|\$\d+|%\(\w+\)s|%s|\?")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+ORDER_KEYS = ("total", "max", "mean", "calls")
+
+@lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> str:
+    """SQL 문의 지문. 리터럴과 바인드 변수를 ?로, IN/VALUES 목록을 (?...)로, 공백을 한 칸으로 바꿉니다."""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _BIND_PARAMETER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _VALUE_LIST.sub("(?...)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+def _row_count(cursor) -> int:
+    """영향받은 행 수. SELECT는 rowcount가 -1이므로 비동기 드라이버 어댑터가 미리 받아 둔 행 수를 사용합니다."""
+    if cursor.rowcount is not None and cursor.rowcount >= 0:
+        return cursor.rowcount
+    buffered = getattr(cursor, "_rows", None)
+    return len(buffered) if buffered is not None else 0
+
+class QueryStats:
+    """SQL 문 지문별 실행 횟수/시간/행 수 누적
+
+    지문 수가 max_fingerprints를 넘으면 누적 시간이 가장 짧은 절반을 버려 메모리를 제한합니다.
+    """
+
+    def __init__(self, max_fingerprints: int = 1000):
+        self.max_fingerprints = max_fingerprints
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self.started_at = time.time()
+
+    def record(self, statement_fingerprint: str, elapsed: float, rows: int, error: bool = False) -> None:
+        stats = self._stats.get(statement_fingerprint)
+        if stats is None:
+            if len(self._stats) >= self.max_fingerprints:
+                self._evict()
+            stats = self._stats[statement_fingerprint] = {
+                "fingerprint": statement_fingerprint, "calls": 0, "errors": 0, "rows": 0, "total": 0.0, "max": 0.0
+            }
+        stats["calls"] += 1
+        stats["rows"] += rows
+        stats["total"] += elapsed
+        if elapsed > stats["max"]:
+            stats["max"] = elapsed
+        if error:
+            stats["errors"] += 1
+
+    def _evict(self) -> None:
+        keep = sorted(self._stats.values(), key=lambda stats: stats["total"], reverse=True)[:self.max_fingerprints // 2]
+        self._stats = {stats["fingerprint"]: stats for stats in keep}
+
+    def top(self, limit: int = 20, order: str = "total") -> List[Dict[str, Any]]:
+        """정렬 기준(total, max, mean, calls) 상위 limit개를 ms 단위로 반환합니다."""
+        if order not in ORDER_KEYS:
+            raise ValueError(f"정렬 기준은 {', '.join(ORDER_KEYS)} 중 하나여야 합니다: {order}")
+        rows = [
+            {
+                "fingerprint": stats["fingerprint"],
+                "calls": stats["calls"],
+                "errors": stats["errors"],
+                "rows": stats["rows"],
+                "total_ms": round(stats["total"] * 1000, 3),
+                "mean_ms": round(stats["total"] / stats["calls"] * 1000, 3),
+                "max_ms": round(stats["max"] * 1000, 3)
+            }
+            for stats in self._stats.values()
+        ]
+        key = {"total": "total_ms", "max": "max_ms", "mean": "mean_ms", "calls": "calls"}[order]
+        return sorted(rows, key=lambda row: row[key], reverse=True)[:limit]
+
+    def reset(self) -> None:
+        self._stats.clear()
+        self.started_at = time.time()
+
+class QueryLogger:
+    """커서 이벤트로 SQL 실행 시간/행 수를 측정하는 계층
+
+    모든 실행을 지문별로 누적하고, 기준 시간(slow_ms) 이상이거나 표본(sample_rate)으로 뽑힌 실행만 로그로 남깁니다.
+    로그에는 바인드 값을 남기지 않습니다.
+    """
+
+    def __init__(self, slow_ms: float = 200.0, sample_rate: float = 0.0, stats: Optional[QueryStats] = None):
+        self.slow_ms = slow_ms
+        self.sample_rate = sample_rate
+        self.stats = stats or QueryStats()
+
+    def instrument(self, engine: AsyncEngine) -> None:
+        event.listen(engine.sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine.sync_engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(engine.sync_engine, "handle_error", self._handle_error)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        context._query_started = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_query_started", None)
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+        rows = _row_count(cursor)
+        statement_fingerprint = fingerprint(statement)
+        self.stats.record(statement_fingerprint, elapsed, rows)
+        elapsed_ms = elapsed * 1000
+        if elapsed_ms >= self.slow_ms:
+            self._log(logging.WARNING, "slow_query", statement_fingerprint, elapsed_ms, rows, executemany, parameters)
+        elif self.sample_rate and random.random() < self.sample_rate:
+            self._log(logging.INFO, "sampled_query", statement_fingerprint, elapsed_ms, rows, executemany, parameters)
+
+    def _handle_error(self, exception_context):
+        context = exception_context.execution_context
+        started = getattr(context, "_query_started", None)
+        if started is None or exception_context.statement is None:
+            return
+        elapsed = time.perf_counter() - started
+        self.stats.record(fingerprint(exception_context.statement), elapsed, 0, error=True)
+
+    def _log(self, level: int, kind: str, statement_fingerprint: str, elapsed_ms: float,
+             rows: int, executemany: bool, parameters) -> None:
+        batch = len(parameters) if executemany and parameters is not None else 1
+        logger.log(level, "%s %.1fms rows=%d batch=%d: %s", kind, elapsed_ms, rows, batch, statement_fingerprint, extra={
+            "event": kind,
+            "elapsed_ms": round(elapsed_ms, 3),
+            "rows": rows,
+            "batch": batch,
+            "fingerprint": statement_fingerprint
+        })
@@ -0,0 +1,174 @@
+import os
+import sys
+import json
+import time
+import queue
+import atexit
+import logging
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional, Tuple
+
+from app.foundation.infra.tracing.tracer import current_span
+
+# 로그 큐 최대 길이. 출력이 밀려 가득 차면 새 로그를 버리고 개수만 셈 (이벤트 루프를 멈추지 않음)
+QUEUE_SIZE = 10000
+
+# LogRecord 기본 속성 (이외의 속성은 extra로 넘긴 구조화 필드로 출력)
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "taskName"}
+
+class JsonFormatter(logging.Formatter):
+    """한 줄에 로그 하나를 JSON으로 출력합니다. extra로 넘긴 필드도 그대로 포함합니다."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "pid": record.process
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                data[key] = value
+        if record.exc_info:
+            data["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+class RateLimitFilter(logging.Filter):
+    """같은 위치(파일, 줄)에서 나오는 WARNING 미만 로그를 초당 rate개로 제한합니다.
+
+    요청마다 찍히는 INFO 로그가 트래픽에 비례해 늘지 않도록 하며,
+    버린 개수는 다음에 통과하는 같은 위치의 로그에 suppressed 필드로 붙입니다.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        super().__init__()
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1.0)
+        # 위치별 (남은 토큰, 마지막 갱신 시각, 버린 개수)
+        self._buckets: Dict[Tuple[str, int], list] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or self.rate <= 0:
+            return True
+        key = (record.pathname, record.lineno)
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = [self.burst, now, 0]
+        else:
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+        if bucket[0] < 1.0:
+            bucket[2] += 1
+            return False
+        bucket[0] -= 1.0
+        if bucket[2]:
+            record.suppressed = bucket[2]
+            bucket[2] = 0
+        return True
+
+class TraceContextFilter(logging.Filter):
+    """추적 중인 요청의 로그에 trace_id를 붙입니다 (로그를 남긴 쪽의 컨텍스트에서 실행)."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        span = current_span()
+        if span is not None:
+            record.trace_id = span.trace.trace_id
+        return True
+
+class NonBlockingQueueHandler(QueueHandler):
+    """큐가 가득 차면 기다리지 않고 로그를 버리는 QueueHandler
+
+    버린 개수는 다음에 큐에 들어가는 로그에 dropped 필드로 붙입니다.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped_total = 0
+        self._pending_drops = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            prepared = self.prepare(record)
+            if self._pending_drops:
+                prepared.dropped = self._pending_drops
+            self.queue.put_nowait(prepared)
+            self._pending_drops = 0
+        except queue.Full:
+            self._pending_drops += 1
+            self.dropped_total += 1
+        except Exception:
+            self.handleError(record)
+
+class _Listener(QueueListener):
+    """종료할 때 출력이 막혀 있어도 정해진 시간 이상 기다리지 않는 QueueListener"""
+
+    def stop(self, timeout: float = 5.0) -> None:
+        try:
+            self.queue.put(self._sentinel, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+        self._thread = None
+
+_queue_handler: Optional[NonBlockingQueueHandler] = None
+_listener: Optional[_Listener] = None
+_lock = threading.Lock()
+
+def _output_handler(log_format: str) -> logging.Handler:
+    handler = logging.StreamHandler(sys.stdout)
+    if log_format == "json":
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter("%(asctime)s - %(process)d - %(name)s - %(levelname)s - %(message)s"))
+    return handler
+
+def _start_listener() -> None:
+    """새 큐와 출력 스레드를 만들어 큐 핸들러에 연결합니다."""
+    global _listener
+    log_queue: queue.Queue = queue.Queue(QUEUE_SIZE)
+    _queue_handler.queue = log_queue
+    _listener = _Listener(log_queue, _output_handler(os.getenv("LOG_FORMAT", "json")), respect_handler_level=False)
+    _listener.start()
+
+def _restart_after_fork() -> None:
+    # fork된 자식에는 출력 스레드가 없으므로 새로 시작 (부모 큐는 잠금 상태일 수 있어 버림)
+    if _queue_handler is not None:
+        _start_listener()
+
+def stop_logging() -> None:
+    """큐에 남은 로그를 모두 출력하고 출력 스레드를 멈춥니다."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+def configure_logging(level: Optional[str] = None) -> None:
+    """프로세스 로깅을 한 번 설정합니다. 이후 호출은 무시합니다.
+
+    모든 로그는 루트 로거의 큐 핸들러를 거쳐 백그라운드 스레드에서 stdout으로 출력되므로
+    출력이 느려도 이벤트 루프가 기다리지 않습니다.
+
+    환경 변수:
+        LOG_LEVEL       루트 로그 수준 (기본 INFO)
+        LOG_FORMAT      json 또는 text (기본 json)
+        LOG_RATE_LIMIT  위치별 초당 최대 INFO/DEBUG 로그 수 (기본 10, 0이면 제한 없음)
+    """
+    global _queue_handler
+    with _lock:
+        if _queue_handler is not None:
+            return
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        _queue_handler = NonBlockingQueueHandler(queue.Queue(QUEUE_SIZE))
+        _queue_handler.addFilter(RateLimitFilter(float(os.getenv("LOG_RATE_LIMIT", "10"))))
+        _queue_handler.addFilter(TraceContextFilter())
+        root.addHandler(_queue_handler)
+        root.setLevel(level or os.getenv("LOG_LEVEL", "INFO"))
+        _start_listener()
+        os.register_at_fork(after_in_child=_restart_after_fork)
+        atexit.register(stop_logging)
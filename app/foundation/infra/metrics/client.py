@@ -0,0 +1,42 @@
+import time
+from types import SimpleNamespace
+
+import aiohttp
+
+from app.foundation.infra.metrics.registry import Counter, Histogram
+
+DART_REQUESTS = Counter(
+    "fin_dart_requests_total",
+    "DART OpenAPI 호출 수 (api: 호출한 API 파일명, status: HTTP 상태 코드 또는 error)",
+    ["api", "status"]
+)
+DART_REQUEST_SECONDS = Histogram(
+    "fin_dart_request_duration_seconds",
+    "DART OpenAPI 응답 헤더를 받기까지 걸린 시간",
+    ["api"]
+)
+
+def api_name(url) -> str:
+    """요청 URL의 마지막 경로(fnlttSinglAcnt.json 등)"""
+    return url.path.rsplit("/", 1)[-1] or "unknown"
+
+async def _on_request_start(session, context: SimpleNamespace, params) -> None:
+    context.started = time.perf_counter()
+
+async def _on_request_end(session, context: SimpleNamespace, params) -> None:
+    api = api_name(params.url)
+    DART_REQUEST_SECONDS.labels(api).observe(time.perf_counter() - context.started)
+    DART_REQUESTS.labels(api, str(params.response.status)).inc()
+
+async def _on_request_exception(session, context: SimpleNamespace, params) -> None:
+    api = api_name(params.url)
+    DART_REQUEST_SECONDS.labels(api).observe(time.perf_counter() - context.started)
+    DART_REQUESTS.labels(api, "error").inc()
+
+def client_trace_config() -> aiohttp.TraceConfig:
+    """외부 API 호출 수/상태 코드/지연 시간을 기록하는 aiohttp 추적 설정"""
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(_on_request_start)
+    trace_config.on_request_end.append(_on_request_end)
+    trace_config.on_request_exception.append(_on_request_exception)
+    return trace_config
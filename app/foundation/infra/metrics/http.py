@@ -0,0 +1,67 @@
+import time
+from typing import Dict
+
+from app.foundation.infra.metrics.registry import Gauge, Histogram
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "fin_http_request_duration_seconds",
+    "HTTP 요청 처리 시간 (라우트 경로 템플릿별)",
+    ["method", "route", "status"]
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "fin_http_requests_in_progress",
+    "처리 중인 HTTP 요청 수"
+)
+
+# 라우트에 맞지 않은 요청(404 등)은 경로별로 나누지 않음 (임의 경로로 레이블이 늘어나지 않도록)
+UNMATCHED_ROUTE = "unmatched"
+
+class MetricsMiddleware:
+    """라우트별 요청 수와 처리 시간을 기록하는 ASGI 미들웨어
+
+    레이블에는 실제 경로 대신 라우트의 경로 템플릿(/ratios/{company_name})을 씁니다.
+    응답 본문을 감싸지 않고 시작 메시지의 상태 코드만 읽으므로 스트리밍 응답에도 영향이 없습니다.
+    """
+
+    def __init__(self, app, exclude_paths=("/metrics",)):
+        self.app = app
+        self.exclude_paths = frozenset(exclude_paths)
+        self._route_paths: Dict[object, str] = {}
+
+    def _route_path(self, scope) -> str:
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return UNMATCHED_ROUTE
+        path = self._route_paths.get(endpoint)
+        if path is None:
+            path = UNMATCHED_ROUTE
+            for route in getattr(scope.get("app"), "routes", ()):
+                if getattr(route, "endpoint", None) is endpoint:
+                    path = route.path
+                    break
+            self._route_paths[endpoint] = path
+        return path
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        status = "500"
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels()
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # 라우팅은 안쪽 앱에서 일어나므로 라우트 경로는 처리 후 scope에서 읽음
+            elapsed = time.perf_counter() - started
+            in_progress.dec()
+            HTTP_REQUEST_SECONDS.labels(scope["method"], self._route_path(scope), status).observe(elapsed)
@@ -0,0 +1,55 @@
+import time
+import weakref
+from typing import Optional
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.foundation.infra.metrics.registry import REGISTRY, Counter, Gauge, Histogram
+
+# 연결 대기는 대부분 1ms 미만이므로 낮은 구간을 촘촘하게 둠
+CHECKOUT_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "fin_db_pool_checkout_wait_seconds",
+    "연결 풀에서 사용 가능한 연결을 얻기까지 걸린 시간 (풀 대기, 새 연결 생성, pre-ping 포함)",
+    buckets=CHECKOUT_BUCKETS
+)
+DB_POOL_TIMEOUTS = Counter("fin_db_pool_checkout_timeouts_total", "연결 풀 대기 시간 초과 수")
+DB_POOL_SIZE = Gauge("fin_db_pool_size", "연결 풀 기본 크기")
+DB_POOL_MAX_CONNECTIONS = Gauge("fin_db_pool_max_connections", "연결 풀 최대 연결 수 (기본 크기 + 추가 연결)")
+DB_POOL_CHECKED_OUT = Gauge("fin_db_pool_checked_out", "사용 중인 연결 수")
+DB_POOL_SATURATION = Gauge("fin_db_pool_saturation", "사용 중인 연결 / 최대 연결 수")
+
+# engine.dispose()가 풀을 다시 만들면 새 풀을 가리킴
+_current_pool: Optional[weakref.ref] = None
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """연결 대기 시간과 사용량을 지표로 기록하는 비동기 연결 풀"""
+
+    def __init__(self, *args, **kwargs):
+        global _current_pool
+        super().__init__(*args, **kwargs)
+        _current_pool = weakref.ref(self)
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            DB_POOL_TIMEOUTS.inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.observe(time.perf_counter() - started)
+
+def collect_pool_usage() -> None:
+    pool = _current_pool() if _current_pool is not None else None
+    if pool is None:
+        return
+    max_connections = pool.size() + max(pool._max_overflow, 0)
+    checked_out = pool.checkedout()
+    DB_POOL_SIZE.set(pool.size())
+    DB_POOL_MAX_CONNECTIONS.set(max_connections)
+    DB_POOL_CHECKED_OUT.set(checked_out)
+    DB_POOL_SATURATION.set(checked_out / max_connections if max_connections else 0.0)
+
+REGISTRY.add_collector(collect_pool_usage)
@@ -0,0 +1,286 @@
+import os
+import json
+import math
+import time
+import logging
+import tempfile
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 요청/외부 호출 지연 시간 기본 구간(초)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# 작업자 프로세스별 지표 파일을 모을 디렉터리 (서버 실행기가 설정). 없으면 현재 프로세스 지표만 노출
+METRICS_DIR_ENV = "METRICS_DIR"
+
+class _Metric:
+    """이름/설명/레이블을 가진 지표. 레이블 값 조합마다 하위 지표를 한 번만 만들어 재사용합니다.
+
+    출력(dump)은 스레드 풀에서 실행되는 동안 이벤트 루프가 하위 지표를 추가할 수 있으므로
+    하위 지표 목록을 복사한 뒤 순회합니다.
+    """
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), registry: Optional["Registry"] = None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        (registry or REGISTRY).register(self)
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values: str):
+        """레이블 값 순서는 labelnames와 같아야 합니다. 문자열로 넘기면 변환 없이 바로 찾습니다."""
+        child = self._children.get(values)
+        if child is None:
+            key = tuple(str(value) for value in values)
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} 레이블 수가 맞지 않습니다: {self.labelnames}")
+            child = self._children.get(key)
+            if child is None:
+                child = self._children[key] = self._new_child()
+        return child
+
+class _CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+class Counter(_Metric):
+    """누적 값 (요청 수, 저장한 행 수 등). Prometheus에서 rate()로 초당 값을 구합니다."""
+
+    kind = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def dump(self) -> List[list]:
+        return [[list(key), child.value] for key, child in list(self._children.items())]
+
+class _GaugeChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+class Gauge(_Metric):
+    """현재 값 (연결 풀 사용량 등). 여러 작업자의 값은 합치지 않고 pid 레이블로 구분합니다."""
+
+    kind = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def dump(self) -> List[list]:
+        return [[list(key), child.value] for key, child in list(self._children.items())]
+
+class _HistogramChild:
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        # 구간별 개수만 세고 누적 합은 출력할 때 계산
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+class Histogram(_Metric):
+    """분포 (지연 시간 등). 구간 경계는 상한 포함(le)입니다."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS, registry: Optional["Registry"] = None):
+        self.buckets = tuple(sorted(float(bound) for bound in buckets))
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def dump(self) -> List[list]:
+        return [[list(key), [list(child.counts), child.sum]] for key, child in list(self._children.items())]
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _label_text(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra is not None:
+        pairs.append(f'{extra[0]}="{_escape(extra[1])}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+class Registry:
+    """프로세스 안의 지표 모음
+
+    지표 갱신은 이벤트 루프 안에서 잠금 없이 값을 더하기만 하므로 상시 켜 둘 수 있습니다.
+    연결 풀 사용량처럼 출력 시점에 읽는 값은 collector로 등록합니다.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+
+    def register(self, metric: _Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"이미 등록된 지표입니다: {metric.name}")
+        self._metrics[metric.name] = metric
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """출력 직전에 호출되어 게이지 값을 갱신하는 함수를 등록합니다."""
+        self._collectors.append(collector)
+
+    def collect(self) -> None:
+        for collector in list(self._collectors):
+            try:
+                collector()
+            except Exception as e:
+                logger.warning("지표 수집 실패: %s", e)
+
+    def dump(self) -> Dict[str, dict]:
+        """프로세스 간 합산용으로 현재 값을 직렬화 가능한 형태로 반환합니다."""
+        self.collect()
+        return {
+            name: {
+                "kind": metric.kind,
+                "documentation": metric.documentation,
+                "labelnames": list(metric.labelnames),
+                "buckets": list(getattr(metric, "buckets", ())),
+                "values": metric.dump()
+            }
+            for name, metric in list(self._metrics.items())
+        }
+
+    def write(self, directory: str) -> None:
+        """현재 프로세스의 지표를 directory/<pid>.json에 씁니다 (원자적 교체).
+
+        주기적 기록과 /metrics 출력이 동시에 쓸 수 있으므로 임시 파일은 쓰기마다 따로 만듭니다.
+        """
+        path = os.path.join(directory, f"{os.getpid()}.json")
+        data = {"pid": os.getpid(), "written_at": time.time(), "metrics": self.dump()}
+        fd, tmp_path = tempfile.mkstemp(prefix=f"{os.getpid()}.", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식으로 출력합니다.
+
+        METRICS_DIR이 설정되어 있으면 모든 작업자 프로세스의 파일을 합칩니다.
+        카운터/히스토그램은 종료된 작업자 값까지 더해 단조 증가를 유지하고,
+        게이지는 살아 있는 작업자 값만 pid 레이블을 붙여 출력합니다.
+        """
+        directory = os.getenv(METRICS_DIR_ENV)
+        if not directory:
+            return render_dumps([(os.getpid(), self.dump())], label_gauges=False)
+        os.makedirs(directory, exist_ok=True)
+        self.write(directory)
+        dumps = []
+        for filename in os.listdir(directory):
+            if not filename.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(directory, filename), encoding="utf-8") as f:
+                    data = json.load(f)
+                dumps.append((data["pid"], data["metrics"]))
+            except (OSError, ValueError, KeyError):
+                continue
+        return render_dumps(dumps, label_gauges=True)
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def render_dumps(dumps: Iterable[Tuple[int, Dict[str, dict]]], label_gauges: bool) -> str:
+    """프로세스별 지표 덤프를 합쳐 Prometheus 텍스트 형식으로 출력합니다."""
+    merged: Dict[str, dict] = {}
+    for pid, metrics in dumps:
+        alive = pid == os.getpid() or _pid_alive(pid)
+        for name, metric in metrics.items():
+            target = merged.setdefault(name, {**metric, "values": {}})
+            for labels, value in metric["values"]:
+                if metric["kind"] == "gauge":
+                    if not alive:
+                        continue
+                    key = tuple(labels) + ((str(pid),) if label_gauges else ())
+                    target["values"][key] = value
+                elif metric["kind"] == "histogram":
+                    counts, total = value
+                    current = target["values"].get(tuple(labels))
+                    if current is None:
+                        target["values"][tuple(labels)] = [list(counts), total]
+                    else:
+                        current[0] = [a + b for a, b in zip(current[0], counts)]
+                        current[1] += total
+                else:
+                    key = tuple(labels)
+                    target["values"][key] = target["values"].get(key, 0.0) + value
+
+    lines = []
+    for name, metric in merged.items():
+        lines.append(f"# HELP {name} {metric['documentation']}")
+        lines.append(f"# TYPE {name} {metric['kind']}")
+        labelnames = metric["labelnames"]
+        if metric["kind"] == "gauge" and label_gauges:
+            labelnames = labelnames + ["pid"]
+        for labels, value in sorted(metric["values"].items()):
+            if metric["kind"] != "histogram":
+                lines.append(f"{name}{_label_text(labelnames, labels)} {_format_value(value)}")
+                continue
+            counts, total = value
+            cumulative = 0
+            for bound, count in zip(metric["buckets"] + [math.inf], counts):
+                cumulative += count
+                bucket = _label_text(labelnames, labels, ("le", _format_value(bound)))
+                lines.append(f"{name}_bucket{bucket} {cumulative}")
+            lines.append(f"{name}_sum{_label_text(labelnames, labels)} {_format_value(total)}")
+            lines.append(f"{name}_count{_label_text(labelnames, labels)} {cumulative}")
+    return "\n".join(lines) + "\n"
+
+# 애플리케이션 전역 지표 모음
+REGISTRY = Registry()
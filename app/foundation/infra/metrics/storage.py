@@ -0,0 +1,15 @@
+from app.foundation.infra.metrics.registry import Counter
+
+ROWS_INGESTED = Counter(
+    "fin_rows_ingested_total",
+    "저장한 재무제표 행 수. rate()로 초당 수집 행 수를 구합니다."
+)
+CACHE_REQUESTS = Counter(
+    "fin_cache_requests_total",
+    "캐시 조회 수 (response_snapshot: hit/miss/stale, corp_code_index: hit/mapped/download, "
+    "company_search: hit/build/update)",
+    ["cache", "result"]
+)
+
+def record_cache(cache: str, result: str) -> None:
+    CACHE_REQUESTS.labels(cache, result).inc()
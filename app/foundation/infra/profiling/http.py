@@ -0,0 +1,85 @@
+import io
+import time
+import pstats
+import asyncio
+import cProfile
+from urllib.parse import parse_qs
+
+from app.foundation.infra.profiling.sampler import PROFILE_STORE, StackSampler, render_collapsed, sampling_available
+from app.foundation.infra.security.admin import is_admin_token
+
+# 프로파일 방식: sample(샘플링, 접힌 스택) 또는 cprofile(결정적, 함수별 호출 수/시간)
+PROFILE_HEADER = b"x-profile"
+PROFILE_QUERY = "_profile"
+PROFILE_MODES = ("sample", "cprofile")
+
+# 요청 단위 샘플링 간격(CPU 시간, 초)
+SAMPLE_INTERVAL = 0.001
+
+# cProfile 결과에 남길 함수 수
+CPROFILE_TOP = 80
+
+class ProfilingMiddleware:
+    """관리자 토큰과 함께 X-Profile 헤더(또는 _profile 쿼리)를 보낸 요청 하나를 프로파일하는 ASGI 미들웨어
+
+    결과는 작업자 메모리에 보관하고 응답 헤더 X-Profile-Id로 조회 ID를 알려 줍니다.
+    sample은 이 요청의 태스크가 CPU를 쓰는 동안만 표본을 세므로 동시에 처리 중인 다른 요청과 섞이지 않습니다
+    (SIGPROF를 쓰므로 이벤트 루프가 메인 스레드에서 돌 때만 동작).
+    cprofile은 이벤트 루프 스레드 전체를 측정하므로 트래픽이 적을 때 쓰고, 한 번에 한 요청만 측정합니다.
+    스레드 풀에서 실행되는 작업(asyncio.to_thread 등)은 어느 방식에도 포함되지 않습니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._cprofile_active = False
+
+    def _requested_mode(self, scope):
+        mode = None
+        token = None
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER:
+                mode = value.decode("latin-1")
+            elif name == b"x-admin-token":
+                token = value.decode("latin-1")
+        if mode is None and scope.get("query_string"):
+            mode = parse_qs(scope["query_string"].decode("latin-1")).get(PROFILE_QUERY, [None])[0]
+        if mode not in PROFILE_MODES or not is_admin_token(token):
+            return None
+        return mode
+
+    async def __call__(self, scope, receive, send):
+        mode = self._requested_mode(scope) if scope["type"] == "http" else None
+        if mode is None or (mode == "cprofile" and self._cprofile_active) or (mode == "sample" and not sampling_available()):
+            await self.app(scope, receive, send)
+            return
+
+        profile = {"mode": mode, "method": scope["method"], "path": scope["path"], "started_at": time.time()}
+        profile_id = PROFILE_STORE.add(profile)
+
+        async def send_with_profile_id(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [(b"x-profile-id", profile_id.encode())]
+            await send(message)
+
+        started = time.perf_counter()
+        if mode == "sample":
+            sampler = StackSampler(SAMPLE_INTERVAL, task=asyncio.current_task()).start()
+            try:
+                await self.app(scope, receive, send_with_profile_id)
+            finally:
+                stacks = sampler.stop()
+                profile["samples"] = sampler.samples
+                profile["output"] = render_collapsed(stacks)
+        else:
+            self._cprofile_active = True
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                await self.app(scope, receive, send_with_profile_id)
+            finally:
+                profiler.disable()
+                self._cprofile_active = False
+                output = io.StringIO()
+                pstats.Stats(profiler, stream=output).sort_stats("cumulative").print_stats(CPROFILE_TOP)
+                profile["output"] = output.getvalue()
+        profile["duration_ms"] = round((time.perf_counter() - started) * 1000, 3)
@@ -0,0 +1,185 @@
+import os
+import time
+import logging
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 단계별로 보관할 할당 위치 수
+TOP_SITES = 10
+
+# 할당 위치 집계에서 제외할 파일 (tracemalloc 자신과 임포트 과정)
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>")
+)
+
+class _ActiveStage:
+    __slots__ = ("name", "start_current", "peak", "snapshot")
+
+    def __init__(self, name: str, start_current: int, snapshot: Optional[tracemalloc.Snapshot]):
+        self.name = name
+        self.start_current = start_current
+        self.peak = start_current
+        self.snapshot = snapshot
+
+class AllocationTracker:
+    """tracemalloc으로 단계(수집, 검증, 고유번호 인덱스 생성 등)별 최대/잔존 메모리와 할당 위치를 모읍니다.
+
+    추적을 켜지 않았으면(MEMORY_TRACKING) 단계 기록은 아무것도 하지 않습니다.
+    tracemalloc의 최대값은 프로세스 전체 하나뿐이므로 단계에 들어가고 나올 때마다 진행 중인 모든 단계에 반영한 뒤 초기화합니다.
+    동시에 실행 중인 다른 요청의 할당도 함께 잡히므로 트래픽이 없을 때(수집 CLI, 부하 없는 작업자) 측정하는 진단용입니다.
+    잔존 할당 위치를 구하는 스냅샷은 추적 중인 모든 할당을 복사하느라 그동안 이벤트 루프를 멈추므로
+    API 서버 프로세스에서는 끄고(snapshots=False) 수집 CLI와 작업자 프로세스에서만 씁니다.
+    """
+
+    def __init__(self, top_sites: int = TOP_SITES):
+        self.top_sites = top_sites
+        self.snapshots = True
+        self._active: List[_ActiveStage] = []
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self.started_at: Optional[float] = None
+
+    @property
+    def enabled(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self, frames: int = 1, snapshots: bool = True) -> None:
+        """추적을 시작합니다. frames는 할당마다 기록할 호출 스택 깊이 (깊을수록 느림).
+
+        이미 추적 중이면 단계별 스냅샷 사용 여부만 바꿉니다.
+        """
+        self.snapshots = snapshots
+        if tracemalloc.is_tracing():
+            return
+        tracemalloc.start(frames)
+        self.started_at = time.time()
+        logger.info("메모리 할당 추적 시작 - 스택 깊이: %s", frames)
+
+    def stop(self) -> None:
+        tracemalloc.stop()
+        self._active.clear()
+
+    def _fold_peak(self) -> None:
+        """지금까지의 최대값을 진행 중인 단계에 반영하고 최대값을 초기화합니다."""
+        _, peak = tracemalloc.get_traced_memory()
+        for active in self._active:
+            if peak > active.peak:
+                active.peak = peak
+        tracemalloc.reset_peak()
+
+    def _take_snapshot(self) -> Optional[tracemalloc.Snapshot]:
+        if not self.snapshots:
+            return None
+        return tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """블록 실행 동안의 최대 메모리 증가와 블록이 끝난 뒤에도 남은 메모리, 남은 할당 위치를 기록합니다."""
+        if not tracemalloc.is_tracing():
+            yield
+            return
+        self._fold_peak()
+        snapshot = self._take_snapshot()
+        active = _ActiveStage(name, tracemalloc.get_traced_memory()[0], snapshot)
+        self._active.append(active)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self._fold_peak()
+            self._active.remove(active)
+            if tracemalloc.is_tracing():
+                current = tracemalloc.get_traced_memory()[0]
+                sites = self._retained_sites(active.snapshot)
+                self._record(name, active.peak - active.start_current, current - active.start_current, elapsed, sites)
+
+    def _retained_sites(self, before: Optional[tracemalloc.Snapshot]) -> List[Dict[str, Any]]:
+        if before is None:
+            return []
+        after = self._take_snapshot()
+        return [
+            {
+                "site": str(difference.traceback[0]) if difference.traceback else "?",
+                "size_kb": round(difference.size_diff / 1024, 1),
+                "count": difference.count_diff
+            }
+            for difference in after.compare_to(before, "lineno")[:self.top_sites]
+            if difference.size_diff > 0
+        ]
+
+    def _record(self, name: str, peak: int, retained: int, elapsed: float, sites: List[Dict[str, Any]]) -> None:
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = {"stage": name, "calls": 0, "max_peak": 0, "total_retained": 0}
+        stats["calls"] += 1
+        stats["max_peak"] = max(stats["max_peak"], peak)
+        stats["total_retained"] += retained
+        stats["last"] = {
+            "peak_kb": round(peak / 1024, 1),
+            "retained_kb": round(retained / 1024, 1),
+            "seconds": round(elapsed, 4),
+            "at": time.time(),
+            "top_sites": sites
+        }
+        logger.info("메모리 단계 %s: 최대 %.1fKB, 잔존 %.1fKB", name, peak / 1024, retained / 1024, extra={
+            "event": "memory_stage",
+            "stage": name,
+            "peak_kb": round(peak / 1024, 1),
+            "retained_kb": round(retained / 1024, 1)
+        })
+
+    def report(self) -> Dict[str, Any]:
+        """단계별 누적과 마지막 실행 결과, 현재 추적 중인 메모리를 반환합니다 (최대값 큰 순)."""
+        current, peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+        stages = [
+            {
+                "stage": stats["stage"],
+                "calls": stats["calls"],
+                "max_peak_kb": round(stats["max_peak"] / 1024, 1),
+                "mean_retained_kb": round(stats["total_retained"] / stats["calls"] / 1024, 1),
+                "last": stats["last"]
+            }
+            for stats in self._stats.values()
+        ]
+        return {
+            "enabled": self.enabled,
+            "started_at": self.started_at,
+            "traced_current_kb": round(current / 1024, 1),
+            "traced_peak_since_last_stage_kb": round(peak / 1024, 1),
+            "stages": sorted(stages, key=lambda stage: stage["max_peak_kb"], reverse=True)
+        }
+
+    def top_sites_now(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """현재 살아 있는 할당을 위치별로 모아 큰 순으로 반환합니다."""
+        if not tracemalloc.is_tracing():
+            return []
+        statistics = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS).statistics("lineno")
+        return [
+            {"site": str(stat.traceback[0]), "size_kb": round(stat.size / 1024, 1), "count": stat.count}
+            for stat in statistics[:limit]
+        ]
+
+    def reset(self) -> None:
+        self._stats.clear()
+
+ALLOCATION_TRACKER = AllocationTracker()
+
+def track_allocations(name: str):
+    """전역 추적기의 단계 기록 컨텍스트. 추적이 꺼져 있으면 비용이 거의 없습니다."""
+    return ALLOCATION_TRACKER.stage(name)
+
+def start_from_env(snapshots: bool = True) -> None:
+    """MEMORY_TRACKING(기록할 호출 스택 깊이, 0이면 끔)이 설정되어 있으면 추적을 시작합니다.
+
+    Args:
+        snapshots: 단계별 잔존 할당 위치 기록 여부. 요청을 처리하는 서버 프로세스는 False
+    """
+    frames = int(os.getenv("MEMORY_TRACKING", "0"))
+    if frames > 0:
+        ALLOCATION_TRACKER.start(frames, snapshots)
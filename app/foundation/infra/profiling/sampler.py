@@ -0,0 +1,195 @@
+import os
+import sys
+import time
+import signal
+import asyncio
+import logging
+import threading
+from collections import Counter, deque
+from functools import lru_cache
+from typing import Any, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 스택 하나에 남길 최대 프레임 수
+MAX_DEPTH = 128
+
+# 연속 모드에서 보관할 서로 다른 스택 수 상한 (넘으면 드문 스택을 합쳐 버림)
+MAX_STACKS = 20000
+
+@lru_cache(maxsize=4096)
+def _module_name(filename: str) -> str:
+    """파일 경로를 모듈 이름으로 바꿉니다 (sys.path 기준, 못 찾으면 파일 이름)."""
+    best = ""
+    for entry in sys.path:
+        entry = os.path.abspath(entry or ".")
+        if filename.startswith(entry + os.sep) and len(entry) > len(best):
+            best = entry
+    relative = filename[len(best) + 1:] if best else os.path.basename(filename)
+    module = relative[:-3] if relative.endswith(".py") else relative
+    return module.replace(os.sep, ".").removesuffix(".__init__")
+
+def collapse_stack(frame) -> str:
+    """프레임을 flamegraph.pl/speedscope의 접힌 스택 형식(바깥;...;안쪽)으로 바꿉니다."""
+    names = []
+    while frame is not None and len(names) < MAX_DEPTH:
+        code = frame.f_code
+        names.append(f"{_module_name(code.co_filename)}:{getattr(code, 'co_qualname', code.co_name)}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+def render_collapsed(stacks: Counter) -> str:
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+class StackSampler:
+    """CPU 시간 기준 샘플링 프로파일러가 모은 접힌 스택
+
+    표본은 SIGPROF 신호 처리기에서 이벤트 루프 스레드(메인 스레드)가 직접 기록합니다.
+    다른 스레드에서 읽는 방식은 루프가 I/O를 기다리며 GIL을 놓을 때만 표본을 얻게 되어
+    정작 태스크가 CPU를 쓰는 구간을 거의 잡지 못하기 때문입니다.
+    task를 주면 그 태스크가 실행 중일 때의 표본만, 아니면 어떤 태스크든 실행 중일 때의 표본을 셉니다.
+    """
+
+    def __init__(self, interval: float, task: Optional[asyncio.Task] = None):
+        self.interval = interval
+        self.task = task
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._elapsed = 0.0
+
+    def start(self) -> "StackSampler":
+        _SIGNAL_TIMER.add(self)
+        return self
+
+    def stop(self) -> Counter:
+        _SIGNAL_TIMER.remove(self)
+        return self.stacks
+
+    def record(self, frame, task: Optional[asyncio.Task], tick: float) -> None:
+        if task is None or (self.task is not None and task is not self.task):
+            return
+        # 타이머는 활성 샘플러 중 가장 짧은 간격으로 울리므로 자기 간격만큼 모였을 때만 기록
+        self._elapsed += tick
+        if self._elapsed < self.interval:
+            return
+        self._elapsed -= self.interval
+        self.samples += 1
+        self.stacks[collapse_stack(frame)] += 1
+        if len(self.stacks) > MAX_STACKS:
+            self._trim()
+
+    def _trim(self) -> None:
+        kept = Counter(dict(self.stacks.most_common(MAX_STACKS // 2)))
+        kept["(trimmed)"] += sum(self.stacks.values()) - sum(kept.values())
+        self.stacks = kept
+
+def sampling_available() -> bool:
+    """신호 기반 샘플링은 POSIX의 메인 스레드에서만 설정할 수 있습니다."""
+    return hasattr(signal, "SIGPROF") and threading.current_thread() is threading.main_thread()
+
+class _SignalTimer:
+    """프로세스 CPU 시간 타이머(ITIMER_PROF) 하나를 활성 샘플러들이 나눠 씁니다."""
+
+    def __init__(self):
+        self._samplers: List[StackSampler] = []
+        self._tick = 0.0
+        self._previous_handler = None
+
+    def add(self, sampler: StackSampler) -> None:
+        if not sampling_available():
+            raise RuntimeError("샘플링 프로파일러는 POSIX 메인 스레드에서만 시작할 수 있습니다.")
+        if not self._samplers:
+            self._previous_handler = signal.signal(signal.SIGPROF, self._handle)
+        self._samplers.append(sampler)
+        self._reset_timer()
+
+    def remove(self, sampler: StackSampler) -> None:
+        if sampler not in self._samplers:
+            return
+        self._samplers.remove(sampler)
+        self._reset_timer()
+        if not self._samplers:
+            signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+
+    def _reset_timer(self) -> None:
+        self._tick = min((sampler.interval for sampler in self._samplers), default=0.0)
+        signal.setitimer(signal.ITIMER_PROF, self._tick, self._tick)
+
+    def _handle(self, signum, frame) -> None:
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        for sampler in list(self._samplers):
+            sampler.record(frame, task, self._tick)
+
+_SIGNAL_TIMER = _SignalTimer()
+
+class ContinuousProfiler:
+    """이벤트 루프 스레드를 낮은 빈도로 계속 샘플링하여 요청 전체에 걸친 접힌 스택을 누적합니다."""
+
+    def __init__(self, hz: float):
+        self.hz = hz
+        self.started_at: Optional[float] = None
+        self._sampler: Optional[StackSampler] = None
+
+    @property
+    def running(self) -> bool:
+        return self._sampler is not None
+
+    def start(self) -> None:
+        """이벤트 루프 스레드(메인 스레드) 안에서 호출해야 합니다."""
+        if self.running or self.hz <= 0:
+            return
+        if not sampling_available():
+            logger.warning("연속 샘플링을 시작할 수 없습니다: POSIX 메인 스레드가 아닙니다.")
+            return
+        self._sampler = StackSampler(1.0 / self.hz).start()
+        self.started_at = time.time()
+
+    def stop(self) -> None:
+        if self._sampler is not None:
+            self._sampler.stop()
+            self._sampler = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        stacks = Counter(self._sampler.stacks) if self._sampler is not None else Counter()
+        return {
+            "hz": self.hz,
+            "started_at": self.started_at,
+            "samples": sum(stacks.values()),
+            "collapsed": render_collapsed(stacks)
+        }
+
+    def reset(self) -> None:
+        if self._sampler is not None:
+            self._sampler.stacks = Counter()
+            self.started_at = time.time()
+
+class ProfileStore:
+    """요청별 프로파일 결과를 최근 것부터 정해진 개수만 보관합니다 (작업자 프로세스별)."""
+
+    def __init__(self, capacity: int = 50):
+        self._profiles: Deque[Dict[str, Any]] = deque(maxlen=capacity)
+        self._next_id = 0
+
+    def add(self, profile: Dict[str, Any]) -> str:
+        self._next_id += 1
+        profile["profile_id"] = f"{os.getpid()}-{self._next_id}"
+        self._profiles.append(profile)
+        return profile["profile_id"]
+
+    def recent(self) -> List[Dict[str, Any]]:
+        return [
+            {key: value for key, value in profile.items() if key != "output"}
+            for profile in reversed(self._profiles)
+        ]
+
+    def get(self, profile_id: str) -> Optional[Dict[str, Any]]:
+        for profile in self._profiles:
+            if profile["profile_id"] == profile_id:
+                return profile
+        return None
+
+PROFILE_STORE = ProfileStore()
+CONTINUOUS_PROFILER = ContinuousProfiler(float(os.getenv("PROFILE_SAMPLE_HZ", "0")))
@@ -0,0 +1,19 @@
+import hmac
+from typing import Optional
+
+from fastapi import Header, HTTPException
+
+from app.foundation.core.config.settings import settings
+
+def is_admin_token(token: Optional[str]) -> bool:
+    """관리자 토큰이 설정되어 있고 주어진 값과 같은지 확인합니다."""
+    if not settings.ADMIN_TOKEN or token is None:
+        return False
+    return hmac.compare_digest(token.encode(), settings.ADMIN_TOKEN.encode())
+
+def require_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    """관리자 토큰(X-Admin-Token)을 확인합니다. ADMIN_TOKEN이 설정되지 않았으면 관리자 기능을 숨깁니다."""
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(status_code=403, detail="관리자 토큰이 올바르지 않습니다.")
@@ -0,0 +1,26 @@
+from types import SimpleNamespace
+
+import aiohttp
+
+from app.foundation.infra.metrics.client import api_name
+from app.foundation.infra.tracing.tracer import start_span
+
+async def _on_request_start(session, context: SimpleNamespace, params) -> None:
+    context.span = start_span(f"HTTP {params.method} {api_name(params.url)}", method=params.method, host=params.url.host)
+
+async def _on_request_end(session, context: SimpleNamespace, params) -> None:
+    if context.span is not None:
+        context.span.set_attribute("status", params.response.status)
+        context.span.finish()
+
+async def _on_request_exception(session, context: SimpleNamespace, params) -> None:
+    if context.span is not None:
+        context.span.finish(params.exception)
+
+def tracing_trace_config() -> aiohttp.TraceConfig:
+    """외부 API 호출을 현재 추적의 구간으로 기록하는 aiohttp 추적 설정"""
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(_on_request_start)
+    trace_config.on_request_end.append(_on_request_end)
+    trace_config.on_request_exception.append(_on_request_exception)
+    return trace_config
@@ -0,0 +1,33 @@
+from app.foundation.infra.tracing.tracer import TRACER
+
+# 값이 1이면 표본 비율과 관계없이 이 요청을 추적 (응답의 X-Trace-Id로 조회)
+FORCE_TRACE_HEADER = b"x-trace"
+
+class TracingMiddleware:
+    """표본으로 뽑힌 요청마다 추적을 시작하는 ASGI 미들웨어
+
+    추적한 요청은 응답 헤더 X-Trace-Id에 추적 ID를 담습니다.
+    추적하지 않는 요청은 그대로 통과시키므로 하위 구간도 만들어지지 않습니다.
+    """
+
+    def __init__(self, app, exclude_paths=("/metrics",)):
+        self.app = app
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+        forced = any(name == FORCE_TRACE_HEADER and value == b"1" for name, value in scope["headers"])
+        if not TRACER.should_sample(forced):
+            await self.app(scope, receive, send)
+            return
+
+        with TRACER.start_trace(f"{scope['method']} {scope['path']}", method=scope["method"], path=scope["path"]) as trace:
+            async def send_with_trace_id(message):
+                if message["type"] == "http.response.start":
+                    trace.root.set_attribute("status", message["status"])
+                    message["headers"] = list(message.get("headers", [])) + [(b"x-trace-id", trace.trace_id.encode())]
+                await send(message)
+
+            await self.app(scope, receive, send_with_trace_id)
@@ -0,0 +1,32 @@
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.foundation.infra.tracing.tracer import start_span
+
+# 구간 속성에 남길 SQL 문 최대 길이
+STATEMENT_PREVIEW = 300
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "SQL"
+    context._trace_span = start_span(
+        f"SQL {operation}",
+        statement=" ".join(statement.split())[:STATEMENT_PREVIEW],
+        executemany=executemany
+    )
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    span = getattr(context, "_trace_span", None)
+    if span is not None:
+        span.set_attribute("rowcount", cursor.rowcount)
+        span.finish()
+
+def _handle_error(exception_context):
+    span = getattr(exception_context.execution_context, "_trace_span", None)
+    if span is not None:
+        span.finish(exception_context.original_exception)
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """SQL 실행마다 현재 추적의 구간을 기록합니다 (추적 중인 요청만)."""
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine.sync_engine, "handle_error", _handle_error)
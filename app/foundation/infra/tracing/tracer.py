@@ -0,0 +1,307 @@
+import os
+import json
+import time
+import random
+import inspect
+import logging
+import functools
+import threading
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from queue import SimpleQueue
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 파일 내보내기에서 조회할 때 읽는 파일 끝부분 크기
+FILE_SCAN_BYTES = 16 * 1024 * 1024
+
+class Span:
+    """추적 안의 한 구간. 시작/종료 시각은 perf_counter 기준이며 출력할 때 추적 시작 기준 ms로 바꿉니다."""
+
+    __slots__ = ("trace", "span_id", "parent_id", "name", "attributes", "start", "end", "error")
+
+    def __init__(self, trace: "Trace", span_id: int, parent_id: Optional[int], name: str, attributes: Dict[str, Any]):
+        self.trace = trace
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.name = name
+        self.attributes = attributes
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self.error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        if self.end is not None:
+            return
+        self.end = time.perf_counter()
+        if error is not None:
+            self.error = type(error).__name__
+
+    @property
+    def duration(self) -> float:
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+class Trace:
+    """요청 하나의 구간 모음. 루트 구간이 끝나면 내보냅니다."""
+
+    def __init__(self, name: str, attributes: Dict[str, Any]):
+        self.trace_id = f"{random.getrandbits(64):016x}"
+        self.started_at = time.time()
+        self.spans: List[Span] = []
+        self.root = self.start_span(name, None, attributes)
+
+    def start_span(self, name: str, parent: Optional[Span], attributes: Dict[str, Any]) -> Span:
+        span = Span(self, len(self.spans) + 1, parent.span_id if parent is not None else None, name, attributes)
+        self.spans.append(span)
+        return span
+
+    def to_dict(self) -> Dict[str, Any]:
+        """구간 목록과 구간 이름별 합계를 반환합니다.
+
+        자기 시간(self_ms)은 구간 시간에서 하위 구간 시간을 뺀 값으로, 동시에 실행된 하위 구간이 있으면 0 이하로 자릅니다.
+        """
+        origin = self.root.start
+        child_time: Dict[int, float] = {}
+        for span in self.spans:
+            if span.parent_id is not None:
+                child_time[span.parent_id] = child_time.get(span.parent_id, 0.0) + span.duration
+        spans = []
+        breakdown: Dict[str, Dict[str, Any]] = {}
+        for span in self.spans:
+            duration_ms = span.duration * 1000
+            self_ms = max(duration_ms - child_time.get(span.span_id, 0.0) * 1000, 0.0)
+            spans.append({
+                "span_id": span.span_id,
+                "parent_id": span.parent_id,
+                "name": span.name,
+                "start_ms": round((span.start - origin) * 1000, 3),
+                "duration_ms": round(duration_ms, 3),
+                "self_ms": round(self_ms, 3),
+                "attributes": span.attributes,
+                "error": span.error
+            })
+            stats = breakdown.setdefault(span.name, {"name": span.name, "count": 0, "total_ms": 0.0, "self_ms": 0.0})
+            stats["count"] += 1
+            stats["total_ms"] += duration_ms
+            stats["self_ms"] += self_ms
+        for stats in breakdown.values():
+            stats["total_ms"] = round(stats["total_ms"], 3)
+            stats["self_ms"] = round(stats["self_ms"], 3)
+        return {
+            "trace_id": self.trace_id,
+            "name": self.root.name,
+            "started_at": self.started_at,
+            "duration_ms": round(self.root.duration * 1000, 3),
+            "error": self.root.error,
+            "span_count": len(self.spans),
+            "breakdown": sorted(breakdown.values(), key=lambda stats: stats["self_ms"], reverse=True),
+            "spans": spans
+        }
+
+class InMemoryExporter:
+    """최근 추적을 정해진 개수만큼 보관합니다 (작업자 프로세스별)."""
+
+    def __init__(self, capacity: int = 200):
+        self._traces: Deque[Dict[str, Any]] = deque(maxlen=capacity)
+
+    def export(self, trace: Dict[str, Any]) -> None:
+        self._traces.append(trace)
+
+    def recent(self, limit: int = 50) -> List[Dict[str, Any]]:
+        return list(self._traces)[-limit:][::-1]
+
+    def find(self, trace_id: str) -> Optional[Dict[str, Any]]:
+        for trace in reversed(self._traces):
+            if trace["trace_id"] == trace_id:
+                return trace
+        return None
+
+class FileExporter:
+    """추적을 JSON Lines 파일에 추가합니다.
+
+    쓰기는 백그라운드 스레드에서 하므로 요청 처리 경로에서 파일 I/O를 기다리지 않습니다.
+    한 줄을 한 번의 write로 추가하므로 여러 작업자가 같은 파일을 써도 줄이 섞이지 않습니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._queue: SimpleQueue = SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+
+    def export(self, trace: Dict[str, Any]) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._write_loop, name="trace-file-exporter", daemon=True)
+            self._thread.start()
+        self._queue.put(trace)
+
+    def _write_loop(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        while True:
+            trace = self._queue.get()
+            try:
+                line = (json.dumps(trace, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+                fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                try:
+                    os.write(fd, line)
+                finally:
+                    os.close(fd)
+            except Exception as e:
+                logger.warning("추적 파일 쓰기 실패: %s", e)
+
+    def _tail(self) -> List[str]:
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                size = f.tell()
+                f.seek(max(size - FILE_SCAN_BYTES, 0))
+                return f.read().decode("utf-8", errors="ignore").splitlines()
+        except OSError:
+            return []
+
+    def recent(self, limit: int = 50) -> List[Dict[str, Any]]:
+        traces = []
+        for line in reversed(self._tail()):
+            if len(traces) >= limit:
+                break
+            try:
+                traces.append(json.loads(line))
+            except ValueError:
+                continue
+        return traces
+
+    def find(self, trace_id: str) -> Optional[Dict[str, Any]]:
+        # 다른 작업자가 처리한 요청도 찾을 수 있음
+        needle = f'"trace_id": "{trace_id}"'
+        for line in reversed(self._tail()):
+            if needle in line:
+                try:
+                    return json.loads(line)
+                except ValueError:
+                    return None
+        return None
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+class Tracer:
+    """요청별 구간 추적
+
+    추적하지 않는 요청(표본 밖)에서는 현재 구간이 없으므로 span()/traced()가 아무것도 만들지 않아 비용이 거의 없습니다.
+    """
+
+    def __init__(self, exporters: List[Any], sample_rate: float = 0.0):
+        self.exporters = exporters
+        self.sample_rate = sample_rate
+
+    @classmethod
+    def from_env(cls) -> "Tracer":
+        """TRACE_EXPORTER(memory, file, none 쉼표 목록), TRACE_FILE, TRACE_SAMPLE_RATE, TRACE_BUFFER_SIZE로 만듭니다."""
+        exporters: List[Any] = []
+        for name in os.getenv("TRACE_EXPORTER", "memory").split(","):
+            name = name.strip()
+            if name == "memory":
+                exporters.append(InMemoryExporter(int(os.getenv("TRACE_BUFFER_SIZE", "200"))))
+            elif name == "file":
+                exporters.append(FileExporter(os.getenv("TRACE_FILE", "data/traces.jsonl")))
+        return cls(exporters, float(os.getenv("TRACE_SAMPLE_RATE", "0.01")))
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.exporters)
+
+    def should_sample(self, forced: bool = False) -> bool:
+        return self.enabled and (forced or random.random() < self.sample_rate)
+
+    @contextmanager
+    def start_trace(self, name: str, **attributes) -> Iterator[Trace]:
+        """새 추적을 시작하고 루트 구간을 현재 구간으로 둡니다. 끝나면 내보냅니다."""
+        trace = Trace(name, attributes)
+        token = _current_span.set(trace.root)
+        try:
+            yield trace
+        except BaseException as e:
+            trace.root.finish(e)
+            raise
+        finally:
+            trace.root.finish()
+            _current_span.reset(token)
+            self.export(trace)
+
+    def export(self, trace: Trace) -> None:
+        data = trace.to_dict()
+        for exporter in self.exporters:
+            try:
+                exporter.export(data)
+            except Exception as e:
+                logger.warning("추적 내보내기 실패: %s", e)
+
+    def recent(self, limit: int = 50) -> List[Dict[str, Any]]:
+        return self.exporters[0].recent(limit) if self.exporters else []
+
+    def find(self, trace_id: str) -> Optional[Dict[str, Any]]:
+        for exporter in self.exporters:
+            trace = exporter.find(trace_id)
+            if trace is not None:
+                return trace
+        return None
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+def start_span(name: str, **attributes) -> Optional[Span]:
+    """현재 구간의 하위 구간을 시작합니다. 하위 구간을 만들지 않는 말단 구간(SQL 실행, 외부 호출)용이며
+    호출한 쪽에서 finish()해야 합니다. 추적 중이 아니면 None"""
+    parent = _current_span.get()
+    if parent is None:
+        return None
+    return parent.trace.start_span(name, parent, attributes)
+
+@contextmanager
+def span(name: str, **attributes) -> Iterator[Optional[Span]]:
+    """현재 구간의 하위 구간을 만들고 블록 안에서 현재 구간으로 둡니다. 추적 중이 아니면 None"""
+    parent = _current_span.get()
+    if parent is None:
+        yield None
+        return
+    child = parent.trace.start_span(name, parent, attributes)
+    token = _current_span.set(child)
+    try:
+        yield child
+    except BaseException as e:
+        child.finish(e)
+        raise
+    finally:
+        child.finish()
+        _current_span.reset(token)
+
+def traced(name: Optional[str] = None):
+    """함수(동기/비동기) 실행을 구간으로 기록하는 데코레이터. 구간 이름 기본값은 Class.method"""
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _current_span.get() is None:
+                    return await func(*args, **kwargs)
+                with span(span_name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current_span.get() is None:
+                return func(*args, **kwargs)
+            with span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+# 애플리케이션 전역 추적기
+TRACER = Tracer.from_env()
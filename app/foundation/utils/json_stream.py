@@ -0,0 +1,124 @@
+import json
+from typing import Any, Dict, Iterator, List, Optional
+
+_WHITESPACE = " \t\n\r"
+
+class JsonArrayStreamParser:
+    """JSON 응답의 특정 배열 필드를 조각 단위로 받아 원소를 하나씩 꺼내는 증분 파서
+
+    DART 응답처럼 최상위 객체에 큰 배열 하나(list)와 작은 스칼라 필드(status, message)가 있는
+    구조를 가정합니다. 배열 원소는 파싱되는 즉시 반환되고 버퍼에서 제거되므로
+    메모리 사용량은 응답 전체가 아니라 원소 하나와 수신 조각 크기에 비례합니다.
+
+    사용 예:
+        parser = JsonArrayStreamParser("list")
+        for chunk in chunks:
+            for item in parser.feed(chunk):
+                ...
+        parser.close()
+        parser.header  # {"status": "000", "message": "정상"}
+    """
+
+    def __init__(self, array_key: str = "list"):
+        self.array_key = array_key
+        self.header: Dict[str, Any] = {}
+        self._decoder = json.JSONDecoder()
+        self._marker = f'"{array_key}"'
+        self._buffer = ""
+        self._header_text = ""
+        self._bytes = b""
+        self._state = "header"  # header -> array -> trailer
+        self._pos = 0
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """응답 조각을 추가하고 완성된 배열 원소를 반환합니다."""
+        # UTF-8 다중 바이트 문자가 조각 경계에서 잘릴 수 있으므로 완성된 부분만 디코딩
+        data = self._bytes + chunk
+        try:
+            text = data.decode("utf-8")
+            self._bytes = b""
+        except UnicodeDecodeError as e:
+            text = data[:e.start].decode("utf-8")
+            self._bytes = data[e.start:]
+        self._buffer += text
+        return self._drain()
+
+    def _drain(self) -> List[Any]:
+        items: List[Any] = []
+        buffer = self._buffer
+        pos = self._pos
+
+        if self._state == "header":
+            start = buffer.find(self._marker)
+            if start < 0:
+                return items
+            bracket = buffer.find("[", start + len(self._marker))
+            if bracket < 0:
+                return items
+            self._header_text = buffer[:start]
+            pos = bracket + 1
+            self._state = "array"
+
+        if self._state == "array":
+            while True:
+                while pos < len(buffer) and buffer[pos] in _WHITESPACE + ",":
+                    pos += 1
+                if pos >= len(buffer):
+                    break
+                if buffer[pos] == "]":
+                    self._state = "trailer"
+                    pos += 1
+                    break
+                try:
+                    item, end = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    # 원소가 아직 다 도착하지 않음
+                    break
+                pos = end
+                items.append(item)
+            # 소비한 부분은 버퍼에서 제거
+            buffer = buffer[pos:]
+            pos = 0
+
+        self._buffer = buffer
+        self._pos = pos
+        return items
+
+    def close(self) -> Dict[str, Any]:
+        """스트림 종료 후 배열 외 필드(status, message 등)를 파싱하여 반환합니다."""
+        if self._state == "header":
+            # 배열 필드가 없는 응답 (예: {"status": "013", "message": "조회된 데이타가 없습니다."})
+            self.header = json.loads(self._buffer) if self._buffer.strip() else {}
+            return self.header
+        if self._state != "trailer":
+            raise ValueError(f"'{self.array_key}' 배열이 끝나기 전에 스트림이 종료되었습니다.")
+
+        # 배열을 제외한 앞뒤 부분을 합쳐 작은 객체로 파싱
+        head = self._header_text.rstrip().rstrip(",")
+        tail = self._buffer.strip().lstrip(",").strip()
+        if head.rstrip().endswith("{"):
+            text = head + tail
+        else:
+            text = head + ("," + tail if tail and tail != "}" else tail)
+        self.header = json.loads(text)
+        return self.header
+
+def iter_batches(items: Iterator[Any], batch_size: int) -> Iterator[List[Any]]:
+    """원소 스트림을 고정 크기 배치로 묶습니다."""
+    batch: List[Any] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def parse_array_stream(chunks, array_key: str = "list", header: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+    """바이트 조각 이터러블에서 배열 원소를 순서대로 꺼냅니다. header dict가 주어지면 나머지 필드를 채웁니다."""
+    parser = JsonArrayStreamParser(array_key)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    result = parser.close()
+    if header is not None:
+        header.update(result)
@@ -1,14 +1,33 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from typing import Callable
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
+import asyncio
 import logging
 import os
 from dotenv import load_dotenv
 
 from app.api.fin.fin_router import router as fin_router
-from app.foundation.infra.database.database import init_db
+from app.api.fin.dependencies import register_fin_dependencies
+from app.api.monitoring.monitoring_router import router as monitoring_router
+from app.api.admin.admin_router import router as admin_router
+from app.foundation.core.container.container import Container
+from app.foundation.infra.database.database import init_db, async_session, engine
+from app.foundation.infra.logger.logging_config import configure_logging
+from app.foundation.infra.metrics.http import MetricsMiddleware
+from app.foundation.infra.tracing.http import TracingMiddleware
+from app.foundation.infra.profiling.http import ProfilingMiddleware
+from app.foundation.infra.profiling.sampler import CONTINUOUS_PROFILER
+from app.foundation.infra.profiling.memory import start_from_env as start_memory_tracking
+from app.foundation.infra.metrics.registry import REGISTRY, METRICS_DIR_ENV
+from app.platform.messaging.job_queue import JobWorkerPool
+from app.platform.messaging.event_bus import event_bus, PostgresEventRelay
+from app.domin.fin.service.job_handlers import FIN_JOB_HANDLERS
+from app.domin.fin.service.account_taxonomy import load_account_mappings
+from app.domin.fin.service.ratio_registry import RATIO_EVALUATOR
+from sqlalchemy import text
 
 # 환경 변수 로드
 env = os.getenv("APP_ENV", "development")
@@ -18,14 +37,83 @@ else:
     # 프로덕션 환경에서는 Railway의 환경 변수를 사용
     load_dotenv()
 
-# 로깅 설정
-logging.basicConfig(
-    level=os.getenv("LOG_LEVEL", "INFO"),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# 로깅 설정 (큐를 거쳐 백그라운드 스레드에서 출력)
+configure_logging()
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+# MEMORY_TRACKING이 설정된 경우에만 할당 추적 (serve 실행기는 미리 읽기 전에 이미 시작함)
+# 요청 처리 중 이벤트 루프를 멈추지 않도록 단계별 스냅샷(잔존 할당 위치)은 끔
+start_memory_tracking(snapshots=False)
+
+# 프로세스 내 백그라운드 작업자 (0이면 별도 작업자 프로세스만 사용)
+job_workers = int(os.getenv("JOB_WORKERS", "2"))
+job_worker_pool = JobWorkerPool(async_session, FIN_JOB_HANDLERS, concurrency=job_workers, event_bus=event_bus)
+# 별도 작업자 프로세스의 진행 이벤트를 SSE 구독자에게 전달
+event_relay = PostgresEventRelay(engine, event_bus)
+
+# 작업자 시작 시 미리 열어 둘 DB 연결 수 (연결 풀 크기 이하)
+warmup_connections = int(os.getenv("WARMUP_DB_CONNECTIONS", "2"))
+
+async def warm_up() -> None:
+    """작업자별 예열: 요청을 받기 전에 DB 연결 풀을 채우고 재무비율 평가 경로를 한 번 실행합니다."""
+    try:
+        connections = [await engine.connect() for _ in range(warmup_connections)]
+        for connection in connections:
+            await connection.execute(text("SELECT 1"))
+            await connection.close()
+    except Exception as e:
+        logger.warning("DB 연결 예열 실패: %s", e)
+    RATIO_EVALUATOR.evaluate({})
+    RATIO_EVALUATOR.reset_timings()
+    logger.info("작업자 예열 완료 - pid: %s, DB 연결: %s", os.getpid(), warmup_connections)
+
+# 다중 작업자 실행 시 지표 파일을 쓰는 간격(초). /metrics를 받은 작업자는 자신의 지표를 바로 씀
+METRICS_FLUSH_SECONDS = float(os.getenv("METRICS_FLUSH_SECONDS", "5"))
+
+async def flush_metrics(directory: str) -> None:
+    """작업자 지표를 주기적으로 METRICS_DIR에 써서 다른 작업자가 합쳐 출력할 수 있게 합니다."""
+    while True:
+        await asyncio.sleep(METRICS_FLUSH_SECONDS)
+        try:
+            await asyncio.to_thread(REGISTRY.write, directory)
+        except Exception as e:
+            logger.warning("지표 파일 쓰기 실패: %s", e)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 범위 의존성(HTTP 클라이언트, 캐시 등)을 한 번 만들고 종료 시 정리합니다."""
+    logger.info("Starting application in %s environment", env)
+    await init_db()
+    logger.info("Database initialized")
+    async with async_session() as session:
+        await load_account_mappings(session)
+
+    container = Container()
+    register_fin_dependencies(container)
+    app.state.container = container
+    await warm_up()
+
+    await event_relay.start()
+    if job_workers > 0:
+        job_worker_pool.start()
+    metrics_dir = os.getenv(METRICS_DIR_ENV)
+    metrics_flusher = asyncio.create_task(flush_metrics(metrics_dir)) if metrics_dir else None
+    # PROFILE_SAMPLE_HZ가 설정된 경우에만 연속 샘플링
+    CONTINUOUS_PROFILER.start()
+    try:
+        yield
+    finally:
+        await job_worker_pool.stop()
+        await event_relay.stop()
+        await container.aclose()
+        CONTINUOUS_PROFILER.stop()
+        if metrics_flusher is not None:
+            metrics_flusher.cancel()
+            # 종료 전까지의 카운터가 합계에 남도록 마지막으로 한 번 더 씀
+            REGISTRY.write(metrics_dir)
+
+# 기본 응답 직렬화는 orjson 사용 (라우트에서 직렬화된 바이트를 반환하면 그대로 전송)
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # CORS 설정
 app.add_middleware(
@@ -35,18 +123,20 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# 관리자 토큰과 X-Profile 헤더를 보낸 요청 하나를 프로파일
+app.add_middleware(ProfilingMiddleware)
+# 표본 요청의 구간 추적 (X-Trace: 1 헤더로 강제)
+app.add_middleware(TracingMiddleware)
+# 라우트별 요청 수/처리 시간 (가장 바깥에서 CORS 처리 시간까지 포함)
+app.add_middleware(MetricsMiddleware)
 
 # 라우터 등록
 app.include_router(fin_router, tags=["financial"])
+app.include_router(monitoring_router)
+app.include_router(admin_router)
 
 current_time: Callable[[], str] = lambda: datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
 
-@app.on_event("startup")
-async def startup_event():
-    logger.info(f"Starting application in {env} environment")
-    await init_db()
-    logger.info("Database initialized")
-
 @app.get("/")
 async def home():
     logger.info("Accessing home page")
@@ -63,5 +153,5 @@ async def home():
 """
         return HTMLResponse(content=content)
     except Exception as e:
-        logger.error(f"Error in home page: {str(e)}")
+        logger.error("Error in home page: %s", e)
         raise 
\ No newline at end of file
@@ -0,0 +1,159 @@
+import os
+import json
+import socket
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, Callable, Set
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+EventPredicate = Callable[[Dict[str, Any]], bool]
+
+class Subscription:
+    """이벤트 구독. 소비가 느리면 가장 오래된 이벤트부터 버립니다."""
+
+    def __init__(self, bus: "EventBus", predicate: Optional[EventPredicate], max_queue: int):
+        self.bus = bus
+        self.predicate = predicate
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.dropped = 0
+
+    def offer(self, event: Dict[str, Any]) -> None:
+        if self.predicate is not None and not self.predicate(event):
+            return
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """다음 이벤트를 기다립니다. 시간 내에 없으면 None을 반환합니다."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self.bus.unsubscribe(self)
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+class EventBus:
+    """프로세스 내 발행/구독 이벤트 버스
+
+    릴레이가 연결되어 있으면 다른 프로세스(작업자)에서 발행한 이벤트도 전달됩니다.
+    """
+
+    def __init__(self, max_queue: int = 1000):
+        self.max_queue = max_queue
+        self._subscribers: Set[Subscription] = set()
+        self._relay: Optional["PostgresEventRelay"] = None
+
+    def subscribe(self, predicate: Optional[EventPredicate] = None) -> Subscription:
+        subscription = Subscription(self, predicate, self.max_queue)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscribers.discard(subscription)
+
+    def attach_relay(self, relay: Optional["PostgresEventRelay"]) -> None:
+        self._relay = relay
+
+    def publish_local(self, event: Dict[str, Any]) -> None:
+        """현재 프로세스의 구독자에게만 이벤트를 전달합니다."""
+        for subscription in list(self._subscribers):
+            subscription.offer(event)
+
+    async def publish(self, event_type: str, **data) -> Dict[str, Any]:
+        """이벤트를 발행합니다."""
+        event = {
+            "type": event_type,
+            "ts": datetime.now(timezone.utc).isoformat(),
+            **data
+        }
+        self.publish_local(event)
+        if self._relay is not None:
+            try:
+                await self._relay.notify(event)
+            except Exception as e:
+                # 이벤트 전달 실패가 본 작업을 실패시키지 않도록 기록만 함
+                logger.warning("이벤트 릴레이 실패: %s", e)
+        return event
+
+class PostgresEventRelay:
+    """Postgres LISTEN/NOTIFY로 프로세스 간 이벤트를 중계합니다."""
+
+    CHANNEL = "fin_events"
+
+    def __init__(self, engine, bus: EventBus):
+        self.engine = engine
+        self.bus = bus
+        self.origin = f"{socket.gethostname()}:{os.getpid()}"
+        self._connection = None
+        self._driver_connection = None
+
+    async def start(self) -> None:
+        """알림 수신용 연결을 열고 버스에 릴레이를 연결합니다."""
+        self._connection = await self.engine.connect()
+        raw_connection = await self._connection.get_raw_connection()
+        self._driver_connection = raw_connection.driver_connection
+        await self._driver_connection.add_listener(self.CHANNEL, self._on_notify)
+        self.bus.attach_relay(self)
+        logger.info("이벤트 릴레이 시작 - 채널: %s", self.CHANNEL)
+
+    async def stop(self) -> None:
+        self.bus.attach_relay(None)
+        if self._driver_connection is not None:
+            await self._driver_connection.remove_listener(self.CHANNEL, self._on_notify)
+            self._driver_connection = None
+        if self._connection is not None:
+            await self._connection.close()
+            self._connection = None
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            return
+        # 자기 프로세스가 보낸 이벤트는 이미 로컬로 전달됨
+        if message.get("origin") == self.origin:
+            return
+        self.bus.publish_local(message["event"])
+
+    async def notify(self, event: Dict[str, Any]) -> None:
+        payload = json.dumps({"origin": self.origin, "event": event}, ensure_ascii=False, default=str)
+        async with self.engine.begin() as connection:
+            await connection.execute(text("SELECT pg_notify(:channel, :payload)"), {
+                "channel": self.CHANNEL,
+                "payload": payload
+            })
+
+def format_sse(event: Dict[str, Any]) -> str:
+    """이벤트를 Server-Sent Events 형식으로 직렬화합니다."""
+    data = json.dumps(event, ensure_ascii=False, default=str)
+    return f"event: {event['type']}\ndata: {data}\n\n"
+
+async def sse_stream(subscription: Subscription, is_disconnected: Callable, heartbeat: float = 15.0):
+    """구독한 이벤트를 SSE 문자열로 내보냅니다. 주기적으로 주석 줄을 보내 연결을 유지합니다."""
+    try:
+        yield ": connected\n\n"
+        while True:
+            event = await subscription.get(timeout=heartbeat)
+            if await is_disconnected():
+                break
+            if event is None:
+                yield ": heartbeat\n\n"
+                continue
+            yield format_sse(event)
+    finally:
+        subscription.close()
+
+# 애플리케이션 전역 이벤트 버스
+event_bus = EventBus()
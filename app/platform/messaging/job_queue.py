@@ -0,0 +1,234 @@
+import os
+import socket
+import asyncio
+import logging
+from typing import Dict, Any, Optional, Callable, Awaitable
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.platform.messaging.event_bus import EventBus
+from app.platform.messaging.job_repository import (
+    insert_job,
+    get_active_job_by_dedup_key,
+    get_job,
+    claim_next_job,
+    update_job_progress,
+    complete_job,
+    fail_job,
+    requeue_stale_jobs
+)
+
+logger = logging.getLogger(__name__)
+
+class JobQueue:
+    """Postgres 테이블(job_queue) 기반의 영속 작업 큐"""
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def enqueue(
+        self,
+        job_type: str,
+        payload: Dict[str, Any],
+        priority: int = 0,
+        dedup_key: Optional[str] = None,
+        max_attempts: int = 3
+    ) -> Dict[str, Any]:
+        """작업을 큐에 추가합니다.
+
+        같은 중복 제거 키의 작업이 이미 대기/실행 중이면 새로 추가하지 않고 기존 작업을 반환합니다.
+        """
+        job_id = await insert_job(self.db_session, job_type, payload, priority, dedup_key, max_attempts)
+        await self.db_session.commit()
+        if job_id is None:
+            job = await get_active_job_by_dedup_key(self.db_session, dedup_key)
+            if job is not None:
+                logger.info("중복 작업이 이미 존재합니다 - 키: %s, 작업 ID: %s", dedup_key, job['id'])
+                return {**job, "deduplicated": True}
+            # 조회 직전에 기존 작업이 끝난 경우 다시 추가
+            return await self.enqueue(job_type, payload, priority, dedup_key, max_attempts)
+
+        logger.info("작업 추가 - 유형: %s, 작업 ID: %s, 우선순위: %s", job_type, job_id, priority)
+        return {**await get_job(self.db_session, job_id), "deduplicated": False}
+
+    async def get(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """작업 상태를 조회합니다."""
+        return await get_job(self.db_session, job_id)
+
+class JobOwnershipLost(Exception):
+    """실행 중인 작업이 응답 없음으로 회수되어 더 이상 이 작업자의 것이 아닐 때 발생합니다."""
+
+class JobContext:
+    """작업 처리기에 전달되는 실행 정보"""
+
+    def __init__(self, job: Dict[str, Any], session_factory, event_bus: Optional[EventBus] = None):
+        self.job = job
+        self.job_id: int = job["id"]
+        self.attempt: int = job["attempts"]
+        self.worker_id: str = job["locked_by"]
+        self.session_factory = session_factory
+        self.event_bus = event_bus
+
+    async def report(self, progress: float, message: Optional[str] = None, **detail) -> None:
+        """진행률(0~1)을 기록합니다. 작업 트랜잭션과 분리된 세션으로 즉시 커밋합니다.
+
+        진행률 기록은 잠금 시각도 늘리는 하트비트를 겸합니다. 작업이 이미 회수되었으면
+        JobOwnershipLost를 발생시켜 처리기가 중복 실행을 멈추도록 합니다.
+        이벤트 버스가 있으면 진행 이벤트(job_progress)도 발행하며, detail은 이벤트에만 포함됩니다.
+        """
+        async with self.session_factory() as session:
+            owned = await update_job_progress(session, self.job_id, self.worker_id, progress, message)
+            await session.commit()
+        if not owned:
+            raise JobOwnershipLost(f"작업이 회수되었습니다: {self.job_id}")
+        if self.event_bus is not None:
+            await self.event_bus.publish(
+                "job_progress",
+                job_id=self.job_id,
+                job_type=self.job["job_type"],
+                progress=progress,
+                stage=message,
+                **detail
+            )
+
+JobHandler = Callable[[Dict[str, Any], JobContext], Awaitable[Optional[Dict[str, Any]]]]
+
+class JobWorkerPool:
+    """작업 큐를 폴링하여 처리기를 실행하는 프로세스 내 작업자 풀
+
+    프로세스마다 풀을 하나씩 띄우면 SKIP LOCKED 덕분에 작업자 수를 늘리는 것만으로 확장됩니다.
+    """
+
+    def __init__(
+        self,
+        session_factory,
+        handlers: Dict[str, JobHandler],
+        concurrency: int = 2,
+        poll_interval: float = 1.0,
+        retry_base_delay: float = 5.0,
+        stale_timeout: float = 900.0,
+        event_bus: Optional[EventBus] = None
+    ):
+        self.session_factory = session_factory
+        self.event_bus = event_bus
+        self.handlers = handlers
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.retry_base_delay = retry_base_delay
+        self.stale_timeout = stale_timeout
+        # 진행률 보고 없이 오래 걸리는 단계에서도 회수되지 않도록 잠금 시각을 늘리는 주기
+        self.heartbeat_interval = stale_timeout / 3
+        self.worker_prefix = f"{socket.gethostname()}:{os.getpid()}"
+        self._tasks = []
+        self._stopping = asyncio.Event()
+
+    def start(self) -> None:
+        """작업자 태스크를 시작합니다."""
+        if self._tasks:
+            return
+        self._stopping.clear()
+        self._tasks = [
+            asyncio.create_task(self._worker(f"{self.worker_prefix}:{index}"))
+            for index in range(self.concurrency)
+        ]
+        self._tasks.append(asyncio.create_task(self._reaper()))
+        logger.info("작업자 풀 시작 - 작업자 수: %s", self.concurrency)
+
+    async def stop(self) -> None:
+        """새 작업을 가져오지 않도록 하고 실행 중인 작업이 끝날 때까지 기다립니다."""
+        self._stopping.set()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info("작업자 풀 종료")
+
+    async def _sleep(self, seconds: float) -> None:
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _worker(self, worker_id: str) -> None:
+        while not self._stopping.is_set():
+            try:
+                async with self.session_factory() as session:
+                    job = await claim_next_job(session, worker_id)
+                    await session.commit()
+            except Exception as e:
+                logger.error("작업 가져오기 실패 - 작업자: %s, 오류: %s", worker_id, e)
+                await self._sleep(self.poll_interval)
+                continue
+
+            if job is None:
+                await self._sleep(self.poll_interval)
+                continue
+            await self.run_job(job)
+
+    async def run_job(self, job: Dict[str, Any]) -> None:
+        """작업 하나를 실행하고 결과에 따라 완료/재시도/실패로 기록합니다.
+
+        실행하는 동안 하트비트로 잠금 시각을 늘리고, 완료/실패 기록은 작업을 잡은 작업자가
+        아직 실행 중일 때만 반영합니다 (회수되어 다른 작업자가 잡은 작업을 덮어쓰지 않음).
+        """
+        handler = self.handlers.get(job["job_type"])
+        context = JobContext(job, self.session_factory, self.event_bus)
+        heartbeat = asyncio.create_task(self._heartbeat(job))
+        try:
+            if handler is None:
+                raise ValueError(f"등록되지 않은 작업 유형입니다: {job['job_type']}")
+            result = await handler(job["payload"], context)
+            async with self.session_factory() as session:
+                completed = await complete_job(session, job["id"], context.worker_id, result)
+                await session.commit()
+            if not completed:
+                logger.warning("회수된 작업이라 완료를 기록하지 않았습니다 - 작업 ID: %s, 작업자: %s", job['id'], context.worker_id)
+                return
+            logger.info("작업 완료 - 작업 ID: %s, 유형: %s", job['id'], job['job_type'])
+            await self._publish("job_completed", job, result=result)
+        except JobOwnershipLost:
+            logger.warning("회수된 작업의 처리를 중단합니다 - 작업 ID: %s, 작업자: %s", job['id'], context.worker_id)
+        except Exception as e:
+            retry = handler is not None and job["attempts"] < job["max_attempts"]
+            # 지수 백오프로 재시도
+            delay = self.retry_base_delay * (2 ** (job["attempts"] - 1)) if retry else None
+            logger.error("작업 실패 - 작업 ID: %s, 시도: %s/%s, 오류: %s", job['id'], job['attempts'], job['max_attempts'], e)
+            async with self.session_factory() as session:
+                recorded = await fail_job(session, job["id"], context.worker_id, str(e), delay)
+                await session.commit()
+            if not recorded:
+                logger.warning("회수된 작업이라 실패를 기록하지 않았습니다 - 작업 ID: %s, 작업자: %s", job['id'], context.worker_id)
+                return
+            await self._publish("job_failed", job, error=str(e), will_retry=retry)
+        finally:
+            heartbeat.cancel()
+
+    async def _heartbeat(self, job: Dict[str, Any]) -> None:
+        """작업을 실행하는 동안 주기적으로 잠금 시각을 늘립니다. 작업이 회수되었으면 멈춥니다."""
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                async with self.session_factory() as session:
+                    owned = await update_job_progress(session, job["id"], job["locked_by"])
+                    await session.commit()
+            except Exception as e:
+                logger.warning("작업 하트비트 실패 - 작업 ID: %s, 오류: %s", job['id'], e)
+                continue
+            if not owned:
+                logger.warning("작업이 회수되었습니다 - 작업 ID: %s, 작업자: %s", job['id'], job['locked_by'])
+                return
+
+    async def _publish(self, event_type: str, job: Dict[str, Any], **data) -> None:
+        if self.event_bus is not None:
+            await self.event_bus.publish(event_type, job_id=job["id"], job_type=job["job_type"], payload=job["payload"], **data)
+
+    async def _reaper(self) -> None:
+        """비정상 종료된 작업자가 잡고 있던 작업을 주기적으로 회수합니다."""
+        while not self._stopping.is_set():
+            try:
+                async with self.session_factory() as session:
+                    count = await requeue_stale_jobs(session, self.stale_timeout)
+                    await session.commit()
+                if count:
+                    logger.warning("응답 없는 작업 %s건을 다시 대기 상태로 돌렸습니다.", count)
+            except Exception as e:
+                logger.error("작업 회수 실패: %s", e)
+            await self._sleep(self.stale_timeout / 3)
@@ -0,0 +1,199 @@
+import json
+from typing import Optional, Dict, Any
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+JOB_COLUMNS = """
+    id, job_type, payload, status, priority, dedup_key, attempts, max_attempts,
+    progress, progress_message, result, error, run_after, locked_by, locked_at,
+    created_at, updated_at, finished_at
+"""
+
+def _row_to_dict(result, row) -> Optional[Dict[str, Any]]:
+    if row is None:
+        return None
+    job = dict(zip(result.keys(), row))
+    # asyncpg는 JSONB를 문자열로 반환
+    for column in ("payload", "result"):
+        if isinstance(job.get(column), str):
+            job[column] = json.loads(job[column])
+    return job
+
+async def insert_job(
+    db_session: AsyncSession,
+    job_type: str,
+    payload: Dict[str, Any],
+    priority: int = 0,
+    dedup_key: Optional[str] = None,
+    max_attempts: int = 3
+) -> Optional[int]:
+    """작업을 큐에 추가합니다. 같은 중복 제거 키의 작업이 대기/실행 중이면 None을 반환합니다."""
+    query = text("""
+        INSERT INTO job_queue (job_type, payload, priority, dedup_key, max_attempts)
+        VALUES (:job_type, CAST(:payload AS JSONB), :priority, :dedup_key, :max_attempts)
+        ON CONFLICT (dedup_key) WHERE status IN ('queued', 'running')
+        DO NOTHING
+        RETURNING id
+    """)
+    result = await db_session.execute(query, {
+        "job_type": job_type,
+        "payload": json.dumps(payload, ensure_ascii=False),
+        "priority": priority,
+        "dedup_key": dedup_key,
+        "max_attempts": max_attempts
+    })
+    row = result.fetchone()
+    return row[0] if row else None
+
+async def get_active_job_by_dedup_key(db_session: AsyncSession, dedup_key: str) -> Optional[Dict[str, Any]]:
+    """중복 제거 키로 대기/실행 중인 작업을 조회합니다."""
+    query = text(f"""
+        SELECT {JOB_COLUMNS} FROM job_queue
+        WHERE dedup_key = :dedup_key
+        AND status IN ('queued', 'running')
+        LIMIT 1
+    """)
+    result = await db_session.execute(query, {"dedup_key": dedup_key})
+    return _row_to_dict(result, result.fetchone())
+
+async def get_job(db_session: AsyncSession, job_id: int) -> Optional[Dict[str, Any]]:
+    """작업 ID로 작업을 조회합니다."""
+    query = text(f"SELECT {JOB_COLUMNS} FROM job_queue WHERE id = :job_id")
+    result = await db_session.execute(query, {"job_id": job_id})
+    return _row_to_dict(result, result.fetchone())
+
+async def claim_next_job(db_session: AsyncSession, worker_id: str) -> Optional[Dict[str, Any]]:
+    """실행 가능한 작업 하나를 우선순위 순으로 가져와 실행 중으로 표시합니다.
+
+    FOR UPDATE SKIP LOCKED로 다른 작업자가 잡은 행은 건너뛰므로
+    여러 프로세스가 동시에 호출해도 같은 작업을 중복 실행하지 않습니다.
+    """
+    query = text(f"""
+        UPDATE job_queue
+        SET status = 'running',
+            attempts = attempts + 1,
+            locked_by = :worker_id,
+            locked_at = CURRENT_TIMESTAMP,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE id = (
+            SELECT id FROM job_queue
+            WHERE status = 'queued'
+            AND run_after <= CURRENT_TIMESTAMP
+            ORDER BY priority DESC, id
+            FOR UPDATE SKIP LOCKED
+            LIMIT 1
+        )
+        RETURNING {JOB_COLUMNS}
+    """)
+    result = await db_session.execute(query, {"worker_id": worker_id})
+    return _row_to_dict(result, result.fetchone())
+
+async def update_job_progress(
+    db_session: AsyncSession,
+    job_id: int,
+    worker_id: str,
+    progress: Optional[float] = None,
+    message: Optional[str] = None
+) -> bool:
+    """작업 진행률을 갱신하고 잠금 시각(locked_at)을 현재 시각으로 늘립니다.
+
+    progress가 None이면 진행률은 그대로 두고 잠금 시각만 갱신합니다(하트비트).
+    작업을 잡은 작업자가 아직 실행 중일 때만 갱신하며, 회수되었으면 False를 반환합니다.
+    """
+    query = text("""
+        UPDATE job_queue
+        SET progress = COALESCE(:progress, progress),
+            progress_message = COALESCE(:message, progress_message),
+            locked_at = CURRENT_TIMESTAMP,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE id = :job_id
+        AND locked_by = :worker_id
+        AND status = 'running'
+    """)
+    result = await db_session.execute(query, {
+        "job_id": job_id,
+        "worker_id": worker_id,
+        "progress": progress,
+        "message": message
+    })
+    return result.rowcount > 0
+
+async def complete_job(db_session: AsyncSession, job_id: int, worker_id: str, result: Optional[Dict[str, Any]] = None) -> bool:
+    """작업을 성공으로 완료 처리합니다. 작업이 회수되어 다른 작업자에게 넘어갔으면 False"""
+    query = text("""
+        UPDATE job_queue
+        SET status = 'succeeded',
+            progress = 1,
+            result = CAST(:result AS JSONB),
+            error = NULL,
+            locked_by = NULL,
+            updated_at = CURRENT_TIMESTAMP,
+            finished_at = CURRENT_TIMESTAMP
+        WHERE id = :job_id
+        AND locked_by = :worker_id
+        AND status = 'running'
+    """)
+    executed = await db_session.execute(query, {
+        "job_id": job_id,
+        "worker_id": worker_id,
+        "result": json.dumps(result or {}, ensure_ascii=False, default=str)
+    })
+    return executed.rowcount > 0
+
+async def fail_job(db_session: AsyncSession, job_id: int, worker_id: str, error: str, retry_delay_seconds: Optional[float]) -> bool:
+    """작업 실패를 기록합니다. 재시도 지연이 주어지면 다시 대기 상태로 되돌립니다.
+
+    작업이 회수되어 다른 작업자에게 넘어갔으면 기록하지 않고 False를 반환합니다.
+    """
+    if retry_delay_seconds is None:
+        query = text("""
+            UPDATE job_queue
+            SET status = 'failed',
+                error = :error,
+                locked_by = NULL,
+                updated_at = CURRENT_TIMESTAMP,
+                finished_at = CURRENT_TIMESTAMP
+            WHERE id = :job_id
+            AND locked_by = :worker_id
+            AND status = 'running'
+        """)
+        result = await db_session.execute(query, {"job_id": job_id, "worker_id": worker_id, "error": error})
+        return result.rowcount > 0
+
+    query = text("""
+        UPDATE job_queue
+        SET status = 'queued',
+            error = :error,
+            locked_by = NULL,
+            run_after = CURRENT_TIMESTAMP + make_interval(secs => :delay),
+            updated_at = CURRENT_TIMESTAMP
+        WHERE id = :job_id
+        AND locked_by = :worker_id
+        AND status = 'running'
+    """)
+    result = await db_session.execute(query, {
+        "job_id": job_id,
+        "worker_id": worker_id,
+        "error": error,
+        "delay": float(retry_delay_seconds)
+    })
+    return result.rowcount > 0
+
+async def requeue_stale_jobs(db_session: AsyncSession, timeout_seconds: float) -> int:
+    """작업자가 비정상 종료되어 오래 실행 중으로 남은 작업을 다시 대기 상태로 돌립니다.
+
+    실행 중인 작업자는 진행률 갱신과 하트비트로 locked_at을 늘리므로
+    timeout_seconds 동안 갱신이 없었던 작업만 회수합니다.
+    """
+    query = text("""
+        UPDATE job_queue
+        SET status = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'queued' END,
+            error = COALESCE(error, '작업자 응답 없음'),
+            locked_by = NULL,
+            updated_at = CURRENT_TIMESTAMP,
+            finished_at = CASE WHEN attempts >= max_attempts THEN CURRENT_TIMESTAMP ELSE NULL END
+        WHERE status = 'running'
+        AND locked_at < CURRENT_TIMESTAMP - make_interval(secs => :timeout)
+    """)
+    result = await db_session.execute(query, {"timeout": float(timeout_seconds)})
+    return result.rowcount
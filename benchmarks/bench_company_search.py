@@ -0,0 +1,102 @@
+"""회사명 검색 색인 벤치마크
+
+합성 CORPCODE.xml로 검색 색인을 만들고 쿼리 종류별(정확한 이름, 2음절 접두어, 한 음절 오타, 초성)
+조회 시간과 오타 쿼리의 상위 10개 재현율, 고유번호 갱신 시 증분 반영 시간을 측정합니다.
+--syllables로 음절 종류를 줄이면 흔한 n-gram이 많은(역색인이 긴) 불리한 분포를 만들 수 있습니다.
+
+사용 예:
+    python -m benchmarks.bench_company_search --companies 100000
+    python -m benchmarks.bench_company_search --syllables 40
+"""
+import os
+import json
+import time
+import random
+import argparse
+import tempfile
+from typing import Callable, List
+
+import benchmarks.bench_corp_code_index as corp_code_bench
+from app.domin.fin.service.corp_code_index import MappedCorpCodeIndex
+from app.domin.fin.service.company_search import CompanySearchIndex
+
+def hangul_syllables(count: int) -> str:
+    """완성형 한글 음절 중 고르게 떨어진 count개"""
+    step = (0xD7A3 - 0xAC00) // count
+    return "".join(chr(0xAC00 + index * step) for index in range(count))
+
+def measure(search: Callable[[str], object], queries: List[str]) -> dict:
+    times = []
+    for query in queries:
+        started = time.perf_counter()
+        search(query)
+        times.append(time.perf_counter() - started)
+    times.sort()
+    return {
+        "queries": len(queries),
+        "mean_us": round(sum(times) / len(times) * 1e6, 1),
+        "p50_us": round(times[len(times) // 2] * 1e6, 1),
+        "p99_us": round(times[int(len(times) * 0.99)] * 1e6, 1)
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--companies", type=int, default=100000, help="합성 고유번호 항목 수")
+    parser.add_argument("--queries", type=int, default=2000, help="종류별 쿼리 수")
+    parser.add_argument("--syllables", type=int, default=300, help="회사명 생성에 쓸 음절 종류 수")
+    args = parser.parse_args()
+
+    corp_code_bench.SYLLABLES = hangul_syllables(args.syllables)
+    rng = random.Random(7)
+    with tempfile.TemporaryDirectory() as directory:
+        xml_path = os.path.join(directory, "CORPCODE.xml")
+        index_path = os.path.join(directory, "CORPCODE.idx")
+        names = [name for name in corp_code_bench.generate_corp_codes(xml_path, args.companies)
+                 if not name.startswith("없는회사")][:args.queries]
+        index = MappedCorpCodeIndex.from_file(xml_path, index_path)
+
+        started = time.perf_counter()
+        search_index = CompanySearchIndex(index.entries())
+        print(json.dumps({"build_seconds": round(time.perf_counter() - started, 3), "companies": len(search_index)}))
+
+        def typo(name: str) -> str:
+            position = rng.randrange(len(name))
+            return name[:position] + rng.choice(corp_code_bench.SYLLABLES) + name[position + 1:]
+
+        typos = [(name, typo(name)) for name in names]
+        cases = {
+            "exact": names,
+            "prefix": [name[:2] for name in names],
+            "typo": [query for _, query in typos],
+            "choseong": ["ㅅㅅ", "ㅎㄷㅈ", "ㄱㄴ"] * (args.queries // 3)
+        }
+        for name, queries in cases.items():
+            print(json.dumps({"case": name, **measure(search_index.search, queries)}))
+        recall = sum(
+            1 for name, query in typos
+            if any(match.corp_name == name for match in search_index.search(query, 10))
+        ) / len(typos)
+        print(json.dumps({"typo_recall_at_10": round(recall, 4)}))
+
+        # 고유번호 갱신: 1% 변경(이름 변경/삭제/추가) 후 증분 반영
+        entries = list(index.entries())
+        updated = [
+            (corp_code, corp_name + "신", stock_code) if position % 200 == 0 else (corp_code, corp_name, stock_code)
+            for position, (corp_code, corp_name, stock_code) in enumerate(entries) if position % 200 != 1
+        ]
+        updated += [(f"9{position:07d}", f"신규회사{position}", "") for position in range(len(entries) // 200)]
+        started = time.perf_counter()
+        removed, changed = search_index.diff(updated)
+        diff_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        search_index.apply(removed, changed)
+        print(json.dumps({
+            "update_removed": len(removed),
+            "update_changed": len(changed),
+            "diff_seconds": round(diff_seconds, 4),
+            "apply_seconds": round(time.perf_counter() - started, 4)
+        }))
+        index.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""고유번호 인덱스 벤치마크 (파이썬 객체 인덱스 vs 메모리 매핑 인덱스)
+
+합성 CORPCODE.xml로 작업자 하나가 인덱스를 들고 있을 때 늘어나는 RSS와 조회 시간을 측정합니다.
+각 방식은 별도 프로세스에서 실행하며, 매핑 방식의 인덱스 파일은 미리 컴파일해 둡니다
+(서버 실행기가 fork 전에 만드는 것과 같음). 두 인덱스의 조회 결과가 모두 같은지도 확인합니다.
+
+사용 예:
+    python -m benchmarks.bench_corp_code_index --companies 100000
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import subprocess
+import tempfile
+from xml.sax.saxutils import escape
+
+SYLLABLES = "가나다라마바사아자차카타파하삼성현대엘지에스케이한국전자화학바이오건설금융"
+SUFFIXES = ["", "전자", "화학", "홀딩스", "바이오", "건설", "(주)", "제약", "에너지"]
+
+def generate_corp_codes(path: str, companies: int) -> list:
+    """DART CORPCODE.xml 형식의 합성 파일을 만들고 조회할 회사명 표본을 반환합니다."""
+    rng = random.Random(42)
+    names = []
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n<result>\n')
+        for index in range(companies):
+            # 일부 회사명은 중복되도록 생성 (실제 파일에도 동명 회사가 있음)
+            if names and rng.random() < 0.02:
+                name = rng.choice(names)
+            else:
+                name = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 6))) + rng.choice(SUFFIXES)
+            names.append(name)
+            stock_code = f"{rng.randint(0, 999999):06d}" if rng.random() < 0.03 else " "
+            f.write(
+                f"<list><corp_code>{index:08d}</corp_code><corp_name>{escape(name)}</corp_name>"
+                f"<stock_code>{stock_code}</stock_code><modify_date>20240101</modify_date></list>\n"
+            )
+        f.write("</result>\n")
+    sample = rng.sample(names, min(len(names), 10000))
+    return sample + [f"없는회사{index}" for index in range(1000)]
+
+def current_rss_kb() -> int:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+def child(args: argparse.Namespace) -> None:
+    from app.domin.fin.service.corp_code_index import CorpCodeIndex, MappedCorpCodeIndex
+
+    with open(args.names, encoding="utf-8") as f:
+        names = json.load(f)
+    start_rss = current_rss_kb()
+    started = time.perf_counter()
+    if args.mode == "memory":
+        index = CorpCodeIndex.from_file(args.xml)
+    else:
+        index = MappedCorpCodeIndex(args.index)
+    load_seconds = time.perf_counter() - started
+    loaded_rss = current_rss_kb()
+
+    started = time.perf_counter()
+    found = sum(1 for name in names if index.get(name) is not None)
+    lookup_seconds = time.perf_counter() - started
+    print(json.dumps({
+        "mode": args.mode,
+        "companies": len(index),
+        "load_seconds": round(load_seconds, 4),
+        "rss_growth_mb": round((loaded_rss - start_rss) / 1024, 1),
+        "lookups": len(names),
+        "found": found,
+        "us_per_lookup": round(lookup_seconds / len(names) * 1e6, 2)
+    }, ensure_ascii=False))
+
+def verify(xml_path: str, index_path: str, names: list) -> None:
+    """두 인덱스의 회사명/회사 코드 조회 결과와 상장 회사 집합이 같은지 확인합니다."""
+    from app.domin.fin.service.corp_code_index import CorpCodeIndex, MappedCorpCodeIndex
+
+    memory = CorpCodeIndex.from_file(xml_path)
+    mapped = MappedCorpCodeIndex(index_path)
+    assert len(memory) == len(mapped)
+    for name in names:
+        assert memory.get(name) == mapped.get(name), name
+    for company in memory.companies[::97]:
+        assert memory.get_by_code(company.corp_code) == mapped.get_by_code(company.corp_code)
+    assert mapped.get_by_code("99999999") is None
+    assert sorted(c.corp_code for c in memory.listed()) == [c.corp_code for c in mapped.listed()]
+    mapped.close()
+    print(json.dumps({"verified_lookups": len(names)}))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--companies", type=int, default=100000, help="합성 고유번호 항목 수")
+    parser.add_argument("--mode", choices=["memory", "mapped"], help=argparse.SUPPRESS)
+    parser.add_argument("--xml", help=argparse.SUPPRESS)
+    parser.add_argument("--index", help=argparse.SUPPRESS)
+    parser.add_argument("--names", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        child(args)
+        return
+
+    from app.domin.fin.service.corp_code_index import MappedCorpCodeIndex
+
+    with tempfile.TemporaryDirectory() as directory:
+        xml_path = os.path.join(directory, "CORPCODE.xml")
+        index_path = os.path.join(directory, "CORPCODE.idx")
+        names_path = os.path.join(directory, "names.json")
+        names = generate_corp_codes(xml_path, args.companies)
+        with open(names_path, "w", encoding="utf-8") as f:
+            json.dump(names, f, ensure_ascii=False)
+        started = time.perf_counter()
+        MappedCorpCodeIndex.from_file(xml_path, index_path).close()
+        print(json.dumps({
+            "compile_seconds": round(time.perf_counter() - started, 4),
+            "index_file_mb": round(os.path.getsize(index_path) / 1024 / 1024, 2)
+        }))
+        verify(xml_path, index_path, names)
+        for mode in ("memory", "mapped"):
+            subprocess.run([
+                sys.executable, "-m", "benchmarks.bench_corp_code_index",
+                "--mode", mode, "--xml", xml_path, "--index", index_path, "--names", names_path
+            ], check=True)
+
+if __name__ == "__main__":
+    main()
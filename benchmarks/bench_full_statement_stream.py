@@ -0,0 +1,135 @@
+"""전체 재무제표 응답 파싱 벤치마크 (기존 방식 vs 스트리밍 + 배치 검증)
+
+기존 방식은 응답 본문을 한 번에 읽어 json.loads 후 항목마다 Pydantic 모델을 만들고,
+스트리밍 방식은 64KB 조각을 증분 파싱하여 500개씩 TypeAdapter로 검증한 뒤 버립니다.
+각 방식을 별도 프로세스에서 실행하여 최대 RSS를 분리 측정합니다.
+
+사용 예:
+    python -m benchmarks.bench_full_statement_stream --items 200000
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import resource
+import subprocess
+import tempfile
+
+ACCOUNTS = ["매출액", "매출원가", "매출총이익", "판매비와관리비", "영업이익", "이자비용", "금융수익",
+            "법인세비용차감전순이익", "당기순이익", "자산총계", "부채총계", "자본총계", "유동자산", "유동부채"]
+DIVISIONS = [("BS", "재무상태표"), ("IS", "손익계산서"), ("CIS", "포괄손익계산서"), ("CF", "현금흐름표")]
+
+def generate_payload(path: str, items: int) -> None:
+    """DART fnlttSinglAcntAll.json 형식의 합성 응답을 파일로 생성합니다."""
+    rng = random.Random(42)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"status":"000","message":"정상","list":[')
+        for index in range(items):
+            sj_div, sj_nm = DIVISIONS[index % len(DIVISIONS)]
+            item = {
+                "rcept_no": "20240312000736", "reprt_code": "11011", "bsns_year": "2023",
+                "corp_code": "00126380", "sj_div": sj_div, "sj_nm": sj_nm,
+                "account_id": f"ifrs-full_Account{index}",
+                "account_nm": f"{ACCOUNTS[index % len(ACCOUNTS)]}{index}",
+                "account_detail": "-", "thstrm_nm": "제 55 기",
+                "thstrm_amount": f"{rng.randint(-10**12, 10**13):,}",
+                "frmtrm_nm": "제 54 기", "frmtrm_amount": f"{rng.randint(-10**12, 10**13):,}",
+                "bfefrmtrm_nm": "제 53 기", "bfefrmtrm_amount": f"{rng.randint(-10**12, 10**13):,}",
+                "ord": str(index), "currency": "KRW"
+            }
+            if index:
+                f.write(",")
+            f.write(json.dumps(item, ensure_ascii=False))
+        f.write("]}")
+
+def current_rss_kb() -> int:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+def run_baseline(path: str) -> int:
+    from app.domin.fin.models.schemas import RawFinancialStatement
+    from app.domin.fin.service.dart_api_service import FULL_STATEMENT_DIVISIONS
+
+    with open(path, "rb") as f:
+        data = json.loads(f.read())
+    statements = []
+    for item in data["list"]:
+        if item.get("sj_div") in FULL_STATEMENT_DIVISIONS:
+            statements.append(RawFinancialStatement(**item))
+    return len(statements)
+
+def run_stream(path: str, batch_size: int, chunk_size: int) -> int:
+    from app.domin.fin.service.dart_api_service import RAW_STATEMENT_LIST, FULL_STATEMENT_DIVISIONS
+    from app.foundation.utils.json_stream import JsonArrayStreamParser
+
+    parser = JsonArrayStreamParser("list")
+    total = 0
+    batch = []
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            for item in parser.feed(chunk):
+                if item.get("sj_div") not in FULL_STATEMENT_DIVISIONS:
+                    continue
+                batch.append(item)
+                if len(batch) >= batch_size:
+                    total += len(RAW_STATEMENT_LIST.validate_python(batch))
+                    batch = []
+    parser.close()
+    if batch:
+        total += len(RAW_STATEMENT_LIST.validate_python(batch))
+    return total
+
+def child(args: argparse.Namespace) -> None:
+    # 비교 대상 모듈을 먼저 불러와 import 비용을 기준 RSS에 포함
+    import app.domin.fin.service.dart_api_service  # noqa: F401
+    start_rss = current_rss_kb()
+    started = time.perf_counter()
+    if args.mode == "baseline":
+        count = run_baseline(args.payload)
+    else:
+        count = run_stream(args.payload, args.batch_size, args.chunk_size)
+    elapsed = time.perf_counter() - started
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({
+        "mode": args.mode,
+        "items": count,
+        "seconds": round(elapsed, 4),
+        "items_per_second": round(count / elapsed, 1),
+        "peak_rss_mb": round(peak_rss / 1024, 1),
+        "peak_rss_growth_mb": round((peak_rss - start_rss) / 1024, 1)
+    }, ensure_ascii=False))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=100000, help="합성 응답 항목 수")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--chunk-size", type=int, default=64 * 1024)
+    parser.add_argument("--mode", choices=["baseline", "stream"], help=argparse.SUPPRESS)
+    parser.add_argument("--payload", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        child(args)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        payload = os.path.join(directory, "fnlttSinglAcntAll.json")
+        generate_payload(payload, args.items)
+        print(f"payload: {os.path.getsize(payload) / 1024 / 1024:.1f} MB, items: {args.items}")
+        for mode in ("baseline", "stream"):
+            subprocess.run([
+                sys.executable, "-m", "benchmarks.bench_full_statement_stream",
+                "--mode", mode, "--payload", payload,
+                "--batch-size", str(args.batch_size), "--chunk-size", str(args.chunk_size)
+            ], check=True)
+
+if __name__ == "__main__":
+    main()
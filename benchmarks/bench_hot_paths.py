@@ -0,0 +1,325 @@
+"""DB/네트워크 없이 실행할 수 있는 CPU 위주 경로의 마이크로벤치마크와 회귀 비교
+
+실제 크기의 합성 데이터(주요계정 응답 80행, 전체 재무제표 응답 2만 행, 고유번호 10만 개 회사)로
+경우별 호출 시간을 측정합니다.
+
+측정 방법:
+    반복 한 번이 --min-time 이상 걸리도록 경우별 호출 횟수를 늘려 정하고(timeit.autorange와 같음),
+    예열 라운드 후 모든 경우를 돌아가며 한 번씩 측정하는 라운드를 --repeats번 반복하여
+    항목당 최소/중앙값/표준편차를 구합니다. 반복마다 gc.collect() 후 GC를 끄고 측정합니다.
+    회귀 비교는 잡음이 가장 적은 최소값으로 합니다. 공유 CPU 가상 머신처럼 잡음이 큰 환경에서는
+    --repeats를 늘리고 --tolerance를 넓혀 사용합니다.
+
+경우:
+    processor.convert_amount          금액 문자열 하나 변환 (항목당)
+    processor.deduplicate_statements  주요계정 응답 80행 중복 제거
+    processor.prepare_statement_data  행 하나씩 DB 저장 형식 변환 (항목당)
+    processor.prepare_statement_batch 주요계정 응답 80행 일괄 변환
+    ratio.extract_financial_data      당기/전년도 fin_data 행으로 재무제표 구분별 계정 추출
+    ratio.calculate_ratios            재무비율 레지스트리 전체 지표 계산
+    ratio.evaluate_many               1000개 회사 열 단위 일괄 계산 (회사당)
+    metrics.build_financial_metrics   재무제표 조회(/financial) 응답의 지표 조립
+    serialize.financial_metrics       재무지표 응답 직렬화 (10개 연도)
+    serialize.ratios                  재무비율 조회 응답 직렬화 (10개 연도)
+    corp_code.iter_corp_codes         CORPCODE.xml 파싱 (회사당)
+    corp_code.mapped_get              메모리 매핑 인덱스 회사명 조회 (조회당)
+    json_stream.feed                  전체 재무제표 응답 64KB 조각 증분 파싱 (항목당)
+    company_search.search             한 음절 오타 쿼리 검색 (조회당)
+
+사용 예:
+    python -m benchmarks.bench_hot_paths
+    python -m benchmarks.bench_hot_paths --cases 'ratio.*' 'processor.*'
+    python -m benchmarks.bench_hot_paths --compare                  # 기준값보다 느려진 경우가 있으면 종료 코드 1
+    python -m benchmarks.bench_hot_paths --update-baseline          # 의도한 변경 후 기준값 갱신
+"""
+import gc
+import io
+import os
+import sys
+import json
+import time
+import random
+import fnmatch
+import argparse
+import platform
+import statistics
+import tempfile
+from typing import Any, Callable, Dict, List, NamedTuple
+
+from benchmarks.bench_corp_code_index import generate_corp_codes
+from benchmarks.bench_full_statement_stream import generate_payload
+from benchmarks.bench_ingestion_memory import single_account_responses
+from benchmarks.bench_response_serialization import generate_ratio_rows, generate_series
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baselines", "hot_paths.json")
+
+class Case(NamedTuple):
+    name: str
+    function: Callable[[], Any]
+    # 호출 한 번에 처리하는 항목 수 (항목당 시간으로 나눌 때 사용)
+    operations: int = 1
+
+def calibrate(function: Callable[[], Any], min_time: float) -> int:
+    """반복 한 번이 min_time 이상 걸리는 호출 횟수 (2의 거듭제곱)"""
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            function()
+        if time.perf_counter() - started >= min_time:
+            return loops
+        loops *= 2
+
+def run_rounds(cases: List[Case], loops: List[int], repeats: int, warmup: int) -> List[List[float]]:
+    """모든 경우를 한 번씩 측정하는 라운드를 반복하여 경우별 항목당 시간(μs) 표본을 모읍니다.
+
+    경우마다 몰아서 측정하면 그동안의 기계 상태(다른 프로세스, CPU 클럭)가 한 경우에만 반영되므로
+    라운드마다 돌아가며 측정하여 느린 구간이 모든 경우에 고르게 섞이도록 합니다.
+    """
+    samples: List[List[float]] = [[] for _ in cases]
+    gc_enabled = gc.isenabled()
+    try:
+        for round_ in range(warmup + repeats):
+            for position, case in enumerate(cases):
+                gc.collect()
+                gc.disable()
+                started = time.perf_counter()
+                for _ in range(loops[position]):
+                    case.function()
+                elapsed = time.perf_counter() - started
+                gc.enable()
+                if round_ >= warmup:
+                    samples[position].append(elapsed / loops[position] / case.operations * 1e6)
+    finally:
+        if gc_enabled:
+            gc.enable()
+        else:
+            gc.disable()
+    return samples
+
+def summarize(case: Case, loops: int, samples: List[float]) -> Dict[str, Any]:
+    return {
+        "case": case.name,
+        "operations": case.operations,
+        "loops": loops,
+        "repeats": len(samples),
+        "min_us": round(min(samples), 4),
+        "median_us": round(statistics.median(samples), 4),
+        "stdev_us": round(statistics.stdev(samples), 4) if len(samples) > 1 else 0.0
+    }
+
+def fin_data_rows(responses: List[bytes], year: str) -> List[Dict[str, Any]]:
+    """응답을 수집 경로대로 변환한 뒤 fin_data 조회 결과(사업연도, 구분, 정렬순서 순) 형태로 만듭니다."""
+    from app.domin.fin.models.schemas import CompanyInfo, DartApiResponse
+    from app.domin.fin.service.dart_api_service import annotate_statement_items
+    from app.domin.fin.service.financial_data_processor import FinancialDataProcessor, validate_statement_items
+
+    statements = []
+    for body, is_cash_flow in zip(responses, (False, True)):
+        api_response = DartApiResponse(**json.loads(body))
+        statements.extend(validate_statement_items(annotate_statement_items(api_response.list, cash_flow=is_cash_flow)))
+    company_info = CompanyInfo(corp_code="00126380", corp_name="삼성전자", stock_code="005930", modify_date="")
+    rows = FinancialDataProcessor().prepare_statement_batch(statements, company_info)
+    for row in rows:
+        row["bsns_year"] = year
+    return sorted(rows, key=lambda row: (row["sj_div"], row["ord"]))
+
+def build_cases(args: argparse.Namespace, directory: str) -> List[Case]:
+    """경우별 합성 데이터를 준비하고 측정할 함수 목록을 만듭니다."""
+    from app.domin.fin.models.schemas import CompanyInfo, DartApiResponse
+    from app.domin.fin.service.company_search import CompanySearchIndex
+    from app.domin.fin.service.corp_code_index import MappedCorpCodeIndex, iter_corp_codes
+    from app.domin.fin.service.dart_api_service import annotate_statement_items
+    from app.domin.fin.service.financial_data_processor import FinancialDataProcessor, validate_statement_items
+    from app.domin.fin.service.ratio_registry import RATIO_EVALUATOR
+    from app.domin.fin.service.ratio_service import RatioService
+    from app.domin.fin.service.response_snapshot_service import (
+        build_financial_metrics,
+        build_ratios,
+        encode_response,
+        financial_metrics_response
+    )
+    from app.foundation.utils.json_stream import JsonArrayStreamParser
+
+    rng = random.Random(42)
+    processor = FinancialDataProcessor()
+    ratio_service = RatioService(db_session=None)
+    company_info = CompanyInfo(corp_code="00126380", corp_name="삼성전자", stock_code="005930", modify_date="")
+
+    # 주요계정(연결+개별 재무상태표/손익계산서) + 현금흐름표 응답 한 회사분
+    responses = single_account_responses("00126380", rng)
+    statements = []
+    for body, is_cash_flow in zip(responses, (False, True)):
+        api_response = DartApiResponse(**json.loads(body))
+        statements.extend(validate_statement_items(annotate_statement_items(api_response.list, cash_flow=is_cash_flow)))
+    # 빈 금액(미기재 계정)도 섞음. 변환 실패 값은 경고 로그가 시간을 좌우하므로 넣지 않음
+    amounts = [statement.thstrm_amount for statement in statements] + ["", ""]
+
+    current_rows = fin_data_rows(responses, "2023")
+    previous_rows = fin_data_rows(single_account_responses("00126380", rng), "2022")
+    financial_data = ratio_service._extract_financial_data(current_rows, previous_rows)
+    many = [
+        ratio_service._extract_financial_data(fin_data_rows(single_account_responses(f"{index:08d}", rng), "2023"))
+        for index in range(args.ratio_companies)
+    ]
+
+    series = generate_series(10)
+    ratio_rows = generate_ratio_rows(10, float)
+
+    xml_path = os.path.join(directory, "CORPCODE.xml")
+    names = generate_corp_codes(xml_path, args.companies)
+    with open(xml_path, "rb") as f:
+        xml_bytes = f.read()
+    index = MappedCorpCodeIndex.from_file(xml_path, os.path.join(directory, "CORPCODE.idx"))
+    lookups = names[:args.lookups]
+    search_index = CompanySearchIndex(index.entries())
+    # 회사명의 음절 하나를 다른 음절로 바꾼 오타 쿼리
+    typo_queries = []
+    for name in names[:args.lookups // 10]:
+        position = rng.randrange(len(name))
+        typo_queries.append(name[:position] + chr(0xAC00 + rng.randrange(11172)) + name[position + 1:])
+
+    payload_path = os.path.join(directory, "full.json")
+    generate_payload(payload_path, args.full_items)
+    with open(payload_path, "rb") as f:
+        payload = f.read()
+    chunks = [payload[start:start + 64 * 1024] for start in range(0, len(payload), 64 * 1024)]
+
+    def convert_amounts() -> None:
+        for amount in amounts:
+            processor.convert_amount(amount)
+
+    def prepare_each() -> None:
+        for statement in statements:
+            processor.prepare_statement_data(statement, company_info)
+
+    def parse_corp_codes() -> None:
+        for _ in iter_corp_codes(io.BytesIO(xml_bytes)):
+            pass
+
+    def mapped_get() -> None:
+        for name in lookups:
+            index.get(name)
+
+    def search() -> None:
+        for query in typo_queries:
+            search_index.search(query)
+
+    def stream_payload() -> None:
+        parser = JsonArrayStreamParser("list")
+        for chunk in chunks:
+            parser.feed(chunk)
+        parser.close()
+
+    return [
+        Case("processor.convert_amount", convert_amounts, len(amounts)),
+        Case("processor.deduplicate_statements", lambda: processor.deduplicate_statements(statements)),
+        Case("processor.prepare_statement_data", prepare_each, len(statements)),
+        Case("processor.prepare_statement_batch", lambda: processor.prepare_statement_batch(statements, company_info)),
+        Case("ratio.extract_financial_data", lambda: ratio_service._extract_financial_data(current_rows, previous_rows)),
+        Case("ratio.calculate_ratios", lambda: ratio_service._calculate_ratios(financial_data)),
+        Case("ratio.evaluate_many", lambda: RATIO_EVALUATOR.evaluate_many(many), len(many)),
+        Case("metrics.build_financial_metrics", lambda: build_financial_metrics("삼성전자", current_rows)),
+        Case("serialize.financial_metrics", lambda: encode_response(financial_metrics_response(
+            "삼성전자", series["years"], series["operating_margins"], series["net_margins"],
+            series["roe_values"], series["roa_values"], series["revenue_growths"],
+            series["net_income_growths"], series["debt_ratios"], series["current_ratios"]
+        ))),
+        Case("serialize.ratios", lambda: encode_response(build_ratios(ratio_rows))),
+        Case("corp_code.iter_corp_codes", parse_corp_codes, args.companies),
+        Case("corp_code.mapped_get", mapped_get, len(lookups)),
+        Case("json_stream.feed", stream_payload, args.full_items),
+        Case("company_search.search", search, len(typo_queries))
+    ]
+
+def compare(results: List[Dict[str, Any]], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """기준값보다 최소 시간이 허용 비율을 넘게 늘어난 경우를 반환합니다."""
+    failures = []
+    for result in results:
+        expected = baseline["cases"].get(result["case"])
+        if expected is None:
+            continue
+        result["baseline_min_us"] = expected["min_us"]
+        result["change"] = round(result["min_us"] / expected["min_us"] - 1, 4)
+        if result["min_us"] > expected["min_us"] * (1 + tolerance):
+            failures.append(result["case"])
+    return failures
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cases", nargs="*", default=["*"], help="측정할 경우 이름 패턴 (fnmatch)")
+    parser.add_argument("--companies", type=int, default=100000, help="합성 고유번호 항목 수")
+    parser.add_argument("--lookups", type=int, default=10000, help="회사명 조회 수 (오타 검색은 1/10)")
+    parser.add_argument("--full-items", type=int, default=20000, help="전체 재무제표 응답 항목 수")
+    parser.add_argument("--ratio-companies", type=int, default=1000, help="일괄 재무비율 계산 회사 수")
+    parser.add_argument("--min-time", type=float, default=0.1, help="반복 한 번의 최소 시간(초)")
+    parser.add_argument("--repeats", type=int, default=9, help="측정 라운드 수")
+    parser.add_argument("--warmup", type=int, default=1, help="측정 전 예열 라운드 수")
+    parser.add_argument("--tolerance", type=float, default=0.20, help="기준값 대비 허용 시간 증가 비율")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="기준값 파일")
+    parser.add_argument("--compare", action="store_true", help="기준값과 비교하여 느려진 경우가 있으면 실패")
+    parser.add_argument("--update-baseline", action="store_true", help="측정 결과로 기준값 파일 갱신")
+    parser.add_argument("--output", help="결과 JSON 파일")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        cases = [
+            case for case in build_cases(args, directory)
+            if any(fnmatch.fnmatch(case.name, pattern) for pattern in args.cases)
+        ]
+        loops = [calibrate(case.function, args.min_time) for case in cases]
+        samples = run_rounds(cases, loops, args.repeats, args.warmup)
+        results = [summarize(case, count, case_samples) for case, count, case_samples in zip(cases, loops, samples)]
+    if not args.compare:
+        for result in results:
+            print(json.dumps(result, ensure_ascii=False))
+    parameters = {
+        "companies": args.companies, "lookups": args.lookups,
+        "full_items": args.full_items, "ratio_companies": args.ratio_companies
+    }
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "parameters": parameters,
+        "results": results
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+
+    if args.update_baseline:
+        baseline = {"python": report["python"], "machine": report["machine"], "parameters": parameters, "cases": {}}
+        if os.path.exists(args.baseline):
+            # 일부 경우만 측정했으면 나머지 기준값은 유지
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline["cases"] = json.load(f)["cases"]
+        baseline["cases"].update({
+            result["case"]: {"min_us": result["min_us"], "median_us": result["median_us"]} for result in results
+        })
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        print(json.dumps({"baseline_updated": args.baseline}))
+        return
+
+    if not args.compare:
+        return
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline["parameters"] != parameters:
+        sys.exit(f"기준값과 측정 조건이 다릅니다: {baseline['parameters']} != {parameters}")
+    if (baseline["python"], baseline["machine"]) != (report["python"], report["machine"]):
+        # 다른 인터프리터/기계의 시간은 비교 의미가 적음
+        print(json.dumps({"warning": f"기준값 {baseline['python']}/{baseline['machine']}, 현재 {report['python']}/{report['machine']}"}))
+    failures = compare(results, baseline, args.tolerance)
+    for result in results:
+        print(json.dumps(result, ensure_ascii=False))
+    print(json.dumps({"tolerance": args.tolerance, "failed": failures}, ensure_ascii=False))
+    if failures:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""수집/고유번호 인덱스 단계별 최대 메모리 회귀 벤치마크
+
+서버와 같은 할당 추적기(tracemalloc, track_allocations)로 표준 수집 작업의 단계별 최대/잔존 메모리를 측정하고
+저장된 기준값보다 최대 메모리가 허용 비율 이상 늘어난 단계가 있으면 종료 코드 1로 실패합니다.
+DB와 네트워크 없이 DART 응답 처리와 DB 저장 형식 변환까지만 실행합니다.
+
+표준 수집 작업:
+    corp_code.compile     합성 고유번호 zip(10만 개 회사)으로 인덱스 파일 생성
+    company_search.build  회사명 검색 색인 생성
+    ingest.fetch          주요계정/현금흐름표 응답 JSON 파싱, 기간명 채우기, 검증 (회사별)
+    ingest.prepare        중복 제거와 DB 저장 형식 변환 (회사별)
+    ingest_full.stream    전체 재무제표 응답을 64KB 조각으로 스트리밍 파싱하여 배치 검증/변환
+
+사용 예:
+    python -m benchmarks.bench_ingestion_memory
+    python -m benchmarks.bench_ingestion_memory --sites            # 단계별 잔존 할당 위치도 출력
+    python -m benchmarks.bench_ingestion_memory --update-baseline  # 의도한 변경 후 기준값 갱신
+"""
+import io
+import os
+import sys
+import json
+import random
+import zipfile
+import argparse
+import platform
+import tempfile
+from typing import Any, Dict, List
+
+from benchmarks.bench_corp_code_index import generate_corp_codes
+from benchmarks.bench_full_statement_stream import ACCOUNTS, generate_payload
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baselines", "ingestion_memory.json")
+
+# 아주 작은 단계가 할당기 상태에 따라 흔들려도 실패하지 않도록 두는 절대 여유(KB)
+ABSOLUTE_SLACK_KB = 64
+
+def corp_code_zip(companies: int) -> bytes:
+    """DART corpCode.xml API 응답과 같은 zip(CORPCODE.xml 하나)을 만듭니다."""
+    with tempfile.TemporaryDirectory() as directory:
+        xml_path = os.path.join(directory, "CORPCODE.xml")
+        generate_corp_codes(xml_path, companies)
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
+            zip_file.write(xml_path, "CORPCODE.xml")
+        return buffer.getvalue()
+
+def single_account_responses(corp_code: str, rng: random.Random) -> List[bytes]:
+    """fnlttSinglAcnt.json(재무상태표/손익계산서, 연결+개별)과 fnlttCashFlow.json 응답 본문을 만듭니다."""
+    def item(sj_div: str, sj_nm: str, account_nm: str, ord_: int, fs_div: str) -> Dict[str, Any]:
+        return {
+            "rcept_no": "20240312000736", "reprt_code": "11011", "bsns_year": "2023", "corp_code": corp_code,
+            "stock_code": "005930", "fs_div": fs_div, "fs_nm": "연결재무제표" if fs_div == "CFS" else "재무제표",
+            "sj_div": sj_div, "sj_nm": sj_nm, "account_nm": account_nm,
+            "thstrm_nm": "제 55 기", "thstrm_dt": "2023.12.31", "thstrm_amount": f"{rng.randint(-10**12, 10**13):,}",
+            "frmtrm_nm": "제 54 기", "frmtrm_dt": "2022.12.31", "frmtrm_amount": f"{rng.randint(-10**12, 10**13):,}",
+            "bfefrmtrm_nm": "제 53 기", "bfefrmtrm_dt": "2021.12.31", "bfefrmtrm_amount": f"{rng.randint(-10**12, 10**13):,}",
+            "ord": str(ord_), "currency": "KRW"
+        }
+
+    accounts = [
+        item(sj_div, sj_nm, account_nm, index, fs_div)
+        for fs_div in ("CFS", "OFS")
+        for sj_div, sj_nm in (("BS", "재무상태표"), ("IS", "손익계산서"))
+        for index, account_nm in enumerate(ACCOUNTS)
+    ]
+    cash_flow = [
+        item("CF", "현금흐름표", f"{name}활동현금흐름{index}", index, "CFS")
+        for index, name in enumerate(["영업", "투자", "재무"] * 8)
+    ]
+    return [
+        json.dumps({"status": "000", "message": "정상", "list": body}, ensure_ascii=False).encode("utf-8")
+        for body in (accounts, cash_flow)
+    ]
+
+def run_standard_ingestion(args: argparse.Namespace, directory: str) -> None:
+    """표준 수집 작업을 단계별로 실행합니다 (결과는 할당 추적기에 기록됨)."""
+    from app.domin.fin.models.schemas import CompanyInfo, DartApiResponse
+    from app.domin.fin.service.company_search import CompanySearchIndex
+    from app.domin.fin.service.corp_code_index import MappedCorpCodeIndex
+    from app.domin.fin.service.dart_api_service import FULL_STATEMENT_DIVISIONS, annotate_statement_items
+    from app.domin.fin.service.financial_data_processor import FinancialDataProcessor, validate_statement_items
+    from app.foundation.infra.profiling.memory import track_allocations
+    from app.foundation.utils.json_stream import JsonArrayStreamParser
+
+    rng = random.Random(42)
+    content = corp_code_zip(args.companies)
+    responses = [single_account_responses(f"{index:08d}", rng) for index in range(args.ingest_companies)]
+    full_path = os.path.join(directory, "full.json")
+    generate_payload(full_path, args.full_items)
+    processor = FinancialDataProcessor()
+
+    with track_allocations("corp_code.compile"):
+        index = MappedCorpCodeIndex.from_zip_bytes(content, os.path.join(directory, "CORPCODE.idx"))
+    del content
+    with track_allocations("company_search.build"):
+        search_index = CompanySearchIndex(index.entries())
+
+    for position, (accounts, cash_flow) in enumerate(responses):
+        company_info = CompanyInfo(corp_code=f"{position:08d}", corp_name=f"회사{position}", stock_code="", modify_date="")
+        with track_allocations("ingest.fetch"):
+            statements = []
+            for body, is_cash_flow in ((accounts, False), (cash_flow, True)):
+                api_response = DartApiResponse(**json.loads(body))
+                statements.extend(validate_statement_items(annotate_statement_items(api_response.list, cash_flow=is_cash_flow)))
+        with track_allocations("ingest.prepare"):
+            rows = processor.prepare_statement_batch(processor.deduplicate_statements(statements), company_info)
+        del statements, rows
+
+    company_info = CompanyInfo(corp_code="00126380", corp_name="삼성전자", stock_code="005930", modify_date="")
+    with track_allocations("ingest_full.stream"):
+        parser = JsonArrayStreamParser("list")
+        batch, saved = [], 0
+        with open(full_path, "rb") as f:
+            for chunk in iter(lambda: f.read(64 * 1024), b""):
+                for item in parser.feed(chunk):
+                    if item.get("sj_div") not in FULL_STATEMENT_DIVISIONS:
+                        continue
+                    batch.append(item)
+                    if len(batch) >= 500:
+                        saved += len(processor.prepare_statement_batch(validate_statement_items(batch), company_info))
+                        batch = []
+        parser.close()
+        if batch:
+            saved += len(processor.prepare_statement_batch(validate_statement_items(batch), company_info))
+        del batch
+    index.close()
+    del search_index
+
+def compare(stages: List[Dict[str, Any]], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """기준값보다 최대 메모리가 허용 비율과 절대 여유를 넘게 늘어난 단계를 반환합니다."""
+    failures = []
+    for stage in stages:
+        expected = baseline["stages"].get(stage["stage"])
+        if expected is None:
+            continue
+        limit = expected["max_peak_kb"] * (1 + tolerance) + ABSOLUTE_SLACK_KB
+        stage["baseline_peak_kb"] = expected["max_peak_kb"]
+        stage["change"] = round(stage["max_peak_kb"] / expected["max_peak_kb"] - 1, 4) if expected["max_peak_kb"] else None
+        if stage["max_peak_kb"] > limit:
+            failures.append(stage["stage"])
+    return failures
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--companies", type=int, default=100000, help="합성 고유번호 항목 수")
+    parser.add_argument("--ingest-companies", type=int, default=50, help="주요계정 수집 회사 수")
+    parser.add_argument("--full-items", type=int, default=20000, help="전체 재무제표 응답 항목 수")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="기준값 대비 허용 최대 메모리 증가 비율")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="기준값 파일")
+    parser.add_argument("--update-baseline", action="store_true", help="측정 결과로 기준값 파일 갱신")
+    parser.add_argument("--sites", action="store_true", help="단계별 잔존 할당 위치 출력 (느림)")
+    args = parser.parse_args()
+
+    from app.foundation.infra.profiling.memory import ALLOCATION_TRACKER
+
+    ALLOCATION_TRACKER.start(frames=1, snapshots=args.sites)
+    with tempfile.TemporaryDirectory() as directory:
+        run_standard_ingestion(args, directory)
+    report = ALLOCATION_TRACKER.report()
+    ALLOCATION_TRACKER.stop()
+
+    stages = [
+        {
+            "stage": stage["stage"],
+            "calls": stage["calls"],
+            "max_peak_kb": stage["max_peak_kb"],
+            "mean_retained_kb": stage["mean_retained_kb"],
+            **({"top_sites": stage["last"]["top_sites"]} if args.sites else {})
+        }
+        for stage in report["stages"]
+    ]
+    parameters = {"companies": args.companies, "ingest_companies": args.ingest_companies, "full_items": args.full_items}
+
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "parameters": parameters,
+                "stages": {stage["stage"]: {"max_peak_kb": stage["max_peak_kb"]} for stage in stages}
+            }, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        for stage in stages:
+            print(json.dumps(stage, ensure_ascii=False))
+        print(json.dumps({"baseline_updated": args.baseline}))
+        return
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline["parameters"] != parameters:
+        sys.exit(f"기준값과 측정 조건이 다릅니다: {baseline['parameters']} != {parameters}")
+    if baseline["python"].rsplit(".", 1)[0] != platform.python_version().rsplit(".", 1)[0]:
+        # 파이썬 버전마다 객체 크기가 달라 비교가 의미 없을 수 있음
+        print(json.dumps({"warning": f"기준값 파이썬 버전 {baseline['python']}, 현재 {platform.python_version()}"}))
+    failures = compare(stages, baseline, args.tolerance)
+    for stage in stages:
+        print(json.dumps(stage, ensure_ascii=False))
+    print(json.dumps({"tolerance": args.tolerance, "failed": failures}, ensure_ascii=False))
+    if failures:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""지표 수집 오버헤드 벤치마크
+
+히스토그램 기록 한 번의 비용과, 지표 미들웨어가 있을 때와 없을 때
+최소 라우트(ASGI 직접 호출) 요청 처리 시간 차이를 측정합니다.
+
+사용 예:
+    python -m benchmarks.bench_metrics --requests 20000
+"""
+import json
+import time
+import asyncio
+import argparse
+
+from fastapi import FastAPI
+
+from app.foundation.infra.metrics.http import MetricsMiddleware
+from app.foundation.infra.metrics.registry import Histogram, Registry
+
+def build_app(with_metrics: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ratios/{company_name}")
+    async def ratios(company_name: str):
+        return {"company_name": company_name}
+
+    if with_metrics:
+        app.add_middleware(MetricsMiddleware)
+    return app
+
+async def run_requests(app: FastAPI, requests: int) -> float:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    started = time.perf_counter()
+    for index in range(requests):
+        path = f"/ratios/company{index % 100}"
+        scope = {
+            "type": "http", "http_version": "1.1", "method": "GET", "scheme": "http",
+            "path": path, "raw_path": path.encode(), "query_string": b"", "headers": [],
+            "client": ("127.0.0.1", 50000), "server": ("127.0.0.1", 9000), "root_path": ""
+        }
+        await app(scope, receive, send)
+    return time.perf_counter() - started
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000, help="측정할 요청 수")
+    parser.add_argument("--observations", type=int, default=1000000, help="히스토그램 기록 횟수")
+    args = parser.parse_args()
+
+    histogram = Histogram("bench_seconds", "벤치마크용", ["method", "route", "status"], registry=Registry())
+    started = time.perf_counter()
+    for index in range(args.observations):
+        histogram.labels("GET", "/ratios/{company_name}", "200").observe(index % 1000 / 10000)
+    print(json.dumps({"case": "histogram_observe", "ns_per_call": round((time.perf_counter() - started) / args.observations * 1e9, 1)}))
+
+    results = {}
+    for with_metrics in (False, True):
+        app = build_app(with_metrics)
+        asyncio.run(run_requests(app, 1000))  # 예열
+        elapsed = asyncio.run(run_requests(app, args.requests))
+        results[with_metrics] = elapsed / args.requests * 1e6
+        print(json.dumps({"case": "with_metrics" if with_metrics else "without_metrics", "us_per_request": round(results[with_metrics], 2)}))
+    print(json.dumps({"middleware_overhead_us": round(results[True] - results[False], 2)}))
+
+if __name__ == "__main__":
+    main()
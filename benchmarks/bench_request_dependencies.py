@@ -0,0 +1,90 @@
+"""요청당 의존성 생성 비용 벤치마크
+
+요청마다 FinController → FinService → 하위 서비스 그래프를 만드는 비용을 비교합니다.
+
+- legacy: 변경 전 동작 재현. 그래프 안의 DartApiService 수(6)와 FinService(1)만큼 load_dotenv()로
+  .env를 다시 읽고, 생성 시 INFO 로그를 남김
+- per_request: 컨테이너 없이 생성 (DartApiService를 요청마다 하나 만들어 하위 서비스가 공유)
+- container: 애플리케이션 범위 DartApiService를 주입하고 DB 세션만 요청마다 묶음
+
+sys.addaudithook으로 생성 중 열린 파일 수를 세어 디스크 읽기가 없는지 확인합니다.
+
+사용 예:
+    python -m benchmarks.bench_request_dependencies --requests 20000
+"""
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import tempfile
+from typing import Callable
+
+# 벤치마크용 설정 (실제 .env와 DB 없이 실행)
+os.environ.setdefault("DART_API_KEY", "benchmark")
+
+from dotenv import load_dotenv
+
+from app.domin.fin.controller.fin_controller import FinController
+from app.domin.fin.service.dart_api_service import DartApiService
+
+# 변경 전 그래프에서 load_dotenv()를 호출하던 횟수 (FinService 1 + DartApiService 6)
+LEGACY_DOTENV_READS = 7
+
+file_opens = 0
+
+def audit(event: str, args) -> None:
+    global file_opens
+    if event == "open":
+        file_opens += 1
+
+def measure(build: Callable[[], object], requests: int) -> dict:
+    global file_opens
+    build()
+    file_opens = 0
+    started = time.perf_counter()
+    for _ in range(requests):
+        build()
+    elapsed = time.perf_counter() - started
+    return {
+        "us_per_request": round(elapsed / requests * 1e6, 2),
+        "file_opens_per_request": round(file_opens / requests, 2)
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000, help="측정할 요청 수")
+    args = parser.parse_args()
+
+    # 로그 출력 비용은 레코드 생성까지만 포함 (출력 핸들러 없음)
+    legacy_logger = logging.getLogger("benchmarks.legacy")
+    legacy_logger.setLevel(logging.INFO)
+    legacy_logger.addHandler(logging.NullHandler())
+    legacy_logger.propagate = False
+    session = object()
+    shared_api = DartApiService()
+
+    with tempfile.TemporaryDirectory() as directory:
+        dotenv_path = os.path.join(directory, ".env")
+        with open(dotenv_path, "w", encoding="utf-8") as f:
+            f.write("DART_API_KEY=benchmark\nDATABASE_URL=postgresql+asyncpg://localhost/findb\n")
+
+        def legacy() -> object:
+            for _ in range(LEGACY_DOTENV_READS):
+                load_dotenv(dotenv_path)
+            legacy_logger.info("FinController가 초기화되었습니다.")
+            legacy_logger.info("FinService가 초기화되었습니다.")
+            return FinController(session)
+
+        cases = {
+            "legacy": legacy,
+            "per_request": lambda: FinController(session),
+            "container": lambda: FinController(session, shared_api)
+        }
+        sys.addaudithook(audit)
+        for name, build in cases.items():
+            print(json.dumps({"case": name, "requests": args.requests, **measure(build, args.requests)}))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""응답 직렬화 벤치마크 (기존 방식 vs 빠른 경로)
+
+기존 방식은 응답 모델을 검증하여 만들고 FastAPI 기본 경로처럼 jsonable_encoder + json.dumps로
+직렬화하며, 재무비율 응답은 ROUND(...) 결과인 Decimal 값을 그대로 인코딩합니다.
+빠른 경로는 model_construct로 만든 모델을 pydantic-core 직렬화기로, 재무비율 딕셔너리는
+(저장소 계층에서 float로 바뀐 값을) orjson으로 직렬화합니다.
+연도 수(이력 길이)별로 응답 하나당 비용을 측정합니다.
+
+사용 예:
+    python -m benchmarks.bench_response_serialization --years 1 10 100
+"""
+import json
+import time
+import random
+import argparse
+from decimal import Decimal
+from typing import Any, Callable, Dict, List
+
+from fastapi.encoders import jsonable_encoder
+
+from app.domin.fin.models.schemas import (
+    FinancialMetricsResponse,
+    FinancialMetrics,
+    GrowthData,
+    DebtLiquidityData
+)
+from app.domin.fin.service.response_snapshot_service import (
+    build_ratios,
+    encode_response,
+    financial_metrics_response,
+    ratio_columns
+)
+
+def generate_series(years: int, seed: int = 42) -> Dict[str, List[Any]]:
+    rng = random.Random(seed)
+    series = {"years": [str(2024 - offset) for offset in range(years)]}
+    for name in ("operating_margins", "net_margins", "roe_values", "roa_values", "revenue_growths",
+                 "net_income_growths", "debt_ratios", "current_ratios"):
+        series[name] = [rng.uniform(-50, 300) for _ in range(years)]
+    return series
+
+def generate_ratio_rows(years: int, numeric: Callable[[float], Any], seed: int = 42) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    labels = [label for _, label in ratio_columns()]
+    return [
+        {"사업연도": str(2024 - offset), **{label: numeric(round(rng.uniform(-50, 300), 2)) for label in labels}}
+        for offset in range(years)
+    ]
+
+def legacy_dumps(content: Any) -> bytes:
+    """FastAPI 기본 JSONResponse 경로 (jsonable_encoder 후 표준 라이브러리 json)"""
+    return json.dumps(
+        jsonable_encoder(content), ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+def legacy_metrics(series: Dict[str, List[Any]]) -> bytes:
+    response = FinancialMetricsResponse(
+        companyName="삼성전자",
+        financialMetrics=FinancialMetrics(
+            operatingMargin=series["operating_margins"], netMargin=series["net_margins"],
+            roe=series["roe_values"], roa=series["roa_values"], years=series["years"]
+        ),
+        growthData=GrowthData(
+            revenueGrowth=series["revenue_growths"], netIncomeGrowth=series["net_income_growths"],
+            years=series["years"]
+        ),
+        debtLiquidityData=DebtLiquidityData(
+            debtRatio=series["debt_ratios"], currentRatio=series["current_ratios"], years=series["years"]
+        )
+    )
+    return legacy_dumps(response)
+
+def fast_metrics(series: Dict[str, List[Any]]) -> bytes:
+    return encode_response(financial_metrics_response(
+        "삼성전자", series["years"], series["operating_margins"], series["net_margins"],
+        series["roe_values"], series["roa_values"], series["revenue_growths"],
+        series["net_income_growths"], series["debt_ratios"], series["current_ratios"]
+    ))
+
+def measure(function: Callable[[], bytes], min_seconds: float) -> Dict[str, float]:
+    """최소 측정 시간을 채울 때까지 반복하여 호출당 평균 시간(μs)을 구합니다."""
+    function()
+    iterations = 0
+    started = time.perf_counter()
+    while True:
+        body = function()
+        iterations += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_seconds:
+            break
+    return {"us_per_response": round(elapsed / iterations * 1e6, 2), "bytes": len(body)}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--years", type=int, nargs="+", default=[1, 10, 100], help="응답에 포함할 연도 수")
+    parser.add_argument("--min-seconds", type=float, default=0.5, help="경우별 최소 측정 시간")
+    args = parser.parse_args()
+
+    for years in args.years:
+        series = generate_series(years)
+        decimal_rows = generate_ratio_rows(years, lambda value: Decimal(str(value)))
+        float_rows = generate_ratio_rows(years, float)
+        cases = {
+            "financial_metrics/legacy": lambda: legacy_metrics(series),
+            "financial_metrics/fast": lambda: fast_metrics(series),
+            "ratios/legacy": lambda: legacy_dumps(build_ratios(decimal_rows)),
+            "ratios/fast": lambda: encode_response(build_ratios(float_rows))
+        }
+        for name, function in cases.items():
+            print(json.dumps({"case": name, "years": years, **measure(function, args.min_seconds)}, ensure_ascii=False))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""로컬 DART 대역 서버
+
+OpenDART API 중 이 서비스가 호출하는 API(corpCode.xml, fnlttSinglAcnt, fnlttCashFlow, fnlttSinglAcntAll,
+fnlttMultiAcnt, list.json)를 같은 경로와 응답 형식으로 제공합니다.
+응답 지연과 오류 비율을 조절할 수 있고, API별 호출 수를 /_stats로 조회합니다.
+
+애플리케이션은 DART_API_URL을 이 서버의 /api로 지정하여 실행합니다.
+
+사용 예:
+    python -m loadtest.fake_dart --port 8081 --companies 5000 --latency-ms 80 --jitter-ms 40 --error-rate 0.01
+    DART_API_URL=http://127.0.0.1:8081/api DART_API_KEY=loadtest python -m app.cli.serve
+"""
+import time
+import random
+import asyncio
+import argparse
+from collections import Counter
+from typing import Dict
+
+from aiohttp import web
+
+from loadtest.fixtures import (
+    BS_IS_ACCOUNTS,
+    CASH_FLOW_ACCOUNTS,
+    DETAIL_ACCOUNTS,
+    FixtureStore,
+    dumps,
+    generate_companies
+)
+
+NO_DATA = {"status": "013", "message": "조회된 데이타가 없습니다."}
+RATE_LIMITED = {"status": "020", "message": "요청 제한을 초과하였습니다."}
+
+class FakeDart:
+    """지연/오류 주입과 호출 수 집계를 하는 DART API 대역"""
+
+    def __init__(self, store: FixtureStore, latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                 error_rate: float = 0.0, rate_limit_rate: float = 0.0, seed: int = 42):
+        self.store = store
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.calls: Counter = Counter()
+        self.errors: Counter = Counter()
+        self.started_at = time.time()
+        self._random = random.Random(seed)
+
+    def application(self) -> web.Application:
+        app = web.Application(middlewares=[self._inject])
+        app.router.add_get("/api/corpCode.xml", self.corp_code)
+        app.router.add_get("/api/fnlttSinglAcnt.json", self.single_account)
+        app.router.add_get("/api/fnlttCashFlow.json", self.cash_flow)
+        app.router.add_get("/api/fnlttSinglAcntAll.json", self.full_statements)
+        app.router.add_get("/api/fnlttMultiAcnt.json", self.multi_account)
+        app.router.add_get("/api/list.json", self.disclosure_list)
+        app.router.add_get("/_stats", self.stats)
+        app.router.add_post("/_stats/reset", self.reset)
+        app.router.add_get("/_companies", self.companies)
+        return app
+
+    @web.middleware
+    async def _inject(self, request: web.Request, handler):
+        if not request.path.startswith("/api/"):
+            return await handler(request)
+        api = request.path.rsplit("/", 1)[-1]
+        self.calls[api] += 1
+        if self.latency_ms or self.jitter_ms:
+            await asyncio.sleep(max(self.latency_ms + self._random.gauss(0, self.jitter_ms), 0) / 1000)
+        if not request.query.get("crtfc_key"):
+            return web.json_response({"status": "010", "message": "등록되지 않은 키입니다."})
+        roll = self._random.random()
+        if roll < self.error_rate:
+            self.errors[api] += 1
+            return web.Response(status=503, text="Service Unavailable")
+        if roll < self.error_rate + self.rate_limit_rate:
+            self.errors[api] += 1
+            return web.Response(body=dumps(RATE_LIMITED), content_type="application/json")
+        return await handler(request)
+
+    @staticmethod
+    def _json(data: Dict) -> web.Response:
+        return web.Response(body=dumps(data), content_type="application/json")
+
+    def _statement_response(self, request: web.Request, api: str, accounts, fs_div: str = "CFS",
+                            with_account_id: bool = False) -> web.Response:
+        query = request.query
+        corp_code, year, reprt_code = query.get("corp_code", ""), query.get("bsns_year", ""), query.get("reprt_code", "")
+        recorded = self.store.recorded(api, corp_code, year, reprt_code)
+        if recorded is not None:
+            return web.Response(body=recorded, content_type="application/json")
+        if not year.isdigit() or not self.store.has_data(corp_code, year, reprt_code):
+            return self._json(NO_DATA)
+        items = self.store.statement_items(corp_code, year, reprt_code, accounts, fs_div, with_account_id)
+        return self._json({"status": "000", "message": "정상", "list": items})
+
+    async def corp_code(self, request: web.Request) -> web.Response:
+        return web.Response(body=self.store.corp_code_zip(), content_type="application/x-msdownload")
+
+    async def single_account(self, request: web.Request) -> web.Response:
+        return self._statement_response(request, "fnlttSinglAcnt", BS_IS_ACCOUNTS, request.query.get("fs_div", "CFS"))
+
+    async def cash_flow(self, request: web.Request) -> web.Response:
+        return self._statement_response(request, "fnlttCashFlow", CASH_FLOW_ACCOUNTS, request.query.get("fs_div", "CFS"))
+
+    async def full_statements(self, request: web.Request) -> web.Response:
+        return self._statement_response(
+            request, "fnlttSinglAcntAll", BS_IS_ACCOUNTS + DETAIL_ACCOUNTS + CASH_FLOW_ACCOUNTS,
+            request.query.get("fs_div", "CFS"), with_account_id=True
+        )
+
+    async def multi_account(self, request: web.Request) -> web.Response:
+        query = request.query
+        year, reprt_code = query.get("bsns_year", ""), query.get("reprt_code", "")
+        items = []
+        if year.isdigit():
+            for corp_code in query.get("corp_code", "").split(","):
+                if self.store.has_data(corp_code, year, reprt_code):
+                    items.extend(self.store.statement_items(corp_code, year, reprt_code, BS_IS_ACCOUNTS))
+        if not items:
+            return self._json(NO_DATA)
+        return self._json({"status": "000", "message": "정상", "list": items})
+
+    async def disclosure_list(self, request: web.Request) -> web.Response:
+        query = request.query
+        disclosures = self.store.disclosures(query.get("bgn_de", ""), query.get("end_de", ""))
+        if not disclosures:
+            return self._json(NO_DATA)
+        page_no = int(query.get("page_no", "1"))
+        page_count = min(int(query.get("page_count", "10")), 100)
+        start = (page_no - 1) * page_count
+        return self._json({
+            "status": "000",
+            "message": "정상",
+            "page_no": page_no,
+            "page_count": page_count,
+            "total_count": len(disclosures),
+            "total_page": (len(disclosures) + page_count - 1) // page_count,
+            "list": disclosures[start:start + page_count]
+        })
+
+    async def stats(self, request: web.Request) -> web.Response:
+        return web.json_response({
+            "since": self.started_at,
+            "calls": dict(self.calls),
+            "errors": dict(self.errors),
+            "total": sum(self.calls.values())
+        })
+
+    async def reset(self, request: web.Request) -> web.Response:
+        self.calls.clear()
+        self.errors.clear()
+        self.started_at = time.time()
+        return web.json_response({"status": "success"})
+
+    async def companies(self, request: web.Request) -> web.Response:
+        """부하 생성기가 요청할 회사명 목록 (고유번호 파일 순서)"""
+        return web.json_response([company.corp_name for company in self.store.companies])
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--companies", type=int, default=5000, help="고유번호 파일의 회사 수")
+    parser.add_argument("--fixtures", help="실제 응답을 저장해 둔 디렉터리 (있으면 합성 데이터보다 우선)")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="응답 지연 평균(ms)")
+    parser.add_argument("--jitter-ms", type=float, default=20.0, help="응답 지연 표준편차(ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="HTTP 503으로 응답할 비율")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="요청 제한 초과(020)로 응답할 비율")
+    parser.add_argument("--missing-rate", type=float, default=0.05, help="데이터 없음(013)으로 응답할 (회사, 연도, 보고서) 비율")
+    parser.add_argument("--disclosures-per-day", type=int, default=5, help="공시목록 API의 하루 공시 수")
+    return parser.parse_args()
+
+def main() -> None:
+    args = parse_args()
+    store = FixtureStore(
+        generate_companies(args.companies), args.fixtures,
+        missing_rate=args.missing_rate, disclosures_per_day=args.disclosures_per_day
+    )
+    fake = FakeDart(store, args.latency_ms, args.jitter_ms, args.error_rate, args.rate_limit_rate)
+    web.run_app(fake.application(), host=args.host, port=args.port, access_log=None)
+
+if __name__ == "__main__":
+    main()
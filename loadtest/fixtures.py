@@ -0,0 +1,211 @@
+"""로컬 DART 대역 서버의 응답 데이터
+
+회사 목록과 재무제표는 시드로 결정되는 합성 데이터이므로 서버를 다시 띄워도 같은 응답을 돌려줍니다.
+fixtures 디렉터리를 주면 실제 DART에서 받아 둔 응답을 우선 사용합니다:
+
+    <fixtures>/corpCode.zip
+    <fixtures>/<API 이름>/<corp_code>_<bsns_year>_<reprt_code>.json   (예: fnlttSinglAcnt/00126380_2023_11011.json)
+"""
+import io
+import os
+import json
+import zlib
+import random
+import zipfile
+from datetime import date, timedelta
+from typing import Any, Dict, List, NamedTuple, Optional
+from xml.sax.saxutils import escape
+
+# 앞쪽은 실제 회사명을 써서 수동 확인과 인기 회사(핫 키) 재현에 사용
+WELL_KNOWN = [
+    ("00126380", "삼성전자", "005930"),
+    ("00164779", "SK하이닉스", "000660"),
+    ("01515323", "LG에너지솔루션", "373220"),
+    ("00164742", "현대자동차", "005380"),
+    ("00266961", "NAVER", "035420"),
+    ("00258801", "카카오", "035720"),
+    ("00401731", "LG화학", "051910"),
+    ("00106641", "기아", "000270"),
+    ("00155319", "POSCO홀딩스", "005490"),
+    ("00149655", "삼성물산", "028260")
+]
+
+# (재무제표 구분, 재무제표명, 계정과목명, 표준 계정코드, 기준 금액 배수)
+BS_IS_ACCOUNTS = [
+    ("BS", "재무상태표", "유동자산", "ifrs-full_CurrentAssets", 0.45),
+    ("BS", "재무상태표", "비유동자산", "ifrs-full_NoncurrentAssets", 0.55),
+    ("BS", "재무상태표", "자산총계", "ifrs-full_Assets", 1.0),
+    ("BS", "재무상태표", "유동부채", "ifrs-full_CurrentLiabilities", 0.22),
+    ("BS", "재무상태표", "비유동부채", "ifrs-full_NoncurrentLiabilities", 0.13),
+    ("BS", "재무상태표", "부채총계", "ifrs-full_Liabilities", 0.35),
+    ("BS", "재무상태표", "자본금", "ifrs-full_IssuedCapital", 0.02),
+    ("BS", "재무상태표", "이익잉여금", "ifrs-full_RetainedEarnings", 0.5),
+    ("BS", "재무상태표", "자본총계", "ifrs-full_Equity", 0.65),
+    ("IS", "손익계산서", "매출액", "ifrs-full_Revenue", 0.8),
+    ("IS", "손익계산서", "영업이익", "dart_OperatingIncomeLoss", 0.08),
+    ("IS", "손익계산서", "법인세차감전 순이익", "ifrs-full_ProfitLossBeforeTax", 0.09),
+    ("IS", "손익계산서", "당기순이익", "ifrs-full_ProfitLoss", 0.06)
+]
+
+CASH_FLOW_ACCOUNTS = [
+    ("CF", "현금흐름표", "영업활동현금흐름", "ifrs-full_CashFlowsFromUsedInOperatingActivities", 0.1),
+    ("CF", "현금흐름표", "투자활동현금흐름", "ifrs-full_CashFlowsFromUsedInInvestingActivities", -0.07),
+    ("CF", "현금흐름표", "재무활동현금흐름", "ifrs-full_CashFlowsFromUsedInFinancingActivities", -0.02)
+]
+
+# 전체 재무제표 API에만 있는 세부 계정
+DETAIL_ACCOUNTS = [
+    ("IS", "손익계산서", "이자비용", "ifrs-full_InterestExpense", 0.004),
+    ("IS", "손익계산서", "기본주당이익", "ifrs-full_BasicEarningsLossPerShare", 0.0000003),
+    ("BS", "재무상태표", "단기차입금", "ifrs-full_ShorttermBorrowings", 0.05),
+    ("BS", "재무상태표", "장기차입금", "ifrs-full_LongtermBorrowings", 0.04)
+]
+
+REPORT_NAMES = {"11011": ("사업보고서", "12"), "11012": ("반기보고서", "06"), "11013": ("분기보고서", "03"), "11014": ("분기보고서", "09")}
+
+class Company(NamedTuple):
+    corp_code: str
+    corp_name: str
+    stock_code: str
+
+def generate_companies(count: int) -> List[Company]:
+    """실제 회사명 몇 개와 합성 회사로 이루어진 고유번호 목록 (앞쪽일수록 상장 회사)"""
+    companies = [Company(*entry) for entry in WELL_KNOWN[:count]]
+    for index in range(len(companies), count):
+        stock_code = f"{900000 + index:06d}" if index < count * 0.3 else ""
+        companies.append(Company(f"{10000000 + index:08d}", f"부하테스트{index:05d}", stock_code))
+    return companies
+
+def corp_code_zip(companies: List[Company]) -> bytes:
+    """DART corpCode.xml API 응답 형식(CORPCODE.xml 하나를 담은 zip)"""
+    xml = io.StringIO()
+    xml.write('<?xml version="1.0" encoding="UTF-8"?>\n<result>\n')
+    for company in companies:
+        xml.write(
+            f"<list><corp_code>{company.corp_code}</corp_code><corp_name>{escape(company.corp_name)}</corp_name>"
+            f"<stock_code>{company.stock_code or ' '}</stock_code><modify_date>20240101</modify_date></list>\n"
+        )
+    xml.write("</result>\n")
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        zip_file.writestr("CORPCODE.xml", xml.getvalue().encode("utf-8"))
+    return buffer.getvalue()
+
+def _rng(*key: Any) -> random.Random:
+    return random.Random(zlib.crc32(":".join(map(str, key)).encode()))
+
+def _amount(value: float) -> str:
+    return f"{int(value):,}"
+
+class FixtureStore:
+    """API별 응답 본문을 만들거나 fixtures 디렉터리에서 읽습니다.
+
+    missing_rate 비율의 (회사, 연도, 보고서)는 데이터 없음(013)으로 응답합니다 (비상장/미제출 회사 재현).
+    """
+
+    def __init__(self, companies: List[Company], fixtures_dir: Optional[str] = None,
+                 missing_rate: float = 0.05, disclosures_per_day: int = 5):
+        self.companies = companies
+        self.by_code = {company.corp_code: company for company in companies}
+        self.fixtures_dir = fixtures_dir
+        self.missing_rate = missing_rate
+        self.disclosures_per_day = disclosures_per_day
+        self._corp_code_zip: Optional[bytes] = None
+
+    def corp_code_zip(self) -> bytes:
+        if self._corp_code_zip is None:
+            recorded = self._recorded_path("corpCode.zip")
+            if recorded is not None:
+                with open(recorded, "rb") as f:
+                    self._corp_code_zip = f.read()
+            else:
+                self._corp_code_zip = corp_code_zip(self.companies)
+        return self._corp_code_zip
+
+    def _recorded_path(self, *parts: str) -> Optional[str]:
+        if not self.fixtures_dir:
+            return None
+        path = os.path.join(self.fixtures_dir, *parts)
+        return path if os.path.exists(path) else None
+
+    def recorded(self, api: str, corp_code: str, year: str, reprt_code: str) -> Optional[bytes]:
+        path = self._recorded_path(api, f"{corp_code}_{year}_{reprt_code}.json")
+        if path is None:
+            return None
+        with open(path, "rb") as f:
+            return f.read()
+
+    def has_data(self, corp_code: str, year: str, reprt_code: str) -> bool:
+        if corp_code not in self.by_code:
+            return False
+        return _rng("missing", corp_code, year, reprt_code).random() >= self.missing_rate
+
+    def statement_items(self, corp_code: str, year: str, reprt_code: str, accounts, fs_div: str = "CFS",
+                        with_account_id: bool = False) -> List[Dict[str, Any]]:
+        """회사/연도별로 정해지는 금액의 재무제표 항목 (당기/전기/전전기는 연도별 금액으로 일관됨)"""
+        company = self.by_code[corp_code]
+        base = _rng("scale", corp_code).uniform(1e10, 3e14)
+        items = []
+        for ord_, (sj_div, sj_nm, account_nm, account_id, ratio) in enumerate(accounts, start=1):
+            amounts = []
+            for offset in range(3):
+                growth = _rng("growth", corp_code, int(year) - offset).uniform(0.85, 1.25)
+                amounts.append(_amount(base * ratio * growth * (1.08 ** (int(year) - offset - 2015))))
+            item = {
+                "rcept_no": f"{year}0312{int(corp_code) % 1000000:06d}",
+                "reprt_code": reprt_code,
+                "bsns_year": year,
+                "corp_code": corp_code,
+                "stock_code": company.stock_code,
+                "fs_div": fs_div,
+                "fs_nm": "연결재무제표" if fs_div == "CFS" else "재무제표",
+                "sj_div": sj_div,
+                "sj_nm": sj_nm,
+                "account_nm": account_nm,
+                "thstrm_nm": f"제 {int(year) - 1968} 기",
+                "thstrm_amount": amounts[0],
+                "frmtrm_nm": f"제 {int(year) - 1969} 기",
+                "frmtrm_amount": amounts[1],
+                "bfefrmtrm_nm": f"제 {int(year) - 1970} 기",
+                "bfefrmtrm_amount": amounts[2],
+                "ord": str(ord_),
+                "currency": "KRW"
+            }
+            if with_account_id:
+                item["account_id"] = account_id
+                item["account_detail"] = "-"
+            items.append(item)
+        return items
+
+    def disclosures(self, bgn_de: str, end_de: str) -> List[Dict[str, Any]]:
+        """기간 내 날짜마다 disclosures_per_day건의 정기공시 목록 (접수일자 오름차순)"""
+        start = date(int(bgn_de[:4]), int(bgn_de[4:6]), int(bgn_de[6:]))
+        end = date(int(end_de[:4]), int(end_de[4:6]), int(end_de[6:]))
+        listed = [company for company in self.companies if company.stock_code] or self.companies
+        result = []
+        day = start
+        while day <= end:
+            rng = _rng("disclosures", day.isoformat())
+            for sequence in range(self.disclosures_per_day):
+                company = rng.choice(listed)
+                reprt_code = rng.choice(list(REPORT_NAMES))
+                name, month = REPORT_NAMES[reprt_code]
+                # 결산월이 지난 보고서만 제출되므로 올해 결산월이 아직 안 왔으면 작년 보고서
+                year = day.year if int(month) < day.month else day.year - 1
+                prefix = "[기재정정]" if rng.random() < 0.1 else ""
+                result.append({
+                    "corp_code": company.corp_code,
+                    "corp_name": company.corp_name,
+                    "stock_code": company.stock_code,
+                    "corp_cls": "Y",
+                    "report_nm": f"{prefix}{name} ({year}.{month})",
+                    "rcept_no": f"{day:%Y%m%d}{800000 + sequence:06d}",
+                    "flr_nm": company.corp_name,
+                    "rcept_dt": f"{day:%Y%m%d}",
+                    "rm": ""
+                })
+            day += timedelta(days=1)
+        return result
+
+def dumps(data: Dict[str, Any]) -> bytes:
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
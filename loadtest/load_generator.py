@@ -0,0 +1,227 @@
+"""비동기 부하 생성기
+
+/ratios/{company_name}와 POST /financial(회사명)을 섞어 요청하고
+엔드포인트별 처리량(RPS), 지연 시간 백분위(p50/p95/p99), 상태 코드별 건수와
+부하 동안 애플리케이션이 DART 대역 서버에 보낸 API별 호출 수를 보고합니다.
+
+회사는 핫/콜드 분포로 고릅니다. 요청의 --hot-ratio 비율은 상위 --hot-keys개 회사(캐시 적중 경로)에,
+나머지는 전체 회사에서 고르게(대부분 처음 조회되어 DART 조회와 저장 경로) 보냅니다.
+
+--rate를 주면 정해진 간격으로 요청을 보내는 개방 루프로 동작하며, 지연 시간은 예정 시각부터 잽니다
+(서버가 밀려도 대기 시간이 빠지지 않음). 주지 않으면 --concurrency개 작업자가 응답을 받는 대로 다음 요청을 보냅니다.
+
+사용 예:
+    python -m loadtest.load_generator --target http://127.0.0.1:9000 --dart-url http://127.0.0.1:8081 \\
+        --duration 60 --concurrency 64 --mix ratios=0.6,financial_post=0.4
+
+GET /financial(기본 회사)은 회사명 없이 호출되어 항상 5xx를 반환하므로 요청하지 않습니다.
+"""
+import json
+import time
+import random
+import asyncio
+import argparse
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+
+ENDPOINTS = ("ratios", "financial_post")
+
+def percentile(values: List[float], fraction: float) -> Optional[float]:
+    """정렬된 값의 백분위 (최근접 순위)"""
+    if not values:
+        return None
+    rank = max(int(round(fraction * len(values) + 0.5)) - 1, 0)
+    return values[min(rank, len(values) - 1)]
+
+def parse_mix(text: str) -> Dict[str, float]:
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise argparse.ArgumentTypeError(f"알 수 없는 엔드포인트: {name} ({', '.join(ENDPOINTS)})")
+        mix[name] = float(weight)
+    return mix
+
+class KeyChooser:
+    """핫/콜드 분포로 회사명을 고릅니다."""
+
+    def __init__(self, names: List[str], hot_keys: int, hot_ratio: float, rng: random.Random):
+        self.names = names
+        self.hot = names[:max(min(hot_keys, len(names)), 1)]
+        self.hot_ratio = hot_ratio
+        self.rng = rng
+
+    def choose(self) -> str:
+        if self.rng.random() < self.hot_ratio:
+            return self.rng.choice(self.hot)
+        return self.rng.choice(self.names)
+
+class Results:
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {name: [] for name in ENDPOINTS}
+        self.statuses: Dict[str, Counter] = {name: Counter() for name in ENDPOINTS}
+
+    def record(self, endpoint: str, status: str, latency: float) -> None:
+        self.latencies[endpoint].append(latency)
+        self.statuses[endpoint][status] += 1
+
+    def summary(self, elapsed: float) -> Dict[str, Any]:
+        endpoints = {}
+        all_latencies: List[float] = []
+        for endpoint in ENDPOINTS:
+            latencies = sorted(self.latencies[endpoint])
+            if not latencies:
+                continue
+            all_latencies.extend(latencies)
+            endpoints[endpoint] = {
+                "requests": len(latencies),
+                "rps": round(len(latencies) / elapsed, 2),
+                "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+                "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+                "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+                "max_ms": round(latencies[-1] * 1000, 2),
+                "statuses": dict(self.statuses[endpoint])
+            }
+        all_latencies.sort()
+        total = {
+            "requests": len(all_latencies),
+            "rps": round(len(all_latencies) / elapsed, 2),
+            "p50_ms": round((percentile(all_latencies, 0.50) or 0) * 1000, 2),
+            "p95_ms": round((percentile(all_latencies, 0.95) or 0) * 1000, 2),
+            "p99_ms": round((percentile(all_latencies, 0.99) or 0) * 1000, 2),
+            "errors": sum(
+                count for statuses in self.statuses.values()
+                for status, count in statuses.items() if not status.startswith("2")
+            )
+        }
+        return {"elapsed_seconds": round(elapsed, 2), "total": total, "endpoints": endpoints}
+
+class LoadGenerator:
+    def __init__(self, args: argparse.Namespace, names: List[str]):
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.keys = KeyChooser(names, args.hot_keys, args.hot_ratio, self.rng)
+        self.endpoints, self.weights = zip(*args.mix.items())
+        self.results = Results()
+        self.recording = False
+
+    def next_request(self) -> Tuple[str, str, str, Optional[Dict[str, str]]]:
+        """(엔드포인트, 메서드, 경로, 본문)"""
+        endpoint = self.rng.choices(self.endpoints, self.weights)[0]
+        year = self.rng.choice(self.args.years) if self.args.years else None
+        query = f"?year={year}" if year else ""
+        if endpoint == "ratios":
+            return endpoint, "GET", f"/ratios/{self.keys.choose()}{query}", None
+        return endpoint, "POST", f"/financial{query}", {"company_name": self.keys.choose()}
+
+    async def send(self, http: aiohttp.ClientSession, scheduled: Optional[float] = None) -> None:
+        endpoint, method, path, body = self.next_request()
+        started = scheduled if scheduled is not None else time.perf_counter()
+        try:
+            async with http.request(method, self.args.target + path, json=body) as response:
+                await response.read()
+                status = str(response.status)
+        except asyncio.TimeoutError:
+            status = "timeout"
+        except aiohttp.ClientError as e:
+            status = type(e).__name__
+        if self.recording:
+            self.results.record(endpoint, status, time.perf_counter() - started)
+
+    async def closed_loop(self, http: aiohttp.ClientSession, deadline: float) -> None:
+        async def worker() -> None:
+            while time.perf_counter() < deadline:
+                await self.send(http)
+        await asyncio.gather(*(worker() for _ in range(self.args.concurrency)))
+
+    async def open_loop(self, http: aiohttp.ClientSession, deadline: float) -> None:
+        # 동시 요청 수는 --concurrency로 제한하되, 지연은 예정 시각부터 측정
+        interval = 1.0 / self.args.rate
+        in_flight = asyncio.Semaphore(self.args.concurrency)
+        tasks = set()
+
+        async def one(scheduled: float) -> None:
+            async with in_flight:
+                await self.send(http, scheduled)
+
+        next_at = time.perf_counter()
+        while next_at < deadline:
+            delay = next_at - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            task = asyncio.create_task(one(next_at))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            next_at += interval
+        await asyncio.gather(*tasks)
+
+    async def run(self, http: aiohttp.ClientSession, seconds: float, record: bool) -> float:
+        self.recording = record
+        started = time.perf_counter()
+        deadline = started + seconds
+        if self.args.rate:
+            await self.open_loop(http, deadline)
+        else:
+            await self.closed_loop(http, deadline)
+        return time.perf_counter() - started
+
+async def fetch_json(http: aiohttp.ClientSession, method: str, url: str) -> Any:
+    async with http.request(method, url) as response:
+        response.raise_for_status()
+        return await response.json()
+
+async def main(args: argparse.Namespace) -> Dict[str, Any]:
+    timeout = aiohttp.ClientTimeout(total=args.timeout)
+    connector = aiohttp.TCPConnector(limit=args.concurrency)
+    async with aiohttp.ClientSession(timeout=timeout, connector=connector) as http:
+        names = await fetch_json(http, "GET", f"{args.dart_url}/_companies")
+        generator = LoadGenerator(args, names[:args.companies] if args.companies else names)
+        if args.warmup:
+            await generator.run(http, args.warmup, record=False)
+        await fetch_json(http, "POST", f"{args.dart_url}/_stats/reset")
+        elapsed = await generator.run(http, args.duration, record=True)
+        dart = await fetch_json(http, "GET", f"{args.dart_url}/_stats")
+
+    summary = generator.results.summary(elapsed)
+    summary["dart"] = {
+        "calls": dart["calls"],
+        "errors": dart["errors"],
+        "total": dart["total"],
+        "calls_per_request": round(dart["total"] / max(summary["total"]["requests"], 1), 3)
+    }
+    summary["parameters"] = {
+        "mix": args.mix, "concurrency": args.concurrency, "rate": args.rate, "hot_keys": args.hot_keys,
+        "hot_ratio": args.hot_ratio, "companies": len(generator.keys.names), "years": args.years
+    }
+    return summary
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", default="http://127.0.0.1:9000", help="애플리케이션 주소")
+    parser.add_argument("--dart-url", default="http://127.0.0.1:8081", help="DART 대역 서버 주소 (회사 목록, 호출 수 조회)")
+    parser.add_argument("--duration", type=float, default=60.0, help="측정 시간(초)")
+    parser.add_argument("--warmup", type=float, default=10.0, help="측정 전 예열 시간(초, 결과와 DART 호출 수에서 제외)")
+    parser.add_argument("--concurrency", type=int, default=32, help="동시 요청 수 (개방 루프에서는 최대 동시 요청 수)")
+    parser.add_argument("--rate", type=float, default=None, help="초당 요청 수 (개방 루프)")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("ratios=0.6,financial_post=0.4"),
+                        help="엔드포인트별 요청 비중")
+    parser.add_argument("--hot-keys", type=int, default=20, help="핫 회사 수 (고유번호 파일 앞쪽부터)")
+    parser.add_argument("--hot-ratio", type=float, default=0.9, help="핫 회사로 보내는 요청 비율")
+    parser.add_argument("--companies", type=int, default=0, help="요청할 회사 수 상한 (0이면 전체)")
+    parser.add_argument("--years", type=int, nargs="*", default=[], help="요청마다 고를 연도 (없으면 직전 연도)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="요청 제한 시간(초)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="결과 JSON 파일")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    result = asyncio.run(main(arguments))
+    text = json.dumps(result, ensure_ascii=False, indent=2)
+    print(text)
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+from app.domin.fin.service import account_taxonomy
+from app.domin.fin.service.account_taxonomy import (
+    DEFAULT_ACCOUNT_ALIASES,
+    DEFAULT_ACCOUNT_IDS,
+    AccountTaxonomy,
+    load_account_mappings,
+    normalize_account_name
+)
+from app.domin.fin.service.financial_data_processor import parse_statement_items
+from loadtest.fixtures import BS_IS_ACCOUNTS, FixtureStore, generate_companies
+
+@pytest.fixture
+def taxonomy() -> AccountTaxonomy:
+    return AccountTaxonomy(DEFAULT_ACCOUNT_ALIASES, DEFAULT_ACCOUNT_IDS)
+
+@pytest.mark.parametrize("account_nm, expected", [
+    ("자산 총계", "자산총계"),
+    ("Ⅰ. 유동자산", "유동자산"),
+    ("1. 매출액", "매출액"),
+    ("(1) 영업이익", "영업이익"),
+    ("가. 당기순이익", "당기순이익"),
+    ("　영업이익（손실）", "영업이익(손실)")
+])
+def test_normalize_account_name(account_nm, expected):
+    assert normalize_account_name(account_nm) == expected
+
+@pytest.mark.parametrize("account_nm, expected", [
+    ("수익(매출액)", "매출액"),
+    ("영업수익", "매출액"),
+    ("Ⅲ. 영업이익(손실)", "영업이익"),
+    ("분기순이익(손실)", "당기순이익"),
+    ("영업활동으로 인한 현금흐름", "영업활동현금흐름"),
+    ("유동성장기차입금", "유동성장기부채"),
+    ("매출원가", None)
+])
+def test_resolve_by_name(taxonomy, account_nm, expected):
+    assert taxonomy.resolve(account_nm) == expected
+
+def test_account_id_takes_precedence_over_name(taxonomy):
+    assert taxonomy.resolve("영업수익", "ifrs-full_Revenue") == "매출액"
+    assert taxonomy.resolve("기타수익", "ifrs-full_Revenue") == "매출액"
+    # 모르는 계정코드면 계정과목명으로 찾음
+    assert taxonomy.resolve("자산총계", "dart_Unknown") == "자산총계"
+
+def test_extend_overrides_defaults(taxonomy):
+    count = taxonomy.extend([
+        ("순영업수익", None, "매출액"),
+        (None, "entity_CustomRevenue", "매출액"),
+        ("영업수익", "", "영업이익")
+    ])
+    assert count == 3
+    assert taxonomy.resolve("순 영업수익") == "매출액"
+    assert taxonomy.resolve("기타", "entity_CustomRevenue") == "매출액"
+    assert taxonomy.resolve("영업수익") == "영업이익"
+
+def test_load_account_mappings_extends_global_taxonomy(session, monkeypatch, taxonomy):
+    async def get_account_mappings(db_session):
+        return [{"account_nm": "이자수익(매출)", "account_id": None, "canonical_account": "매출액"}]
+
+    monkeypatch.setattr(account_taxonomy, "ACCOUNT_TAXONOMY", taxonomy)
+    monkeypatch.setattr(account_taxonomy, "get_account_mappings", get_account_mappings)
+
+    assert asyncio.run(load_account_mappings(session)) == 1
+    assert taxonomy.resolve("이자수익(매출)") == "매출액"
+
+def test_load_account_mappings_falls_back_to_defaults_on_error(session, monkeypatch, taxonomy):
+    async def get_account_mappings(db_session):
+        raise RuntimeError('relation "account_mapping" does not exist')
+
+    monkeypatch.setattr(account_taxonomy, "ACCOUNT_TAXONOMY", taxonomy)
+    monkeypatch.setattr(account_taxonomy, "get_account_mappings", get_account_mappings)
+
+    assert asyncio.run(load_account_mappings(session)) == 0
+    assert session.rollbacks == 1
+
+def test_ingestion_stores_canonical_account():
+    company = generate_companies(1)[0]
+    items = FixtureStore([company]).statement_items(company.corp_code, "2023", "11011", BS_IS_ACCOUNTS)
+    for item in items:
+        if item["account_nm"] == "매출액":
+            item["account_nm"] = "수익(매출액)"
+        if item["account_nm"] == "법인세차감전 순이익":
+            item["account_nm"] = "법인세비용차감전순이익"
+
+    rows = parse_statement_items(items, {**company._asdict(), "modify_date": "20240101"})
+    canonical = {row["account_nm"]: row["canonical_account"] for row in rows}
+
+    assert canonical["수익(매출액)"] == "매출액"
+    assert canonical["자본총계"] == "자본총계"
+    # 매핑되지 않은 계정은 비워 두고 계정과목명은 원본을 유지
+    assert canonical["법인세비용차감전순이익"] is None
@@ -0,0 +1,110 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from app.domin.fin.models.schemas import CompanyInfo
+from app.domin.fin.service import backfill_service
+from app.domin.fin.service.backfill_service import BackfillCheckpoint, BackfillService
+from loadtest.fixtures import BS_IS_ACCOUNTS, FixtureStore, generate_companies
+
+COMPANIES = [
+    CompanyInfo(corp_code=company.corp_code, corp_name=company.corp_name, stock_code=company.stock_code, modify_date="20240101")
+    for company in generate_companies(3)
+]
+STORE = FixtureStore(generate_companies(3), missing_rate=0.0)
+
+class FakeDartApi:
+    def __init__(self, failing: set = frozenset()):
+        self.failing = failing
+        self.requests = []
+
+    async def fetch_raw_statement_items(self, corp_code: str, year: int, reprt_code: str, session=None) -> List[dict]:
+        self.requests.append((corp_code, year))
+        if (corp_code, year) in self.failing:
+            raise RuntimeError("DART 오류")
+        return STORE.statement_items(corp_code, str(year), reprt_code, BS_IS_ACCOUNTS)
+
+@pytest.fixture
+def saved_rows(monkeypatch):
+    rows = []
+
+    async def bulk_save_financial_statements(db_session, batch):
+        rows.extend(batch)
+
+    monkeypatch.setattr(backfill_service, "bulk_save_financial_statements", bulk_save_financial_statements)
+    return rows
+
+def backfill(tmp_path, session, dart: FakeDartApi, **options) -> BackfillService:
+    return BackfillService(
+        lambda: session,
+        dart_api=dart,
+        concurrency=2,
+        workers=1,
+        checkpoint_path=str(tmp_path / "backfill.checkpoint"),
+        compute_ratios=False,
+        report_interval=60,
+        **options
+    )
+
+def test_checkpoint_key_omits_annual_report_code():
+    assert BackfillCheckpoint.key("00126380", 2023) == "00126380:2023"
+    assert BackfillCheckpoint.key("00126380", 2023, "11012") == "00126380:2023:11012"
+
+def test_checkpoint_persists_marks_once(tmp_path):
+    path = str(tmp_path / "nested" / "backfill.checkpoint")
+    checkpoint = BackfillCheckpoint(path)
+    checkpoint.mark(["00126380:2022", "00126380:2023"])
+    checkpoint.mark(["00126380:2023", "00164779:2023"])
+
+    with open(path, encoding="utf-8") as f:
+        assert f.read().splitlines() == ["00126380:2022", "00126380:2023", "00164779:2023"]
+    reloaded = BackfillCheckpoint(path)
+    assert "00164779:2023" in reloaded
+    assert "00164779:2022" not in reloaded
+
+def test_run_resumes_from_checkpoint(tmp_path, session, saved_rows):
+    BackfillCheckpoint(str(tmp_path / "backfill.checkpoint")).mark(
+        [BackfillCheckpoint.key(COMPANIES[0].corp_code, 2022), BackfillCheckpoint.key(COMPANIES[1].corp_code, 2023)]
+    )
+    dart = FakeDartApi()
+    service = backfill(tmp_path, session, dart, batch_size=20)
+
+    result = asyncio.run(service.run(COMPANIES, [2022, 2023]))
+
+    assert sorted(dart.requests) == sorted(
+        (company.corp_code, year) for company in COMPANIES for year in (2022, 2023)
+        if (company.corp_code, year) not in {(COMPANIES[0].corp_code, 2022), (COMPANIES[1].corp_code, 2023)}
+    )
+    assert result["status"] == "success"
+    assert result["processed"] == 4
+    assert len(saved_rows) == 4 * len(BS_IS_ACCOUNTS)
+    # 작은 배치 크기로 여러 번 나눠 커밋해도 모든 작업이 체크포인트에 남음
+    assert session.commits >= 2
+    reloaded = BackfillCheckpoint(str(tmp_path / "backfill.checkpoint"))
+    assert all(BackfillCheckpoint.key(company.corp_code, year) in reloaded for company in COMPANIES for year in (2022, 2023))
+
+def test_failed_fetches_are_retried_on_next_run(tmp_path, session, saved_rows):
+    failing = {(COMPANIES[2].corp_code, 2023)}
+    first = backfill(tmp_path, session, FakeDartApi(failing))
+    result = asyncio.run(first.run(COMPANIES, [2023]))
+
+    assert result["status"] == "partial"
+    assert [(item["corp_code"], item["year"]) for item in result["failed"]] == list(failing)
+
+    dart = FakeDartApi()
+    asyncio.run(backfill(tmp_path, session, dart).run(COMPANIES, [2023]))
+    assert dart.requests == list(failing)
+
+def test_writer_failure_stops_run_without_checkpoint(tmp_path, session, monkeypatch):
+    async def bulk_save_financial_statements(db_session, batch):
+        raise RuntimeError("DB 오류")
+
+    monkeypatch.setattr(backfill_service, "bulk_save_financial_statements", bulk_save_financial_statements)
+    # 결과 큐가 가득 차도 조회 작업자가 멈춰 있지 않고 실패가 전달되어야 함
+    service = backfill(tmp_path, session, FakeDartApi(), batch_size=1)
+    companies = COMPANIES * 10
+
+    with pytest.raises(RuntimeError, match="DB 오류"):
+        asyncio.run(asyncio.wait_for(service.run(companies, range(2015, 2024)), timeout=30))
+    assert BackfillCheckpoint(str(tmp_path / "backfill.checkpoint")).completed == set()
@@ -0,0 +1,158 @@
+import time
+import asyncio
+
+import pytest
+
+from app.domin.fin.service import dart_api_service
+from app.domin.fin.service.company_info_service import CompanyInfoService
+from app.domin.fin.service.company_search import (
+    CompanySearchIndex,
+    normalize_company_name,
+    to_choseong,
+    to_jamo
+)
+from app.domin.fin.service.corp_code_index import MappedCorpCodeIndex
+from app.domin.fin.service.dart_api_service import DartApiService
+from loadtest.fixtures import WELL_KNOWN
+
+ENTRIES = WELL_KNOWN + [
+    ("20000001", "삼성전기", "009150"),
+    ("20000002", "삼성SDI", "006400"),
+    ("20000003", "㈜삼성전자서비스", ""),
+    ("20000004", "카카오뱅크", "323410"),
+    ("20000005", "카카오게임즈", ""),
+    ("20000006", "현대모비스", "012330"),
+    ("20000007", "LG전자", "066570"),
+    ("20000010", "㈜대한정밀", ""),
+    ("20000011", "대한정밀 주식회사", "")
+]
+
+@pytest.fixture
+def index() -> CompanySearchIndex:
+    return CompanySearchIndex(ENTRIES)
+
+def names(matches) -> list:
+    return [match.corp_name for match in matches]
+
+@pytest.mark.parametrize("name, expected", [
+    ("㈜삼성전자", "삼성전자"),
+    ("삼성 전자 (주)", "삼성전자"),
+    ("주식회사 카카오", "카카오"),
+    ("ＮＡＶＥＲ", "naver"),
+    ("SK-하이닉스", "sk하이닉스")
+])
+def test_normalize_company_name(name, expected):
+    assert normalize_company_name(name) == expected
+
+def test_hangul_decomposition():
+    assert to_choseong("삼성전자") == "ㅅㅅㅈㅈ"
+    assert to_jamo("전") == "ㅈㅓㄴ"
+    assert to_jamo("sk하") == "skㅎㅏ"
+
+@pytest.mark.parametrize("query", ["삼성전자", "삼성 전자(주)", "㈜삼성전자", "삼성전자 "])
+def test_exact_match_after_normalization(index, query):
+    best = index.search(query)[0]
+    assert (best.corp_name, best.score) == ("삼성전자", 1.0)
+    assert index.resolve(query) == "00126380"
+
+def test_prefix_autocomplete_ranks_exact_then_longer_names(index):
+    assert names(index.search("카카오")) == ["카카오", "카카오뱅크", "카카오게임즈"]
+    assert set(names(index.search("삼성", limit=4))) == {"삼성SDI", "삼성전자", "삼성물산", "삼성전기"}
+
+def test_choseong_query(index):
+    assert names(index.search("ㅋㅋㅇ")) == ["카카오", "카카오뱅크", "카카오게임즈"]
+    assert names(index.search("ㅅ ㅅ ㅈ ㅈ"))[0] == "삼성전자"
+
+def test_typo_and_substring_queries(index):
+    assert index.search("삼성젼자")[0].corp_name == "삼성전자"
+    assert index.resolve("삼성젼자") == "00126380"
+    assert index.resolve("하이닉스") == "00164779"
+
+def test_ambiguous_or_unknown_names_are_not_resolved(index):
+    assert index.resolve("삼성") is None
+    assert index.resolve("엘지전자") is None
+    assert index.resolve("") is None
+    assert index.search("삼성", limit=0) == []
+
+def test_exact_match_shared_by_several_companies_is_not_resolved(index):
+    assert [match.score for match in index.search("대한정밀", limit=2)] == [1.0, 1.0]
+    assert index.resolve("대한정밀") is None
+    assert index.resolve("(주)대한정밀") is None
+
+def test_diff_and_apply_updates_index(index):
+    entries = [entry for entry in ENTRIES if entry[0] != "20000004"]
+    entries = [("00258801", "카카오홀딩스", "035720") if entry[0] == "00258801" else entry for entry in entries]
+    entries.append(("20000008", "토스뱅크", ""))
+
+    removed, changed = index.diff(entries)
+    assert removed == ["20000004"]
+    assert sorted(changed) == [("00258801", "카카오홀딩스", "035720"), ("20000008", "토스뱅크", "")]
+
+    index.apply(removed, changed)
+    assert len(index) == len(entries)
+    assert "카카오뱅크" not in names(index.search("카카오"))
+    assert index.search("카카오홀딩스")[0].corp_code == "00258801"
+    assert index.resolve("토스뱅크") == "20000008"
+    assert index.diff(entries) == ([], [])
+
+def test_compaction_keeps_results(index):
+    survivors = ENTRIES[:5]
+    index.apply(*index.diff(survivors))
+
+    assert len(index) == 5
+    assert len(index._codes) == 5
+    assert names(index.search("삼성")) == ["삼성전자"]
+
+class OfflineDartApi(DartApiService):
+    async def download_corp_code_zip(self) -> bytes:
+        raise AssertionError("유효 기간 안의 인덱스 파일이 있으면 다운로드하지 않아야 함")
+
+@pytest.fixture
+def dart_api(tmp_path, monkeypatch) -> OfflineDartApi:
+    path = str(tmp_path / "CORPCODE.idx")
+    MappedCorpCodeIndex.compile(((code, name, stock, "20240101") for code, name, stock in ENTRIES), path)
+    monkeypatch.setattr(dart_api_service.settings, "CORP_CODE_INDEX_FILE", path)
+    return OfflineDartApi(api_key="test")
+
+@pytest.mark.parametrize("company_name, corp_code", [
+    ("삼성전자", "00126380"),
+    ("삼성전자(주)", "00126380"),
+    ("삼성젼자", "00126380"),
+    ("naver", "00266961")
+])
+def test_fetch_company_info_resolves_name(dart_api, company_name, corp_code):
+    assert asyncio.run(dart_api.fetch_company_info(company_name)).corp_code == corp_code
+
+def test_fetch_company_info_lists_candidates_when_ambiguous(dart_api):
+    with pytest.raises(ValueError, match="후보: .*삼성전자"):
+        asyncio.run(dart_api.fetch_company_info("삼성"))
+
+def test_company_info_service_resolves_without_database(session, dart_api):
+    # FakeSession에는 execute가 없으므로 fin_data를 조회하면 실패함
+    company = asyncio.run(CompanyInfoService(session, dart_api).get_company_info("삼성 전자"))
+    assert company.corp_code == "00126380"
+
+def test_fetch_company_info_lists_companies_sharing_normalized_name(dart_api):
+    with pytest.raises(ValueError, match="후보: .*대한정밀"):
+        asyncio.run(dart_api.fetch_company_info("대한정밀"))
+    # 원래 이름 그대로면 고유번호 인덱스에서 바로 찾음
+    assert asyncio.run(dart_api.fetch_company_info("대한정밀 주식회사")).corp_code == "20000011"
+
+def test_search_index_follows_corp_code_refresh(dart_api):
+    async def run():
+        first = await dart_api.fetch_company_search_index()
+        assert await dart_api.fetch_company_search_index() is first
+
+        # 고유번호 인덱스가 바뀌면 같은 색인에 차이만 반영
+        path = dart_api_service.settings.CORP_CODE_INDEX_FILE
+        MappedCorpCodeIndex.compile([("20000009", "새회사", "", "20240102")] + [
+            (code, name, stock, "20240101") for code, name, stock in ENTRIES
+        ], path)
+        dart_api._corp_code_loaded_at = time.monotonic() - dart_api_service.CORP_CODE_CACHE_SECONDS - 1
+        updated = await dart_api.fetch_company_search_index()
+        return first, updated
+
+    first, updated = asyncio.run(run())
+
+    assert updated is first
+    assert updated.resolve("새회사") == "20000009"
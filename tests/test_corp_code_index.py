@@ -0,0 +1,150 @@
+import os
+import time
+import asyncio
+
+import pytest
+
+from app.domin.fin.models.schemas import CompanyInfo
+from app.domin.fin.service import dart_api_service
+from app.domin.fin.service.corp_code_index import CorpCodeIndex, MappedCorpCodeIndex, read_corp_codes
+from app.domin.fin.service.dart_api_service import CORP_CODE_CACHE_SECONDS, DartApiService
+from loadtest.fixtures import Company, corp_code_zip, generate_companies
+
+# 같은 이름의 회사(앞 항목이 우선), 같은 회사 코드의 중복 항목(뒤 항목이 우선), 비상장/다국어 이름 포함
+COMPANIES = generate_companies(60) + [
+    Company("20000001", "삼성전자", ""),
+    Company("20000002", "가나다", "123456"),
+    Company("20000003", "ABC Holdings", ""),
+    Company("20000002", "가나다라", "654321"),
+    Company("20000004", "Ｆｕｌｌｗｉｄｔｈ㈜", "")
+]
+
+@pytest.fixture(scope="module")
+def source(tmp_path_factory) -> str:
+    path = tmp_path_factory.mktemp("corp_code") / "CORPCODE.zip"
+    path.write_bytes(corp_code_zip(COMPANIES))
+    return str(path)
+
+@pytest.fixture(scope="module")
+def indexes(source, tmp_path_factory):
+    """(사전 기반 기준 인덱스, 매핑 인덱스)
+
+    매핑 인덱스는 중복된 회사 코드의 이전 항목을 버리므로 기준 인덱스도 회사 코드별 마지막 항목으로 만듦
+    """
+    latest = {company.corp_code: position for position, company in enumerate(COMPANIES)}
+    reference = CorpCodeIndex(
+        CompanyInfo(corp_code=company.corp_code, corp_name=company.corp_name, stock_code=company.stock_code, modify_date="20240101")
+        for position, company in enumerate(COMPANIES) if latest[company.corp_code] == position
+    )
+    mapped = MappedCorpCodeIndex.from_file(source, str(tmp_path_factory.mktemp("index") / "CORPCODE.idx"))
+    yield reference, mapped
+    mapped.close()
+
+def test_mapped_index_deduplicates_codes(indexes):
+    _, mapped = indexes
+    assert len(mapped) == len({company.corp_code for company in COMPANIES})
+
+@pytest.mark.parametrize("name", sorted({company.corp_name for company in COMPANIES}) + [
+    "", "가", "가나", "삼성", "삼성전자우", "zzz", "￿", "부하테스트99999"
+])
+def test_get_by_name_matches_dict_index(indexes, name):
+    reference, mapped = indexes
+    assert mapped.get(name) == reference.get(name)
+
+@pytest.mark.parametrize("corp_code", sorted({company.corp_code for company in COMPANIES}) + [
+    "", "0", "00000000", "99999999", "0012638", "001263800", "한글코드"
+])
+def test_get_by_code_matches_dict_index(indexes, corp_code):
+    reference, mapped = indexes
+    assert mapped.get_by_code(corp_code) == reference.get_by_code(corp_code)
+
+def test_duplicate_rules(indexes):
+    _, mapped = indexes
+    # 같은 회사명은 원본 파일상 첫 항목, 같은 회사 코드는 마지막 항목
+    assert mapped.get("삼성전자").corp_code == "00126380"
+    assert mapped.get_by_code("20000002").corp_name == "가나다라"
+    assert mapped.get("가나다") is None
+
+def test_listed_and_entries(indexes):
+    reference, mapped = indexes
+    assert mapped.listed() == sorted(reference.listed(), key=lambda company: company.corp_code)
+    assert sorted(mapped.entries()) == sorted(reference.entries())
+
+def test_from_file_recompiles_only_when_source_is_newer(source, tmp_path):
+    path = str(tmp_path / "CORPCODE.idx")
+    MappedCorpCodeIndex.from_file(source, path).close()
+    compiled_at = os.path.getmtime(path)
+
+    MappedCorpCodeIndex.from_file(source, path).close()
+    assert os.path.getmtime(path) == compiled_at
+
+    os.utime(source, (compiled_at + 10, compiled_at + 10))
+    MappedCorpCodeIndex.from_file(source, path).close()
+    assert os.path.getmtime(path) > compiled_at
+
+def test_rejects_files_of_other_format(tmp_path):
+    path = tmp_path / "CORPCODE.idx"
+    path.write_bytes(b"NOTANIDX" + bytes(32))
+    with pytest.raises(ValueError):
+        MappedCorpCodeIndex(str(path))
+
+def test_read_corp_codes_from_zip(source):
+    entries = read_corp_codes(source)
+    assert entries[0] == ("00126380", "삼성전자", "005930", "20240101")
+    assert len(entries) == len(COMPANIES)
+
+class CountingDartApi(DartApiService):
+    """고유번호 zip 다운로드 횟수를 세는 DART 클라이언트"""
+
+    downloads = 0
+
+    async def download_corp_code_zip(self) -> bytes:
+        type(self).downloads += 1
+        # 다른 작업자가 잠금을 기다리는 동안 다운로드가 진행 중이도록 잠시 양보
+        await asyncio.sleep(0.05)
+        return corp_code_zip(COMPANIES[:20])
+
+@pytest.fixture
+def index_file(tmp_path, monkeypatch) -> str:
+    path = str(tmp_path / "CORPCODE.idx")
+    monkeypatch.setattr(dart_api_service.settings, "CORP_CODE_INDEX_FILE", path)
+    monkeypatch.setattr(dart_api_service, "CORP_CODE_LOCK_POLL_SECONDS", 0.01)
+    monkeypatch.setattr(CountingDartApi, "downloads", 0)
+    return path
+
+def test_concurrent_workers_download_once(index_file):
+    async def run():
+        # 작업자 프로세스마다 따로 있는 클라이언트를 흉내 냄 (프로세스 내 잠금은 공유하지 않음)
+        clients = [CountingDartApi(api_key="test") for _ in range(4)]
+        return await asyncio.gather(*(client.fetch_corp_code_index() for client in clients))
+
+    results = asyncio.run(run())
+
+    assert CountingDartApi.downloads == 1
+    assert all(len(index) == 20 for index in results)
+
+def test_expired_mapping_remaps_fresh_file_without_download(index_file):
+    client = CountingDartApi(api_key="test")
+    asyncio.run(client.fetch_corp_code_index())
+
+    # 다른 작업자가 방금 만든 파일이 있으면 자신의 매핑이 만료되어도 다운로드하지 않음
+    client._corp_code_loaded_at -= CORP_CODE_CACHE_SECONDS + 1
+    MappedCorpCodeIndex.compile(
+        ((company.corp_code, company.corp_name, company.stock_code, "20240101") for company in COMPANIES[:30]),
+        index_file
+    )
+    index = asyncio.run(client.fetch_corp_code_index())
+
+    assert CountingDartApi.downloads == 1
+    assert len(index) == 30
+
+def test_expired_file_is_downloaded_again(index_file):
+    client = CountingDartApi(api_key="test")
+    asyncio.run(client.fetch_corp_code_index())
+    client._corp_code_loaded_at -= CORP_CODE_CACHE_SECONDS + 1
+    expired = time.time() - CORP_CODE_CACHE_SECONDS - 1
+    os.utime(index_file, (expired, expired))
+
+    asyncio.run(client.fetch_corp_code_index())
+
+    assert CountingDartApi.downloads == 2
@@ -0,0 +1,201 @@
+import asyncio
+from typing import Dict, List, Optional
+
+import pytest
+
+from app.domin.fin.models.schemas import Disclosure, DisclosureListResponse, SyncTarget
+from app.domin.fin.service import disclosure_sync_service, job_handlers
+from app.domin.fin.service.disclosure_sync_service import DisclosureSyncService, SYNC_NAME
+from app.domin.fin.service.job_handlers import SYNC_REPORT_JOB
+
+def disclosure(rcept_no: str, report_nm: str, corp_code: str = "00126380", stock_code: str = "005930") -> Disclosure:
+    return Disclosure(
+        corp_code=corp_code,
+        corp_name=f"회사{corp_code}",
+        stock_code=stock_code,
+        report_nm=report_nm,
+        rcept_no=rcept_no,
+        rcept_dt=rcept_no[:8]
+    )
+
+class FakeDartApi:
+    """공시목록을 page_size건씩 나눠 돌려주는 DART 대역"""
+
+    def __init__(self, disclosures: List[Disclosure], page_size: int = 2):
+        self.disclosures = disclosures
+        self.page_size = page_size
+        self.requests = []
+
+    async def fetch_disclosure_list(self, bgn_de: str, end_de: str, page_no: int = 1) -> DisclosureListResponse:
+        self.requests.append((bgn_de, end_de, page_no))
+        start = (page_no - 1) * self.page_size
+        total_page = max(1, -(-len(self.disclosures) // self.page_size))
+        return DisclosureListResponse(
+            status="000",
+            message="정상",
+            page_no=page_no,
+            total_page=total_page,
+            total_count=len(self.disclosures),
+            list=self.disclosures[start:start + self.page_size]
+        )
+
+class FakeJobQueue:
+    """등록된 작업을 기록하는 작업 큐 대역. 같은 중복 제거 키는 기존 작업을 돌려줌"""
+
+    def __init__(self):
+        self.jobs: Dict[str, dict] = {}
+
+    async def enqueue(self, job_type, payload, priority=0, dedup_key=None, max_attempts=3) -> dict:
+        if dedup_key in self.jobs:
+            return {**self.jobs[dedup_key], "deduplicated": True}
+        job = {"id": len(self.jobs) + 1, "job_type": job_type, "payload": payload}
+        self.jobs[dedup_key] = job
+        return {**job, "deduplicated": False}
+
+@pytest.fixture
+def sync_state(monkeypatch):
+    """기준점 저장소 대역. state에 기준점을 넣고 saved로 저장된 값을 확인합니다."""
+    store: Dict[str, Optional[dict]] = {"state": None, "saved": None}
+
+    async def get_sync_state(db_session, name):
+        assert name == SYNC_NAME
+        return store["state"]
+
+    async def save_sync_state(db_session, name, last_rcept_dt, last_rcept_no):
+        store["saved"] = (last_rcept_dt, last_rcept_no)
+
+    monkeypatch.setattr(disclosure_sync_service, "get_sync_state", get_sync_state)
+    monkeypatch.setattr(disclosure_sync_service, "save_sync_state", save_sync_state)
+    return store
+
+@pytest.mark.parametrize("report_nm, expected", [
+    ("사업보고서 (2023.12)", ("2023", "11011")),
+    ("[기재정정]반기보고서 (2024.06)", ("2024", "11012")),
+    ("분기보고서 (2024.03)", ("2024", "11013")),
+    ("분기보고서 (2024.09)", ("2024", "11014")),
+    ("분기보고서 (2024.05)", None),
+    ("주요사항보고서(자기주식취득결정)", None)
+])
+def test_parse_report(report_nm, expected):
+    assert DisclosureSyncService.parse_report(disclosure("20240101000001", report_nm)) == expected
+
+def test_collect_targets_keeps_only_new_periodic_reports_after_checkpoint(session, sync_state):
+    sync_state["state"] = {"last_rcept_dt": "20240312", "last_rcept_no": "20240312000002"}
+    dart = FakeDartApi([
+        disclosure("20240312000001", "사업보고서 (2023.12)", corp_code="00000001"),
+        disclosure("20240312000002", "사업보고서 (2023.12)", corp_code="00000002"),
+        disclosure("20240312000003", "사업보고서 (2023.12)", corp_code="00000003"),
+        disclosure("20240313000001", "사업보고서 (2023.12)", corp_code="00000004", stock_code=" "),
+        disclosure("20240313000002", "주요사항보고서(유상증자결정)", corp_code="00000005"),
+        disclosure("20240314000001", "분기보고서 (2024.03)", corp_code="00000006")
+    ])
+    service = DisclosureSyncService(session, dart)
+
+    targets, disclosures = asyncio.run(service.collect_targets())
+
+    # 기준점 당일부터 모든 페이지를 조회
+    assert [request[0] for request in dart.requests] == ["20240312"] * 3
+    assert [request[2] for request in dart.requests] == [1, 2, 3]
+    # 기준 접수번호 이하는 제외하고, 비상장/비정기 보고서는 대상에서만 빠짐
+    assert [item.rcept_no for item in disclosures] == [
+        "20240312000003", "20240313000001", "20240313000002", "20240314000001"
+    ]
+    assert [(target.corp_code, target.bsns_year, target.reprt_code) for target in targets] == [
+        ("00000003", "2023", "11011"),
+        ("00000006", "2024", "11013")
+    ]
+
+def test_collect_targets_merges_amendments_to_latest_filing(session, sync_state):
+    dart = FakeDartApi([
+        disclosure("20240320000001", "[기재정정]사업보고서 (2023.12)"),
+        disclosure("20240312000001", "사업보고서 (2023.12)"),
+        disclosure("20240315000001", "반기보고서 (2023.06)")
+    ], page_size=10)
+    service = DisclosureSyncService(session, dart)
+
+    targets, _ = asyncio.run(service.collect_targets())
+
+    assert [(target.reprt_code, target.rcept_no, target.amended) for target in targets] == [
+        ("11012", "20240315000001", False),
+        ("11011", "20240320000001", True)
+    ]
+
+def test_collect_targets_marks_refiled_period_as_amended(session, sync_state):
+    dart = FakeDartApi([
+        disclosure("20240312000001", "사업보고서 (2023.12)"),
+        disclosure("20240320000001", "사업보고서 (2023.12)")
+    ], page_size=10)
+
+    targets, _ = asyncio.run(DisclosureSyncService(session, dart).collect_targets())
+
+    assert len(targets) == 1
+    assert targets[0].rcept_no == "20240320000001"
+    assert targets[0].amended is True
+
+def test_sync_enqueues_reports_and_advances_checkpoint(session, sync_state):
+    dart = FakeDartApi([
+        disclosure("20240312000001", "사업보고서 (2023.12)", corp_code="00000001"),
+        disclosure("20240313000001", "주요사항보고서(유상증자결정)", corp_code="00000002"),
+        disclosure("20240314000001", "반기보고서 (2024.06)", corp_code="00000003")
+    ])
+    service = DisclosureSyncService(session, dart)
+    service.job_queue = FakeJobQueue()
+
+    result = asyncio.run(service.sync())
+
+    assert result["status"] == "success"
+    assert [(item["corp_code"], item["job_id"]) for item in result["enqueued"]] == [("00000001", 1), ("00000003", 2)]
+    job = service.job_queue.jobs["sync_report:00000001:2023:11011:20240312000001"]
+    assert (job["job_type"], job["payload"]["rcept_dt"]) == (SYNC_REPORT_JOB, "20240312")
+    # 수집 대상이 아닌 공시도 기준점에 포함되고, 재수집 결과를 기다리지 않고 전진
+    assert sync_state["saved"] == ("20240314", "20240314000001")
+
+def test_sync_deduplicates_reports_already_queued(session, sync_state):
+    dart = FakeDartApi([disclosure("20240312000001", "사업보고서 (2023.12)")])
+    service = DisclosureSyncService(session, dart)
+    service.job_queue = FakeJobQueue()
+
+    asyncio.run(service.sync())
+    result = asyncio.run(service.sync())
+
+    assert len(service.job_queue.jobs) == 1
+    assert result["enqueued"][0]["deduplicated"] is True
+
+def test_sync_without_new_disclosures_keeps_checkpoint(session, sync_state):
+    service = DisclosureSyncService(session, FakeDartApi([]))
+    service.job_queue = FakeJobQueue()
+
+    result = asyncio.run(service.sync())
+
+    assert result["enqueued"] == []
+    assert sync_state["saved"] is None
+
+class RecordingEventBus:
+    def __init__(self):
+        self.events = []
+
+    async def publish(self, event_type, **data):
+        self.events.append((event_type, data))
+
+class FakeContext:
+    def __init__(self, session, event_bus):
+        self.event_bus = event_bus
+        self.session_factory = lambda: session
+
+def test_sync_report_job_ingests_period_and_publishes_filing(session, monkeypatch):
+    ingested = []
+
+    async def ingest_statements(self, company_info, year, reprt_code="11011", on_progress=None):
+        ingested.append((company_info.corp_code, company_info.modify_date, year, reprt_code))
+        return 10
+
+    monkeypatch.setattr(job_handlers.FinancialStatementService, "ingest_statements", ingest_statements)
+    bus = RecordingEventBus()
+    target = SyncTarget(corp_code="00126380", corp_name="삼성전자", stock_code="005930", bsns_year="2023",
+                        reprt_code="11011", rcept_no="20240312000001", rcept_dt="20240312")
+
+    result = asyncio.run(job_handlers.handle_sync_report(target.model_dump(), FakeContext(session, bus)))
+
+    assert ingested == [("00126380", "20240312", 2023, "11011")]
+    assert result == {"corp_code": "00126380", "rcept_no": "20240312000001", "rows": 10}
+    assert bus.events == [("filing", {**target.model_dump(), "rows": 10})]
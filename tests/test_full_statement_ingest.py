@@ -0,0 +1,113 @@
+import asyncio
+from typing import Dict, List
+
+import pytest
+
+from app.domin.fin.models.schemas import CompanyInfo
+from app.domin.fin.service import financial_statement_service
+from app.domin.fin.service.financial_data_processor import validate_statement_items
+from app.domin.fin.service.financial_statement_service import FinancialStatementService
+from loadtest.fixtures import BS_IS_ACCOUNTS, FixtureStore, generate_companies
+
+COMPANY = generate_companies(1)[0]
+COMPANY_INFO = CompanyInfo(corp_code=COMPANY.corp_code, corp_name=COMPANY.corp_name, stock_code=COMPANY.stock_code, modify_date="20240101")
+
+class StreamingDartApi:
+    """구분(CFS/OFS)별로 정해 둔 배치를 차례로 돌려주는 전체 재무제표 스트림 대역
+
+    error가 있으면 첫 배치를 돌려준 뒤 예외를 냄 (응답 도중 실패)
+    """
+
+    def __init__(self, batches: Dict[str, List[List[dict]]], error: Exception = None):
+        self.batches = batches
+        self.error = error
+        self.requested: List[str] = []
+
+    async def stream_full_statements(self, corp_code, year, reprt_code="11011", fs_div="CFS", batch_size=500):
+        self.requested.append(fs_div)
+        for items in self.batches.get(fs_div, []):
+            yield validate_statement_items(items)
+            if self.error is not None:
+                raise self.error
+
+class FakeRecomputeService:
+    def __init__(self, graph):
+        self.graph = graph
+        self.applied = []
+
+    async def snapshot(self, corp_code, bsns_year, reprt_code):
+        return []
+
+    async def apply_changes(self, corp_code, corp_name, bsns_year, reprt_code="11011", changes=None):
+        self.applied.append((bsns_year, reprt_code, len(changes)))
+        return []
+
+def items(fs_div: str) -> List[dict]:
+    return FixtureStore([COMPANY]).statement_items(COMPANY.corp_code, "2023", "11011", BS_IS_ACCOUNTS, fs_div=fs_div)
+
+@pytest.fixture
+def store(monkeypatch):
+    """저장소 함수가 기록하는 호출 (delete: 삭제한 기간, rows: 저장한 행)"""
+    calls = {"delete": [], "rows": []}
+
+    async def delete_period_statements(db_session, corp_code, bsns_year, reprt_code):
+        calls["delete"].append((corp_code, bsns_year, reprt_code))
+
+    async def bulk_save_financial_statements(db_session, rows):
+        calls["rows"].extend(rows)
+        return len(rows)
+
+    monkeypatch.setattr(financial_statement_service, "delete_period_statements", delete_period_statements)
+    monkeypatch.setattr(financial_statement_service, "bulk_save_financial_statements", bulk_save_financial_statements)
+    return calls
+
+def make_service(session, dart_api) -> FinancialStatementService:
+    service = FinancialStatementService(session, dart_api)
+    service.ratio_recompute_service = FakeRecomputeService(service.ratio_recompute_service.graph)
+    return service
+
+def test_saves_stream_in_one_transaction(session, store):
+    dart_api = StreamingDartApi({"CFS": [items("CFS")]})
+    service = make_service(session, dart_api)
+
+    saved = asyncio.run(service.ingest_full_statements(COMPANY_INFO, 2023))
+
+    assert saved == len(BS_IS_ACCOUNTS)
+    assert dart_api.requested == ["CFS"]
+    assert store["delete"] == [(COMPANY.corp_code, "2023", "11011")]
+    assert (session.commits, session.rollbacks) == (1, 0)
+    assert service.ratio_recompute_service.applied[0][:2] == ("2023", "11011")
+
+def test_empty_stream_keeps_existing_statements(session, store):
+    dart_api = StreamingDartApi({})
+    service = make_service(session, dart_api)
+
+    assert asyncio.run(service.ingest_full_statements(COMPANY_INFO, 2023)) == 0
+
+    # 연결/개별 모두 없으면(013) 기존 데이터를 지우지 않고 재무비율도 다시 계산하지 않음
+    assert dart_api.requested == ["CFS", "OFS"]
+    assert store["delete"] == []
+    assert (session.commits, session.rollbacks) == (0, 1)
+    assert service.ratio_recompute_service.applied == []
+
+def test_falls_back_to_separate_statements(session, store):
+    dart_api = StreamingDartApi({"OFS": [items("OFS")]})
+    service = make_service(session, dart_api)
+
+    saved = asyncio.run(service.ingest_full_statements(COMPANY_INFO, 2023))
+
+    assert saved == len(BS_IS_ACCOUNTS)
+    assert dart_api.requested == ["CFS", "OFS"]
+    assert session.commits == 1
+
+def test_stream_error_rolls_back_delete(session, store):
+    dart_api = StreamingDartApi({"CFS": [items("CFS")]}, error=RuntimeError("연결 끊김"))
+    service = make_service(session, dart_api)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(service.ingest_full_statements(COMPANY_INFO, 2023))
+
+    # 삭제는 실행됐지만 커밋 전에 롤백되므로 기존 데이터가 남음
+    assert len(store["delete"]) == 1
+    assert (session.commits, session.rollbacks) == (0, 1)
+    assert service.ratio_recompute_service.applied == []
@@ -0,0 +1,280 @@
+import os
+import uuid
+import asyncio
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from app.platform.messaging import job_queue
+from app.platform.messaging.job_queue import JobContext, JobOwnershipLost, JobQueue, JobWorkerPool
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+def make_job(**overrides) -> Dict[str, Any]:
+    job = {
+        "id": 1,
+        "job_type": "ingest_financial",
+        "payload": {"company_name": "삼성전자"},
+        "attempts": 1,
+        "max_attempts": 3,
+        "locked_by": "host:1:0"
+    }
+    job.update(overrides)
+    return job
+
+class FakeEventBus:
+    def __init__(self):
+        self.events = []
+
+    async def publish(self, event_type: str, **data) -> None:
+        self.events.append((event_type, data))
+
+class FakeJobRepository:
+    """job_queue 모듈이 쓰는 저장소 함수 대역. owned가 False면 작업이 회수된 것으로 응답합니다."""
+
+    def __init__(self, monkeypatch, owned: bool = True):
+        self.owned = owned
+        self.calls: List[tuple] = []
+        for name in ("update_job_progress", "complete_job", "fail_job"):
+            monkeypatch.setattr(job_queue, name, self._recorder(name))
+
+    def _recorder(self, name: str):
+        async def record(db_session, *args):
+            self.calls.append((name, *args))
+            return self.owned
+        return record
+
+    def named(self, name: str) -> List[tuple]:
+        return [call for call in self.calls if call[0] == name]
+
+def test_enqueue_returns_active_job_for_duplicate_key(session, monkeypatch):
+    existing = make_job(id=7, status="running")
+
+    async def insert_job(db_session, *args):
+        return None
+
+    async def get_active_job_by_dedup_key(db_session, dedup_key):
+        assert dedup_key == "ingest:00126380:2023"
+        return existing
+
+    monkeypatch.setattr(job_queue, "insert_job", insert_job)
+    monkeypatch.setattr(job_queue, "get_active_job_by_dedup_key", get_active_job_by_dedup_key)
+
+    job = asyncio.run(JobQueue(session).enqueue("ingest_financial", {}, dedup_key="ingest:00126380:2023"))
+
+    assert job["id"] == 7
+    assert job["deduplicated"] is True
+
+def test_enqueue_retries_when_duplicate_finished_meanwhile(session, monkeypatch):
+    inserted = iter([None, 8])
+
+    async def insert_job(db_session, *args):
+        return next(inserted)
+
+    async def get_active_job_by_dedup_key(db_session, dedup_key):
+        return None
+
+    async def get_job(db_session, job_id):
+        return make_job(id=job_id, status="queued")
+
+    monkeypatch.setattr(job_queue, "insert_job", insert_job)
+    monkeypatch.setattr(job_queue, "get_active_job_by_dedup_key", get_active_job_by_dedup_key)
+    monkeypatch.setattr(job_queue, "get_job", get_job)
+
+    job = asyncio.run(JobQueue(session).enqueue("ingest_financial", {}, dedup_key="ingest:00126380:2023"))
+
+    assert job["id"] == 8
+    assert job["deduplicated"] is False
+    assert session.commits == 2
+
+def test_report_raises_when_job_was_reclaimed(session, monkeypatch):
+    repository = FakeJobRepository(monkeypatch, owned=False)
+    event_bus = FakeEventBus()
+    context = JobContext(make_job(), lambda: session, event_bus)
+
+    with pytest.raises(JobOwnershipLost):
+        asyncio.run(context.report(0.5, "저장"))
+    assert repository.named("update_job_progress") == [("update_job_progress", 1, "host:1:0", 0.5, "저장")]
+    assert event_bus.events == []
+
+def pool(session, handler, event_bus=None, **options) -> JobWorkerPool:
+    return JobWorkerPool(lambda: session, {"ingest_financial": handler}, event_bus=event_bus, **options)
+
+def test_run_job_completes_as_claiming_worker(session, monkeypatch):
+    repository = FakeJobRepository(monkeypatch)
+    event_bus = FakeEventBus()
+
+    async def handler(payload, context):
+        await context.report(0.5)
+        return {"rows": 3}
+
+    asyncio.run(pool(session, handler, event_bus).run_job(make_job()))
+
+    assert repository.named("complete_job") == [("complete_job", 1, "host:1:0", {"rows": 3})]
+    assert [event for event, _ in event_bus.events] == ["job_progress", "job_completed"]
+
+def test_run_job_does_not_publish_completion_of_reclaimed_job(session, monkeypatch):
+    repository = FakeJobRepository(monkeypatch, owned=False)
+    event_bus = FakeEventBus()
+
+    async def handler(payload, context):
+        return {"rows": 3}
+
+    asyncio.run(pool(session, handler, event_bus).run_job(make_job()))
+
+    assert len(repository.named("complete_job")) == 1
+    assert event_bus.events == []
+
+@pytest.mark.parametrize("attempts, expected_delay", [(1, 5.0), (2, 10.0), (3, None)])
+def test_run_job_retries_with_backoff_until_max_attempts(session, monkeypatch, attempts, expected_delay):
+    repository = FakeJobRepository(monkeypatch)
+    event_bus = FakeEventBus()
+
+    async def handler(payload, context):
+        raise RuntimeError("DART 오류")
+
+    asyncio.run(pool(session, handler, event_bus, retry_base_delay=5.0).run_job(make_job(attempts=attempts)))
+
+    assert repository.named("fail_job") == [("fail_job", 1, "host:1:0", "DART 오류", expected_delay)]
+    assert event_bus.events[-1][1]["will_retry"] is (expected_delay is not None)
+
+def test_run_job_stops_without_recording_when_ownership_lost(session, monkeypatch):
+    repository = FakeJobRepository(monkeypatch, owned=False)
+
+    async def handler(payload, context):
+        await context.report(0.1)
+        raise AssertionError("회수된 뒤에는 실행되지 않아야 함")
+
+    asyncio.run(pool(session, handler).run_job(make_job()))
+
+    assert repository.named("complete_job") == []
+    assert repository.named("fail_job") == []
+
+def test_heartbeat_extends_lock_while_handler_runs(session, monkeypatch):
+    repository = FakeJobRepository(monkeypatch)
+
+    async def handler(payload, context):
+        await asyncio.sleep(0.2)
+        return {}
+
+    asyncio.run(pool(session, handler, stale_timeout=0.15).run_job(make_job()))
+
+    heartbeats = repository.named("update_job_progress")
+    assert len(heartbeats) >= 2
+    assert all(call[1:] == (1, "host:1:0") for call in heartbeats)
+
+# Postgres 통합 테스트: 중복 제거 부분 유일 인덱스, SKIP LOCKED, 응답 없는 작업 회수는 실제 DB에서만 확인할 수 있음
+postgres = pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL이 없으면 Postgres 테스트를 건너뜀")
+
+def job_queue_ddl() -> List[str]:
+    """.sql 스크립트에서 job_queue 테이블과 인덱스 생성문만 꺼냅니다."""
+    script = (Path(__file__).resolve().parent.parent / ".sql").read_text(encoding="utf-8")
+    statements = []
+    for statement in script.split(";"):
+        lines = [line for line in statement.splitlines() if not line.strip().startswith("--")]
+        statement = "\n".join(lines).strip()
+        if statement.startswith("CREATE") and " job_queue " in f"{statement} ":
+            statements.append(statement)
+    return statements
+
+def run_with_database(body) -> None:
+    """테스트마다 새 스키마에 job_queue를 만들고 세션 팩토리를 넘겨 실행한 뒤 스키마를 지웁니다."""
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    schema = f"test_job_queue_{uuid.uuid4().hex[:8]}"
+
+    async def run() -> None:
+        engine = create_async_engine(TEST_DATABASE_URL, connect_args={"server_settings": {"search_path": schema}})
+        try:
+            async with engine.begin() as connection:
+                await connection.exec_driver_sql(f"CREATE SCHEMA {schema}")
+                for statement in job_queue_ddl():
+                    await connection.exec_driver_sql(statement)
+            await body(async_sessionmaker(engine, expire_on_commit=False))
+        finally:
+            async with engine.begin() as connection:
+                await connection.exec_driver_sql(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+            await engine.dispose()
+
+    asyncio.run(run())
+
+@postgres
+def test_dedup_key_is_unique_only_while_active():
+    from app.platform.messaging.job_repository import claim_next_job, complete_job, insert_job
+
+    async def body(session_factory) -> None:
+        async with session_factory() as session:
+            first = await insert_job(session, "ingest_financial", {}, dedup_key="ingest:1")
+            assert first is not None
+            assert await insert_job(session, "ingest_financial", {}, dedup_key="ingest:1") is None
+            assert await insert_job(session, "ingest_financial", {}, dedup_key="ingest:2") is not None
+            await session.commit()
+
+            job = await claim_next_job(session, "worker-a")
+            assert job["id"] == first
+            # 실행 중에도 중복으로 보고, 끝난 뒤에는 같은 키로 다시 추가할 수 있음
+            assert await insert_job(session, "ingest_financial", {}, dedup_key="ingest:1") is None
+            assert await complete_job(session, first, "worker-a", {"rows": 1})
+            assert await insert_job(session, "ingest_financial", {}, dedup_key="ingest:1") is not None
+            await session.commit()
+
+    run_with_database(body)
+
+@postgres
+def test_concurrent_claims_skip_locked_rows():
+    from app.platform.messaging.job_repository import claim_next_job, insert_job
+
+    async def body(session_factory) -> None:
+        async with session_factory() as session:
+            low = await insert_job(session, "ingest_financial", {}, priority=0)
+            high = await insert_job(session, "ingest_financial", {}, priority=5)
+            await session.commit()
+
+        # 첫 작업자의 트랜잭션이 열려 있는 동안 두 번째 작업자는 잠긴 행을 기다리지 않고 다음 행을 가져감
+        async with session_factory() as first_session, session_factory() as second_session:
+            first = await claim_next_job(first_session, "worker-a")
+            second = await asyncio.wait_for(claim_next_job(second_session, "worker-b"), timeout=5)
+            assert (first["id"], second["id"]) == (high, low)
+            assert await claim_next_job(second_session, "worker-b") is None
+            await first_session.commit()
+            await second_session.commit()
+
+    run_with_database(body)
+
+@postgres
+def test_stale_jobs_are_requeued_and_old_owner_cannot_finish():
+    from sqlalchemy import text
+    from app.platform.messaging.job_repository import (
+        claim_next_job, complete_job, get_job, insert_job, requeue_stale_jobs, update_job_progress
+    )
+
+    async def expire(session, job_id: int) -> None:
+        await session.execute(
+            text("UPDATE job_queue SET locked_at = CURRENT_TIMESTAMP - INTERVAL '1 hour' WHERE id = :job_id"),
+            {"job_id": job_id}
+        )
+
+    async def body(session_factory) -> None:
+        async with session_factory() as session:
+            retried = await insert_job(session, "ingest_financial", {}, max_attempts=2)
+            exhausted = await insert_job(session, "ingest_financial", {}, max_attempts=1)
+            fresh = await insert_job(session, "ingest_financial", {})
+            for worker_id in ("worker-a", "worker-b", "worker-c"):
+                await claim_next_job(session, worker_id)
+            await expire(session, retried)
+            await expire(session, exhausted)
+            await session.commit()
+
+            assert await requeue_stale_jobs(session, 60) == 2
+            await session.commit()
+
+            statuses = {job_id: (await get_job(session, job_id))["status"] for job_id in (retried, exhausted, fresh)}
+            assert statuses == {retried: "queued", exhausted: "failed", fresh: "running"}
+            # 회수된 작업은 원래 작업자가 완료/하트비트를 기록할 수 없음
+            assert not await complete_job(session, retried, "worker-a", {})
+            assert not await update_job_progress(session, retried, "worker-a")
+            assert await update_job_progress(session, fresh, "worker-c", 0.5)
+            await session.commit()
+
+    run_with_database(body)
@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+from app.foundation.utils.json_stream import JsonArrayStreamParser, iter_batches, parse_array_stream
+
+ITEMS = [
+    {"account_nm": "매출액", "thstrm_amount": "258,935,494", "ord": 1, "nested": {"list": [1, 2]}},
+    {"account_nm": "영업이익(손실)", "thstrm_amount": "-6,566,976", "ord": 2, "note": "괄호 ] 와 { 포함"},
+    {"account_nm": "당기순이익", "thstrm_amount": None, "ord": 3}
+]
+
+def chunked(data: bytes, size: int):
+    return [data[start:start + size] for start in range(0, len(data), size)]
+
+def stream(payload: bytes, size: int):
+    parser = JsonArrayStreamParser("list")
+    items = []
+    for chunk in chunked(payload, size):
+        items.extend(parser.feed(chunk))
+    return items, parser.close()
+
+@pytest.mark.parametrize("document", [
+    {"status": "000", "message": "정상", "list": ITEMS},
+    {"list": ITEMS, "status": "000", "message": "정상"},
+    {"status": "000", "list": ITEMS, "message": "정상"},
+    {"status": "000", "message": "정상", "list": []}
+], ids=["list-last", "list-first", "list-middle", "empty"])
+@pytest.mark.parametrize("size", [1, 7, 64, 1 << 16])
+def test_items_and_header_match_full_parse(document, size):
+    payload = json.dumps(document, ensure_ascii=False, indent=1).encode("utf-8")
+
+    items, header = stream(payload, size)
+
+    assert items == document["list"]
+    assert header == {key: value for key, value in document.items() if key != "list"}
+
+def test_items_are_yielded_before_stream_ends():
+    payload = json.dumps({"status": "000", "list": ITEMS}, ensure_ascii=False).encode("utf-8")
+    parser = JsonArrayStreamParser("list")
+
+    # 두 번째 원소 중간까지만 받으면 첫 원소만 나옴
+    cut = payload.index("영업이익".encode("utf-8"))
+    assert parser.feed(payload[:cut]) == ITEMS[:1]
+    assert parser.feed(payload[cut:]) == ITEMS[1:]
+    # 소비한 원소는 버퍼에 남지 않음
+    assert len(parser._buffer) < 10
+
+def test_multibyte_character_split_across_chunks():
+    payload = json.dumps({"list": [{"account_nm": "자본총계"}]}, ensure_ascii=False).encode("utf-8")
+    split = payload.index("자".encode("utf-8")) + 1
+
+    parser = JsonArrayStreamParser("list")
+    items = parser.feed(payload[:split]) + parser.feed(payload[split:])
+
+    assert items == [{"account_nm": "자본총계"}]
+
+def test_response_without_array_returns_header():
+    payload = json.dumps({"status": "013", "message": "조회된 데이타가 없습니다."}, ensure_ascii=False).encode("utf-8")
+
+    items, header = stream(payload, 5)
+
+    assert items == []
+    assert header == {"status": "013", "message": "조회된 데이타가 없습니다."}
+
+def test_truncated_array_raises():
+    payload = json.dumps({"status": "000", "list": ITEMS}, ensure_ascii=False).encode("utf-8")
+    parser = JsonArrayStreamParser("list")
+    parser.feed(payload[:-10])
+
+    with pytest.raises(ValueError):
+        parser.close()
+
+def test_parse_array_stream_fills_header_and_batches():
+    payload = json.dumps({"status": "000", "message": "정상", "list": list(range(7))}).encode("utf-8")
+    header = {}
+
+    batches = list(iter_batches(parse_array_stream(chunked(payload, 3), header=header), 3))
+
+    assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+    assert header == {"status": "000", "message": "정상"}
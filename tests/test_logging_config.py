@@ -0,0 +1,65 @@
+import queue
+import logging
+
+import pytest
+
+from app.foundation.infra.logger import logging_config
+from app.foundation.infra.logger.logging_config import NonBlockingQueueHandler, RateLimitFilter
+
+def record(lineno: int = 10, level: int = logging.INFO, message: str = "요청 처리") -> logging.LogRecord:
+    return logging.LogRecord("app", level, "app/module.py", lineno, message, (), None)
+
+@pytest.fixture
+def clock(monkeypatch):
+    """logging_config가 보는 time.monotonic을 직접 움직이는 시계"""
+    now = [1000.0]
+    monkeypatch.setattr(logging_config.time, "monotonic", lambda: now[0])
+    return now
+
+def test_rate_limit_drops_after_burst_and_reports_suppressed(clock):
+    rate_limit = RateLimitFilter(rate=2.0)
+
+    assert [rate_limit.filter(record()) for _ in range(5)] == [True, True, False, False, False]
+
+    # 0.5초 뒤 토큰 하나가 채워지면 통과하는 로그에 버린 개수를 붙임
+    clock[0] += 0.5
+    passed = record()
+    assert rate_limit.filter(passed)
+    assert passed.suppressed == 3
+    clock[0] += 0.5
+    following = record()
+    assert rate_limit.filter(following)
+    assert not hasattr(following, "suppressed")
+
+def test_rate_limit_is_per_location_and_skips_warnings(clock):
+    rate_limit = RateLimitFilter(rate=1.0)
+
+    assert rate_limit.filter(record(lineno=10))
+    assert not rate_limit.filter(record(lineno=10))
+    assert rate_limit.filter(record(lineno=20))
+    assert all(rate_limit.filter(record(lineno=10, level=logging.WARNING)) for _ in range(5))
+
+def test_zero_rate_disables_limit(clock):
+    rate_limit = RateLimitFilter(rate=0.0)
+    assert all(rate_limit.filter(record()) for _ in range(100))
+
+def test_queue_handler_counts_and_reports_dropped_records():
+    log_queue: queue.Queue = queue.Queue(maxsize=1)
+    handler = NonBlockingQueueHandler(log_queue)
+
+    for index in range(3):
+        handler.emit(record(message=f"로그 {index}"))
+
+    # 큐가 가득 차면 기다리지 않고 버림
+    assert handler.dropped_total == 2
+    first = log_queue.get_nowait()
+    assert first.getMessage() == "로그 0"
+    assert not hasattr(first, "dropped")
+
+    handler.emit(record(message="다음 로그"))
+    following = log_queue.get_nowait()
+    assert following.dropped == 2
+
+    handler.emit(record(message="그 다음 로그"))
+    assert not hasattr(log_queue.get_nowait(), "dropped")
+    assert handler.dropped_total == 2
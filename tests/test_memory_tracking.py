@@ -0,0 +1,43 @@
+import tracemalloc
+
+import pytest
+
+from app.foundation.infra.profiling import memory
+from app.foundation.infra.profiling.memory import AllocationTracker
+
+@pytest.fixture
+def tracker():
+    tracker = AllocationTracker()
+    yield tracker
+    tracker.stop()
+
+def run_stage(tracker: AllocationTracker) -> dict:
+    with tracker.stage("ingest.prepare"):
+        retained = [bytes(1024) for _ in range(100)]
+    assert retained
+    return tracker.report()["stages"][0]["last"]
+
+def test_stage_records_retained_sites_with_snapshots(tracker):
+    tracker.start(snapshots=True)
+    last = run_stage(tracker)
+
+    assert last["retained_kb"] > 90
+    assert last["top_sites"]
+
+def test_server_process_skips_snapshots(tracker, monkeypatch):
+    def take_snapshot():
+        raise AssertionError("스냅샷을 끄면 단계마다 take_snapshot을 호출하지 않아야 함")
+
+    tracker.start(snapshots=False)
+    monkeypatch.setattr(memory.tracemalloc, "take_snapshot", take_snapshot)
+    last = run_stage(tracker)
+
+    assert last["retained_kb"] > 90
+    assert last["top_sites"] == []
+
+def test_start_while_tracing_only_switches_snapshots(tracker):
+    tracker.start(frames=1, snapshots=True)
+    tracker.start(frames=5, snapshots=False)
+
+    assert tracemalloc.get_traceback_limit() == 1
+    assert tracker.snapshots is False
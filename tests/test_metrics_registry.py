@@ -0,0 +1,54 @@
+import os
+import sys
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from app.foundation.infra.metrics.registry import Counter, Histogram, Registry, render_dumps
+
+def test_render_merges_worker_counters_and_histograms():
+    registry = Registry()
+    requests = Counter("requests_total", "요청 수", ["path"], registry=registry)
+    latency = Histogram("latency_seconds", "지연 시간", buckets=(0.1, 1.0), registry=registry)
+    requests.labels("/a").inc()
+    latency.observe(0.5)
+
+    text = render_dumps([(os.getpid(), registry.dump()), (os.getpid(), registry.dump())], label_gauges=False)
+
+    assert 'requests_total{path="/a"} 2' in text
+    assert 'latency_seconds_bucket{le="1"} 2' in text
+    assert "latency_seconds_count 2" in text
+
+def test_dump_while_labels_are_added():
+    registry = Registry()
+    counter = Counter("items_total", "항목 수", ["key"], registry=registry)
+    # 스레드 전환을 자주 일으켜 순회 도중 하위 지표가 추가되도록 함
+    previous = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    def add_children():
+        for index in range(20000):
+            counter.labels(str(index)).inc()
+
+    # 출력은 스레드 풀, 레이블 추가는 이벤트 루프에서 동시에 일어남
+    writer = threading.Thread(target=add_children)
+    writer.start()
+    try:
+        while writer.is_alive():
+            registry.dump()
+    finally:
+        writer.join()
+        sys.setswitchinterval(previous)
+
+    assert len(registry.dump()["items_total"]["values"]) == 20000
+
+def test_concurrent_writes_use_separate_temp_files(tmp_path):
+    registry = Registry()
+    Counter("writes_total", "쓰기 수", registry=registry).inc()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: registry.write(str(tmp_path)), range(64)))
+
+    assert os.listdir(tmp_path) == [f"{os.getpid()}.json"]
+    data = json.loads((tmp_path / f"{os.getpid()}.json").read_text(encoding="utf-8"))
+    assert data["metrics"]["writes_total"]["values"] == [[[], 1.0]]
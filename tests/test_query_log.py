@@ -0,0 +1,42 @@
+import pytest
+
+from app.foundation.infra.database.query_log import fingerprint
+
+@pytest.mark.parametrize("statement, expected", [
+    ("SELECT * FROM fin_data WHERE corp_code = '00126380' AND bsns_year = 2023",
+     "SELECT * FROM fin_data WHERE corp_code = ? AND bsns_year = ?"),
+    ("SELECT * FROM t WHERE name = 'O''Brien' AND note = ''", "SELECT * FROM t WHERE name = ? AND note = ?"),
+    ("SELECT * FROM t WHERE v = -1.5 LIMIT 10", "SELECT * FROM t WHERE v = ? LIMIT ?"),
+    # 식별자 안의 숫자와 형 변환(::)은 그대로 둠
+    ("SELECT col1, t2.x FROM t2 WHERE x::text = 'a'", "SELECT col1, t2.x FROM t2 WHERE x::text = ?")
+])
+def test_literals_become_placeholders(statement, expected):
+    assert fingerprint(statement) == expected
+
+@pytest.mark.parametrize("statement", [
+    "SELECT * FROM t WHERE id = :id",
+    "SELECT * FROM t WHERE id = $1",
+    "SELECT * FROM t WHERE id = %(id)s",
+    "SELECT * FROM t WHERE id = %s",
+    "SELECT * FROM t WHERE id = ?"
+])
+def test_bind_parameter_styles_share_fingerprint(statement):
+    assert fingerprint(statement) == "SELECT * FROM t WHERE id = ?"
+
+def test_value_lists_collapse_regardless_of_length():
+    short = fingerprint("SELECT * FROM t WHERE id IN (1, 2)")
+    long = fingerprint("SELECT * FROM t WHERE id IN ($1,$2,$3,$4,$5)")
+
+    assert short == long == "SELECT * FROM t WHERE id IN (?...)"
+    # 열 목록은 값이 아니므로 유지
+    assert fingerprint("INSERT INTO t (a, b) VALUES (%(a)s, %(b)s)") == "INSERT INTO t (a, b) VALUES (?...)"
+
+def test_whitespace_is_collapsed():
+    statement = """
+        SELECT a,
+               b
+        FROM\tt
+        WHERE id = :id
+    """
+    assert fingerprint(statement) == "SELECT a, b FROM t WHERE id = ?"
+    assert fingerprint(statement) == fingerprint("SELECT a, b FROM t WHERE id = :other")
@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+
+from app.domin.fin.service import ratio_recompute_service
+from app.domin.fin.service.ratio_dependency import (
+    DEFAULT_GRAPH,
+    RatioDependencyGraph,
+    StatementChange,
+    diff_statement_rows
+)
+from app.domin.fin.service.ratio_recompute_service import RatioRecomputeService
+from app.domin.fin.service.ratio_registry import RATIO_EVALUATOR
+
+def change(sj_div: str, account_nm: str, bsns_year: str = "2023", reprt_code: str = "11011") -> StatementChange:
+    return StatementChange(bsns_year, reprt_code, sj_div, account_nm)
+
+@pytest.mark.parametrize("changed, expected", [
+    (change("BS", "부채총계"), {("2023", "11011"): {"debt_ratio", "cash_flow_debt_ratio"}}),
+    (change("BS", "사채"), {("2023", "11011"): {"debt_dependency"}}),
+    # 전년도 값을 쓰는 성장률은 다음 연도 셀도 다시 계산
+    (change("IS", "매출액"), {
+        ("2023", "11011"): {"operating_profit_ratio", "net_profit_ratio", "sales_growth"},
+        ("2024", "11011"): {"sales_growth"}
+    }),
+    # 순이익은 TTM이 없을 때의 대체 입력이므로 ROE/ROA도 영향받음. 저장하지 않는 순이익증가율은 제외
+    (change("IS", "당기순이익"), {("2023", "11011"): {"net_profit_ratio", "roe", "roa"}}),
+    (change("TTM", "당기순이익", reprt_code="11012"), {("2023", "11012"): {"roe", "roa"}}),
+    (change("IS", "법인세비용"), {})
+])
+def test_affected_cells(changed, expected):
+    assert DEFAULT_GRAPH.affected([changed]) == expected
+
+def test_affected_merges_changes_per_period():
+    plan = DEFAULT_GRAPH.affected([change("BS", "유동자산"), change("BS", "자본총계"), change("BS", "유동자산", "2022")])
+    assert plan == {
+        ("2023", "11011"): {"current_ratio", "debt_ratio", "roe"},
+        ("2022", "11011"): {"current_ratio"}
+    }
+
+def test_default_graph_covers_stored_ratios_only():
+    assert DEFAULT_GRAPH.metrics == RATIO_EVALUATOR.stored_columns
+    all_cells = DEFAULT_GRAPH.affected(DEFAULT_GRAPH.all_changed("2023", "11011"))
+    assert all_cells[("2023", "11011")] == set(RATIO_EVALUATOR.stored_columns)
+
+def test_custom_graph():
+    graph = RatioDependencyGraph({"margin": [("IS", "영업이익", 0), ("IS", "매출액", 0)]})
+    assert graph.accounts == ["매출액", "영업이익"]
+    assert graph.affected([change("IS", "매출액")]) == {("2023", "11011"): {"margin"}}
+
+def row(account_nm: str, amount, sj_div: str = "IS", **extra) -> dict:
+    return {
+        "bsns_year": "2023",
+        "reprt_code": "11011",
+        "sj_div": sj_div,
+        "account_nm": account_nm,
+        "thstrm_amount": amount,
+        "thstrm_add_amount": None,
+        "frmtrm_amount": 90,
+        **extra
+    }
+
+def test_diff_statement_rows_reports_only_tracked_changes():
+    before = [row("매출액", 100), row("영업이익", 10), row("법인세비용", 3), row("자산총계", 500, "BS")]
+    after = [row("매출액", 100.0), row("영업이익", 12), row("법인세비용", 4), row("자본총계", 300, "BS")]
+
+    changes = diff_statement_rows(DEFAULT_GRAPH, before, after)
+
+    # 금액이 같으면 타입이 달라도 변경이 아님. 추가/삭제된 계정은 변경으로 봄
+    assert sorted(changes) == sorted([change("IS", "영업이익"), change("BS", "자산총계"), change("BS", "자본총계")])
+
+def test_diff_statement_rows_uses_canonical_account():
+    before = [row("수익(매출액)", 100, canonical_account="매출액")]
+    after = [row("매출액", 100)]
+    assert diff_statement_rows(DEFAULT_GRAPH, before, after) == []
+
+def test_recompute_saves_only_affected_cells_of_existing_periods(session, monkeypatch):
+    requested = {}
+    saved = []
+
+    async def get_ratio_inputs(db_session, corp_code, years, reprt_codes, accounts=None):
+        requested.update(years=years, reprt_codes=reprt_codes)
+        return [
+            {**row("매출액", 1000), "bfefrmtrm_amount": None},
+            {**row("영업이익", 100), "bfefrmtrm_amount": None},
+            {**row("매출액", 800), "bsns_year": "2022", "bfefrmtrm_amount": None}
+        ]
+
+    async def save_ratio_cells(db_session, corp_code, corp_name, bsns_year, reprt_code, values):
+        saved.append((bsns_year, reprt_code, values))
+
+    monkeypatch.setattr(ratio_recompute_service, "get_ratio_inputs", get_ratio_inputs)
+    monkeypatch.setattr(ratio_recompute_service, "save_ratio_cells", save_ratio_cells)
+
+    results = asyncio.run(RatioRecomputeService(session).recompute("00126380", "삼성전자", [change("IS", "매출액")]))
+
+    # 대상 기간과 전년도 입력을 한 번에 조회하고, 아직 수집되지 않은 2024년은 건너뜀
+    assert requested == {"years": ["2022", "2023", "2024"], "reprt_codes": ["11011"]}
+    assert saved == [("2023", "11011", {
+        "net_profit_ratio": None,
+        "operating_profit_ratio": pytest.approx(10.0),
+        "sales_growth": pytest.approx(25.0)
+    })]
+    assert [result["bsns_year"] for result in results] == ["2023"]
@@ -0,0 +1,90 @@
+import random
+
+import pytest
+
+from app.domin.fin.service.ratio_registry import (
+    RATIO_EVALUATOR,
+    RATIO_REGISTRY,
+    RatioDefinition,
+    RatioEvaluator,
+    account,
+    to_columns
+)
+
+def data(**sections) -> dict:
+    """data(BS={"자본총계": 100}) → {"BS": {"자본총계": {"current": 100, "previous": 0}}}. 튜플은 (당기, 전기)"""
+    return {
+        sj_div: {
+            account_nm: {"current": value[0], "previous": value[1]} if isinstance(value, tuple) else {"current": value, "previous": 0.0}
+            for account_nm, value in accounts.items()
+        }
+        for sj_div, accounts in sections.items()
+    }
+
+@pytest.mark.parametrize("equity, expected", [(200.0, 50.0), (0.0, None), (-200.0, None)])
+def test_ratio_requires_positive_denominator(equity, expected):
+    result = RATIO_EVALUATOR.evaluate(data(BS={"부채총계": 100.0, "자본총계": equity}), ["debt_ratio"])
+    assert result.get("debt_ratio") == expected
+
+@pytest.mark.parametrize("previous, expected", [(80.0, 25.0), (-80.0, 225.0), (0.0, None)])
+def test_growth_uses_absolute_nonzero_base(previous, expected):
+    # 전기 적자에서 흑자 전환하면 절댓값 기준으로 증가율을 계산
+    result = RATIO_EVALUATOR.evaluate(data(IS={"매출액": (100.0, previous)}), ["sales_growth"])
+    assert result.get("sales_growth") == expected
+
+def test_missing_input_is_omitted():
+    result = RATIO_EVALUATOR.evaluate(data(BS={"부채총계": 100.0}))
+    assert result == {}
+
+def test_missing_value_policy():
+    evaluator = RatioEvaluator([
+        RatioDefinition("coverage", "이자보상배율", account("IS", "영업이익"), account("IS", "이자비용"),
+                        scale=1.0, zero_policy="nonzero", missing=0.0)
+    ])
+    assert evaluator.evaluate(data(IS={"영업이익": 50.0})) == {"coverage": 0.0}
+    assert evaluator.evaluate(data(IS={"영업이익": 50.0, "이자비용": 0.0})) == {"coverage": 0.0}
+    assert evaluator.evaluate(data(IS={"영업이익": 50.0, "이자비용": -10.0})) == {"coverage": -5.0}
+
+def test_fallback_operand_prefers_ttm():
+    statements = data(IS={"당기순이익": 10.0}, BS={"자본총계": 100.0})
+    assert RATIO_EVALUATOR.evaluate(statements, ["roe"]) == {"roe": 10.0}
+    statements["TTM"] = {"당기순이익": {"current": 30.0}}
+    assert RATIO_EVALUATOR.evaluate(statements, ["roe"]) == {"roe": 30.0}
+
+def test_sum_operand_adds_present_accounts():
+    statements = data(BS={"단기차입금": 10.0, "사채": 30.0, "자산총계": 200.0})
+    assert RATIO_EVALUATOR.evaluate(statements, ["debt_dependency"]) == {"debt_dependency": 20.0}
+    assert RATIO_EVALUATOR.evaluate(data(BS={"자산총계": 200.0}), ["debt_dependency"]) == {}
+
+def test_invalid_definitions_are_rejected():
+    with pytest.raises(ValueError):
+        RatioEvaluator([RatioDefinition("x", "x", account("IS", "a"), account("IS", "b"), kind="diff")])
+    with pytest.raises(ValueError):
+        RatioEvaluator([RatioDefinition("x", "x", account("IS", "a"), account("IS", "b"), zero_policy="any")])
+
+def random_record(rng: random.Random) -> dict:
+    """계정 일부가 없거나 0/음수인 회사 재무 데이터"""
+    record = {}
+    for definition in RATIO_REGISTRY:
+        for operand in (definition.numerator, definition.denominator, definition.numerator.fallback):
+            if operand is None:
+                continue
+            for account_nm in operand.accounts:
+                if rng.random() < 0.2:
+                    continue
+                values = record.setdefault(operand.sj_div, {}).setdefault(account_nm, {})
+                for field in ("current", "previous"):
+                    values[field] = rng.choice([0.0, -rng.uniform(1, 1e9), rng.uniform(1, 1e12)])
+    return record
+
+def test_columnar_evaluation_matches_scalar():
+    rng = random.Random(20240101)
+    records = [random_record(rng) for _ in range(300)] + [{}]
+
+    assert RATIO_EVALUATOR.evaluate_many(records) == [RATIO_EVALUATOR.evaluate(record) for record in records]
+
+def test_to_columns_places_values_by_company():
+    columns = to_columns([data(IS={"매출액": (100.0, 80.0)}), {}, data(IS={"매출액": 50.0}, BS={"자본총계": 10.0})])
+    assert columns[("IS", "매출액", "current")] == [100.0, None, 50.0]
+    assert columns[("IS", "매출액", "previous")] == [80.0, None, 0.0]
+    assert columns[("BS", "자본총계", "current")] == [None, None, 10.0]
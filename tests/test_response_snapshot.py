@@ -0,0 +1,156 @@
+import json
+import asyncio
+from typing import Dict, Tuple
+
+import pytest
+
+from app.domin.fin.service import response_snapshot_service
+from app.domin.fin.service.response_snapshot_service import (
+    FINANCIAL_METRICS,
+    LATEST,
+    SNAPSHOT_VERSION,
+    ResponseSnapshotService,
+    build_financial_metrics,
+    encode_response,
+    ratios_response_type,
+    year_key
+)
+
+def statement(account_nm: str, current: float, previous: float, sj_div: str = "BS") -> dict:
+    return {
+        "sj_div": sj_div,
+        "account_nm": account_nm,
+        "canonical_account": account_nm,
+        "thstrm_amount": current,
+        "frmtrm_amount": previous,
+        "bsns_year": "2023"
+    }
+
+STATEMENTS = [
+    statement("자산총계", 1000.0, 900.0),
+    statement("부채총계", 400.0, 300.0),
+    statement("자본총계", 600.0, 600.0),
+    statement("유동자산", 300.0, 250.0),
+    statement("유동부채", 200.0, 200.0),
+    statement("매출액", 500.0, 400.0, "IS"),
+    statement("영업이익", 50.0, 40.0, "IS"),
+    statement("당기순이익", 30.0, 0.0, "IS")
+]
+
+@pytest.fixture
+def snapshot_store(monkeypatch):
+    """(회사 코드, 연도, 응답 종류) → 스냅샷 행"""
+    store: Dict[Tuple[str, str, str], dict] = {}
+
+    async def get_response_snapshot(db_session, corp_code, bsns_year, response_type):
+        return store.get((corp_code, bsns_year, response_type))
+
+    async def save_response_snapshot(db_session, corp_code, corp_name, bsns_year, response_type, version, body):
+        store[(corp_code, bsns_year, response_type)] = {"corp_name": corp_name, "version": version, "body": body}
+
+    async def get_company_statements(db_session, corp_code, year):
+        return STATEMENTS if year in (None, "2023") else []
+
+    async def delete_response_snapshot(db_session, corp_code, bsns_year, response_type):
+        store.pop((corp_code, bsns_year, response_type), None)
+
+    async def get_stored_ratios(db_session, corp_code, reprt_code, columns, year):
+        if reprt_code != "11011" or year not in (None, "2023"):
+            return []
+        return [{"bsns_year": "2023", "부채비율": 66.7, "EPS증가율": None}]
+
+    async def get_latest_years(db_session, corp_code, reprt_codes):
+        return {reprt_code: "2023" for reprt_code in reprt_codes if reprt_code == "11011"}
+
+    for name, function in (
+        ("get_response_snapshot", get_response_snapshot),
+        ("save_response_snapshot", save_response_snapshot),
+        ("delete_response_snapshot", delete_response_snapshot),
+        ("get_latest_years", get_latest_years),
+        ("get_company_statements", get_company_statements),
+        ("get_stored_ratios", get_stored_ratios)
+    ):
+        monkeypatch.setattr(response_snapshot_service, name, function)
+    return store
+
+def test_year_key_and_response_type():
+    assert year_key(None) == LATEST
+    assert year_key(2023) == "2023"
+    assert ratios_response_type("11012") == "ratios:11012"
+
+def test_get_returns_body_of_current_version(session, snapshot_store):
+    snapshot_store[("00126380", "2023", FINANCIAL_METRICS)] = {
+        "corp_name": "삼성전자", "version": SNAPSHOT_VERSION, "body": memoryview(b'{"a":1}')
+    }
+    body = asyncio.run(ResponseSnapshotService(session).get("00126380", "2023", FINANCIAL_METRICS))
+    assert body == b'{"a":1}'
+    assert isinstance(body, bytes)
+
+def test_get_treats_other_versions_as_missing(session, snapshot_store):
+    snapshot_store[("00126380", "2023", FINANCIAL_METRICS)] = {
+        "corp_name": "삼성전자", "version": SNAPSHOT_VERSION - 1, "body": b'{"a":1}'
+    }
+    service = ResponseSnapshotService(session)
+    assert asyncio.run(service.get("00126380", "2023", FINANCIAL_METRICS)) is None
+    assert asyncio.run(service.get("00126380", "2022", FINANCIAL_METRICS)) is None
+
+def test_store_saves_current_version_and_commits(session, snapshot_store):
+    payload = {"status": "success", "data": [{"부채비율": 66.7}]}
+
+    body = asyncio.run(ResponseSnapshotService(session).store("00126380", "삼성전자", "2023", "ratios:11011", payload))
+
+    assert json.loads(body) == payload
+    assert snapshot_store[("00126380", "2023", "ratios:11011")]["version"] == SNAPSHOT_VERSION
+    assert session.commits == 1
+
+def test_store_returns_body_when_save_fails(session, monkeypatch):
+    async def save_response_snapshot(*args):
+        raise RuntimeError("DB 오류")
+
+    monkeypatch.setattr(response_snapshot_service, "save_response_snapshot", save_response_snapshot)
+    payload = {"status": "success"}
+
+    body = asyncio.run(ResponseSnapshotService(session).store("00126380", "삼성전자", "2023", "ratios:11011", payload))
+
+    assert json.loads(body) == payload
+    assert session.rollbacks == 1
+
+def test_refresh_rebuilds_period_and_latest_snapshots(session, snapshot_store):
+    count = asyncio.run(ResponseSnapshotService(session).refresh("00126380", "삼성전자", ["2023", "2023"], ["11011", "11012"]))
+
+    # 재무지표는 사업보고서 기준, 재무비율은 저장된 행이 있는 보고서만
+    assert count == 4
+    assert sorted(snapshot_store) == [
+        ("00126380", "2023", FINANCIAL_METRICS),
+        ("00126380", "2023", "ratios:11011"),
+        ("00126380", LATEST, FINANCIAL_METRICS),
+        ("00126380", LATEST, "ratios:11011")
+    ]
+    ratios = json.loads(snapshot_store[("00126380", "2023", "ratios:11011")]["body"])
+    assert ratios["data"] == [{"bsns_year": "2023", "부채비율": 66.7}]
+
+def test_refresh_of_past_year_leaves_latest_snapshots_alone(session, snapshot_store):
+    latest = {"corp_name": "삼성전자", "version": SNAPSHOT_VERSION, "body": b"{}"}
+    snapshot_store[("00126380", LATEST, FINANCIAL_METRICS)] = latest
+    snapshot_store[("00126380", LATEST, "ratios:11011")] = latest
+
+    count = asyncio.run(ResponseSnapshotService(session).refresh("00126380", "삼성전자", ["2021"], ["11011"]))
+
+    # 최신 재무비율은 최신 연도만 담으므로 유지, 전체 연도를 담는 최신 재무지표는 삭제하여 다음 조회 때 생성
+    assert count == 0
+    assert sorted(snapshot_store) == [("00126380", LATEST, "ratios:11011")]
+
+def test_refresh_without_annual_report_skips_financial_metrics(session, snapshot_store):
+    asyncio.run(ResponseSnapshotService(session).refresh("00126380", "삼성전자", ["2023"], ["11012"]))
+    assert snapshot_store == {}
+
+def test_financial_metrics_snapshot_matches_model_serialization():
+    response = build_financial_metrics("삼성전자", STATEMENTS)
+    body = json.loads(encode_response(response))
+
+    assert body == json.loads(response.model_dump_json())
+    assert body["financialMetrics"]["years"] == ["2023"]
+    assert body["financialMetrics"]["operatingMargin"] == [10.0]
+    assert body["debtLiquidityData"]["currentRatio"] == [150.0]
+    # 전기 순이익이 0이면 순이익증가율은 계산하지 않음
+    assert body["growthData"]["netIncomeGrowth"] == []
@@ -0,0 +1,89 @@
+import asyncio
+from typing import Dict, List
+
+import pytest
+
+from app.domin.fin.service import ttm_service
+from app.domin.fin.service.ratio_dependency import StatementChange
+from app.domin.fin.service.ttm_service import TtmService, affected_periods, compute_ttm
+
+FLOWS = {
+    ("2022", "11011"): {"매출액": 1000.0, "영업이익": 100.0, "당기순이익": 80.0},
+    ("2022", "11012"): {"매출액": 450.0, "영업이익": 40.0, "당기순이익": 30.0},
+    ("2023", "11012"): {"매출액": 500.0, "영업이익": 55.0},
+    ("2023", "11013"): {"매출액": 260.0}
+}
+
+def test_affected_periods_of_annual_report_include_next_year_interims():
+    assert affected_periods("2022", "11011") == [
+        ("2022", "11011"), ("2023", "11012"), ("2023", "11013"), ("2023", "11014")
+    ]
+
+def test_affected_periods_of_interim_report_include_next_year_same_report():
+    assert affected_periods("2023", "11012") == [("2023", "11012"), ("2024", "11012")]
+
+def test_compute_ttm_of_annual_report_is_the_annual_amount():
+    assert compute_ttm(FLOWS, "2022", "11011") == FLOWS[("2022", "11011")]
+
+def test_compute_ttm_of_interim_report():
+    # TTM = 당해 누적 + 전년 연간 - 전년 같은 기간 누적
+    assert compute_ttm(FLOWS, "2023", "11012") == {"매출액": 1050.0, "영업이익": 115.0}
+
+def test_compute_ttm_skips_accounts_without_prior_periods():
+    # 전년 1분기 보고서가 없으면 계산할 수 없음
+    assert compute_ttm(FLOWS, "2023", "11013") == {}
+    assert compute_ttm(FLOWS, "2024", "11012") == {}
+
+def flow_rows(flows: Dict, stored: Dict) -> List[dict]:
+    rows = []
+    for sj_div, periods in (("IS", flows), ("TTM", stored)):
+        for (bsns_year, reprt_code), amounts in periods.items():
+            for account_nm, amount in amounts.items():
+                # 중간 보고서의 손익은 누적금액(thstrm_add_amount)을 사용
+                interim = sj_div == "IS" and reprt_code != "11011"
+                rows.append({
+                    "bsns_year": bsns_year,
+                    "reprt_code": reprt_code,
+                    "sj_div": sj_div,
+                    "account_nm": account_nm,
+                    "thstrm_amount": amount / 2 if interim else amount,
+                    "thstrm_add_amount": amount if interim else None
+                })
+    return rows
+
+@pytest.fixture
+def ttm_store(monkeypatch):
+    store = {"rows": [], "replaced": []}
+
+    async def get_flow_amounts(db_session, corp_code, years, accounts):
+        return [row for row in store["rows"] if row["bsns_year"] in years]
+
+    async def replace_ttm_amounts(db_session, corp_code, corp_name, bsns_year, reprt_code, amounts):
+        store["replaced"].append((bsns_year, reprt_code, amounts))
+
+    monkeypatch.setattr(ttm_service, "get_flow_amounts", get_flow_amounts)
+    monkeypatch.setattr(ttm_service, "replace_ttm_amounts", replace_ttm_amounts)
+    return store
+
+def test_refresh_rewrites_only_changed_periods(session, ttm_store):
+    ttm_store["rows"] = flow_rows(FLOWS, stored={
+        ("2022", "11011"): FLOWS[("2022", "11011")],
+        ("2023", "11012"): {"매출액": 1050.0, "영업이익": 100.0}
+    })
+
+    changes = asyncio.run(TtmService(session).refresh("00126380", "삼성전자", "2022", "11011"))
+
+    # 연간 TTM은 그대로, 2023 반기는 영업이익만 바뀜. 다음 해 분기는 계산할 수 없어 저장하지 않음
+    assert ttm_store["replaced"] == [("2023", "11012", {"매출액": 1050.0, "영업이익": 115.0})]
+    assert changes == [StatementChange("2023", "11012", "TTM", "영업이익")]
+
+def test_refresh_clears_ttm_that_can_no_longer_be_computed(session, ttm_store):
+    ttm_store["rows"] = flow_rows(
+        {("2023", "11013"): {"매출액": 260.0}},
+        stored={("2023", "11013"): {"매출액": 900.0}}
+    )
+
+    changes = asyncio.run(TtmService(session).refresh("00126380", "삼성전자", "2023", "11013"))
+
+    assert ttm_store["replaced"] == [("2023", "11013", {})]
+    assert changes == [StatementChange("2023", "11013", "TTM", "매출액")]